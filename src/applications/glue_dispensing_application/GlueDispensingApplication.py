@@ -383,12 +383,7 @@ class GlueSprayingApplication(BaseRobotApplication, RobotApplicationInterface):
     """ TEMP METHODS FOR TESTING WHILE IN DEVELOPMENT """
 
     def handle_set_preselected_workpiece(self, wp_id):
-        selected_workpiece = None
-        all_workpieces = self.workpiece_service.load_all()
-        for wp in all_workpieces:
-            if str(wp.workpieceId) == str(wp_id):
-                selected_workpiece = wp
-                break
+        selected_workpiece = self.workpiece_service.get_workpiece_by_id(wp_id)
 
         if selected_workpiece is not None:
             self.preselected_workpiece = selected_workpiece
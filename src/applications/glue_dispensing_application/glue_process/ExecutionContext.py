@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from applications.glue_dispensing_application.glue_process import flight_recorder
 from applications.glue_dispensing_application.settings.enums import GlueSettingKey
 
 
@@ -93,6 +94,27 @@ class ExecutionContext(Context):
             traceback.print_exc()
             return 0
 
+    def to_flight_digest(self) -> flight_recorder.ContextDigest:
+        """Compact context summary stored with every flight recorder record."""
+        flags = 0
+        if self.spray_on:
+            flags |= flight_recorder.FLAG_SPRAY_ON
+        if self.motor_started:
+            flags |= flight_recorder.FLAG_MOTOR_STARTED
+        if self.generator_started:
+            flags |= flight_recorder.FLAG_GENERATOR_STARTED
+        if self.is_resuming:
+            flags |= flight_recorder.FLAG_IS_RESUMING
+        if self.pump_thread is not None and self.pump_thread.is_alive():
+            flags |= flight_recorder.FLAG_PUMP_THREAD_ALIVE
+        return flight_recorder.ContextDigest(
+            path_index=int(self.current_path_index or 0),
+            point_index=int(self.current_point_index or 0),
+            path_length=len(self.current_path) if self.current_path is not None else 0,
+            total_paths=len(self.paths) if self.paths else 0,
+            flags=flags,
+        )
+
     def to_debug_dict(self) -> dict:
         """
         Serialize context to dictionary for debug output.
@@ -54,7 +54,8 @@ class PumpController:
                 )
                 log_debug_message(
                     self.logger_context,
-                    message=f"Pump ON (global): speed={self.glue_settings.get_motor_speed() if self.glue_settings else 10000}",
+                    "Pump ON (global): speed=%s",
+                    self.glue_settings.get_motor_speed() if self.glue_settings else 10000,
                 )
             else:
                 # Using segment settings
@@ -69,7 +70,8 @@ class PumpController:
                 )
                 log_debug_message(
                     self.logger_context,
-                    message=f"Pump ON (segment): {settings}",
+                    "Pump ON (segment): %s",
+                    settings,
                 )
 
             return result
@@ -107,7 +109,8 @@ class PumpController:
                 )
                 log_debug_message(
                     self.logger_context,
-                    message=f"Pump OFF (segment): {settings}",
+                    "Pump OFF (segment): %s",
+                    settings,
                 )
 
         except Exception as e:
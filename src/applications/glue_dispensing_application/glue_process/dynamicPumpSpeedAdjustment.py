@@ -2,6 +2,7 @@ import threading
 import time
 
 from applications.glue_dispensing_application.settings import GlueSettingKey
+from applications.glue_dispensing_application.glue_process.path_progress_tracker import PathProgressTracker
 from applications.glue_dispensing_application.glue_process.state_machine.GlueProcessState import GlueProcessState
 from modules.utils import files, robot_utils
 from modules.utils.custom_logging import log_debug_message
@@ -28,7 +29,8 @@ def check_robot_state(state_machine, robotService, start_point_index, furthest_c
         next_target_point = start_point_index + furthest_checkpoint_passed
         
         log_debug_message(robotService.logger_context,
-            message=f"Robot state changed to {current_state}, last completed point: {last_completed_point}, should resume from point {next_target_point} (furthest_checkpoint_passed={furthest_checkpoint_passed})")
+            "Robot state changed to %s, last completed point: %s, should resume from point %s (furthest_checkpoint_passed=%s)",
+            current_state, last_completed_point, next_target_point, furthest_checkpoint_passed)
         return True, next_target_point
     
     return False, 0
@@ -68,7 +70,8 @@ def is_final_point_reached(currentPos, final_point, remaining_path, furthest_che
                 return True
             else:
                 log_debug_message(robotService.logger_context,
-                    message=f"Close to final point but haven't passed second-to-last point yet (need checkpoint {second_to_last_required}, current: {furthest_checkpoint_passed})")
+                    "Close to final point but haven't passed second-to-last point yet (need checkpoint %s, current: %s)",
+                    second_to_last_required, furthest_checkpoint_passed)
         else:
             log_debug_message(robotService.logger_context,
                 message="Final point reached (path has <2 points), path complete")
@@ -77,34 +80,72 @@ def is_final_point_reached(currentPos, final_point, remaining_path, furthest_che
     return False
 
 # Checkpoint Management Functions
-def update_checkpoint_progress(currentPos, remaining_path, furthest_checkpoint_passed, start_point_index, robotService):
+# A path point counts as passed once the tracked progress is within this distance (mm) of it
+CHECKPOINT_TOLERANCE = 1.0
+# Pump loop period (s); the robot telemetry itself is sampled every ~0.03 s
+PUMP_LOOP_PERIOD = 0.01
+DEBUG_FILE = "robot_pump_values.txt"
+
+def update_checkpoint_progress(currentPos, tracker, start_point_index, robotService, debug_writer):
     """
-    Update furthest checkpoint passed and log progress.
+    Advance the path-progress tracker and log newly passed checkpoints.
     Returns: updated furthest_checkpoint_passed value
     """
-    for i in range(furthest_checkpoint_passed, len(remaining_path)):
-        checkpoint = remaining_path[i]
-        distance_to_checkpoint = robot_utils.calculate_distance_between_points(currentPos, checkpoint)
-
-        if distance_to_checkpoint < 1:
-            log_checkpoint_reached(start_point_index + i, distance_to_checkpoint, start_point_index, i + 1)
-            # Robot has passed this checkpoint - set to the next point we should head toward
-            furthest_checkpoint_passed = i + 1  # +1 because we've passed this point, now head to next
-            log_debug_message(robotService.logger_context,
-                message=f"Passed checkpoint {start_point_index + i}, next target will be point {start_point_index + furthest_checkpoint_passed}")
-    
-    return furthest_checkpoint_passed
+    passed_before = tracker.passed_count
+    tracker.update(currentPos)
+    for i in range(passed_before, tracker.passed_count):
+        log_checkpoint_reached(debug_writer, start_point_index + i, tracker.deviation)
+    if tracker.passed_count > passed_before:
+        log_debug_message(robotService.logger_context,
+            "Passed checkpoint %d, next target will be point %d (progress %.1f/%.1f mm)",
+            start_point_index + tracker.passed_count - 1, start_point_index + tracker.passed_count,
+            tracker.progress, tracker.total_length)
+    return tracker.passed_count
 
 def get_current_target_checkpoint(remaining_path, furthest_checkpoint_passed):
     """Get the current target checkpoint for robot movement"""
     return remaining_path[min(furthest_checkpoint_passed, len(remaining_path) - 1)]
 
-def log_checkpoint_reached(checkpoint_index, distance, start_point_index, furthest_checkpoint_passed):
+def log_checkpoint_reached(debug_writer, checkpoint_index, distance):
     """Log when a checkpoint is reached"""
-    message = f"Checkpoint {checkpoint_index} reached (distance: {distance:.3f} mm)\n"
-    files.write_to_debug_file("robot_pump_values.txt", message)
-    message = "\n"
-    files.write_to_debug_file("robot_pump_values.txt", message)
+    debug_writer.write(f"Checkpoint {checkpoint_index} reached (distance: {distance:.3f} mm)\n\n")
+
+class FixedRateTicker:
+    """Paces a loop at a fixed period; missed deadlines are skipped rather than bunched up."""
+    def __init__(self, period):
+        self.period = period
+        self.overruns = 0
+        self._next = time.monotonic() + period
+
+    def wait(self):
+        now = time.monotonic()
+        delay = self._next - now
+        if delay > 0:
+            time.sleep(delay)
+            self._next += self.period
+        else:
+            self.overruns += 1
+            self._next = now + self.period
+
+# Motion Data
+# The glue acceleration coefficients were tuned when "acceleration" was the velocity change per
+# monitor cycle (0.03 s). Telemetry now reports mm/s², so it is scaled back to keep the tuning.
+ACCELERATION_COEFFICIENT_DT = 0.03
+
+def read_robot_motion(robotService):
+    """
+    Latest (position, velocity, acceleration) as one consistent telemetry sample.
+    Falls back to the individual getters for services without a telemetry buffer.
+    """
+    get_telemetry = getattr(robotService, "get_telemetry", None)
+    if get_telemetry is not None:
+        sample = get_telemetry().latest()
+        if sample is None:
+            return None, 0.0, 0.0
+        return sample.pose.tolist(), sample.speed, sample.acceleration * ACCELERATION_COEFFICIENT_DT
+    return (robotService.get_current_position(),
+            robotService.get_current_velocity(),
+            robotService.get_current_acceleration())
 
 # Speed Calculation Functions
 def calculate_velocity_compensation(current_velocity, glue_speed_coefficient):
@@ -129,13 +170,13 @@ def calculate_pump_speed_adjustments(current_velocity, current_acceleration, glu
     return velocity_compensation + accel_compensation, velocity_compensation, accel_compensation
 
 # Debug/Logging Functions
-def log_debug_data(robotService, current_velocity, current_acceleration, velocity_compensation, accel_compensation, adjustedPumpSpeed, last_write_time):
-    """Log comprehensive debug data to file and return updated last_write_time"""
+def log_debug_data(debug_writer, current_pos, current_velocity, current_acceleration, velocity_compensation, accel_compensation, adjustedPumpSpeed, last_write_time):
+    """Queue comprehensive debug data for the debug file and return updated last_write_time"""
     current_time = time.time()
     delta_time = current_time - last_write_time
     
-    message = f"dt: {delta_time} Pos {robotService.get_current_position()} Vel: {float(current_velocity):.3f}, Acc: {float(current_acceleration):.3f}, Vel Com: {float(velocity_compensation):.3f}, Acc Comp {accel_compensation:.3f}, Pump speed: {float(adjustedPumpSpeed):.3f}\n"
-    files.write_to_debug_file("robot_pump_values.txt", message)
+    message = f"dt: {delta_time} Pos {current_pos} Vel: {float(current_velocity):.3f}, Acc: {float(current_acceleration):.3f}, Vel Com: {float(velocity_compensation):.3f}, Acc Comp {accel_compensation:.3f}, Pump speed: {float(adjustedPumpSpeed):.3f}\n"
+    debug_writer.write(message)
     
     return current_time
 
@@ -185,57 +226,69 @@ def adjustPumpSpeedDynamically(
     final_point = remaining_path[-1]
     furthest_checkpoint_passed = 0
     first_point_reached = False
+    tracker = PathProgressTracker(remaining_path, checkpoint_tolerance=CHECKPOINT_TOLERANCE,
+                                  max_deviation=CHECKPOINT_TOLERANCE)
+    debug_writer = files.BufferedDebugWriter(DEBUG_FILE)
+    ticker = FixedRateTicker(PUMP_LOOP_PERIOD)
 
-    # Main processing loop
-    while True:
-        # Check if robot is paused or stopped
-        should_exit, next_target_point = check_robot_state(execution_context.state_machine if execution_context else None, robotService, start_point_index, furthest_checkpoint_passed)
-        if should_exit:
-            return False, next_target_point
+    try:
+        # Main processing loop
+        while True:
+            # Check if robot is paused or stopped
+            should_exit, next_target_point = check_robot_state(execution_context.state_machine if execution_context else None, robotService, start_point_index, furthest_checkpoint_passed)
+            if should_exit:
+                return False, next_target_point
 
-        # Get current position
-        current_pos = robotService.get_current_position()
-        if current_pos is None:
-            time.sleep(robotService.robot_state_manager_cycle_time)
-            continue
-        # Check if first point is reached
-        first_point_reached, should_continue = is_first_point_reached(
-            current_pos, first_point, threshold, robotService, start_point_index, first_point_reached
-        )
-        if not should_continue:
-            time.sleep(robotService.robot_state_manager_cycle_time)
-            continue
-        # Check if final point is reached
-        if is_final_point_reached(current_pos, final_point, remaining_path, furthest_checkpoint_passed, threshold, robotService):
-            break
-        # Update checkpoint progress
-        furthest_checkpoint_passed = update_checkpoint_progress(
-            current_pos, remaining_path, furthest_checkpoint_passed, start_point_index, robotService
-        )
-        # Get current robot motion data
-        current_velocity = robotService.get_current_velocity()
-        current_acceleration = robotService.get_current_acceleration()
-        # Calculate pump speed adjustments
-        adjusted_pump_speed, velocity_compensation, accel_compensation = calculate_pump_speed_adjustments(
-            current_velocity, current_acceleration, glue_speed_coefficient, glue_acceleration_coefficient
-        )
-        # Log debug data
-        last_write_time = log_debug_data(
-            robotService, current_velocity, current_acceleration, 
-            velocity_compensation, accel_compensation, adjusted_pump_speed, last_write_time
-        )
-        # Apply pump speed adjustment
-        glueSprayService.adjustMotorSpeed(motorAddress=motorAddress, speed=int(adjusted_pump_speed))
+            # Get current position and motion from one telemetry sample
+            current_pos, current_velocity, current_acceleration = read_robot_motion(robotService)
+            if current_pos is None:
+                ticker.wait()
+                continue
+            # Check if first point is reached
+            first_point_reached, should_continue = is_first_point_reached(
+                current_pos, first_point, threshold, robotService, start_point_index, first_point_reached
+            )
+            if not should_continue:
+                ticker.wait()
+                continue
+            # Check if final point is reached
+            if is_final_point_reached(current_pos, final_point, remaining_path, furthest_checkpoint_passed, threshold, robotService):
+                break
+            # Update checkpoint progress
+            furthest_checkpoint_passed = update_checkpoint_progress(
+                current_pos, tracker, start_point_index, robotService, debug_writer
+            )
+            # Calculate pump speed adjustments
+            adjusted_pump_speed, velocity_compensation, accel_compensation = calculate_pump_speed_adjustments(
+                current_velocity, current_acceleration, glue_speed_coefficient, glue_acceleration_coefficient
+            )
+            # Log debug data
+            last_write_time = log_debug_data(
+                debug_writer, current_pos, current_velocity, current_acceleration,
+                velocity_compensation, accel_compensation, adjusted_pump_speed, last_write_time
+            )
+            # Apply pump speed adjustment
+            glueSprayService.adjustMotorSpeed(motorAddress=motorAddress, speed=int(adjusted_pump_speed))
+            ticker.wait()
+    finally:
+        debug_writer.close()
     # Path completed successfully
     log_debug_message(robotService.logger_context, message="RobotService.adjustPumpSpeedWhileRobotIsMoving2 ALL POINTS REACHED! ")
     final_progress = start_point_index + len(remaining_path) - 1
     return True, final_progress
 
 class PumpThreadWithResult(threading.Thread):
-    """Thread wrapper that stores the result from the pump adjustment function"""
-    def __init__(self, *args, **kwargs):
+    """
+    Thread wrapper that stores the result from the pump adjustment function.
+
+    ``done`` is set once ``result`` is available and ``on_done`` (if given) is called right after,
+    so waiters can react without polling is_alive().
+    """
+    def __init__(self, *args, on_done=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.result = None
+        self.done = threading.Event()
+        self.on_done = on_done
     
     def run(self):
         try:
@@ -245,6 +298,10 @@ class PumpThreadWithResult(threading.Thread):
             import traceback
             traceback.print_exc()
             self.result = (False, 0, e)
+        finally:
+            self.done.set()
+            if self.on_done is not None:
+                self.on_done()
 
 def start_dynamic_pump_speed_adjustment_thread(service,
                                                robotService,
@@ -254,7 +311,8 @@ def start_dynamic_pump_speed_adjustment_thread(service,
                                                reach_end_threshold,
                                                pump_ready_event,
                                                start_point_index=0,
-                                               execution_context=None):
+                                               execution_context=None,
+                                               on_done=None):
 
     pump_thread = PumpThreadWithResult(
         target=adjustPumpSpeedDynamically,
@@ -269,7 +327,8 @@ def start_dynamic_pump_speed_adjustment_thread(service,
             start_point_index,  # start_point_index
             pump_ready_event,  # ready_event
             execution_context  # execution_context
-        )
+        ),
+        on_done=on_done
     )
     pump_thread.start()
     print(f"Started pump adjustment thread with start_point_index={start_point_index}")
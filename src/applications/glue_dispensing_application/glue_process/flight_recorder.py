@@ -0,0 +1,309 @@
+"""
+Flight recorder for glue process state transitions.
+
+Every state ENTER/EXIT is appended as a fixed-size, length-prefixed binary record to a
+memory-mapped ring file. ``record()`` only enqueues a tuple; packing and writing happen on a
+background thread, so the state-machine thread never touches the filesystem. The file is
+self-describing (the header carries the state-name table) and survives process crashes,
+since writes go straight to the shared mapping.
+
+Reading:
+    python -m applications.glue_dispensing_application.glue_process.flight_recorder <file>
+prints the most recent cycle timelines and per-state latency histograms.
+"""
+import argparse
+import json
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b"GFRC"
+VERSION = 1
+HEADER_SIZE = 4096
+DEFAULT_CAPACITY = 65536
+
+EVENT_ENTER = 1
+EVENT_EXIT = 2
+EVENT_NAMES = {EVENT_ENTER: "ENTER", EVENT_EXIT: "EXIT"}
+
+# Context digest flags
+FLAG_SPRAY_ON = 1
+FLAG_MOTOR_STARTED = 2
+FLAG_GENERATOR_STARTED = 4
+FLAG_IS_RESUMING = 8
+FLAG_PUMP_THREAD_ALIVE = 16
+
+# magic, version, record size, capacity, state-name table length
+_HEADER = struct.Struct("<4sHHII")
+# length, seq, timestamp, state id, event, flags, duration, path index, point index,
+# path length, total paths, crc32 of everything before it
+_RECORD_BODY = struct.Struct("<HQdHBBdiiii")
+_CRC = struct.Struct("<I")
+_RECORD = struct.Struct(_RECORD_BODY.format + "I")
+RECORD_SIZE = _RECORD.size
+# Just the length prefix and sequence number of each slot, for a vectorised scan
+_SLOT_DTYPE = np.dtype({"names": ["length", "seq"], "formats": ["<u2", "<u8"], "offsets": [0, 2],
+                        "itemsize": RECORD_SIZE})
+
+# Latency histogram bin edges in milliseconds
+DEFAULT_LATENCY_BINS_MS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, np.inf)
+
+
+class ContextDigest(NamedTuple):
+    """Small fixed-size summary of the execution context stored with each record."""
+    path_index: int = 0
+    point_index: int = 0
+    path_length: int = 0
+    total_paths: int = 0
+    flags: int = 0
+
+
+class FlightRecord(NamedTuple):
+    seq: int
+    timestamp: float
+    state: str
+    event: str
+    duration: float
+    path_index: int
+    point_index: int
+    path_length: int
+    total_paths: int
+    flags: int
+
+
+def _pack_header(capacity: int, state_names: Dict[int, str]) -> bytes:
+    names = json.dumps({str(k): v for k, v in state_names.items()}).encode("utf-8")
+    if _HEADER.size + len(names) > HEADER_SIZE:
+        raise ValueError("State-name table does not fit in the flight recorder header")
+    return _HEADER.pack(MAGIC, VERSION, RECORD_SIZE, capacity, len(names)) + names
+
+
+def _unpack_header(data) -> Tuple[int, Dict[int, str]]:
+    magic, version, record_size, capacity, names_len = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+        raise ValueError("Not a flight recorder file (or unsupported version)")
+    names = json.loads(bytes(data[_HEADER.size:_HEADER.size + names_len]).decode("utf-8"))
+    return capacity, {int(k): v for k, v in names.items()}
+
+
+def _occupied_slots(data, capacity: int) -> np.ndarray:
+    """Slot indices whose length prefix is set, newest sequence number first."""
+    capacity = min(capacity, (len(data) - HEADER_SIZE) // RECORD_SIZE)
+    slots = np.frombuffer(data, dtype=_SLOT_DTYPE, count=max(capacity, 0), offset=HEADER_SIZE)
+    occupied = np.flatnonzero(slots["length"] == RECORD_SIZE)
+    return occupied[np.argsort(slots["seq"][occupied])[::-1]]
+
+
+def _unpack_record(data, offset):
+    """Return the record fields at offset, or None for an empty or torn slot."""
+    fields = _RECORD.unpack_from(data, offset)
+    if fields[0] != RECORD_SIZE:
+        return None
+    if zlib.crc32(data[offset:offset + RECORD_SIZE - 4]) != fields[-1]:
+        return None
+    return fields
+
+
+class FlightRecorder:
+    """
+    Asynchronous ring-file recorder for state transitions.
+
+    Args:
+        path: Ring file; reused (history kept) when its layout matches, recreated otherwise.
+        state_names: Mapping of state id to name, written to the header for the reader.
+        capacity: Number of record slots; the oldest records are overwritten when full.
+    """
+
+    def __init__(self, path: str, state_names: Dict[int, str], capacity: int = DEFAULT_CAPACITY):
+        self.path = path
+        self.capacity = int(capacity)
+        self._header = _pack_header(self.capacity, state_names)
+        self._mmap = self._open(path)
+        self._next_seq = self._find_next_seq()
+        self._entered_at: Dict[int, float] = {}
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self.dropped = 0
+        self._writer = threading.Thread(target=self._run, name="FlightRecorderWriter", daemon=True)
+        self._writer.start()
+
+    def _open(self, path):
+        size = HEADER_SIZE + self.capacity * RECORD_SIZE
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        reuse = False
+        if os.path.exists(path) and os.path.getsize(path) == size:
+            with open(path, "rb") as f:
+                reuse = f.read(len(self._header)) == self._header
+        if not reuse:
+            with open(path, "wb") as f:
+                f.write(self._header)
+                f.truncate(size)
+        with open(path, "r+b") as f:
+            return mmap.mmap(f.fileno(), size)
+
+    def _find_next_seq(self) -> int:
+        for slot in _occupied_slots(self._mmap, self.capacity):
+            fields = _unpack_record(self._mmap, HEADER_SIZE + int(slot) * RECORD_SIZE)
+            if fields is not None:
+                return fields[1] + 1
+        return 0
+
+    def record(self, state_id: int, event: int, digest: Optional[ContextDigest] = None):
+        """Queue a transition record; cheap enough to call from the state-machine thread."""
+        if self._closed:
+            self.dropped += 1
+            return
+        self._queue.put((time.time(), state_id, event, digest or ContextDigest()))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            try:
+                self._write(*item)
+            except Exception as e:
+                self.dropped += 1
+                print(f"[FlightRecorder] Failed to write record: {e}")
+
+    def _write(self, timestamp, state_id, event, digest):
+        duration = 0.0
+        if event == EVENT_ENTER:
+            self._entered_at[state_id] = timestamp
+        elif event == EVENT_EXIT:
+            entered = self._entered_at.pop(state_id, None)
+            if entered is not None:
+                duration = timestamp - entered
+
+        seq = self._next_seq
+        self._next_seq += 1
+        body = _RECORD_BODY.pack(RECORD_SIZE, seq, timestamp, state_id, event, digest.flags, duration,
+                                 digest.path_index, digest.point_index, digest.path_length, digest.total_paths)
+        offset = HEADER_SIZE + (seq % self.capacity) * RECORD_SIZE
+        self._mmap[offset:offset + RECORD_SIZE] = body + _CRC.pack(zlib.crc32(body))
+
+    def flush(self, timeout: float = 1.0) -> bool:
+        """Wait until the records queued so far are written and sync the mapping to disk."""
+        if self._closed:
+            return True
+        written = threading.Event()
+        self._queue.put(written)
+        if not written.wait(timeout):
+            return False
+        self._mmap.flush()
+        return True
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join(timeout=2.0)
+        self._mmap.flush()
+        self._mmap.close()
+
+
+# ------------------------------------------------------------------ reader
+
+
+def read_records(path: str) -> List[FlightRecord]:
+    """Read every valid record from a ring file, oldest first."""
+    with open(path, "rb") as f:
+        data = f.read()
+    capacity, state_names = _unpack_header(data)
+    records = []
+    for slot in _occupied_slots(data, capacity)[::-1]:
+        fields = _unpack_record(data, HEADER_SIZE + int(slot) * RECORD_SIZE)
+        if fields is None:
+            continue
+        _, seq, timestamp, state_id, event, flags, duration, path_index, point_index, path_length, total_paths, _ = fields
+        records.append(FlightRecord(seq, timestamp, state_names.get(state_id, str(state_id)),
+                                    EVENT_NAMES.get(event, str(event)), duration,
+                                    path_index, point_index, path_length, total_paths, flags))
+    return records
+
+
+def split_cycles(records: List[FlightRecord], start_state: str = "STARTING") -> List[List[FlightRecord]]:
+    """Split records into cycles, each beginning at an ENTER of start_state."""
+    cycles = []
+    current = []
+    for record in records:
+        if record.state == start_state and record.event == "ENTER" and current:
+            cycles.append(current)
+            current = []
+        current.append(record)
+    if current:
+        cycles.append(current)
+    return cycles
+
+
+def state_latency_histograms(records: List[FlightRecord], bins_ms=DEFAULT_LATENCY_BINS_MS
+                             ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """Histogram of time spent in each state (from EXIT records), in milliseconds."""
+    durations: Dict[str, List[float]] = {}
+    for record in records:
+        if record.event == "EXIT":
+            durations.setdefault(record.state, []).append(record.duration * 1000.0)
+    edges = np.asarray(bins_ms, dtype=float)
+    return {state: (np.histogram(values, bins=edges)[0], edges) for state, values in durations.items()}
+
+
+def format_timeline(cycle: List[FlightRecord]) -> str:
+    if not cycle:
+        return ""
+    start = cycle[0].timestamp
+    lines = []
+    for record in cycle:
+        line = f"{(record.timestamp - start) * 1000:10.1f} ms  {record.event:<5} {record.state:<32}"
+        line += f" path {record.path_index}/{record.total_paths} point {record.point_index}/{record.path_length}"
+        if record.event == "EXIT":
+            line += f"  ({record.duration * 1000:.1f} ms)"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def format_histograms(histograms: Dict[str, Tuple[np.ndarray, np.ndarray]], width: int = 40) -> str:
+    lines = []
+    for state, (counts, edges) in sorted(histograms.items()):
+        lines.append(f"{state} (n={int(counts.sum())})")
+        peak = max(int(counts.max()), 1)
+        for count, low, high in zip(counts, edges[:-1], edges[1:]):
+            if count == 0:
+                continue
+            label = f"{low:g}-{high:g} ms" if np.isfinite(high) else f">={low:g} ms"
+            lines.append(f"  {label:>16} {int(count):6d} {'#' * max(1, int(width * count / peak))}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect a glue process flight recorder file")
+    parser.add_argument("path", help="Flight recorder ring file")
+    parser.add_argument("--cycles", type=int, default=1, help="Number of most recent cycle timelines to print")
+    parser.add_argument("--start-state", default="STARTING", help="State whose ENTER begins a cycle")
+    parser.add_argument("--no-histograms", action="store_true", help="Skip the per-state latency histograms")
+    args = parser.parse_args(argv)
+
+    records = read_records(args.path)
+    print(f"{len(records)} records")
+    cycles = split_cycles(records, args.start_state)
+    for index, cycle in enumerate(cycles[-args.cycles:] if args.cycles > 0 else [], start=1):
+        total = (cycle[-1].timestamp - cycle[0].timestamp) * 1000
+        print(f"\n=== Cycle {len(cycles) - min(args.cycles, len(cycles)) + index} ({total:.1f} ms) ===")
+        print(format_timeline(cycle))
+    if not args.no_histograms:
+        print("\n=== State latency ===")
+        print(format_histograms(state_latency_histograms(records)))
+
+
+if __name__ == "__main__":
+    main()
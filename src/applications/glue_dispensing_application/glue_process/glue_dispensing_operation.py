@@ -1,6 +1,4 @@
-import json
 import os
-from datetime import datetime
 
 from applications.glue_dispensing_application.glue_process.state_handlers.compleated_state_handler import \
     handle_completed_state
@@ -22,6 +20,7 @@ from applications.glue_dispensing_application.glue_process.state_handlers.transi
 from applications.glue_dispensing_application.glue_process.state_handlers.wait_for_path_completion_state_handler import \
     handle_wait_for_path_completion
 
+from applications.glue_dispensing_application.glue_process import flight_recorder
 from applications.glue_dispensing_application.glue_process.state_machine.ExecutableStateMachine import \
     ExecutableStateMachine, StateRegistry, State, ExecutableStateMachineBuilder
 from applications.glue_dispensing_application.glue_process.ExecutionContext import ExecutionContext
@@ -48,9 +47,10 @@ ENABLE_GLUE_DISPENSING_LOGGING = True
 glue_dispensing_logger = setup_logger("Glue Dispensing") if ENABLE_GLUE_DISPENSING_LOGGING else None
 glue_dispensing_logger_context = LoggerContext(enabled=ENABLE_GLUE_DISPENSING_LOGGING, logger=glue_dispensing_logger)
 
-# debug configuration
-ENABLE_CONTEXT_DEBUG = True
+# debug configuration - state transitions go to a binary ring file, see flight_recorder.py
+ENABLE_FLIGHT_RECORDER = True
 DEBUG_DIR = os.path.join(os.path.dirname(__file__), "debug")
+FLIGHT_RECORDER_PATH = os.path.join(DEBUG_DIR, "glue_process.flightrec")
 
 class GlueDispensingOperation(IOperation):
     def __init__(self, robot_service, glue_service, glue_application=None):
@@ -71,51 +71,19 @@ class GlueDispensingOperation(IOperation):
         self.execution_context = ExecutionContext()
         self.glue_process_state_machine = self.get_state_machine()
 
-        # Create debug directory if it doesn't exist
-        if ENABLE_CONTEXT_DEBUG:
-            os.makedirs(DEBUG_DIR, exist_ok=True)
-
-    def _write_context_debug(self, state_name: str):
-        """
-        Write execution context to debug file after state execution.
-
-        Args:
-            state_name: Name of the state that just completed
-        """
-        if not ENABLE_CONTEXT_DEBUG:
+        self.flight_recorder = None
+        if ENABLE_FLIGHT_RECORDER:
+            try:
+                self.flight_recorder = flight_recorder.FlightRecorder(
+                    FLIGHT_RECORDER_PATH, {state.value: state.name for state in GlueProcessState})
+            except Exception as e:
+                log_error_message(glue_dispensing_logger_context, message=f"Flight recorder disabled: {e}")
+
+    def _record_transition(self, state: GlueProcessState, event: int):
+        """Record a state ENTER/EXIT in the flight recorder (non-blocking)."""
+        if self.flight_recorder is None:
             return
-
-        try:
-            # Create debug directory if it doesn't exist
-            os.makedirs(DEBUG_DIR, exist_ok=True)
-
-            # Generate timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-
-            # Get context as dict
-            context_dict = self.execution_context.to_debug_dict()
-
-            # Add metadata
-            debug_data = {
-                "timestamp": timestamp,
-                "state": state_name,
-                "context": context_dict
-            }
-
-            # Generate filename
-            filename = f"{timestamp}_{state_name}.json"
-            filepath = os.path.join(DEBUG_DIR, filename)
-
-            # Write to file
-            with open(filepath, 'w') as f:
-                json.dump(debug_data, f, indent=2, default=str)
-
-
-        except Exception as e:
-            log_error_message(
-                glue_dispensing_logger_context,
-                message=f"Failed to write debug context: {e}"
-            )
+        self.flight_recorder.record(state.value, event, self.execution_context.to_flight_digest())
 
     def setup_execution_context(self, paths, spray_on):
         self.execution_context.reset()
@@ -287,8 +255,8 @@ class GlueDispensingOperation(IOperation):
             registry.register_state(State(
                 state=state_enum,
                 handler=handler,
-                on_enter=lambda ctx, s=state_enum: self._write_context_debug(f"{s.name}_ENTER"),
-                on_exit=lambda ctx, s=state_enum: self._write_context_debug(f"{s.name}_EXIT")
+                on_enter=lambda ctx, s=state_enum: self._record_transition(s, flight_recorder.EVENT_ENTER),
+                on_exit=lambda ctx, s=state_enum: self._record_transition(s, flight_recorder.EVENT_EXIT)
             ))
 
         # Build the executable state machine
@@ -0,0 +1,111 @@
+import numpy as np
+
+
+class PathProgressTracker:
+    """
+    Tracks how far the robot has travelled along a glue path, as arc length.
+
+    Segment vectors, squared lengths and cumulative arc length are computed once. Each update
+    projects the TCP position onto a bounded window of segments starting at the current one, so
+    tracking costs O(window) per call no matter how many points the (densified) path has. Only
+    when the robot is not within ``max_deviation`` of any segment in the window - e.g. it cut a
+    corner or the loop missed a stretch - is the rest of the path searched, resuming from the
+    earliest segment ahead within tolerance so closed paths do not jump to their end.
+
+    Progress never moves backwards. ``passed_count`` mirrors the old checkpoint counter: the
+    number of leading path points the robot has passed (point i counts as passed once the
+    progress is within ``checkpoint_tolerance`` of its arc length).
+    """
+
+    def __init__(self, path, checkpoint_tolerance=1.0, max_deviation=1.0, window=32):
+        points = np.asarray([point[:3] for point in path], dtype=np.float64).reshape(-1, 3)
+        if len(points) == 0:
+            raise ValueError("PathProgressTracker needs at least one path point")
+
+        self.points = points
+        self.segments = np.diff(points, axis=0)
+        self.squared_lengths = np.einsum("ij,ij->i", self.segments, self.segments)
+        self.lengths = np.sqrt(self.squared_lengths)
+        self.arc_lengths = np.concatenate(([0.0], np.cumsum(self.lengths)))
+
+        self.checkpoint_tolerance = checkpoint_tolerance
+        self.max_deviation = max_deviation
+        self.window = max(1, int(window))
+
+        self.segment_index = 0
+        self.progress = 0.0
+        self.passed_count = 0
+        self.deviation = None
+        self.full_searches = 0
+
+    @property
+    def total_length(self):
+        return float(self.arc_lengths[-1])
+
+    @property
+    def remaining_length(self):
+        return self.total_length - self.progress
+
+    @property
+    def fraction(self):
+        total = self.total_length
+        return self.progress / total if total > 0 else 1.0
+
+    def _project(self, position, start, stop):
+        """Closest point on segments [start, stop): (squared distances, segment parameters t)."""
+        origins = self.points[start:stop]
+        segments = self.segments[start:stop]
+        squared_lengths = self.squared_lengths[start:stop]
+        relative = position - origins
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t = np.einsum("ij,ij->i", relative, segments) / squared_lengths
+        t = np.clip(np.nan_to_num(t, nan=0.0), 0.0, 1.0)
+        offsets = relative - t[:, None] * segments
+        return np.einsum("ij,ij->i", offsets, offsets), t
+
+    def update(self, position):
+        """
+        Advance the tracker with a new TCP position.
+
+        Returns:
+            bool: True if the position was matched to the path
+        """
+        position = np.asarray(position, dtype=np.float64).ravel()[:3]
+        segment_count = len(self.segments)
+        if segment_count == 0:
+            distance = float(np.linalg.norm(position - self.points[0]))
+            self.deviation = distance
+            if distance <= self.max_deviation:
+                self.passed_count = 1
+                return True
+            return False
+
+        limit = self.max_deviation * self.max_deviation
+        start = self.segment_index
+        stop = min(start + self.window, segment_count)
+        squared_distances, t = self._project(position, start, stop)
+        best = int(np.argmin(squared_distances))
+
+        if squared_distances[best] > limit and stop < segment_count:
+            # Lost inside the window - take the earliest segment ahead that is close enough
+            self.full_searches += 1
+            squared_distances, t = self._project(position, start, segment_count)
+            close = np.flatnonzero(squared_distances <= limit)
+            if len(close):
+                first = int(close[0])
+                best = first + int(np.argmin(squared_distances[first:first + self.window]))
+            else:
+                best = int(np.argmin(squared_distances))
+
+        self.deviation = float(np.sqrt(squared_distances[best]))
+        if squared_distances[best] > limit:
+            return False
+
+        index = start + best
+        progress = self.arc_lengths[index] + t[best] * self.lengths[index]
+        if progress > self.progress:
+            self.progress = float(progress)
+            self.segment_index = index
+        self.passed_count = int(np.searchsorted(self.arc_lengths, self.progress + self.checkpoint_tolerance,
+                                                side="right"))
+        return True
@@ -5,7 +5,6 @@ from applications.glue_dispensing_application.glue_process.state_machine.GluePro
 from core.model.settings.RobotConfigKey import RobotSettingKey
 
 from modules.utils.custom_logging import log_debug_message, log_error_message
-from core.services.robot_service.impl.base_robot_service import CancellationToken
 
 HandlerResult = namedtuple(
     "HandlerResult",
@@ -22,7 +21,8 @@ HandlerResult = namedtuple(
 
 def handle_send_path_to_robot(context,logger_context):
     """
-    Sends path points to robot with immediate pause support using cancellation tokens.
+    Uploads the path to the robot in batches (RobotService.stream_trajectory), stopping at the
+    next batch boundary on pause/stop.
     Returns a HandlerResult describing success/failure and next FSM state.
     """
     path = context.current_path
@@ -35,46 +35,43 @@ def handle_send_path_to_robot(context,logger_context):
         message=f"Sending {len(path)} points to robot with pause support (path index {path_index})"
     )
 
-    # Create a cancellation token that monitors state machine
-    cancellation_token = CancellationToken()
-    
-    for i, point in enumerate(path, start_point_index):
-        # Check for pause/stop before each movement
+    def should_abort():
+        return context.state_machine.state in (GlueProcessState.PAUSED, GlueProcessState.STOPPED)
+
+    try:
+        # Points are uploaded in batches; pause/stop is checked before each batch
+        upload = context.robot_service.stream_trajectory(
+            path,
+            velocity=settings.get(RobotSettingKey.VELOCITY.value, 10),
+            acceleration=settings.get(RobotSettingKey.ACCELERATION.value, 30),
+            blend_radius=1,
+            should_abort=should_abort,
+        )
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        log_error_message(logger_context, message=f"Exception while sending path: {e}")
+        result = HandlerResult(False, False, GlueProcessState.ERROR, path_index, start_point_index, path, settings)
+        update_context_from_handler_result(context, result)
+        return result.next_state
+
+    i = start_point_index + upload.points_sent
+    if upload.aborted:
         if context.state_machine.state == GlueProcessState.PAUSED:
             context.save_progress(path_index, i)
             log_debug_message(logger_context, message=f"Paused before point {i}")
             result = HandlerResult(True, True, GlueProcessState.PAUSED, path_index, i, path, settings)
-            update_context_from_handler_result(context, result)
-            return result.next_state
-
-        if context.state_machine.state == GlueProcessState.STOPPED:
+        else:
             log_debug_message(logger_context, message=f"Stopped before point {i}")
             result = HandlerResult(True, False, GlueProcessState.STOPPED, path_index, i, path, settings)
-            update_context_from_handler_result(context, result)
-            return result.next_state
-        try:
-            # Send move command (non-blocking)
-            ret = context.robot_service.robot.move_liner(
-                position=point,
-                tool=context.robot_service.robot_config.robot_tool,
-                user=context.robot_service.robot_config.robot_user,
-                vel=settings.get(RobotSettingKey.VELOCITY.value, 10),
-                acc=settings.get(RobotSettingKey.ACCELERATION.value, 30),
-                blendR=1,
-            )
+        update_context_from_handler_result(context, result)
+        return result.next_state
 
-            if ret != 0:
-                log_error_message(logger_context, message=f"MoveL failed with code {ret} at point {i}")
-                result = HandlerResult(False, False, GlueProcessState.ERROR, path_index, i, path, settings)
-                update_context_from_handler_result(context, result)
-                return result.next_state
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            log_error_message(logger_context, message=f"Exception at point {i}: {e}")
-            result = HandlerResult(False, False, GlueProcessState.ERROR, path_index, i, path, settings)
-            update_context_from_handler_result(context, result)
-            return result.next_state
+    if not upload.success:
+        log_error_message(logger_context, message=f"Path upload failed with code {upload.error_code} at point {i}")
+        result = HandlerResult(False, False, GlueProcessState.ERROR, path_index, i, path, settings)
+        update_context_from_handler_result(context, result)
+        return result.next_state
 
     # All points completed successfully
     log_debug_message(logger_context, message="All points sent.")
@@ -34,6 +34,8 @@ def handle_start_pump_adjustment_thread(context,logger_context,should_adjust_pum
                 reach_end_threshold=float(context.current_settings.get(GlueSettingKey.REACH_END_THRESHOLD.value, 1.0)),
                 pump_ready_event=pump_ready_event,
                 start_point_index=context.current_point_index,
+                # Wake WAIT_FOR_PATH_COMPLETION as soon as the thread has its result
+                on_done=getattr(context.state_machine, "notify", None),
             )
             log_debug_message(logger_context, message="Pump adjustment thread started.")
         except Exception as e:
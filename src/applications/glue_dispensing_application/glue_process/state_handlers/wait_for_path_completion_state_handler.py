@@ -1,5 +1,5 @@
+import threading
 from collections import namedtuple
-import time
 from applications.glue_dispensing_application.glue_process.state_machine.GlueProcessState import GlueProcessState
 from modules.utils.custom_logging import log_debug_message, log_error_message
 
@@ -16,6 +16,17 @@ HandlerResult = namedtuple(
     ]
 )
 
+# Upper bound on a single wait; normally the pump thread or a pause/stop wakes the handler first
+WAIT_RECHECK_TIMEOUT = 1.0
+
+
+def _pump_thread_finished(pump_thread) -> bool:
+    done = getattr(pump_thread, "done", None)
+    if isinstance(done, threading.Event) and done.is_set():
+        return True
+    return not pump_thread.is_alive()
+
+
 def handle_wait_for_path_completion(context,logger_context) -> GlueProcessState:
     """
     Waits for the pump adjustment thread to finish.
@@ -35,9 +46,10 @@ def handle_wait_for_path_completion(context,logger_context) -> GlueProcessState:
 
     try:
         # Wait indefinitely for the pump thread to finish.
-        # You can add a soft timeout if you ever need to handle unexpected hangs.
-        while pump_thread.is_alive():
-            state = context.state_machine.state
+        # The pump thread and pause/stop transitions wake the wait, so there is no polling delay.
+        state_machine = context.state_machine
+        while not _pump_thread_finished(pump_thread):
+            state = state_machine.state
 
             if state == GlueProcessState.PAUSED:
                 log_debug_message(logger_context, message="[WAIT] Paused while waiting for pump thread - waiting for thread to finish and capture progress")
@@ -65,7 +77,11 @@ def handle_wait_for_path_completion(context,logger_context) -> GlueProcessState:
                 result = HandlerResult(True, False, GlueProcessState.STOPPED, path_index, context.current_point_index, path, settings)
                 update_context_from_handler_result(context, result)
                 return result.next_state
-            time.sleep(0.1)
+            state_machine.wait_until(
+                lambda: _pump_thread_finished(pump_thread)
+                        or state_machine.state in (GlueProcessState.PAUSED, GlueProcessState.STOPPED),
+                timeout=WAIT_RECHECK_TIMEOUT,
+            )
 
         # Get the pump thread result to capture final progress
         final_point_index = len(path) - 1  # Default to last point
@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import Dict, Callable, TypeVar, Generic, Optional
+from typing import Dict, Callable, TypeVar, Generic, Optional, Iterable
+import threading
 import time
 
 from applications.glue_dispensing_application.glue_process.ExecutionContext import Context
@@ -79,6 +80,10 @@ class ExecutableStateMachine(Generic[TState]):
         self.context: Context = context or Context()
         self._stop_requested = False
         self.state_topic = state_topic or "STATE MACHINE"
+        # Woken on every state change, stop request and notify() so waiters react immediately
+        self._condition = threading.Condition()
+        self._state_version = 0
+        self._transition_listeners = []
 
         log_if_enabled(
             ENABLE_STATE_MACHINE_LOGGING,
@@ -107,8 +112,26 @@ class ExecutableStateMachine(Generic[TState]):
         self.current_state = to_state
         self._call_handler(to_state, "on_enter")
         self.on_transition_success(to_state)
+        self._signal_transition(old_state, to_state)
         return True
 
+    def _signal_transition(self, old_state: TState, new_state: TState):
+        """Wake waiters and call transition listeners"""
+        with self._condition:
+            if new_state != old_state:
+                self._state_version += 1
+            self._condition.notify_all()
+        for listener in list(self._transition_listeners):
+            try:
+                listener(new_state)
+            except Exception as e:
+                log_if_enabled(
+                    ENABLE_STATE_MACHINE_LOGGING,
+                    state_machine_logger,
+                    LoggingLevel.ERROR,
+                    f"Error in transition listener for {new_state}: {e}"
+                )
+
     def _call_handler(self, state: TState, handler_type: str):
         """Call a handler if defined, passing context"""
         state_obj = self.state_registry.get(state)
@@ -139,19 +162,66 @@ class ExecutableStateMachine(Generic[TState]):
             f"Invalid transition attempt: {self.current_state} -> {attempted_state}"
         )
 
+    # ------------------ Waiting ------------------
+    def add_transition_listener(self, listener: Callable[[TState], None]):
+        """Call listener(new_state) after every successful transition, on the transitioning thread"""
+        self._transition_listeners.append(listener)
+
+    def remove_transition_listener(self, listener: Callable[[TState], None]):
+        if listener in self._transition_listeners:
+            self._transition_listeners.remove(listener)
+
+    def notify(self):
+        """Wake every wait_until() caller so it re-checks its condition (e.g. a worker thread finished)"""
+        with self._condition:
+            self._condition.notify_all()
+
+    def wait_until(self, predicate: Callable[[], bool], timeout: Optional[float] = None) -> bool:
+        """
+        Block until predicate() is true, re-checking it on every transition, stop request and notify().
+
+        Returns:
+            bool: the final value of predicate() - False means the timeout expired
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while not predicate():
+                if deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+
+    def wait_for_states(self, states: Iterable[TState], timeout: Optional[float] = None) -> bool:
+        """Block until the machine is in one of states"""
+        states = set(states)
+        return self.wait_until(lambda: self.current_state in states, timeout)
+
     def start_execution(self, delay: float = 0.1):
+        """
+        Run state handlers until stop_execution() is called.
+
+        After a handler that changed the state the next one runs immediately. Otherwise the loop
+        waits up to delay seconds for a transition (e.g. a pause from another thread) or a stop.
+        """
         self._stop_requested = False
         while not self._stop_requested:
+            version = self._state_version
             state_obj = self.state_registry.get(self.current_state)
             if state_obj:
                 next_state = state_obj.execute(self.context)  # <-- get next state from handler
                 if next_state:
                     self.transition(next_state)  # <-- automatic transition
-            time.sleep(delay)
+            self.wait_until(lambda: self._stop_requested or self._state_version != version, timeout=delay)
 
     def stop_execution(self):
         """Stop the execution loop"""
-        self._stop_requested = True
+        with self._condition:
+            self._stop_requested = True
+            self._condition.notify_all()
 
 
 from typing import Optional, Dict, Set
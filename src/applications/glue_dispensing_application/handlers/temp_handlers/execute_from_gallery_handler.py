@@ -101,8 +101,9 @@ def execute_from_gallery(application,workpiece,z_offset_for_calibration_pattern)
     # Two-stage interpolation with ADAPTIVE density based on segment length
     # Use adaptive spacing and spline density multiplier from segment settings
     # Long segments get more points, short segments get fewer points
-    linear_interpolated = []
-    spline_interpolated = []
+    adaptive_spacings = []
+    spline_multipliers = []
+    smoothing_lambdas = []
 
     for i, path in enumerate(points_only):
         # Get settings for this path
@@ -112,12 +113,18 @@ def execute_from_gallery(application,workpiece,z_offset_for_calibration_pattern)
         smoothing_lambda = float(settings.get(GlueSettingKey.SMOOTHING_LAMBDA.value, "0.0"))
 
         print(f"Path {i+1}: Adaptive spacing = {adaptive_spacing}mm, Spline density = {spline_multiplier}x, Smoothing λ = {smoothing_lambda}")
-        linear, spline = combined_interpolation.interpolate_path_two_stage(
-            path,
-            adaptive_spacing_mm=adaptive_spacing,
-            spline_density_multiplier=spline_multiplier,
-            smoothing_lambda=smoothing_lambda
-        )
+        adaptive_spacings.append(adaptive_spacing)
+        spline_multipliers.append(spline_multiplier)
+        smoothing_lambdas.append(smoothing_lambda)
+
+    # All spray patterns of the workpiece are interpolated in one batched call
+    linear_interpolated = []
+    spline_interpolated = []
+    for linear, spline in combined_interpolation.interpolate_paths_two_stage(
+            points_only,
+            adaptive_spacing_mm=adaptive_spacings,
+            spline_density_multiplier=spline_multipliers,
+            smoothing_lambda=smoothing_lambdas):
         linear_interpolated.extend(linear)  # Combine all paths into one
         spline_interpolated.extend(spline)  # Combine all paths into one
 
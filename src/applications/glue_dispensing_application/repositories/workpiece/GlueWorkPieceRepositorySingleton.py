@@ -4,6 +4,10 @@ from applications.glue_dispensing_application.model.workpiece.GlueWorkpiece impo
 from modules.shared.GlueWorkpieceField import GlueWorkpieceField
 
 from core.application.ApplicationContext import get_workpiece_storage_path
+
+# Store large contour arrays in an .npz sidecar next to each workpiece JSON file
+USE_BINARY_SIDECAR = True
+
 class GlueWorkPieceRepositorySingleton:
     """
        Singleton class responsible for managing a single instance of the Workpiece repository.
@@ -63,7 +67,8 @@ class GlueWorkPieceRepositorySingleton:
                       GlueWorkpieceField.OFFSET, GlueWorkpieceField.HEIGHT, GlueWorkpieceField.SPRAY_PATTERN,
                       GlueWorkpieceField.CONTOUR_AREA,
                       GlueWorkpieceField.NOZZLES]
-            cls._instance = GlueWorkpieceJsonRepository(storage_dir, fields, GlueWorkpiece)
+            cls._instance = GlueWorkpieceJsonRepository(storage_dir, fields, GlueWorkpiece,
+                                                        binary_sidecar=USE_BINARY_SIDECAR)
             
             print(f"GlueWorkPieceRepository initialized with storage: {storage_dir}")
         return cls._instance
\ No newline at end of file
@@ -4,6 +4,12 @@ Description:
     Workpieces are stored in a structured directory format based on date and timestamp,
     enabling easy versioning and tracking of saved workpieces.
 
+    A persistent index (see workpiece_index.py) maps workpiece IDs to their files, so the
+    storage tree is not parsed on startup or on every save/delete. Listing goes through the
+    index (``list_summaries``); workpiece bodies are loaded on demand and only the
+    ``cache_size`` most recently used ones stay in memory. Writes are atomic (temporary
+    file + rename).
+
     It expects workpieces classes to inherit from JsonSerializable to enable proper
     (de)serialization.
 """
@@ -13,8 +19,13 @@ import datetime
 import json
 import os
 import shutil
-from typing import Type
+import threading
+from collections import OrderedDict
 
+from applications.glue_dispensing_application.repositories.workpiece.workpiece_index import WorkpieceIndex, \
+    WorkpieceIndexEntry, atomic_write_json, contour_bbox, find_thumbnail, load_sidecar, merge_arrays, save_sidecar, \
+    split_large_arrays
+from modules.contour_matching.matching.workpiece_descriptor_index import get_default_index
 from modules.shared.core.interfaces.JsonSerializable import JsonSerializable
 
 
@@ -27,20 +38,29 @@ class GlueWorkpieceJsonRepository:
           TIMESTAMP_FORMAT (str): Format for unique timestamped folders.
           FOLDER_NAME (str): Subdirectory name where workpieces are stored.
           WORKPIECE_FILE_SUFFIX (str): Suffix used in JSON workpieces file names.
+          INDEX_FILE_NAME (str): Name of the persistent index file in the storage directory.
+          SIDECAR_SUFFIX (str): Suffix of the binary array sidecar next to a workpiece file.
+          SIDECAR_MIN_POINTS (int): Contours with at least this many points go to the sidecar.
       """
     DATE_FORMAT = "%Y-%m-%d"
     TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S-%f"
     FOLDER_NAME = "workpieces"
     WORKPIECE_FILE_SUFFIX = "_workpiece.json"  # Ensure the files have this suffix
+    INDEX_FILE_NAME = "workpiece_index.json"
+    SIDECAR_SUFFIX = "_arrays.npz"
+    SIDECAR_MIN_POINTS = 256
+    DEFAULT_CACHE_SIZE = 64
 
-    def __init__(self, directory, fields, dataClass):
+    def __init__(self, directory, fields, dataClass, cache_size=DEFAULT_CACHE_SIZE, binary_sidecar=False):
         """
-              Initializes the repository and attempts to load existing data.
+              Initializes the repository and brings the index up to date with the storage tree.
 
               Args:
-                  baseDir (str): Root directory where the workpieces folder exists.
+                  directory (str): Directory where the workpieces are stored.
                   fields (list): Expected fields for workpieces validation or display.
                   dataClass (Type): Class type implementing JsonSerializable.
+                  cache_size (int): Number of workpiece bodies kept in the LRU cache.
+                  binary_sidecar (bool): Store large contour arrays in an .npz sidecar.
 
               Raises:
                   TypeError: If `dataClass` is not a subclass of JsonSerializable.
@@ -52,49 +72,168 @@ class GlueWorkpieceJsonRepository:
         self.directory = directory
         self.dataClass = dataClass
         self.fields = fields
-        # check if dataClass is JsonSerializable
+        self.cache_size = cache_size
+        self.binary_sidecar = binary_sidecar
+        self._lock = threading.RLock()
+        self._cache = OrderedDict()  # workpiece ID -> loaded workpiece (LRU order)
 
-        self.data = self.loadData()
+        # Shape descriptors used by contour matching, kept in sync on save/delete
+        self.descriptor_index = get_default_index()
         self.visited_dirs = set()  # Track visited directories to avoid repetition
+        self.index = WorkpieceIndex(os.path.join(directory, self.INDEX_FILE_NAME))
         if not os.path.exists(self.directory):
             print(f"Directory {self.directory} does not exist.")
             raise FileNotFoundError(f"Directory {self.directory} not found.")
+        self.index.load()
+        self.rebuild_index_if_drifted()
+
+    # --- Index maintenance ---
+    def _relative(self, path):
+        return os.path.relpath(path, self.directory) if path else None
+
+    def _absolute(self, path):
+        return os.path.join(self.directory, path) if path else None
+
+    def _scan_files(self):
+        """{relative path: (mtime, size)} of every workpiece JSON file, without parsing them."""
+        files = {}
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(self.WORKPIECE_FILE_SUFFIX):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    files[self._relative(path)] = (stat.st_mtime, stat.st_size)
+        return files
+
+    def rebuild_index_if_drifted(self):
+        """
+        Compare the index with the storage tree and re-index what drifted: files added,
+        changed or removed outside the repository. Only drifted files are parsed.
+
+        Returns:
+            int: Number of index entries that were added, refreshed or dropped.
+        """
+        with self._lock:
+            files = self._scan_files()
+            indexed = {entry.path: entry for entry in self.index.entries.values()}
+            stale = [entry for path, entry in indexed.items() if path not in files]
+            changed = [path for path, stat in files.items()
+                       if path not in indexed or (indexed[path].mtime, indexed[path].size) != stat]
+            if not stale and not changed:
+                return 0
+
+            print(f"Workpiece index drifted ({len(changed)} new/changed, {len(stale)} removed), re-indexing")
+            for entry in stale:
+                self.index.remove(entry.workpiece_id)
+                self._forget(entry.workpiece_id)
+            for path in sorted(changed):
+                try:
+                    data = self._read_json(self._absolute(path))
+                except Exception as e:
+                    print(f"Error indexing workpiece file {path}: {e}")
+                    continue
+                workpiece_id = data.get("workpieceId") or data.get("id")
+                if workpiece_id is None:
+                    print(f"Workpiece file {path} has no ID, skipping")
+                    continue
+                previous = self.index.get(workpiece_id)
+                if previous is not None and previous.path != path:
+                    print(f"Duplicate workpiece ID '{workpiece_id}' in {previous.path} and {path}; using {path}")
+                self.index.upsert(self._make_entry(str(workpiece_id), self._absolute(path), data))
+                self._forget(str(workpiece_id))
+            self.index.save()
+            return len(stale) + len(changed)
+
+    def _make_entry(self, workpiece_id, file_path, data, sidecar_path=None):
+        stat = os.stat(file_path)
+        folder = os.path.dirname(file_path)
+        if sidecar_path is None:
+            candidate = file_path[:-len(self.WORKPIECE_FILE_SUFFIX)] + self.SIDECAR_SUFFIX
+            sidecar_path = candidate if os.path.exists(candidate) else None
+        contour = data.get("contour")
+        if isinstance(contour, dict):
+            contour = contour.get("contour")
+        return WorkpieceIndexEntry(
+            workpiece_id=workpiece_id,
+            path=self._relative(file_path),
+            mtime=stat.st_mtime,
+            size=stat.st_size,
+            name=data.get("name"),
+            bbox=contour_bbox(contour) if not isinstance(contour, dict) else None,
+            thumbnail=self._relative(find_thumbnail(folder)),
+            sidecar=self._relative(sidecar_path),
+        )
+
+    def list_summaries(self):
+        """Index entries (ID, name, bounding box, thumbnail, ...) of every workpiece, without loading bodies."""
+        with self._lock:
+            return list(self.index.entries.values())
+
+    # --- Loading ---
+    def _read_json(self, file_path):
+        with open(file_path, 'r') as f:
+            return json.load(f)
+
+    def _load_body(self, entry):
+        data = self._read_json(self._absolute(entry.path))
+        if entry.sidecar:
+            merge_arrays(data, load_sidecar(self._absolute(entry.sidecar)))
+        return self.dataClass.deserialize(data)
+
+    def _remember(self, workpiece_id, workpiece):
+        self._cache[workpiece_id] = workpiece
+        self._cache.move_to_end(workpiece_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _forget(self, workpiece_id):
+        self._cache.pop(str(workpiece_id), None)
+
+    @property
+    def data(self):
+        """All workpieces, loaded through the bounded cache on every access (see loadData)."""
+        return self.loadData()
 
     def loadData(self):
         """
-        Recursively iterates over all directories inside the base directory, deserializes all JSON files,
-        and returns a list of objects of the provided class type (e.g., Workpiece).
+        Deserializes every indexed workpiece and returns a list of objects of the provided
+        class type (e.g., Workpiece). Bodies are fetched through the LRU cache; the list is
+        not kept, so only the cached bodies stay in memory once the caller drops it.
         """
         objects = []
+        for summary in self.list_summaries():
+            workpiece = self.get_workpiece_by_id(summary.workpiece_id)
+            if workpiece is not None:
+                objects.append(workpiece)
+        return objects
 
-        # Check if the base directory exists
-        if not os.path.exists(self.directory):
-            print(f"Directory {self.directory} does not exist.")
-            return objects
-        else:
-            # print(f"Directory exists: {self.directory}")
-            pass
-        # print(f"Directory: {self.directory}")
-        # Walk through all subdirectories and files
-        for root, _, files in os.walk(self.directory):
-            # print(f"Root: {root}")
-            for file in files:
-                # print(f"File: {file}")
-                file_path = os.path.join(root, file)
-                # print(f"File Path: {file_path}")  # Debugging: check the full file path
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)  # Load JSON data
-                        print(f"Loaded Data: {data}")  # Debugging: Show the loaded data
-                        obj = self.dataClass.deserialize(data)  # Deserialize into the appropriate object
-                        # print(f"Deserialized Object: {obj}")  # Debugging: Show the deserialized object
-                        objects.append(obj)
-                except Exception as e:
-                    print(f"Error loading object from {file_path}: {e}")
-                    raise Exception(f"Error loading object: {e}")
+    def get_workpiece_by_id(self, workpieceId):
+        """
+        Retrieves a workpiece by its ID.
 
-        return objects
+        Args:
+            workpieceId (str): The ID of the workpiece to retrieve.
 
+        Returns:
+            JsonSerializable: The workpiece object if found, else None.
+        """
+        workpiece_id = str(workpieceId)
+        with self._lock:
+            if workpiece_id in self._cache:
+                self._cache.move_to_end(workpiece_id)
+                return self._cache[workpiece_id]
+            entry = self.index.get(workpiece_id)
+            if entry is None:
+                return None
+            try:
+                workpiece = self._load_body(entry)
+            except Exception as e:
+                print(f"Error loading object from {entry.path}: {e}")
+                return None
+            self._remember(workpiece_id, workpiece)
+            return workpiece
+
+    # --- Writing ---
     def save_workpiece(self, workpiece):
         """
         Saves a workpiece object as a JSON file. If a workpiece with the same ID exists,
@@ -108,68 +247,46 @@ class GlueWorkpieceJsonRepository:
             return False, "Workpiece has no 'workpieceId' attribute."
 
         print(f"WorkpieceJsonRepository.saveWorkpiece called with ID: {workpiece.workpieceId}")
-
-        # Ensure data list exists
-        if self.data is None:
-            self.data = []
-
         workpiece_id = str(workpiece.workpieceId)
 
-        # Prepare serialized data
-        serialized_data = json.dumps(self.dataClass.serialize(copy.deepcopy(workpiece)), indent=4)
-
-        # Try to find existing workpiece in memory and on disk
-        existing_index = None
-        for i, wp in enumerate(self.data):
-            if hasattr(wp, "workpieceId") and str(wp.workpieceId) == workpiece_id:
-                existing_index = i
-                break
-
-        # If exists on disk, find its file and overwrite
-        existing_file_path = None
-        if existing_index is not None:
-            for root, _, files in os.walk(self.directory):
-                for file in files:
-                    if file.endswith(self.WORKPIECE_FILE_SUFFIX):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, "r") as f:
-                                data = json.load(f)
-                            file_workpiece_id = data.get("workpieceId") or data.get("id")
-                            if str(file_workpiece_id) == workpiece_id:
-                                existing_file_path = file_path
-                                break
-                        except Exception:
-                            continue
-                if existing_file_path:
-                    break
-
         try:
-            if existing_file_path:
-                # Overwrite existing file
-                with open(existing_file_path, "w") as f:
-                    f.write(serialized_data)
-                # Update in-memory object
-                if existing_index is not None:
-                    self.data[existing_index] = workpiece
-                return True, "Workpiece updated successfully"
-            else:
-                # Create new timestamped directory and save as new file
-                today_date = datetime.datetime.now().strftime(self.DATE_FORMAT)
-                timestamp = datetime.datetime.now().strftime(self.TIMESTAMP_FORMAT)
-                date_dir = os.path.join(self.directory, today_date)
-                timestamp_dir = os.path.join(date_dir, timestamp)
-                os.makedirs(timestamp_dir, exist_ok=True)
-                file_path = os.path.join(timestamp_dir, f"{timestamp}{self.WORKPIECE_FILE_SUFFIX}")
-                with open(file_path, "w") as file:
-                    file.write(serialized_data)
-                # Append or replace in-memory list
-                print(f"Workpiece saved to new file: {file_path}")
-                if existing_index is not None:
-                    self.data[existing_index] = workpiece
+            with self._lock:
+                serialized = self.dataClass.serialize(copy.deepcopy(workpiece))
+                arrays = {}
+                if self.binary_sidecar:
+                    serialized_json, arrays = split_large_arrays(serialized, self.SIDECAR_MIN_POINTS)
                 else:
-                    self.data.append(workpiece)
-                return True, "Workpiece saved successfully"
+                    serialized_json = serialized
+
+                existing = self.index.get(workpiece_id)
+                if existing is not None:
+                    file_path = self._absolute(existing.path)
+                else:
+                    # Create new timestamped directory and save as new file
+                    today_date = datetime.datetime.now().strftime(self.DATE_FORMAT)
+                    timestamp = datetime.datetime.now().strftime(self.TIMESTAMP_FORMAT)
+                    timestamp_dir = os.path.join(self.directory, today_date, timestamp)
+                    os.makedirs(timestamp_dir, exist_ok=True)
+                    file_path = os.path.join(timestamp_dir, f"{timestamp}{self.WORKPIECE_FILE_SUFFIX}")
+
+                sidecar_path = file_path[:-len(self.WORKPIECE_FILE_SUFFIX)] + self.SIDECAR_SUFFIX
+                if arrays:
+                    save_sidecar(sidecar_path, arrays)
+                atomic_write_json(file_path, serialized_json)
+                if not arrays and os.path.exists(sidecar_path):
+                    os.remove(sidecar_path)
+
+                self.index.upsert(self._make_entry(workpiece_id, file_path, serialized,
+                                                   sidecar_path if arrays else None))
+                self.index.save()
+
+                self._remember(workpiece_id, workpiece)
+                self.descriptor_index.upsert(workpiece)
+
+            if existing is not None:
+                return True, "Workpiece updated successfully"
+            print(f"Workpiece saved to new file: {file_path}")
+            return True, "Workpiece saved successfully"
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -184,69 +301,40 @@ class GlueWorkpieceJsonRepository:
 
         Returns:
             tuple: (bool, str) where bool indicates success, and str contains a message.
-
-        Raises:
-            Exception: If workpiece not found or deletion fails.
         """
         print(f"WorkpieceJsonRepository.deleteWorkpiece called with ID: {workpieceId}")
-        print(f"Repository data length: {len(self.data) if self.data else 'None'}")
         try:
-            # Find the workpiece in the data list
-            workpiece_to_delete = None
-            workpiece_index = None
-
-            for i, workpiece in enumerate(self.data):
-                if hasattr(workpiece, 'workpieceId') and str(workpiece.workpieceId) == str(workpieceId):
-                    workpiece_to_delete = workpiece
-                    workpiece_index = i
-                    print(f"Workpiece found in memory: {workpiece}")
-                    break
-
-            if workpiece_to_delete is None:
-                return False, f"Workpiece with ID '{workpieceId}' not found."
-
-            # Find and delete the corresponding file/directory on filesystem
-            file_deleted = False
-            for root, dirs, files in os.walk(self.directory):
-                for file in files:
-                    if file.endswith(self.WORKPIECE_FILE_SUFFIX):
-                        file_path = os.path.join(root, file)
-                        try:
-                            # Load the file to check if it contains our workpiece
-                            with open(file_path, 'r') as f:
-                                data = json.load(f)
-                                # Check if this file contains the workpiece we want to delete
-                                file_workpiece_id = data.get('workpieceId') or data.get('id')
-                                if str(file_workpiece_id) == str(workpieceId):
-                                    # Delete the entire timestamp directory (contains the workpiece file)
-                                    parent_dir = os.path.dirname(file_path)
-                                    shutil.rmtree(parent_dir)
-                                    print(f"Deleted workpiece directory: {parent_dir}")
-
-                                    # Check if the date directory is also empty and delete it
-                                    try:
-                                        date_dir = os.path.dirname(parent_dir)
-                                        if not os.listdir(date_dir):
-                                            os.rmdir(date_dir)
-                                            print(f"Deleted empty date directory: {date_dir}")
-                                    except OSError:
-                                        # Directory not empty or other issues, that's fine
-                                        pass
-
-                                    file_deleted = True
-                                    break
-                        except Exception as e:
-                            print(f"Error checking file {file_path}: {e}")
-                            continue
-
-                if file_deleted:
-                    break
-
-            if not file_deleted:
-                return False, f"Workpiece file for ID '{workpieceId}' not found on filesystem."
-
-            # Remove from in-memory data
-            self.data.pop(workpiece_index)
+            with self._lock:
+                entry = self.index.get(workpieceId)
+                if entry is None:
+                    return False, f"Workpiece with ID '{workpieceId}' not found."
+
+                file_path = self._absolute(entry.path)
+                if not os.path.exists(file_path):
+                    self.index.remove(workpieceId)
+                    self.index.save()
+                    self._forget(workpieceId)
+                    return False, f"Workpiece file for ID '{workpieceId}' not found on filesystem."
+
+                # Delete the entire timestamp directory (contains the workpiece file)
+                parent_dir = os.path.dirname(file_path)
+                shutil.rmtree(parent_dir)
+                print(f"Deleted workpiece directory: {parent_dir}")
+
+                # Check if the date directory is also empty and delete it
+                try:
+                    date_dir = os.path.dirname(parent_dir)
+                    if not os.listdir(date_dir):
+                        os.rmdir(date_dir)
+                        print(f"Deleted empty date directory: {date_dir}")
+                except OSError:
+                    # Directory not empty or other issues, that's fine
+                    pass
+
+                self.index.remove(workpieceId)
+                self.index.save()
+                self._forget(workpieceId)
+                self.descriptor_index.remove(workpieceId)
 
             return True, f"Workpiece '{workpieceId}' deleted successfully."
 
@@ -254,17 +342,5 @@ class GlueWorkpieceJsonRepository:
             print(f"Error deleting workpiece {workpieceId}: {e}")
             return False, f"Error deleting workpiece: {str(e)}"
 
-    def get_workpiece_by_id(self, workpieceId):
-        """
-        Retrieves a workpiece by its ID.
-
-        Args:
-            workpieceId (str): The ID of the workpiece to retrieve.
-
-        Returns:
-            JsonSerializable: The workpiece object if found, else None.
-        """
-        for workpiece in self.data:
-            if hasattr(workpiece, 'workpieceId') and str(workpiece.workpieceId) == str(workpieceId):
-                return workpiece
-        return None
+    # BaseWorkpieceService naming
+    delete_workpiece_by_id = deleteWorkpiece
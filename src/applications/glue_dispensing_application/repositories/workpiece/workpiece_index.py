@@ -0,0 +1,201 @@
+"""
+Description:
+    Persistent index and file helpers for the workpiece JSON repository.
+
+    The index maps each workpiece ID to its JSON file (path relative to the repository
+    directory, mtime, size) plus the summary fields a library view needs without parsing the
+    workpiece body: name, bounding box and thumbnail path. It is stored as one JSON file in
+    the repository directory and rewritten atomically on every change.
+
+    Large contour arrays can be moved out of the JSON into a compact ``.npz`` sidecar next to
+    it; the JSON keeps a ``{"$npz": key}`` reference in their place.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+INDEX_VERSION = 1
+SIDECAR_REF = "$npz"
+THUMBNAIL_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+# --- Atomic writes ---
+def atomic_write(path, write_fn, mode="w"):
+    """
+    Write a file through a temporary file in the same directory and rename it into place,
+    so readers see either the old or the new content, never a partial file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=os.path.basename(path))
+    try:
+        with os.fdopen(fd, mode) as f:
+            write_fn(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def atomic_write_json(path, data, indent=4):
+    atomic_write(path, lambda f: json.dump(data, f, indent=indent))
+
+
+# --- Binary sidecar ---
+def split_large_arrays(data, min_points):
+    """
+    Replace every ``contour`` list with at least min_points points by a sidecar reference.
+
+    Returns:
+        tuple: (data with references, {key: float64 array}). The input is not modified.
+    """
+    arrays = {}
+
+    def visit(obj):
+        if isinstance(obj, dict):
+            result = {}
+            for key, value in obj.items():
+                if key == "contour" and isinstance(value, list) and len(value) >= min_points:
+                    try:
+                        array = np.asarray(value, dtype=np.float64)
+                    except (TypeError, ValueError):
+                        array = None
+                    if array is not None and array.dtype != object:
+                        ref = f"a{len(arrays)}"
+                        arrays[ref] = array
+                        result[key] = {SIDECAR_REF: ref}
+                        continue
+                result[key] = visit(value)
+            return result
+        if isinstance(obj, list):
+            return [visit(item) for item in obj]
+        return obj
+
+    return visit(data), arrays
+
+
+def merge_arrays(data, arrays):
+    """
+    Resolve sidecar references in place. Arrays inside ``{"contour": ..., ...}`` entries
+    stay NumPy arrays (deserializers convert those anyway); a bare top-level contour is
+    restored as the nested list it was saved from.
+    """
+    def resolve(value, keep_array):
+        if isinstance(value, dict) and SIDECAR_REF in value:
+            array = arrays[value[SIDECAR_REF]]
+            return array if keep_array else array.tolist()
+        return visit(value)
+
+    def visit(obj):
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                obj[key] = resolve(value, keep_array=key == "contour" and "settings" in obj) \
+                    if key == "contour" else visit(value)
+        elif isinstance(obj, list):
+            for i, item in enumerate(obj):
+                obj[i] = visit(item)
+        return obj
+
+    return visit(data)
+
+
+def save_sidecar(path, arrays):
+    atomic_write(path, lambda f: np.savez(f, **arrays), mode="wb")
+
+
+def load_sidecar(path):
+    with np.load(path) as npz:
+        return {key: npz[key] for key in npz.files}
+
+
+# --- Index ---
+@dataclass
+class WorkpieceIndexEntry:
+    workpiece_id: str
+    path: str  # JSON file, relative to the repository directory
+    mtime: float
+    size: int
+    name: Optional[str] = None
+    bbox: Optional[List[float]] = None  # [min_x, min_y, max_x, max_y] of the main contour
+    thumbnail: Optional[str] = None  # relative path of an image in the workpiece folder
+    sidecar: Optional[str] = None  # relative path of the .npz sidecar
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+@dataclass
+class WorkpieceIndex:
+    """ID -> WorkpieceIndexEntry, persisted as JSON at ``path``."""
+    path: str
+    entries: Dict[str, WorkpieceIndexEntry] = field(default_factory=dict)
+
+    def load(self) -> bool:
+        """Load the index file; returns False (empty index) if it is missing or unreadable."""
+        self.entries = {}
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                return False
+            self.entries = {str(k): WorkpieceIndexEntry.from_dict(v) for k, v in data.get("entries", {}).items()}
+            return True
+        except (OSError, ValueError, TypeError) as e:
+            if os.path.exists(self.path):
+                print(f"Workpiece index {self.path} is unreadable, it will be rebuilt: {e}")
+            return False
+
+    def save(self):
+        atomic_write_json(self.path, {
+            "version": INDEX_VERSION,
+            "entries": {k: v.to_dict() for k, v in self.entries.items()},
+        }, indent=None)
+
+    def get(self, workpiece_id) -> Optional[WorkpieceIndexEntry]:
+        return self.entries.get(str(workpiece_id))
+
+    def upsert(self, entry: WorkpieceIndexEntry):
+        self.entries[entry.workpiece_id] = entry
+
+    def remove(self, workpiece_id) -> Optional[WorkpieceIndexEntry]:
+        return self.entries.pop(str(workpiece_id), None)
+
+    def ids(self) -> List[str]:
+        return list(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def contour_bbox(contour) -> Optional[List[float]]:
+    """[min_x, min_y, max_x, max_y] of a contour array/list, or None if it has no points."""
+    try:
+        points = np.asarray(contour, dtype=np.float64).reshape(-1, 2)
+    except (TypeError, ValueError):
+        return None
+    if len(points) == 0:
+        return None
+    return [float(v) for v in (*points.min(axis=0), *points.max(axis=0))]
+
+
+def find_thumbnail(folder) -> Optional[str]:
+    """First image file in a workpiece folder, if any."""
+    try:
+        for name in sorted(os.listdir(folder)):
+            if name.lower().endswith(THUMBNAIL_EXTENSIONS):
+                return os.path.join(folder, name)
+    except OSError:
+        pass
+    return None
@@ -3,7 +3,7 @@ from typing import List, Optional
 from dataclasses import dataclass
 
 from applications.glue_dispensing_application.services.glueSprayService.generatorControl.timer import Timer
-from modules.modbusCommunication import ModbusController
+from modules.modbusCommunication import ModbusController, ModbusPriority, ScheduledModbusClient, STATE_READ_MAX_AGE
 from modules.utils.custom_logging import setup_logger, log_if_enabled, LoggingLevel
 
 ENABLE_LOGGING = True
@@ -76,7 +76,11 @@ class GeneratorControl(ModbusController):
         result = False
         try:
             client = self.getModbusClient(self.relaysId)
-            modbus_error = client.writeRegister(self.generator_relay_address, 0)
+            if isinstance(client, ScheduledModbusClient):
+                # Turning the generator off goes ahead of queued set-points and sensor polling
+                modbus_error = client.writeRegister(self.generator_relay_address, 0, priority=ModbusPriority.CRITICAL)
+            else:
+                modbus_error = client.writeRegister(self.generator_relay_address, 0)
 
             if modbus_error is not None:
                 log_if_enabled(enabled = ENABLE_LOGGING,
@@ -146,7 +150,7 @@ class GeneratorControl(ModbusController):
         generator_state = GeneratorState()
         
         try:
-            client = self.getModbusClient(self.relaysId)
+            client = self.getModbusClient(self.relaysId, read_max_age=STATE_READ_MAX_AGE)
             
             # Read generator on/off state from register 10
             state_value, modbus_error = client.read(10)
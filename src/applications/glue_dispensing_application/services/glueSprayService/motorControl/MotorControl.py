@@ -1,12 +1,14 @@
 import time
 
+from applications.glue_dispensing_application.services.glueSprayService.motorControl.errorCodes import \
+    ModbusExceptionType
 from applications.glue_dispensing_application.services.glueSprayService.motorControl.error_handler import \
     MotorControlErrorHandler
 from applications.glue_dispensing_application.services.glueSprayService.motorControl.health_check import HealthCheck
 from applications.glue_dispensing_application.services.glueSprayService.motorControl.motor_state import MotorState, \
     AllMotorsState
 from applications.glue_dispensing_application.services.glueSprayService.motorControl.utils import split_into_16bit
-from modules.modbusCommunication import ModbusController
+from modules.modbusCommunication import ModbusController, ModbusPriority, ScheduledModbusClient
 from modules.utils.custom_logging import LoggingLevel, log_if_enabled, setup_logger
 
 ENABLE_LOGGING = True
@@ -60,6 +62,15 @@ class MotorControl(ModbusController):
                               broadcast_to_ui=False)
                 return False
         
+        # Scheduled clients queue the set-point without blocking the pump loop; a newer
+        # set-point for the same motor replaces one that has not been sent yet
+        submit = getattr(self._adjust_client, "submitWriteRegisters", None)
+        if submit is not None:
+            high16, low16 = split_into_16bit(speed)
+            future = submit(motorAddress, [int(low16, 16), int(high16, 16)])
+            future.add_done_callback(lambda f: self._on_adjust_written(f, motorAddress, speed))
+            return True
+
         try:
             # high16, low16 = split_into_16bit(speed)
             # high16_int, low16_int = int(high16, 16), int(low16, 16)
@@ -96,6 +107,25 @@ class MotorControl(ModbusController):
             self._adjust_client = None
             return False
 
+    def _on_adjust_written(self, future, motorAddress, speed):
+        error = future.exception()
+        if error is None:
+            # A coalesced write completes with the newer set-point that replaced this one
+            low16, high16 = future.result()[:2]
+            log_if_enabled(enabled=ENABLE_LOGGING,
+                           logger=motor_control_logger,
+                           message=f"Motor {motorAddress} adjusted to speed {(int(high16) << 16) | int(low16)}",
+                           level=LoggingLevel.INFO,
+                           broadcast_to_ui=False)
+            return
+        modbus_error = getattr(error, "error", None) or ModbusExceptionType.from_exception(error)
+        MotorControlErrorHandler.handle_modbus_error(motorAddress, modbus_error, ENABLE_LOGGING, motor_control_logger)
+        log_if_enabled(enabled=ENABLE_LOGGING,
+                       logger=motor_control_logger,
+                       message=f"Failed to adjust motor {motorAddress} to {speed}: {error}",
+                       level=LoggingLevel.ERROR,
+                       broadcast_to_ui=False)
+
     def closeAdjustConnection(self):
         """Manually close the adjust motor speed connection."""
         if self._adjust_client is not None and self._adjust_client_connected:
@@ -221,7 +251,7 @@ class MotorControl(ModbusController):
             client = self.getModbusClient(self.motorsId)
 
             # Initial stop - check for modbus errors
-            modbus_error = client.writeRegisters(motorAddress, [0, 0])
+            modbus_error = self._write_stop(client, motorAddress)
             if modbus_error is not None:
                 MotorControlErrorHandler.handle_modbus_error(motorAddress, modbus_error,ENABLE_LOGGING,motor_control_logger)
                 client.close()
@@ -237,7 +267,7 @@ class MotorControl(ModbusController):
             time.sleep(reverse_time)  # Wait for the motor to stop complete reverse movement
             
             # Final stop - check for modbus errors
-            modbus_error = client.writeRegisters(motorAddress, [0, 0])
+            modbus_error = self._write_stop(client, motorAddress)
             if modbus_error is not None:
                 MotorControlErrorHandler.handle_modbus_error(motorAddress, modbus_error,ENABLE_LOGGING,motor_control_logger)
                 result = False
@@ -304,6 +334,12 @@ class MotorControl(ModbusController):
 
 
 
+    def _write_stop(self, client, motorAddress):
+        # Stop commands go ahead of queued set-points and sensor polling on the scheduler
+        if isinstance(client, ScheduledModbusClient):
+            return client.writeRegisters(motorAddress, [0, 0], priority=ModbusPriority.CRITICAL)
+        return client.writeRegisters(motorAddress, [0, 0])
+
     def _write_motor_register(self, client, motorAddress, low16_int, high16_int):
         modbus_errors = []
         motor_errors = []
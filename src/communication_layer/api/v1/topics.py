@@ -68,6 +68,8 @@ class VisionTopics(TopicCategory):
     # Vision service state
     SERVICE_STATE = "vision-service/state"
     LATEST_IMAGE = "vision-system/latest-image"
+    # {"frame_id": int, "timestamp": float, "frame": ndarray} - for frame presentation by frame_id
+    LATEST_FRAME = "vision-system/latest-frame"
     FPS = "vision-system/fps"
     CALIBRATION_IMAGE_CAPTURED = "vision-system/calibration-image-captured"
     # Camera and image processing
@@ -176,6 +178,9 @@ class GlueSprayServiceTopics(TopicCategory):
     FAN_SPEED = "glue/spray/fan/speed"
     FAN_STATE = "glue/spray/fan/state"
 
+    # Modbus line statistics (per-slave latency / errors)
+    MODBUS_STATISTICS = "glue/spray/modbus/statistics"
+
 
 class UITopics(TopicCategory):
     """User interface specific topics"""
@@ -6,6 +6,7 @@ Handles all authentication-related requests including login, logout, and session
 from communication_layer.api.v1 import Constants
 from communication_layer.api.v1.Response import Response
 from communication_layer.api.v1.endpoints import auth_endpoints
+from communication_layer.api_gateway.dispatch.route_table import RouteTable
 from communication_layer.api_gateway.interfaces.dispatch import IDispatcher
 import os
 
@@ -18,7 +19,11 @@ class AuthDispatch(IDispatcher):
     
     def __init__(self):
         """Initialize the AuthHandler."""
-        pass
+        self.routes = RouteTable("AuthDispatch")
+        self.routes.add(auth_endpoints.LOGIN,
+                        lambda request, data, params: self.handle_login(data), name="auth.login")
+        self.routes.add(auth_endpoints.QR_LOGIN,
+                        lambda request, data, params: self.handle_qr_login(data), name="auth.qr_login")
 
     def dispatch(self, parts: list, request: str, data: dict = None) -> dict:
         """
@@ -34,15 +39,10 @@ class AuthDispatch(IDispatcher):
         """
         print(f"AuthHandler: Handling request: {request}")
         
-        # Handle both new RESTful endpoints and legacy endpoints
-        if request in [auth_endpoints.LOGIN]:
-            return self.handle_login(data)
-        elif request in [auth_endpoints.QR_LOGIN]:
-            return self.handle_qr_login(data)
-        else:
-            raise ValueError(f"Unknown request: {request}")
-            return Response(Constants.RESPONSE_STATUS_ERROR,
-                            message=f"Unknown authentication request: {request}").to_dict()
+        match = self.routes.match(request)
+        if match is not None:
+            return self.routes.invoke(match, request, data)
+        raise ValueError(f"Unknown request: {request}")
     
     def handle_login(self, data):
         """
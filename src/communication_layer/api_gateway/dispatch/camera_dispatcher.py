@@ -6,6 +6,7 @@ Handles all camera and vision-related requests including calibration, image capt
 from communication_layer.api.v1 import Constants
 from communication_layer.api.v1.Response import Response
 from communication_layer.api.v1.endpoints import camera_endpoints
+from communication_layer.api_gateway.dispatch.route_table import RouteTable
 from communication_layer.api_gateway.interfaces.dispatch import IDispatcher
 
 class CameraDispatch(IDispatcher):
@@ -25,6 +26,7 @@ class CameraDispatch(IDispatcher):
         """
         self.application = application
         self.cameraSystemController = cameraSystemController
+        self.routes = self._build_routes()
     
     def dispatch(self, parts: list, request: str, data: dict = None) -> dict:
         """
@@ -40,31 +42,46 @@ class CameraDispatch(IDispatcher):
         """
         # print(f"CameraHandler: Handling request: {request} with parts: {parts}")
         
-        # Handle both new RESTful endpoints
-        if request in [camera_endpoints.CAMERA_ACTION_CALIBRATE] or (len(parts) > 1 and parts[1] == "calibrate"):
+        match = self.routes.match(request)
+        if match is not None:
+            return self.routes.invoke(match, request, data)
+        # Legacy part-based requests
+        if len(parts) > 1 and parts[1] == "calibrate":
             return self.handle_camera_calibration()
-        elif request in [camera_endpoints.CAMERA_ACTION_SAVE_WORK_AREA_POINTS] or (len(parts) > 1 and parts[1] == "saveWorkAreaPoints"):
+        elif len(parts) > 1 and parts[1] == "saveWorkAreaPoints":
             return self.handle_save_work_area_points(data)
-        elif request in [camera_endpoints.CAMERA_ACTION_GET_WORK_AREA_POINTS]:
-            return self.handle_get_work_area_points(data)
-        elif request in [camera_endpoints.CAMERA_ACTION_GET_LATEST_FRAME, ]:
-            return self.handle_frame_request(parts, request, data)
-        elif request in [camera_endpoints.CAMERA_ACTION_RAW_MODE_ON]:
-            return self.handle_mode_change(parts, request, data)
-        elif request in [camera_endpoints.CAMERA_ACTION_RAW_MODE_OFF]:
-            return self.handle_mode_change(parts, request, data)
-        elif request in [camera_endpoints.START_CONTOUR_DETECTION]:
-            return self.handle_contour_detection(parts, request, data)
-        elif request in [camera_endpoints.STOP_CONTOUR_DETECTION]:
-            return self.handle_contour_detection(parts, request, data)
-        elif request in [camera_endpoints.CAMERA_ACTION_CAPTURE_CALIBRATION_IMAGE]:
-            return self.handle_capture_request(parts, request, data)
         else:
             raise ValueError(f"CameraHandler: Unknown camera request: {request}")
             # Delegate to camera system controller for other operations
             response = self.cameraSystemController.handle(request, parts, data)
             return response
     
+    def _build_routes(self) -> RouteTable:
+        """Endpoint -> handler table (compiled once; replaces the if/elif chain)."""
+        routes = RouteTable("CameraDispatch")
+        routes.add(camera_endpoints.CAMERA_ACTION_CALIBRATE,
+                   lambda request, data, params: self.handle_camera_calibration(), name="camera.calibrate")
+        routes.add(camera_endpoints.CAMERA_ACTION_SAVE_WORK_AREA_POINTS,
+                   lambda request, data, params: self.handle_save_work_area_points(data),
+                   name="camera.save_work_area_points")
+        routes.add(camera_endpoints.CAMERA_ACTION_GET_WORK_AREA_POINTS,
+                   lambda request, data, params: self.handle_get_work_area_points(data),
+                   name="camera.get_work_area_points")
+        routes.add(camera_endpoints.CAMERA_ACTION_GET_LATEST_FRAME,
+                   lambda request, data, params: self.handle_frame_request([], request, data),
+                   name="camera.latest_frame")
+        mode_change = lambda request, data, params: self.handle_mode_change([], request, data)
+        routes.add(camera_endpoints.CAMERA_ACTION_RAW_MODE_ON, mode_change, name="camera.raw_mode")
+        routes.add(camera_endpoints.CAMERA_ACTION_RAW_MODE_OFF, mode_change, name="camera.raw_mode")
+        contour_detection = lambda request, data, params: self.handle_contour_detection([], request, data)
+        routes.add(camera_endpoints.START_CONTOUR_DETECTION, contour_detection, name="camera.contour_detection")
+        routes.add(camera_endpoints.STOP_CONTOUR_DETECTION, contour_detection, name="camera.contour_detection")
+        routes.add(camera_endpoints.CAMERA_ACTION_CAPTURE_CALIBRATION_IMAGE,
+                   lambda request, data, params: self.handle_capture_request([], request, data),
+                   name="camera.capture_calibration_image")
+        routes.validate()
+        return routes
+
     def handle_camera_calibration(self):
         """
         Handle camera calibration requests.
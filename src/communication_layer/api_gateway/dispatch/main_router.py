@@ -2,6 +2,7 @@ from communication_layer.api_gateway.dispatch.auth_dispatcher import AuthDispatc
 from communication_layer.api_gateway.dispatch.camera_dispatcher import CameraDispatch
 from communication_layer.api_gateway.dispatch.operations_dispatcher import OperationsDispatch
 from communication_layer.api_gateway.dispatch.robot_dispatcher import RobotDispatch
+from communication_layer.api_gateway.dispatch.route_table import RouteTable
 from communication_layer.api_gateway.dispatch.settings_dispatcher import SettingsDispatch
 from communication_layer.api_gateway.dispatch.workpiece_dispatcher import WorkpieceDispatch
 from communication_layer.api_gateway.interfaces.request_handler_interface import IRequestHandler
@@ -9,7 +10,7 @@ from core.application.interfaces.robot_application_interface import RobotApplica
 from communication_layer.api.v1 import Constants
 
 # Import endpoint modules
-from communication_layer.api.v1.endpoints import camera_endpoints, operations_endpoints, auth_endpoints
+from communication_layer.api.v1.endpoints import camera_endpoints
 from core.controllers.vision.camera_system_controller import CameraSystemController
 from core.controllers.workpiece.BaseWorkpieceController import BaseWorkpieceController
 
@@ -61,40 +62,22 @@ class RequestHandler(IRequestHandler):
             Constants.REQUEST_RESOURCE_SETTINGS.lower(): self.settings_dispatcher.dispatch,
             Constants.REQUEST_RESOURCE_WORKPIECE.lower(): self.workpiece_dispatcher.dispatch,
         }
+        self.routes = self._build_routes()
 
     def handleRequest(self, request, data=None):
         """
         Main request handler that routes requests to specialized handlers.
-        
-        This method now delegates to specialized handlers for better organization.
+
+        Declared endpoints are resolved with a single lookup in the compiled route table,
+        which calls the owning dispatcher's handler directly. Anything else falls back to
+        resource-based routing.
         """
-        # print(f"RequestHandler: Processing request: {request}")
-
-        # Authentication requests
-        if request in [auth_endpoints.QR_LOGIN]:
-            return self.auth_dispatcher.dispatch(parts=[], request=request, data=data)
-
-        # Main operations requests
-        operations_requests = [
-            operations_endpoints.START, operations_endpoints.STOP, operations_endpoints.PAUSE,
-            operations_endpoints.TEST_RUN,
-            operations_endpoints.RUN_DEMO, operations_endpoints.STOP_DEMO, operations_endpoints.CALIBRATE,
-            operations_endpoints.HELP,
-            operations_endpoints.CREATE_WORKPIECE, "handleSetPreselectedWorkpiece", "handleExecuteFromGallery"
-        ]
-
-        if request in operations_requests:
-            return self.operations_dispatcher.dispatch(parts=[], request=request, data=data)
-
-        # Camera work area points
-        if (request in [camera_endpoints.CAMERA_ACTION_SAVE_WORK_AREA_POINTS] or
-                (len(self._parseRequest(request)) >= 2 and self._parseRequest(request)[1] == "saveWorkAreaPoints")):
-            return self.camera_dispatcher.handle_save_work_area_points(data)
+        match = self.routes.match(request)
+        if match is not None:
+            return self.routes.invoke(match, request, data)
 
-        # Parse request for resource-based routing
+        # Paths with the resource further down (or with different casing)
         parts = self._parseRequest(request)
-
-        # Try to detect which resource (robot, camera, settings, workpieces) is present in the path
         resource = next((p.lower() for p in parts if p.lower() in self.resource_dispatch), None)
         if resource:
             return self.resource_dispatch[resource](parts=[], request=request, data=data)
@@ -104,6 +87,57 @@ class RequestHandler(IRequestHandler):
         print(f"Available resources: {list(self.resource_dispatch.keys())}")
         raise ValueError(f"Unknown request: {request}")
 
+    def _build_routes(self) -> RouteTable:
+        """
+        Compile the gateway routes: every endpoint declared by a dispatcher, plus per-resource
+        catch-alls that hand undeclared paths to the resource's dispatcher.
+
+        A dispatcher endpoint whose path starts with a different resource was always routed to
+        that resource's dispatcher, so it can never be reached and fails the startup check.
+        """
+        routes = RouteTable("RequestHandler")
+        routes.include(self.auth_dispatcher.routes)
+        routes.include(self.operations_dispatcher.routes)
+
+        # Legacy camera work area points: "<anything>/saveWorkAreaPoints[/...]"
+        def save_work_area_points(request, data, params):
+            return self.camera_dispatcher.handle_save_work_area_points(data)
+
+        routes.add("{resource}/saveWorkAreaPoints/{rest*}", save_work_area_points,
+                   name="camera.save_work_area_points.legacy")
+
+        unreachable = []
+        dispatchers = {
+            Constants.REQUEST_RESOURCE_ROBOT.lower(): self.robot_dispatcher,
+            Constants.REQUEST_RESOURCE_CAMERA.lower(): self.camera_dispatcher,
+            Constants.REQUEST_RESOURCE_SETTINGS.lower(): self.settings_dispatcher,
+            Constants.REQUEST_RESOURCE_WORKPIECE.lower(): self.workpiece_dispatcher,
+        }
+        for resource, dispatcher in dispatchers.items():
+            unreachable += routes.include(
+                dispatcher.routes,
+                accept=lambda route, resource=resource: self._resource_of(route.pattern) in (resource, None))
+
+            def dispatch_resource(request, data, params, dispatcher=dispatcher):
+                return dispatcher.dispatch(parts=[], request=request, data=data)
+
+            for prefix in ("api/v1/", ""):
+                routes.add(f"{prefix}{resource}/{{rest*}}", dispatch_resource, name=f"{resource}.dispatch")
+            # The legacy work area check runs before resource routing
+            routes.add(f"{resource}/saveWorkAreaPoints/{{rest*}}", save_work_area_points,
+                       name="camera.save_work_area_points.legacy")
+
+        routes.validate(extra_unreachable=unreachable)
+        return routes
+
+    def _resource_of(self, path: str):
+        """First resource (robot, camera, settings, workpieces) in the path, as resource routing sees it."""
+        return next((p.lower() for p in self._parseRequest(path) if p.lower() in self.resource_dispatch), None)
+
+    def get_route_stats(self):
+        """Per-route call counts and latencies, busiest first."""
+        return self.routes.stats()
+
     def _parseRequest(self, request: str):
         """
         Parses the incoming request path into parts.
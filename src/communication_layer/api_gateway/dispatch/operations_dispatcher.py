@@ -9,6 +9,7 @@ import traceback
 from communication_layer.api.v1 import Constants
 from communication_layer.api.v1.Response import Response
 from communication_layer.api.v1.endpoints import operations_endpoints
+from communication_layer.api_gateway.dispatch.route_table import RouteTable
 from communication_layer.api_gateway.interfaces.dispatch import IDispatcher
 
 class OperationsDispatch(IDispatcher):
@@ -29,6 +30,7 @@ class OperationsDispatch(IDispatcher):
         """
         self.application = application
         self.application_factory = application_factory
+        self.routes = self._build_routes()
     
     def dispatch(self, parts: list, request: str, data: dict = None) -> dict:
         """
@@ -44,29 +46,35 @@ class OperationsDispatch(IDispatcher):
         """
         # print(f"OperationsHandler: Handling request: {request}")
         
-        # Handle both new RESTful endpoints and legacy endpoints
-        if request in [operations_endpoints.START]:
-            return self.handle_start()
-        elif request in [operations_endpoints.CREATE_WORKPIECE]:
-            return self.handle_create_workpiece()
-        elif request in [operations_endpoints.STOP]:
-            return self.handle_stop()
-        elif request in [operations_endpoints.PAUSE]:
-            return self.handle_pause()
-        elif request in [operations_endpoints.CALIBRATE]:
-            return self.handle_calibrate()
-        elif request in [operations_endpoints.CLEAN_NOZZLE]:
-            return self.handler_clean_nozzle()
-        elif request == "handleSetPreselectedWorkpiece":
-            return self.handle_set_preselected_workpiece(data)
-        elif request == "handleExecuteFromGallery":
-            return self.handle_execute_from_gallery(data)
-        else:
-            raise ValueError(f"Unknown request: {request}")
-            return Response(
-                Constants.RESPONSE_STATUS_ERROR,
-                message=f"Unknown operation request: {request}"
-            ).to_dict()
+        match = self.routes.match(request)
+        if match is not None:
+            return self.routes.invoke(match, request, data)
+        raise ValueError(f"Unknown request: {request}")
+
+    def _build_routes(self) -> RouteTable:
+        """Endpoint -> handler table (compiled once; replaces the if/elif chain)."""
+        routes = RouteTable("OperationsDispatch")
+        routes.add(operations_endpoints.START,
+                   lambda request, data, params: self.handle_start(), name="operations.start")
+        routes.add(operations_endpoints.CREATE_WORKPIECE,
+                   lambda request, data, params: self.handle_create_workpiece(), name="operations.create_workpiece")
+        routes.add(operations_endpoints.STOP,
+                   lambda request, data, params: self.handle_stop(), name="operations.stop")
+        routes.add(operations_endpoints.PAUSE,
+                   lambda request, data, params: self.handle_pause(), name="operations.pause")
+        routes.add(operations_endpoints.CALIBRATE,
+                   lambda request, data, params: self.handle_calibrate(), name="operations.calibrate")
+        routes.add(operations_endpoints.CLEAN_NOZZLE,
+                   lambda request, data, params: self.handler_clean_nozzle(), name="operations.clean_nozzle")
+        # Legacy request names
+        routes.add("handleSetPreselectedWorkpiece",
+                   lambda request, data, params: self.handle_set_preselected_workpiece(data),
+                   name="operations.set_preselected_workpiece")
+        routes.add("handleExecuteFromGallery",
+                   lambda request, data, params: self.handle_execute_from_gallery(data),
+                   name="operations.execute_from_gallery")
+        routes.validate()
+        return routes
     
     def handle_start(self):
         """
@@ -6,6 +6,7 @@ Handles all robot-related requests including movement, calibration, and robot op
 from communication_layer.api.v1 import Constants
 from communication_layer.api.v1.Response import Response
 from communication_layer.api.v1.endpoints import robot_endpoints
+from communication_layer.api_gateway.dispatch.route_table import RouteTable
 from communication_layer.api_gateway.interfaces.dispatch import IDispatcher
 
 class RobotDispatch(IDispatcher):
@@ -25,6 +26,7 @@ class RobotDispatch(IDispatcher):
         """
         self.application = application
         self.robotController = robotController
+        self.routes = self._build_routes()
 
     def dispatch(self, parts: list, request: str, data: dict = None) -> dict:
         """
@@ -40,15 +42,15 @@ class RobotDispatch(IDispatcher):
         """
         print(f"RobotHandler: Handling request: {request} with parts: {parts} and data: {data}")
 
-        # Handle both new RESTful endpoints
-        if request in [robot_endpoints.ROBOT_CALIBRATE] or (len(parts) > 1 and parts[1] == "calibrate"):
+        match = self.routes.match(request)
+        if match is not None:
+            return self.routes.invoke(match, request, data)
+
+        # Legacy part-based requests
+        if len(parts) > 1 and parts[1] == "calibrate":
             return self.handle_robot_calibration()
-        elif request in [robot_endpoints.ROBOT_EXECUTE_NOZZLE_CLEAN] or (len(parts) >= 3 and parts[1] == "move" and parts[2] == "clean"):
+        elif len(parts) >= 3 and parts[1] == "move" and parts[2] == "clean":
             return self.handle_clean_nozzle()
-        elif request in [robot_endpoints.ROBOT_MOVE_TO_HOME_POS]:
-            return self.handle_home_position(request)
-        elif request in [robot_endpoints.ROBOT_STOP]:
-            return self.handle_robot_stop(request)
         elif self._is_jog_command(request):
             return self.handle_jog_command(parts, request)
         elif self._is_slot_command(request):
@@ -59,6 +61,42 @@ class RobotDispatch(IDispatcher):
             # Delegate to robot controller for other operations
             return self.robotController.handle(request, parts)
 
+    def _build_routes(self) -> RouteTable:
+        """Endpoint -> handler table (compiled once; replaces the if/elif chain)."""
+        routes = RouteTable("RobotDispatch")
+        routes.add(robot_endpoints.ROBOT_CALIBRATE,
+                   lambda request, data, params: self.handle_robot_calibration(), name="robot.calibrate")
+        routes.add(robot_endpoints.ROBOT_EXECUTE_NOZZLE_CLEAN,
+                   lambda request, data, params: self.handle_clean_nozzle(), name="robot.clean_nozzle")
+        routes.add(robot_endpoints.ROBOT_MOVE_TO_HOME_POS,
+                   lambda request, data, params: self.handle_home_position(request), name="robot.home")
+        routes.add(robot_endpoints.ROBOT_STOP,
+                   lambda request, data, params: self.handle_robot_stop(request), name="robot.stop")
+
+        # Jog requests sent by the UI controller: robot/jog/<axis>/<direction>/<step>
+        routes.add("robot/jog/{axis}/{direction}/{step}",
+                   lambda request, data, params: self.handle_jog_command(
+                       ["robot", "jog", params["axis"], params["direction"], params["step"]], request, data),
+                   name="robot.jog")
+
+        groups = [
+            (self._jog_endpoints(), "robot.jog_endpoint",
+             lambda request, data, params: self.handle_jog_command(self._parts(request), request)),
+            (self._slot_endpoints(), "robot.slot",
+             lambda request, data, params: self.handle_slot_operation(self._parts(request), request)),
+            (self._position_endpoints(), "robot.position",
+             lambda request, data, params: self.handle_position_command(self._parts(request), request, data)),
+        ]
+        for endpoints, name, handler in groups:
+            for endpoint in endpoints:
+                routes.add(endpoint, handler, name=name)
+        routes.validate()
+        return routes
+
+    @staticmethod
+    def _parts(request):
+        return request.strip("/").split("/")
+
     def handle_robot_calibration(self):
         """
         Handle robot calibration requests.
@@ -90,32 +128,39 @@ class RobotDispatch(IDispatcher):
                 message=f"Error calibrating robot: {e}"
             ).to_dict()
 
-    def _is_jog_command(self, request):
-        """Check if the request is a robot jog command."""
-        jog_endpoints = [
+    @staticmethod
+    def _jog_endpoints():
+        return [
             robot_endpoints.ROBOT_ACTION_JOG_X_PLUS, robot_endpoints.ROBOT_ACTION_JOG_X_MINUS,
             robot_endpoints.ROBOT_ACTION_JOG_Y_PLUS, robot_endpoints.ROBOT_ACTION_JOG_Y_MINUS,
             robot_endpoints.ROBOT_ACTION_JOG_Z_PLUS, robot_endpoints.ROBOT_ACTION_JOG_Z_MINUS
         ]
-        return request in jog_endpoints or "/jog/" in request
 
-    def _is_slot_command(self, request):
-        """Check if the request is a robot slot operation."""
-        slot_endpoints = [
+    @staticmethod
+    def _slot_endpoints():
+        return [
             robot_endpoints.ROBOT_SLOT_0_PICKUP, robot_endpoints.ROBOT_SLOT_0_DROP,
             robot_endpoints.ROBOT_SLOT_1_PICKUP, robot_endpoints.ROBOT_SLOT_1_DROP,
             robot_endpoints.ROBOT_SLOT_2_PICKUP, robot_endpoints.ROBOT_SLOT_2_DROP,
             robot_endpoints.ROBOT_SLOT_3_PICKUP, robot_endpoints.ROBOT_SLOT_3_DROP,
             robot_endpoints.ROBOT_SLOT_4_PICKUP, robot_endpoints.ROBOT_SLOT_4_DROP
         ]
-        return request in slot_endpoints or "/slots/" in request
+
+    @staticmethod
+    def _position_endpoints():
+        return [robot_endpoints.ROBOT_GET_CURRENT_POSITION, robot_endpoints.ROBOT_MOVE_TO_POSITION]
+
+    def _is_jog_command(self, request):
+        """Check if the request is a robot jog command."""
+        return request in self._jog_endpoints() or "/jog/" in request
+
+    def _is_slot_command(self, request):
+        """Check if the request is a robot slot operation."""
+        return request in self._slot_endpoints() or "/slots/" in request
 
     def _is_position_command(self, request):
         """Check if the request is a robot position command."""
-        position_endpoints = [
-            robot_endpoints.ROBOT_GET_CURRENT_POSITION, robot_endpoints.ROBOT_MOVE_TO_POSITION
-        ]
-        return request in position_endpoints or "/position/" in request
+        return request in self._position_endpoints() or "/position/" in request
 
     def handle_home_position(self,request):
         """Handle robot home position movement."""
@@ -0,0 +1,250 @@
+"""
+Route Table - API Gateway
+
+Compiled request routing for the gateway and its dispatchers.
+
+Each endpoint declares its path pattern once. Patterns without parameters are stored in an
+exact-match dict keyed by the declared path; parameterised patterns are compiled into a
+segment trie:
+
+    robot/jog/{axis}/{direction}/{step}   -> one value per segment
+    api/v1/robot/{rest*}                  -> trailing catch-all (zero or more segments)
+
+Matching is a single dict lookup for exact endpoints and a trie walk for the rest, where a
+literal segment beats a parameter, which beats a catch-all. Each route keeps call-count and
+latency metrics. Conflicting declarations raise at registration; ``validate()`` is the
+startup check for routes that can never be matched.
+
+Route handlers are called as ``handler(request, data, params)``.
+"""
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Sample value used by validate() to probe parameterised routes (never a literal segment)
+_PROBE_SEGMENT = "\x00"
+
+
+@dataclass
+class RouteStats:
+    calls: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "avg_ms": self.total_ms / self.calls if self.calls else 0.0,
+            "max_ms": self.max_ms,
+        }
+
+
+@dataclass
+class Route:
+    pattern: str
+    handler: Callable
+    name: str
+    param_names: Tuple[str, ...] = ()
+    catch_all: bool = False
+    stats: RouteStats = field(default_factory=RouteStats)
+
+    @property
+    def is_exact(self) -> bool:
+        return not self.param_names
+
+
+@dataclass
+class RouteMatch:
+    route: Route
+    params: Dict[str, str]
+
+
+class _Node:
+    __slots__ = ("literals", "param", "route", "catch_all")
+
+    def __init__(self):
+        self.literals: Dict[str, "_Node"] = {}
+        self.param: Optional["_Node"] = None
+        self.route: Optional[Route] = None
+        self.catch_all: Optional[Route] = None
+
+
+def _split(path: str) -> List[str]:
+    return [p for p in path.strip("/").split("/") if p]
+
+
+def _parse_pattern(pattern: str) -> Tuple[List[Optional[str]], Tuple[str, ...], bool]:
+    """Segments (None for parameters), parameter names and whether the pattern ends in a catch-all."""
+    segments, names = [], []
+    catch_all = False
+    parts = _split(pattern)
+    for i, part in enumerate(parts):
+        if part.startswith("{") and part.endswith("}"):
+            name = part[1:-1]
+            if name.endswith("*"):
+                if i != len(parts) - 1:
+                    raise ValueError(f"Route '{pattern}': catch-all '{part}' must be the last segment")
+                name, catch_all = name[:-1], True
+            else:
+                segments.append(None)
+            if not name or name in names:
+                raise ValueError(f"Route '{pattern}': invalid or repeated parameter '{part}'")
+            names.append(name)
+        elif "{" in part or "}" in part:
+            raise ValueError(f"Route '{pattern}': malformed segment '{part}'")
+        else:
+            segments.append(part)
+    return segments, tuple(names), catch_all
+
+
+class RouteTable:
+    """Exact-match dict plus segment trie of the routes of one dispatcher (or the gateway)."""
+
+    def __init__(self, name: str = "routes"):
+        self.name = name
+        self._exact: Dict[str, Route] = {}
+        self._root = _Node()
+        self._routes: List[Route] = []
+
+    # --- Registration ---
+    def add(self, pattern: str, handler: Callable, name: Optional[str] = None) -> Route:
+        """Register a route; raises ValueError if it conflicts with an existing one."""
+        _, param_names, catch_all = _parse_pattern(pattern)
+        return self.add_route(Route(pattern, handler, name or pattern, param_names, catch_all))
+
+    def add_route(self, route: Route) -> Route:
+        """Register an existing Route object (shared with other tables, including its stats)."""
+        if route.is_exact:
+            existing = self._exact.get(route.pattern)
+            if existing is not None:
+                return self._conflict(existing, route)
+            self._exact[route.pattern] = route
+        else:
+            segments, _, _ = _parse_pattern(route.pattern)
+            node = self._root
+            for segment in segments:
+                if segment is None:
+                    if node.param is None:
+                        node.param = _Node()
+                    node = node.param
+                else:
+                    node = node.literals.setdefault(segment, _Node())
+            slot = "catch_all" if route.catch_all else "route"
+            existing = getattr(node, slot)
+            if existing is not None:
+                return self._conflict(existing, route)
+            setattr(node, slot, route)
+        self._routes.append(route)
+        return route
+
+    def include(self, table: "RouteTable", accept: Optional[Callable[[Route], bool]] = None) -> List[Route]:
+        """
+        Register the routes of another table here (sharing the Route objects).
+
+        Returns:
+            list: The routes rejected by ``accept``.
+        """
+        rejected = []
+        for route in table.routes:
+            if accept is None or accept(route):
+                self.add_route(route)
+            else:
+                rejected.append(route)
+        return rejected
+
+    def _conflict(self, existing: Route, route: Route) -> Route:
+        # The same endpoint declared twice for the same handler (e.g. aliased constants) is harmless
+        if existing.handler == route.handler:
+            return existing
+        raise ValueError(f"[{self.name}] Ambiguous route '{route.pattern}' ({route.name}) "
+                         f"conflicts with '{existing.pattern}' ({existing.name})")
+
+    @property
+    def routes(self) -> List[Route]:
+        return list(self._routes)
+
+    # --- Matching ---
+    def match(self, path: str) -> Optional[RouteMatch]:
+        route = self._exact.get(path)
+        if route is not None:
+            return RouteMatch(route, {})
+        if self._root.literals or self._root.param or self._root.catch_all:
+            found = self._walk(self._root, _split(path), 0, [])
+            if found is not None:
+                route, values = found
+                return RouteMatch(route, dict(zip(route.param_names, values)))
+        return None
+
+    def _walk(self, node: _Node, segments: List[str], index: int, values: List[str]):
+        if index == len(segments):
+            if node.route is not None:
+                return node.route, values
+            if node.catch_all is not None:
+                return node.catch_all, values + [""]
+            return None
+        segment = segments[index]
+        child = node.literals.get(segment)
+        if child is not None:
+            found = self._walk(child, segments, index + 1, values)
+            if found is not None:
+                return found
+        if node.param is not None:
+            found = self._walk(node.param, segments, index + 1, values + [segment])
+            if found is not None:
+                return found
+        if node.catch_all is not None:
+            return node.catch_all, values + ["/".join(segments[index:])]
+        return None
+
+    def invoke(self, match: RouteMatch, request: str, data: Any = None) -> Any:
+        """Call the matched route's handler, recording its call count and latency."""
+        stats = match.route.stats
+        start = time.perf_counter()
+        try:
+            return match.route.handler(request, data, match.params)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            stats.calls += 1
+            stats.total_ms += elapsed
+            if elapsed > stats.max_ms:
+                stats.max_ms = elapsed
+
+    # --- Startup check / metrics ---
+    def unreachable(self) -> List[Route]:
+        """Parameterised routes whose own pattern resolves to a different route."""
+        problems = []
+        for route in self._routes:
+            if route.is_exact:
+                continue
+            segments, _, _ = _parse_pattern(route.pattern)
+            probe = [_PROBE_SEGMENT if s is None else s for s in segments]
+            # A catch-all is reachable if it wins for any number of trailing segments
+            extra_counts = range(4) if route.catch_all else (0,)
+            if not any(self._resolves_to(route, probe + [_PROBE_SEGMENT] * extra) for extra in extra_counts):
+                problems.append(route)
+        return problems
+
+    def _resolves_to(self, route: Route, segments: List[str]) -> bool:
+        found = self._walk(self._root, segments, 0, [])
+        return found is not None and found[0] is route
+
+    def validate(self, extra_unreachable: Iterable[Route] = ()) -> None:
+        """Raise ValueError listing the routes that can never be matched."""
+        problems = list(self.unreachable()) + list(extra_unreachable)
+        if problems:
+            raise ValueError(f"[{self.name}] Unreachable routes: "
+                             + ", ".join(f"'{r.pattern}' ({r.name})" for r in problems))
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-route metrics, busiest first."""
+        rows = [{"route": r.name, "pattern": r.pattern, **r.stats.as_dict()} for r in self._routes]
+        return sorted(rows, key=lambda row: row["calls"], reverse=True)
+
+    def reset_stats(self) -> None:
+        for route in self._routes:
+            route.stats = RouteStats()
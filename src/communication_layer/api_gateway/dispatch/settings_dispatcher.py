@@ -6,6 +6,7 @@ Handles all settings-related requests including robot, camera, and glue system c
 from communication_layer.api.v1 import Constants
 from communication_layer.api.v1.Response import Response
 from communication_layer.api.v1.endpoints import glue_endpoints, settings_endpoints, modbus_endpoints
+from communication_layer.api_gateway.dispatch.route_table import RouteTable
 from communication_layer.api_gateway.interfaces.dispatch import IDispatcher
 from applications.glue_dispensing_application.handlers.glue_types_handler import GlueTypesHandler
 from applications.glue_dispensing_application.handlers.cell_hardware_handler import CellHardwareHandler
@@ -28,6 +29,7 @@ class SettingsDispatch(IDispatcher):
         self.settingsController = settingsController
         self.glue_types_handler = GlueTypesHandler()
         self.cell_hardware_handler = CellHardwareHandler()
+        self.routes = self._build_routes()
 
     def dispatch(self, parts: list, request: str, data: dict = None) -> dict:
         """
@@ -43,53 +45,47 @@ class SettingsDispatch(IDispatcher):
         """
         print(f"SettingsDispatch: Handling request: {request} with parts: {parts} and data: {data}")
 
-        # Handle both new RESTful endpoints and legacy endpoints
-        # Glue types endpoints (NEW)
-        if request in [glue_endpoints.GLUE_TYPES_GET,
-                       glue_endpoints.GLUE_TYPE_ADD_CUSTOM,
-                       glue_endpoints.GLUE_TYPES_SET,
-                       glue_endpoints.GLUE_TYPE_REMOVE_CUSTOM]:
-            return self.handle_glue_types(parts, request, data)
-        elif request in [glue_endpoints.CELL_HARDWARE_CONFIG_GET,
-                         glue_endpoints.CELL_HARDWARE_CONFIG_SET,
-                         glue_endpoints.CELL_HARDWARE_MOTOR_ADDRESS_GET]:
-            return self.handle_cell_hardware_config(parts, request, data)
-        # Robot settings
-        elif request in [settings_endpoints.SETTINGS_ROBOT_GET]:
-            return self.handle_robot_settings(parts, request, data)
-        elif request in [settings_endpoints.SETTINGS_ROBOT_SET]:
-            return self.handle_robot_settings(parts, request, data)
-        # Camera settings
-        elif request in [settings_endpoints.SETTINGS_CAMERA_GET]:
-            return self.handle_camera_settings(parts, request, data)
-        elif request in [settings_endpoints.SETTINGS_CAMERA_SET]:
-            return self.handle_camera_settings(parts, request, data)
-        elif request in [glue_endpoints.SETTINGS_GLUE_GET]:
-            return self.handle_glue_settings(parts, request, data)
-        elif request in [glue_endpoints.SETTINGS_GLUE_SET]:
-            return self.handle_glue_settings(parts, request, data)
-        # Glue cells settings
-        elif request in [glue_endpoints.GLUE_CELLS_CONFIG_GET]:
-            return self.handle_glue_cells_settings(parts, request, data)
-        elif request in [glue_endpoints.GLUE_CELLS_CONFIG_SET, glue_endpoints.GLUE_CELL_UPDATE,
-                         glue_endpoints.GLUE_CELL_CALIBRATE, glue_endpoints.GLUE_CELL_TARE,
-                         glue_endpoints.GLUE_CELL_UPDATE_TYPE]:
-            return self.handle_glue_cells_settings(parts, request, data)
-        # Modbus settings
-        elif request in [modbus_endpoints.MODBUS_CONFIG_GET, modbus_endpoints.MODBUS_CONFIG_UPDATE,
-                         modbus_endpoints.MODBUS_TEST_CONNECTION, modbus_endpoints.MODBUS_GET_AVAILABLE_PORT]:
-            return self.handle_modbus_settings(parts, request, data)
-        elif request in [settings_endpoints.SETTINGS_GET]:
-            return self.handle_general_settings(parts, request, data)
-        elif request in [settings_endpoints.SETTINGS_UPDATE]:
-            return self.handle_general_settings(parts, request, data)
-        elif request in [settings_endpoints.SETTINGS_ROBOT_CALIBRATION_SET]:
-            return self.handle_robot_calibration_settings(parts, request, data)
-        elif request in [settings_endpoints.SETTINGS_ROBOT_CALIBRATION_GET]:
-            return self.handle_robot_calibration_settings(parts, request, data)
-        else:
-            # Delegate to a settings controller which handles all the logic
-            return self.settingsController.handle(request, parts, data)
+        match = self.routes.match(request)
+        if match is not None:
+            return self.routes.invoke(match, request, data)
+        # Delegate to a settings controller which handles all the logic
+        return self.settingsController.handle(request, parts, data)
+
+    def _build_routes(self) -> RouteTable:
+        """Endpoint -> handler table (compiled once; replaces the if/elif chain)."""
+        routes = RouteTable("SettingsDispatch")
+        groups = [
+            # Glue types endpoints
+            ([glue_endpoints.GLUE_TYPES_GET,
+              glue_endpoints.GLUE_TYPE_ADD_CUSTOM,
+              glue_endpoints.GLUE_TYPES_SET,
+              glue_endpoints.GLUE_TYPE_REMOVE_CUSTOM], self.handle_glue_types),
+            ([glue_endpoints.CELL_HARDWARE_CONFIG_GET,
+              glue_endpoints.CELL_HARDWARE_CONFIG_SET,
+              glue_endpoints.CELL_HARDWARE_MOTOR_ADDRESS_GET], self.handle_cell_hardware_config),
+            # Robot settings
+            ([settings_endpoints.SETTINGS_ROBOT_GET, settings_endpoints.SETTINGS_ROBOT_SET], self.handle_robot_settings),
+            # Camera settings
+            ([settings_endpoints.SETTINGS_CAMERA_GET, settings_endpoints.SETTINGS_CAMERA_SET], self.handle_camera_settings),
+            ([glue_endpoints.SETTINGS_GLUE_GET, glue_endpoints.SETTINGS_GLUE_SET], self.handle_glue_settings),
+            # Glue cells settings
+            ([glue_endpoints.GLUE_CELLS_CONFIG_GET, glue_endpoints.GLUE_CELLS_CONFIG_SET, glue_endpoints.GLUE_CELL_UPDATE,
+              glue_endpoints.GLUE_CELL_CALIBRATE, glue_endpoints.GLUE_CELL_TARE,
+              glue_endpoints.GLUE_CELL_UPDATE_TYPE], self.handle_glue_cells_settings),
+            # Modbus settings
+            ([modbus_endpoints.MODBUS_CONFIG_GET, modbus_endpoints.MODBUS_CONFIG_UPDATE,
+              modbus_endpoints.MODBUS_TEST_CONNECTION, modbus_endpoints.MODBUS_GET_AVAILABLE_PORT],
+             self.handle_modbus_settings),
+            ([settings_endpoints.SETTINGS_GET, settings_endpoints.SETTINGS_UPDATE], self.handle_general_settings),
+            ([settings_endpoints.SETTINGS_ROBOT_CALIBRATION_SET, settings_endpoints.SETTINGS_ROBOT_CALIBRATION_GET],
+             self.handle_robot_calibration_settings),
+        ]
+        for endpoints, handler in groups:
+            route_handler = lambda request, data, params, handler=handler: handler([], request, data)
+            for endpoint in endpoints:
+                routes.add(endpoint, route_handler, name=f"settings.{handler.__name__}")
+        routes.validate()
+        return routes
 
     def handle_robot_calibration_settings(self, parts, request, data=None):
         """
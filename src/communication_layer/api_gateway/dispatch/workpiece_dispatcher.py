@@ -9,6 +9,7 @@ import traceback
 from communication_layer.api.v1 import Constants
 from communication_layer.api.v1.Response import Response
 from communication_layer.api.v1.endpoints import workpiece_endpoints
+from communication_layer.api_gateway.dispatch.route_table import RouteTable
 from communication_layer.api_gateway.interfaces.dispatch import IDispatcher
 
 class WorkpieceDispatch(IDispatcher):
@@ -28,6 +29,7 @@ class WorkpieceDispatch(IDispatcher):
         """
         self.application = application
         self.workpieceController = workpieceController
+        self.routes = self._build_routes()
 
     def dispatch(self, parts: list, request: str, data: dict = None) -> dict:
         """
@@ -43,20 +45,39 @@ class WorkpieceDispatch(IDispatcher):
         """
         print(f"WorkpieceHandler: Handling request: {request} with parts: {parts} data {data}")
         
-        # Handle both new RESTful endpoints and legacy endpoints
-        if request in [workpiece_endpoints.WORKPIECE_SAVE] or (len(parts) > 1 and parts[1] == "save"):
+        match = self.routes.match(request)
+        if match is not None:
+            return self.routes.invoke(match, request, data)
+        # Legacy part-based requests
+        if len(parts) > 1 and parts[1] == "save":
             return self.handle_save_workpiece(request, parts, data)
-        elif request in [workpiece_endpoints.WORKPIECE_SAVE_DXF] or (len(parts) > 1 and parts[1] == "dxf"):
+        elif len(parts) > 1 and parts[1] == "dxf":
             return self.handle_save_workpiece_from_dxf(data)
-        elif request in [workpiece_endpoints.WORKPIECE_GET_ALL] or (len(parts) > 1 and parts[1] == "getall"):
+        elif len(parts) > 1 and parts[1] == "getall":
             return self.handle_get_all_workpieces()
-        elif request in [workpiece_endpoints.WORKPIECE_DELETE] or (len(parts) > 1 and parts[1] == "delete"):
+        elif len(parts) > 1 and parts[1] == "delete":
             return self.handle_delete_workpiece(data)
-        elif request in [workpiece_endpoints.WORKPIECE_GET_BY_ID] or (len(parts) > 1 and parts[1] == "getbyid"):
+        elif len(parts) > 1 and parts[1] == "getbyid":
             return self.handle_get_workpiece_by_id(data)
         else:
             raise ValueError(f"Unknown request: {request}")
 
+    def _build_routes(self) -> RouteTable:
+        """Endpoint -> handler table (compiled once; replaces the if/elif chain)."""
+        routes = RouteTable("WorkpieceDispatch")
+        routes.add(workpiece_endpoints.WORKPIECE_SAVE,
+                   lambda request, data, params: self.handle_save_workpiece(request, [], data), name="workpiece.save")
+        routes.add(workpiece_endpoints.WORKPIECE_SAVE_DXF,
+                   lambda request, data, params: self.handle_save_workpiece_from_dxf(data), name="workpiece.save_dxf")
+        routes.add(workpiece_endpoints.WORKPIECE_GET_ALL,
+                   lambda request, data, params: self.handle_get_all_workpieces(), name="workpiece.get_all")
+        routes.add(workpiece_endpoints.WORKPIECE_DELETE,
+                   lambda request, data, params: self.handle_delete_workpiece(data), name="workpiece.delete")
+        routes.add(workpiece_endpoints.WORKPIECE_GET_BY_ID,
+                   lambda request, data, params: self.handle_get_workpiece_by_id(data), name="workpiece.get_by_id")
+        routes.validate()
+        return routes
+
     
     def handle_save_workpiece(self, request, parts, data):
         """
@@ -87,6 +87,58 @@ class IRobot(ABC):
              Disables the robot, preventing motion.
              """
 
+    def get_trajectory_upload_modes(self):
+        """
+              Bulk trajectory upload modes the robot supports, besides per-point move_liner.
+
+              Returns:
+                  tuple: TrajectoryUploadMode values; empty when only move_liner is available.
+              """
+        return ()
+
+    def start_spline(self, tool=0, user=0, average_time_ms=2000):
+        """
+              Opens a spline motion; points are added with add_spline_points.
+
+              Args:
+                  average_time_ms (int): Average time between consecutive spline points; sets the spline speed.
+
+              Returns:
+                  int: 0 on success, error code otherwise.
+              """
+        return -1
+
+    def add_spline_points(self, points, tool=0, user=0, last=False):
+        """
+              Appends a batch of Cartesian points to the open spline motion.
+
+              Args:
+                  points (list): TCP poses [X, Y, Z, A, B, C].
+                  last (bool): True if the batch ends with the last point of the spline.
+
+              Returns:
+                  int: 0 on success, error code otherwise.
+              """
+        return -1
+
+    def end_spline(self):
+        """
+              Closes the open spline motion.
+
+              Returns:
+                  int: 0 on success, error code otherwise.
+              """
+        return -1
+
+    def get_motion_queue_length(self):
+        """
+              Number of motion commands queued on the controller.
+
+              Returns:
+                  int or None: Queue length, or None if the robot does not report it.
+              """
+        return None
+
     def start_jog(self,axis:RobotAxis,direction:Direction,step,vel,acc):
         """
                   Starts jogging the robot along a specified axis.
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class TrajectoryUploadMode(Enum):
+    """
+       How a path is handed to the robot controller.
+       """
+    SPLINE = "spline"   # Queued as one spline motion, points uploaded in batches
+    MOVEL = "movel"     # One blended linear move command per point
+
+    def __str__(self):
+        return self.value
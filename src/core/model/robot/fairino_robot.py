@@ -1,5 +1,6 @@
 import platform
 import logging
+import xmlrpc.client
 from typing import List
 
 import requests
@@ -8,6 +9,7 @@ from modules.utils.custom_logging import setup_logger, LoggerContext, log_info_m
     log_debug_message
 from core.model.robot.IRobot import IRobot
 from core.model.robot.enums.axis import Direction
+from core.model.robot.enums.trajectory import TrajectoryUploadMode
 from frontend.core.services.domain.RobotService import RobotAxis
 
 if platform.system() == "Windows":
@@ -20,6 +22,8 @@ else:
     raise Exception("Unsupported OS")
 
 ENABLE_LOGGING = True  # Enable or disable logging
+SPLINE_TYPE_WAYPOINTS = 1  # NewSplineStart type: the spline passes through the given points
+STATE_STREAM_MAX_AGE = 0.1  # s - older realtime state frames fall back to XML-RPC (controller pushes every 8 ms)
 # Initialize logger if enabled
 if ENABLE_LOGGING:
     robot_logger = setup_logger("RobotWrapper")
@@ -60,6 +64,17 @@ class TestRobotWrapper(IRobot):
     def execute_path(self,path,rx,ry,rz,vel,acc,blocking):
         print(f"[FairinoRobot] execute_path called with path: {path}")
 
+    def NewSplineStart(self, type, averageTime=2000):
+        print(f"[MOCK] NewSplineStart -> type={type}, averageTime={averageTime}")
+        return 0
+
+    def NewSplinePoint(self, desc_pos, tool, user, lastFlag, vel=0.0, acc=0.0, ovl=100.0, blendR=0.0):
+        return 0
+
+    def NewSplineEnd(self):
+        print("[MOCK] NewSplineEnd called")
+        return 0
+
     # --- State queries ---
     def GetActualTCPPose(self):
         # print("[MOCK] GetActualTCPPose called")
@@ -489,6 +504,7 @@ class FairinoRobot(IRobot):
         2 - stop on error when over speeding;
         3 - adaptive speed reduction, default 0"""
         self.overSpeedStrategy = 3
+        self._multicall_supported = True
 
 
 
@@ -510,7 +526,8 @@ class FairinoRobot(IRobot):
 
         result = self.robot.MoveCart(position, tool, user, vel=vel, acc=acc)
         log_debug_message(self.logger_context,
-                          f"MoveCart to {position} with tool {tool}, user {user}, vel {vel}, acc {acc} -> result: {result}")
+                          "MoveCart to %s with tool %s, user %s, vel %s, acc %s -> result: %s",
+                          position, tool, user, vel, acc, result)
         return result
 
     def move_liner(self, position, tool=0, user=0, vel=30, acc=30, blendR=0):
@@ -531,20 +548,106 @@ class FairinoRobot(IRobot):
 
         result = self.robot.MoveL(position, tool, user, vel=vel, acc=acc, blendR=blendR)
         log_debug_message(self.logger_context,
-                          f"MoveL to {position} with tool {tool}, user {user}, vel {vel}, acc {acc}, blendR {blendR} -> result: {result}")
+                          "MoveL to %s with tool %s, user %s, vel %s, acc %s, blendR %s -> result: %s",
+                          position, tool, user, vel, acc, blendR, result)
         return result
 
     def execute_trajectory(self, path,rx=180,ry=0,rz=0,vel=0.1,acc=0.1,blocking=False):
         print(f"[FairinoRobot] execute_trajectory called with path: {path}")
         self.robot.execute_path(path,rx=180,ry=0,rz=0,vel=vel,acc=acc,blocking=blocking)
 
+    def get_trajectory_upload_modes(self):
+        """Spline upload is available when the SDK exposes the NewSpline* commands."""
+        if hasattr(self.robot, "NewSplinePoint"):
+            return (TrajectoryUploadMode.SPLINE,)
+        return ()
+
+    def start_spline(self, tool=0, user=0, average_time_ms=2000):
+        result = self.robot.NewSplineStart(SPLINE_TYPE_WAYPOINTS, average_time_ms)
+        log_debug_message(self.logger_context, f"NewSplineStart -> result: {result}")
+        return result
+
+    def add_spline_points(self, points, tool=0, user=0, last=False):
+        """
+              Appends a batch of points to the open spline.
+
+              NewSplinePoint vel/acc are not supported by the controller yet, so they are sent as 0;
+              the spline speed is set by the averageTime passed to start_spline.
+
+              On the real controller the batch goes out as two XML-RPC multicalls (inverse
+              kinematics, then NewSplinePoint) - two round-trips per batch instead of two per
+              point. Controllers without system.multicall fall back to one SDK call per point.
+
+              Returns:
+                  int: 0 on success, error code otherwise.
+              """
+        proxy = getattr(self.robot, "robot", None)
+        if self._multicall_supported and isinstance(proxy, xmlrpc.client.ServerProxy):
+            try:
+                return self._add_spline_points_multicall(proxy, points, tool, user, last)
+            except (xmlrpc.client.Fault, xmlrpc.client.ProtocolError) as e:
+                log_error_message(self.logger_context, f"XML-RPC multicall unavailable, sending spline points one by one: {e}")
+                self._multicall_supported = False
+
+        for i, point in enumerate(points):
+            last_flag = int(last and i == len(points) - 1)
+            result = self.robot.NewSplinePoint(point, tool, user, last_flag)
+            if result != 0:
+                log_error_message(self.logger_context, f"NewSplinePoint failed with code {result} at batch point {i}")
+                return result
+        return 0
+
+    def _add_spline_points_multicall(self, proxy, points, tool, user, last):
+        poses = [list(map(float, point[:6])) for point in points]
+
+        # Inverse kinematics is read-only, so it doubles as the multicall support probe
+        inverse_kinematics = xmlrpc.client.MultiCall(proxy)
+        for pose in poses:
+            inverse_kinematics.GetInverseKin(0, pose, -1)
+        joints = list(inverse_kinematics())
+
+        spline_points = xmlrpc.client.MultiCall(proxy)
+        for i, (pose, joint) in enumerate(zip(poses, joints)):
+            if joint[0] != 0:
+                log_error_message(self.logger_context, f"Inverse kinematics failed with code {joint[0]} at batch point {i}")
+                return joint[0]
+            last_flag = int(last and i == len(poses) - 1)
+            spline_points.NewSplinePoint(list(joint[1:7]), pose, int(tool), int(user), 0.0, 0.0,
+                                         100.0, 0.0, last_flag)
+        for i, result in enumerate(spline_points()):
+            if result != 0:
+                log_error_message(self.logger_context, f"NewSplinePoint failed with code {result} at batch point {i}")
+                return result
+        return 0
+
+    def end_spline(self):
+        result = self.robot.NewSplineEnd()
+        log_debug_message(self.logger_context, f"NewSplineEnd -> result: {result}")
+        return result
+
+    def get_motion_queue_length(self):
+        """Controller motion queue length from the realtime state stream, if connected."""
+        state_stream = getattr(self.robot, "state_stream", None)
+        if state_stream is None:
+            return None
+        snapshot = state_stream.snapshot(max_age=STATE_STREAM_MAX_AGE)
+        return None if snapshot is None else snapshot[1].mc_queue_len
+
     def get_current_position(self):
         """
               Retrieves the current TCP (tool center point) position.
 
+              Served from the realtime state stream when the SDK has a fresh frame; falls back
+              to the GetActualTCPPose XML-RPC call otherwise (mock robot, stream not connected).
+
               Returns:
                   list: Current robot TCP pose.
               """
+        state_stream = getattr(self.robot, "state_stream", None)
+        if state_stream is not None:
+            currentPose = state_stream.tcp_pose(max_age=STATE_STREAM_MAX_AGE)
+            if currentPose is not None:
+                return currentPose
         try:
             currentPose = self.robot.GetActualTCPPose()
         except Exception as e:
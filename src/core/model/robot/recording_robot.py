@@ -0,0 +1,125 @@
+import time
+from typing import NamedTuple
+
+from core.model.robot.IRobot import IRobot
+from core.model.robot.enums.trajectory import TrajectoryUploadMode
+
+
+class RecordedCommand(NamedTuple):
+    name: str
+    args: dict
+    timestamp: float
+
+
+class RecordingRobot(IRobot):
+    """
+       Offline robot backend that records the command stream instead of moving.
+
+       Used to test trajectory upload and state handlers without a controller. The motion
+       queue is simulated: uploaded points are queued and ``queue_drain_per_poll`` of them
+       complete on every get_motion_queue_length() call.
+
+       Args:
+           upload_modes: Bulk upload modes to advertise; () makes the robot MoveL-only.
+           queue_drain_per_poll: Points completed per queue poll; None = queue length not reported.
+           fail_at: Optional (command name, n) - the n-th call (1-based) of that command fails.
+           error_code: Code returned by the failing call.
+       """
+
+    def __init__(self, upload_modes=(TrajectoryUploadMode.SPLINE,), queue_drain_per_poll=None,
+                 fail_at=None, error_code=-1):
+        self.upload_modes = tuple(upload_modes)
+        self.queue_drain_per_poll = queue_drain_per_poll
+        self.fail_at = fail_at
+        self.error_code = error_code
+        self.commands = []
+        self.queued = 0
+        self.max_queued = 0
+        self.position = [0.0, 0.0, 0.0, 180.0, 0.0, 0.0]
+        self._call_counts = {}
+
+    def _record(self, name, **args):
+        self.commands.append(RecordedCommand(name, args, time.monotonic()))
+        count = self._call_counts.get(name, 0) + 1
+        self._call_counts[name] = count
+        if self.fail_at is not None and self.fail_at == (name, count):
+            return self.error_code
+        return 0
+
+    def _enqueue(self, count):
+        self.queued += count
+        self.max_queued = max(self.max_queued, self.queued)
+
+    def command_names(self):
+        return [command.name for command in self.commands]
+
+    def uploaded_points(self):
+        """Every point sent through move_liner or add_spline_points, in order."""
+        points = []
+        for command in self.commands:
+            if command.name == "move_liner":
+                points.append(command.args["position"])
+            elif command.name == "add_spline_points":
+                points.extend(command.args["points"])
+        return points
+
+    # --- Motion commands ---
+    def move_cartesian(self, position, tool=0, user=0, vel=30, acc=30, blendR=0):
+        result = self._record("move_cartesian", position=list(position), tool=tool, user=user, vel=vel, acc=acc)
+        if result == 0:
+            self.position = list(position)
+        return result
+
+    def move_liner(self, position, tool=0, user=0, vel=30, acc=30, blendR=0):
+        result = self._record("move_liner", position=list(position), tool=tool, user=user, vel=vel, acc=acc,
+                              blendR=blendR)
+        if result == 0:
+            self._enqueue(1)
+            self.position = list(position)
+        return result
+
+    def get_trajectory_upload_modes(self):
+        return self.upload_modes
+
+    def start_spline(self, tool=0, user=0, average_time_ms=2000):
+        return self._record("start_spline", tool=tool, user=user, average_time_ms=average_time_ms)
+
+    def add_spline_points(self, points, tool=0, user=0, last=False):
+        points = [list(point) for point in points]
+        result = self._record("add_spline_points", points=points, tool=tool, user=user, last=last)
+        if result == 0 and points:
+            self._enqueue(len(points))
+            self.position = points[-1]
+        return result
+
+    def end_spline(self):
+        return self._record("end_spline")
+
+    def stop_motion(self):
+        self.queued = 0
+        return self._record("stop_motion")
+
+    def get_motion_queue_length(self):
+        if self.queue_drain_per_poll is None:
+            return None
+        self.queued = max(0, self.queued - self.queue_drain_per_poll)
+        return self.queued
+
+    # --- State queries ---
+    def get_current_position(self):
+        return list(self.position)
+
+    def get_current_velocity(self):
+        return 0.0
+
+    def get_current_acceleration(self):
+        return 0.0
+
+    def enable(self):
+        self._record("enable")
+
+    def disable(self):
+        self._record("disable")
+
+    def start_jog(self, axis, direction, step, vel, acc):
+        return self._record("start_jog", axis=axis, direction=direction, step=step, vel=vel, acc=acc)
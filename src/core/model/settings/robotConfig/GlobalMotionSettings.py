@@ -9,6 +9,7 @@ class GlobalMotionSettings:
     global_acceleration: int = 100
     emergency_decel: int = 500
     max_jog_step: int = 50
+    spline_streaming: bool = False  # Upload paths as one spline motion on robots that support it (MoveL otherwise)
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'GlobalMotionSettings':
@@ -17,7 +18,8 @@ class GlobalMotionSettings:
             global_velocity=data.get("global_velocity", 100),
             global_acceleration=data.get("global_acceleration", 100),
             emergency_decel=data.get("emergency_decel", 500),
-            max_jog_step=data.get("max_jog_step", 50)
+            max_jog_step=data.get("max_jog_step", 50),
+            spline_streaming=data.get("spline_streaming", False)
         )
 
     def to_dict(self) -> Dict:
@@ -26,5 +28,6 @@ class GlobalMotionSettings:
             "global_velocity": self.global_velocity,
             "global_acceleration": self.global_acceleration,
             "emergency_decel": self.emergency_decel,
-            "max_jog_step": self.max_jog_step
+            "max_jog_step": self.max_jog_step,
+            "spline_streaming": self.spline_streaming
         }
\ No newline at end of file
@@ -22,6 +22,8 @@ class RobotStateManager:
         self.robotStateTopic = RobotTopics.ROBOT_STATE
         self.monitor = robot_monitor
         self.monitor.set_data_callback(self.on_motion_data)
+        # Shared sample history - readers query it instead of polling the monitor
+        self.telemetry = robot_monitor.telemetry
 
     # ----------------------------
     # Callbacks and State Logic
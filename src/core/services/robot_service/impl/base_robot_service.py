@@ -8,6 +8,7 @@ from core.application.interfaces.ISubscriptionModule import ISubscriptionModule
 from core.application_state_management import SubscriptionManger
 from core.model.robot.IRobot import IRobot
 from core.services.robot_service.impl.robot_monitor.state_manager import BaseRobotServiceStateManager
+from core.services.robot_service.impl.trajectory_streamer import TrajectoryStreamer
 from core.services.robot_service.interfaces.IRobotService import IRobotService
 from core.system_state_management import ServiceState
 
@@ -43,6 +44,10 @@ class CancellationToken:
         """Check if the operation has been cancelled."""
         return self._cancelled.is_set()
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or timeout expires; returns True if cancelled."""
+        return self._cancelled.wait(timeout)
+
     def reset(self):
         """Reset the cancellation token."""
         self._cancelled.clear()
@@ -101,6 +106,7 @@ class RobotService(IRobotService):
             self.logger = None
         self.logger_context = LoggerContext(enabled=self.enable_logging,
                                             logger=self.logger)
+        self.trajectory_streamer = TrajectoryStreamer(self.robot, logger_context=self.logger_context)
         log_info_message(self.logger_context, message=f"RobotService initialized with robot type {type(self.robot).__name__}.")
 
     @property
@@ -347,7 +353,39 @@ class RobotService(IRobotService):
                                   message=f"Robot reached target position {endPoint} within threshold {threshold}mm")
                 return True
 
-            time.sleep(0.01)
+            # Wakes immediately on cancellation instead of finishing the poll interval
+            if cancellation_token is not None:
+                cancellation_token.wait(0.01)
+            else:
+                time.sleep(0.01)
+
+    def stream_trajectory(self, points, velocity, acceleration, blend_radius=1, should_abort=None):
+        """
+        Upload a path to the robot in batches: blended MoveL, or one spline motion when the
+        spline_streaming global motion setting is on and the robot supports it.
+
+        Args:
+            points (list): Cartesian path points
+            velocity (float): Speed (mm/s in spline mode)
+            acceleration (float): Acceleration
+            blend_radius (float): MoveL blend radius, used when falling back to per-point moves
+            should_abort (callable): Polled between batches; returning True stops the upload
+
+        Returns:
+            TrajectoryUploadResult
+        """
+        return self.trajectory_streamer.stream(points,
+                                               tool=self.robot_config.robot_tool,
+                                               user=self.robot_config.robot_user,
+                                               vel=velocity,
+                                               acc=acceleration,
+                                               blend_radius=blend_radius,
+                                               should_abort=should_abort,
+                                               spline_enabled=self.robot_config.global_motion_settings.spline_streaming)
+
+    def get_trajectory_upload_stats(self):
+        """Throughput / queue depth of the most recent trajectory upload (TrajectoryUploadStats or None)"""
+        return self.trajectory_streamer.last_stats
 
     def add_subscription_module(self, module: "ISubscriptionModule"):
         """
@@ -374,6 +412,10 @@ class RobotService(IRobotService):
         return self.robot_state_manager.position
         # return self.robot.getCurrentPosition()
 
+    def get_telemetry(self):
+        """Timestamped pose history with filtered speed / acceleration (TelemetryBuffer)"""
+        return self.robot_state_manager.telemetry
+
     def enable_robot(self):
         """Enable robot motion"""
         self.robot.enable()
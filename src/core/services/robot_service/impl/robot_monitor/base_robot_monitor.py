@@ -2,11 +2,12 @@ import threading
 import time
 from abc import abstractmethod
 
+from core.services.robot_service.impl.robot_monitor.telemetry_buffer import TelemetryBuffer
 from core.services.robot_service.interfaces.IRobotMonitor import IRobotMonitor
 
 
 class BaseRobotMonitor(IRobotMonitor):
-    def __init__(self,cycle_time=0.03):
+    def __init__(self,cycle_time=0.03, telemetry_capacity=4096):
         self._stop_event = threading.Event()
         self.data_callback = None  # <-- sends (pos, vel, accel, timestamp)
         self.cycle_time = cycle_time
@@ -19,6 +20,9 @@ class BaseRobotMonitor(IRobotMonitor):
         self.prev_pos = None
         self.prev_time = None
 
+        # Every pose sample lands here; velocity / acceleration come from its motion filter
+        self.telemetry = TelemetryBuffer(capacity=telemetry_capacity)
+
     def run(self):
         """Continuous motion data collection loop."""
         while not self._stop_event.is_set():
@@ -33,12 +37,11 @@ class BaseRobotMonitor(IRobotMonitor):
             if self.current_pos is None:
                 self.data_callback(None, None, None, current_time, error=True)
             else:
-
-                if self.prev_pos is not None:
+                if self.prev_time is not None:
                     self.dt = current_time - self.prev_time
-                    self.current_velocity = self.get_current_velocity()
-                    if self.prev_velocity is not None:
-                        self.current_acceleration = self.get_current_acceleration()
+                self.telemetry.append(current_time, self.current_pos)
+                self.current_velocity = self.get_current_velocity()
+                self.current_acceleration = self.get_current_acceleration()
 
                 # Send motion data back to manager
                 self.data_callback(self.current_pos, self.current_velocity, self.current_acceleration, current_time)
@@ -65,10 +68,12 @@ class BaseRobotMonitor(IRobotMonitor):
     def get_current_position(self):
         raise NotImplementedError
 
-    @abstractmethod
     def get_current_velocity(self):
-        raise NotImplementedError
+        """Filtered TCP speed in mm/s from the telemetry buffer."""
+        sample = self.telemetry.latest()
+        return sample.speed if sample is not None else 0.0
 
-    @abstractmethod
     def get_current_acceleration(self):
-        raise NotImplementedError
\ No newline at end of file
+        """Filtered acceleration along the path in mm/s² from the telemetry buffer."""
+        sample = self.telemetry.latest()
+        return sample.acceleration if sample is not None else 0.0
\ No newline at end of file
@@ -0,0 +1,182 @@
+import threading
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+
+class TelemetrySample(NamedTuple):
+    timestamp: float
+    pose: np.ndarray
+    speed: float
+    acceleration: float
+
+
+class TelemetryWindow(NamedTuple):
+    timestamps: np.ndarray     # (K,)
+    poses: np.ndarray          # (K, D)
+    speeds: np.ndarray         # (K,)
+    accelerations: np.ndarray  # (K,)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+
+class AlphaBetaGammaFilter:
+    """
+    Alpha-beta-gamma tracker for the TCP position (x, y, z).
+
+    Each update predicts position / velocity / acceleration forward by the real sample interval
+    and corrects them with the measured position, so velocity is in mm/s and acceleration in
+    mm/s² regardless of jitter in the polling period.
+    """
+
+    def __init__(self, alpha=0.5, beta=0.2, gamma=0.02, dims=3):
+        self.alpha = alpha
+        self.beta = beta
+        self.gamma = gamma
+        self.dims = dims
+        self.reset()
+
+    def reset(self):
+        self.position = None
+        self.velocity = np.zeros(self.dims)
+        self.acceleration = np.zeros(self.dims)
+
+    def update(self, measurement, dt):
+        measurement = np.asarray(measurement, dtype=np.float64)[:self.dims]
+        if self.position is None:
+            self.position = measurement.copy()
+            return
+        if dt <= 0:
+            return
+
+        predicted = self.position + self.velocity * dt + 0.5 * self.acceleration * dt * dt
+        predicted_velocity = self.velocity + self.acceleration * dt
+        residual = measurement - predicted
+
+        self.position = predicted + self.alpha * residual
+        self.velocity = predicted_velocity + (self.beta / dt) * residual
+        self.acceleration = self.acceleration + (2.0 * self.gamma / (dt * dt)) * residual
+
+    @property
+    def speed(self):
+        return float(np.linalg.norm(self.velocity))
+
+    @property
+    def tangential_acceleration(self):
+        """Acceleration along the direction of motion: > 0 speeding up, < 0 slowing down."""
+        speed = self.speed
+        if speed < 1e-9:
+            return 0.0
+        return float(np.dot(self.velocity, self.acceleration) / speed)
+
+
+class TelemetryBuffer:
+    """
+    Fixed-size ring of timestamped robot pose samples with filtered speed and acceleration.
+
+    Written by the robot monitor thread; read by anyone that needs robot motion (pump
+    adjustment, trajectory feed, state publishing). Storage is NumPy arrays sized once at
+    construction; the oldest samples are overwritten when the ring is full. Timestamps must be
+    non-decreasing - samples older than the newest one are ignored.
+    """
+
+    def __init__(self, capacity=4096, pose_dims=6, motion_filter=None):
+        self.capacity = int(capacity)
+        self.pose_dims = int(pose_dims)
+        self.filter = motion_filter if motion_filter is not None else AlphaBetaGammaFilter()
+        self._lock = threading.Lock()
+        self._timestamps = np.zeros(self.capacity, dtype=np.float64)
+        self._poses = np.zeros((self.capacity, self.pose_dims), dtype=np.float64)
+        self._speeds = np.zeros(self.capacity, dtype=np.float64)
+        self._accelerations = np.zeros(self.capacity, dtype=np.float64)
+        self._next = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def clear(self):
+        with self._lock:
+            self._next = 0
+            self._count = 0
+            self.filter.reset()
+
+    def append(self, timestamp, pose):
+        """
+        Store a pose sample and update the motion filter.
+
+        Returns:
+            tuple: (speed, acceleration) after this sample
+        """
+        pose = np.asarray(pose, dtype=np.float64).ravel()
+        with self._lock:
+            last = (self._next - 1) % self.capacity
+            if self._count:
+                dt = timestamp - self._timestamps[last]
+                if dt < 0:
+                    return float(self._speeds[last]), float(self._accelerations[last])
+            else:
+                dt = 0.0
+
+            self.filter.update(pose, dt)
+            speed = self.filter.speed
+            acceleration = self.filter.tangential_acceleration
+
+            index = self._next
+            self._timestamps[index] = timestamp
+            self._poses[index].fill(0.0)
+            self._poses[index, :min(len(pose), self.pose_dims)] = pose[:self.pose_dims]
+            self._speeds[index] = speed
+            self._accelerations[index] = acceleration
+            self._next = (index + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+        return speed, acceleration
+
+    # --- Queries ---
+    def latest(self) -> Optional[TelemetrySample]:
+        with self._lock:
+            if not self._count:
+                return None
+            index = (self._next - 1) % self.capacity
+            return TelemetrySample(float(self._timestamps[index]), self._poses[index].copy(),
+                                   float(self._speeds[index]), float(self._accelerations[index]))
+
+    def _order(self):
+        """Ring indices in chronological order (caller holds the lock)."""
+        start = (self._next - self._count) % self.capacity
+        return (start + np.arange(self._count)) % self.capacity
+
+    def pose_at(self, t) -> Optional[np.ndarray]:
+        """
+        Pose at time t, linearly interpolated between the neighbouring samples.
+
+        Times after the newest sample return the newest pose (no extrapolation); times before the
+        oldest retained sample return None.
+        """
+        with self._lock:
+            if not self._count:
+                return None
+            order = self._order()
+            timestamps = self._timestamps[order]
+            if t < timestamps[0]:
+                return None
+            if t >= timestamps[-1]:
+                return self._poses[order[-1]].copy()
+            right = int(np.searchsorted(timestamps, t, side="right"))
+            t0, t1 = timestamps[right - 1], timestamps[right]
+            p0, p1 = self._poses[order[right - 1]], self._poses[order[right]]
+            if t1 <= t0:
+                return p1.copy()
+            return p0 + (p1 - p0) * ((t - t0) / (t1 - t0))
+
+    def window(self, t0, t1) -> TelemetryWindow:
+        """Copies of all samples with t0 <= timestamp <= t1, oldest first."""
+        with self._lock:
+            order = self._order()
+            timestamps = self._timestamps[order]
+            low = np.searchsorted(timestamps, t0, side="left")
+            high = np.searchsorted(timestamps, t1, side="right")
+            selected = order[low:high]
+            return TelemetryWindow(timestamps[low:high].copy(), self._poses[selected],
+                                   self._speeds[selected], self._accelerations[selected])
@@ -8,7 +8,6 @@ following the same interface as the Fairino robot monitor.
 
 from core.model.robot.ZeroErrRobot import ZeroErrRobot
 from core.services.robot_service.impl.robot_monitor.base_robot_monitor import BaseRobotMonitor
-from modules.utils import robot_utils
 
 
 class ZeroErrorRobotMonitor(BaseRobotMonitor):
@@ -33,11 +32,3 @@ class ZeroErrorRobotMonitor(BaseRobotMonitor):
     def get_current_position(self):
         """Get current robot position from Zero Error robot"""
         return self.robot.get_current_position()
-
-    def get_current_velocity(self):
-        """Calculate current velocity based on position changes"""
-        return robot_utils.calculate_velocity(self.current_pos, self.prev_pos, self.dt)
-
-    def get_current_acceleration(self):
-        """Calculate current acceleration based on velocity changes"""
-        return robot_utils.calculate_acceleration(self.current_velocity, self.prev_velocity, self.dt, use_dt=False)
\ No newline at end of file
@@ -0,0 +1,183 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from core.model.robot.enums.trajectory import TrajectoryUploadMode
+from modules.utils.custom_logging import LoggerContext, log_debug_message, log_error_message, log_info_message
+
+
+def spline_average_time_ms(points, velocity) -> int:
+    """
+    NewSplineStart ``averageTime`` for *points* at *velocity*.
+
+    The controller ignores per-point spline speed and times the spline from the average time
+    between consecutive points, so this is the mean XYZ segment length (mm) divided by the
+    path velocity (mm/s), in milliseconds.
+    """
+    if velocity <= 0:
+        raise ValueError(f"Spline velocity must be positive, got {velocity}")
+    length = sum(math.dist(a[:3], b[:3]) for a, b in zip(points, points[1:]))
+    segments = max(1, len(points) - 1)
+    return max(1, int(round(length / segments / velocity * 1000.0)))
+
+
+@dataclass
+class TrajectoryUploadStats:
+    mode: TrajectoryUploadMode
+    points: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+    queue_wait: float = 0.0
+    max_queue_depth: Optional[int] = None
+
+    @property
+    def points_per_second(self) -> float:
+        return self.points / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self):
+        return {
+            "mode": self.mode.value,
+            "points": self.points,
+            "batches": self.batches,
+            "elapsed": self.elapsed,
+            "queue_wait": self.queue_wait,
+            "max_queue_depth": self.max_queue_depth,
+            "points_per_second": self.points_per_second,
+        }
+
+
+@dataclass
+class TrajectoryUploadResult:
+    success: bool
+    points_sent: int
+    error_code: int = 0
+    aborted: bool = False
+    stats: Optional[TrajectoryUploadStats] = None
+
+
+class TrajectoryStreamer:
+    """
+    Uploads a Cartesian path to the robot in pipelined batches.
+
+    Paths go out as one blended move_liner per point by default. With ``spline_enabled`` (the
+    ``spline_streaming`` global motion setting), robots advertising TrajectoryUploadMode.SPLINE
+    get one spline motion instead, timed by spline_average_time_ms and uploaded ``batch_size``
+    points at a time; paths too short for a spline still use MoveL. When the robot reports its motion
+    queue length, uploading stays at most ``max_queue_depth`` points ahead of execution, so the
+    controller is never starved but a pause still takes effect quickly.
+
+    ``should_abort`` is polled before every batch (every point in MoveL mode); on abort the
+    result reports how many points were sent so the caller can save its progress.
+    """
+
+    def __init__(self, robot, batch_size=50, max_queue_depth=200, min_spline_points=4,
+                 queue_poll_interval=0.005, spline_enabled=False, logger_context: Optional[LoggerContext] = None):
+        self.robot = robot
+        self.spline_enabled = spline_enabled
+        self.batch_size = max(1, int(batch_size))
+        self.max_queue_depth = max(self.batch_size, int(max_queue_depth))
+        self.min_spline_points = min_spline_points
+        self.queue_poll_interval = queue_poll_interval
+        self.logger_context = logger_context or LoggerContext(enabled=False, logger=None)
+        self.last_stats: Optional[TrajectoryUploadStats] = None
+
+    def choose_mode(self, points, spline_enabled=None) -> TrajectoryUploadMode:
+        if spline_enabled is None:
+            spline_enabled = self.spline_enabled
+        if spline_enabled and len(points) >= self.min_spline_points and \
+                TrajectoryUploadMode.SPLINE in self.robot.get_trajectory_upload_modes():
+            return TrajectoryUploadMode.SPLINE
+        return TrajectoryUploadMode.MOVEL
+
+    def stream(self, points, tool=0, user=0, vel=10, acc=30, blend_radius=1,
+               should_abort: Optional[Callable[[], bool]] = None, spline_enabled=None) -> TrajectoryUploadResult:
+        """
+        Upload *points* to the robot.
+
+        ``spline_enabled`` overrides the streamer default for this path. In spline mode the
+        speed comes from *vel* (mm/s) through the spline timing; *acc* only applies to MoveL.
+
+        Returns:
+            TrajectoryUploadResult: success flag, number of points uploaded and upload stats
+        """
+        mode = self.choose_mode(points, spline_enabled)
+        stats = TrajectoryUploadStats(mode)
+        self.last_stats = stats
+        start = time.perf_counter()
+        try:
+            if mode is TrajectoryUploadMode.SPLINE:
+                result = self._stream_spline(points, tool, user, vel, should_abort, stats)
+            else:
+                result = self._stream_movel(points, tool, user, vel, acc, blend_radius, should_abort, stats)
+        finally:
+            stats.elapsed = time.perf_counter() - start
+
+        result.stats = stats
+        log_info_message(self.logger_context,
+                         f"Trajectory upload ({mode}): {stats.points}/{len(points)} points in {stats.batches} batches, "
+                         f"{stats.elapsed * 1000:.1f} ms ({stats.points_per_second:.0f} pts/s), "
+                         f"queue wait {stats.queue_wait * 1000:.1f} ms, max queue depth {stats.max_queue_depth}")
+        return result
+
+    def _wait_for_queue_room(self, needed, should_abort, stats) -> bool:
+        """Block until the controller queue has room for *needed* points; False if aborted."""
+        waited_from = time.perf_counter()
+        while True:
+            depth = self.robot.get_motion_queue_length()
+            if depth is None:
+                return True
+            if stats.max_queue_depth is None or depth > stats.max_queue_depth:
+                stats.max_queue_depth = depth
+            if depth + needed <= self.max_queue_depth:
+                stats.queue_wait += time.perf_counter() - waited_from
+                return True
+            if should_abort is not None and should_abort():
+                stats.queue_wait += time.perf_counter() - waited_from
+                return False
+            time.sleep(self.queue_poll_interval)
+
+    def _stream_spline(self, points, tool, user, vel, should_abort, stats) -> TrajectoryUploadResult:
+        average_time_ms = spline_average_time_ms(points, vel)
+        ret = self.robot.start_spline(tool=tool, user=user, average_time_ms=average_time_ms)
+        if ret != 0:
+            log_error_message(self.logger_context, f"start_spline failed with code {ret}")
+            return TrajectoryUploadResult(False, 0, error_code=ret)
+
+        for offset in range(0, len(points), self.batch_size):
+            batch = points[offset:offset + self.batch_size]
+            if (should_abort is not None and should_abort()) or \
+                    not self._wait_for_queue_room(len(batch), should_abort, stats):
+                self.robot.end_spline()
+                log_debug_message(self.logger_context, f"Spline upload aborted after {offset} points")
+                return TrajectoryUploadResult(False, offset, aborted=True)
+
+            last = offset + len(batch) >= len(points)
+            ret = self.robot.add_spline_points(batch, tool=tool, user=user, last=last)
+            if ret != 0:
+                log_error_message(self.logger_context, f"add_spline_points failed with code {ret} at point {offset}")
+                self.robot.end_spline()
+                return TrajectoryUploadResult(False, offset, error_code=ret)
+            stats.points += len(batch)
+            stats.batches += 1
+
+        ret = self.robot.end_spline()
+        if ret != 0:
+            log_error_message(self.logger_context, f"end_spline failed with code {ret}")
+            return TrajectoryUploadResult(False, len(points), error_code=ret)
+        return TrajectoryUploadResult(True, len(points))
+
+    def _stream_movel(self, points, tool, user, vel, acc, blend_radius, should_abort, stats) -> TrajectoryUploadResult:
+        for i, point in enumerate(points):
+            if (should_abort is not None and should_abort()) or \
+                    not self._wait_for_queue_room(1, should_abort, stats):
+                log_debug_message(self.logger_context, f"MoveL upload aborted after {i} points")
+                return TrajectoryUploadResult(False, i, aborted=True)
+
+            ret = self.robot.move_liner(position=point, tool=tool, user=user, vel=vel, acc=acc, blendR=blend_radius)
+            if ret != 0:
+                log_error_message(self.logger_context, f"MoveL failed with code {ret} at point {i}")
+                return TrajectoryUploadResult(False, i, error_code=ret)
+            stats.points += 1
+            stats.batches += 1
+        return TrajectoryUploadResult(True, len(points))
@@ -11,7 +11,7 @@ import json
 import cv2
 import threading
 from pathlib import Path
-from modules.shared.MessageBroker import MessageBroker
+from modules.shared.MessageBroker import MessageBroker, DeliveryPolicy
 
 
 
@@ -80,7 +80,10 @@ class _VisionService(VisionSystem):
         self.superRun = super().run
         self.latest_frame = None
         self.frame_lock = threading.Lock()
+        # Signalled (under frame_lock) whenever latest_frame/frame_id change
+        self.frame_condition = threading.Condition(self.frame_lock)
         self.frame_id = 0  # Track unique frame updates
+        self.latest_frame_timestamp = None  # Capture time (time.time()) of latest_frame
         self.contours = None
         self.workAreaCorners = None
         self.filteredContours = None
@@ -183,6 +186,9 @@ class _VisionService(VisionSystem):
               """
         print("Starting VisionService run loop...")
         broker = MessageBroker()
+        # Frames go to the UI on the broker workers; a slow viewer only ever misses frames
+        broker.set_topic_policy(VisionTopics.LATEST_IMAGE, DeliveryPolicy.LATEST)
+        broker.set_topic_policy(VisionTopics.LATEST_FRAME, DeliveryPolicy.LATEST)
         prev_time = time.time()  # store time of previous frame
 
         while True:
@@ -202,6 +208,13 @@ class _VisionService(VisionSystem):
                 broker.publish(VisionTopics.FPS, fps)
                 # print(f"[VisionService] Published latest frame and FPS: {fps:.2f}")
                 self.frame_id += 1  # Increment frame ID on new frame
+                self.latest_frame_timestamp = self.frame_timestamp
+                self.frame_condition.notify_all()
+                broker.publish(VisionTopics.LATEST_FRAME, {
+                    "frame_id": self.frame_id,
+                    "timestamp": self.latest_frame_timestamp,
+                    "frame": frame,
+                })
 
     def getLatestFrame(self):
         """
@@ -47,11 +47,29 @@ class BaseWorkpieceService:
         """
             Loads all previously saved workpieces from the repository.
 
+            Repositories with an index are walked through list_summaries and each workpiece
+            is fetched by ID, so only the repository's bounded cache keeps bodies in memory.
+
             Returns:
                 list: A list of Workpiece objects.
             """
-        data = self.repository.data
-        return data
+        if not hasattr(self.repository, "list_summaries"):
+            return self.repository.data
+        workpieces = (self.repository.get_workpiece_by_id(summary.workpiece_id)
+                      for summary in self.repository.list_summaries())
+        return [workpiece for workpiece in workpieces if workpiece is not None]
+
+    def list_summaries(self):
+        """
+            Lists the saved workpieces without loading them.
+
+            Returns:
+                list: Index entries (ID, name, bounding box, thumbnail) when the repository
+                keeps an index, else the loaded Workpiece objects.
+            """
+        if hasattr(self.repository, "list_summaries"):
+            return self.repository.list_summaries()
+        return self.repository.data
 
     def delete_workpiece_by_id(self, workpieceId):
         """
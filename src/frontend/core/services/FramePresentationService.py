@@ -0,0 +1,207 @@
+"""
+Frame Presentation Service
+
+Push-based camera frame delivery for preview widgets (CameraFeed).
+
+Instead of every preview polling the controller on its own QTimer, the service subscribes
+once to VisionTopics.LATEST_FRAME. A worker thread takes the newest frame, skips it if its
+frame_id was already prepared, and downscales it once per registered view size into a
+QImage. The GUI thread is then signalled and hands each view the image prepared for its
+size, so the GUI thread only converts a small QImage to a pixmap.
+
+Frames are coalesced at every stage: if the camera is faster than the worker, or the worker
+faster than the GUI, only the newest frame is kept and the skipped ones are counted.
+``stats`` reports the counters and the capture-to-screen latency.
+"""
+
+import threading
+import time
+import weakref
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from communication_layer.api.v1.topics import VisionTopics
+from modules.shared.MessageBroker import MessageBroker
+
+LATENCY_SMOOTHING = 0.1
+
+
+@dataclass
+class PresentationStats:
+    frames_received: int = 0  # frames delivered by the broker
+    frames_prepared: int = 0  # frames downscaled by the worker
+    frames_presented: int = 0  # frames handed to the views on the GUI thread
+    frames_unchanged: int = 0  # deliveries skipped because the frame_id was already prepared
+    frames_dropped_source: int = 0  # frame_id gaps: frames never delivered (broker coalescing)
+    frames_dropped_worker: int = 0  # delivered frames replaced by a newer one before preparation
+    frames_dropped_ui: int = 0  # prepared frames replaced by a newer one before the GUI showed them
+    latency_ms_last: float = 0.0  # capture -> handed to the views
+    latency_ms_avg: float = 0.0
+    latency_ms_max: float = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+class FramePresentationService(QObject):
+    """
+    Prepares camera frames for registered views off the GUI thread.
+
+    Views implement ``present_frame(frame_id, qimage)`` and are registered with the size
+    they display (width, height). Must be created on the GUI thread.
+    """
+
+    _frame_prepared = pyqtSignal()
+
+    def __init__(self, broker: Optional[MessageBroker] = None, topic: str = VisionTopics.LATEST_FRAME):
+        super().__init__()
+        self.broker = broker if broker is not None else MessageBroker()
+        self.topic = topic
+        self.stats = PresentationStats()
+        self._views = weakref.WeakKeyDictionary()  # view -> (width, height)
+        self._lock = threading.Condition()
+        self._incoming = None  # newest (frame_id, timestamp, frame) not yet prepared
+        self._prepared = None  # newest (frame_id, timestamp, {size: QImage}) not yet presented
+        self._last_received_id = None
+        self._last_prepared_id = None
+        self._subscribed = False
+        self._running = True
+        self._frame_prepared.connect(self._present)
+        self._worker = threading.Thread(target=self._run, name="FramePresentationWorker", daemon=True)
+        self._worker.start()
+
+    # --- Views ---
+    def register(self, view, size: Tuple[int, int]):
+        with self._lock:
+            self._views[view] = (int(size[0]), int(size[1]))
+            # Re-prepare the current frame for the new size
+            self._last_prepared_id = None
+            if not self._subscribed:
+                self.broker.subscribe(self.topic, self._on_frame)
+                self._subscribed = True
+
+    def update_size(self, view, size: Tuple[int, int]):
+        self.register(view, size)
+
+    def unregister(self, view):
+        with self._lock:
+            self._views.pop(view, None)
+            if not self._views and self._subscribed:
+                self.broker.unsubscribe(self.topic, self._on_frame)
+                self._subscribed = False
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = PresentationStats()
+
+    # --- Broker thread ---
+    def _on_frame(self, message):
+        if not isinstance(message, dict) or message.get("frame") is None:
+            return
+        frame_id = message.get("frame_id")
+        with self._lock:
+            self.stats.frames_received += 1
+            if frame_id is not None and self._last_received_id is not None and frame_id > self._last_received_id + 1:
+                self.stats.frames_dropped_source += frame_id - self._last_received_id - 1
+            self._last_received_id = frame_id
+            if self._incoming is not None:
+                self.stats.frames_dropped_worker += 1
+            self._incoming = (frame_id, message.get("timestamp"), message["frame"])
+            self._lock.notify()
+
+    # --- Worker thread ---
+    def _run(self):
+        while self._running:
+            with self._lock:
+                while self._incoming is None and self._running:
+                    self._lock.wait()
+                if not self._running:
+                    return
+                frame_id, timestamp, frame = self._incoming
+                self._incoming = None
+                if frame_id is not None and frame_id == self._last_prepared_id:
+                    self.stats.frames_unchanged += 1
+                    continue
+                sizes = set(self._views.values())
+            if not sizes:
+                continue
+            try:
+                images = {size: self._prepare(frame, size) for size in sizes}
+            except Exception as e:
+                print(f"[FramePresentationService] Error preparing frame {frame_id}: {e}")
+                continue
+            with self._lock:
+                self._last_prepared_id = frame_id
+                self.stats.frames_prepared += 1
+                if self._prepared is not None:
+                    self.stats.frames_dropped_ui += 1
+                self._prepared = (frame_id, timestamp, images)
+            self._frame_prepared.emit()
+
+    @staticmethod
+    def _prepare(frame: np.ndarray, size: Tuple[int, int]) -> QImage:
+        width, height = size
+        if frame.shape[1] != width or frame.shape[0] != height:
+            frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+        frame = np.ascontiguousarray(frame)
+        if frame.ndim == 2:
+            image = QImage(frame.data, width, height, width, QImage.Format.Format_Grayscale8)
+        else:
+            image = QImage(frame.data, width, height, 3 * width, QImage.Format.Format_RGB888)
+        return image.copy()  # detach from the numpy buffer
+
+    # --- GUI thread ---
+    def _present(self):
+        with self._lock:
+            prepared = self._prepared
+            self._prepared = None
+            views = list(self._views.items())
+        if prepared is None:
+            return  # coalesced into an earlier signal
+        frame_id, timestamp, images = prepared
+        for view, size in views:
+            image = images.get(size)
+            if image is None:
+                continue
+            try:
+                view.present_frame(frame_id, image)
+            except RuntimeError:
+                # Underlying Qt widget already deleted
+                self.unregister(view)
+        if timestamp is not None:
+            latency = (time.time() - timestamp) * 1000.0
+            with self._lock:
+                stats = self.stats
+                stats.frames_presented += 1
+                stats.latency_ms_last = latency
+                stats.latency_ms_max = max(stats.latency_ms_max, latency)
+                stats.latency_ms_avg = latency if stats.frames_presented == 1 else \
+                    stats.latency_ms_avg + LATENCY_SMOOTHING * (latency - stats.latency_ms_avg)
+        else:
+            with self._lock:
+                self.stats.frames_presented += 1
+
+    def shutdown(self):
+        with self._lock:
+            self._running = False
+            self._lock.notify()
+            if self._subscribed:
+                self.broker.unsubscribe(self.topic, self._on_frame)
+                self._subscribed = False
+        self._worker.join(timeout=1.0)
+
+
+_instance = None
+
+
+def get_frame_presentation_service() -> FramePresentationService:
+    """Application-wide presentation service (create it on the GUI thread)."""
+    global _instance
+    if _instance is None:
+        _instance = FramePresentationService()
+    return _instance
@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import QLabel, QPushButton, QVBoxLayout
 from communication_layer.api.v1 import Constants
 from frontend.core.utils.localization import TranslationKeys, TranslatableWidget
 from frontend.widgets.CameraFeed import CameraFeed,CameraFeedConfig
+from frontend.core.services.FramePresentationService import get_frame_presentation_service
 from frontend.widgets.MaterialButton import MaterialButton
 from communication_layer.api.v1.endpoints import auth_endpoints
 from communication_layer.api.v1.endpoints import camera_endpoints
@@ -72,7 +73,8 @@ class QRLoginTab(TranslatableWidget):
         self.camera_feed = CameraFeed(
             cameraFeedConfig=camera_feed_config,
             updateCallback=self.get_camera_frame,
-            toggleCallback=None
+            toggleCallback=None,
+            presentationService=get_frame_presentation_service()
         )
         layout.addWidget(self.camera_feed, alignment=Qt.AlignmentFlag.AlignCenter)
 
@@ -28,7 +28,16 @@ class CameraFeedConfig:
 
 
 class CameraFeed(QFrame):
-    def __init__(self,cameraFeedConfig=CameraFeedConfig(), updateCallback=None, toggleCallback=None):
+    """
+    Camera preview.
+
+    Pull mode (updateCallback): polls the callback every updateFrequency ms.
+    Push mode (presentationService): frames prepared at this widget's size are pushed by the
+    FramePresentationService; no timer runs.
+    """
+
+    def __init__(self,cameraFeedConfig=CameraFeedConfig(), updateCallback=None, toggleCallback=None,
+                 presentationService=None):
         super().__init__()
         self.graphics_view = ClickableGraphicsView(self, self.toggle_resolution)
         self.cameraFeedConfig = cameraFeedConfig
@@ -70,19 +79,28 @@ class CameraFeed(QFrame):
         self.graphics_view.setScene(self.scene)
         self.graphics_view.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        # One pixmap item (added with the first frame), updated in place afterwards
+        self.pixmap_item = None
+        self._last_frame = None
+        self.last_frame_id = None
+
         # Feed control
         self.is_feed_paused = False
         self.clicked_points = []
         self.transformedPoints = []
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.updateCameraLabel)
-        self.timer.start(self.updateFrequency)
-
         self.resolution_small = self.cameraFeedConfig.resolution_small
         self.resolution_large = self.cameraFeedConfig.resolution_large
         self.current_resolution = self.cameraFeedConfig.current_resolution
 
+        self.presentationService = presentationService
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.updateCameraLabel)
+        if self.presentationService is not None:
+            self.presentationService.register(self, (self.width(), self.height()))
+        else:
+            self.timer.start(self.updateFrequency)
+
     def toggle_resolution(self):
         # print("Res toggled")
 
@@ -97,6 +115,8 @@ class CameraFeed(QFrame):
         width, height = self.current_resolution
         self.setFixedSize(width, height)
         self.graphics_view.setFixedSize(width, height)
+        if self.presentationService is not None:
+            self.presentationService.update_size(self, (width, height))
         # print(f"Switched to: {width}x{height}")
 
     def set_image(self, image):
@@ -118,14 +138,25 @@ class CameraFeed(QFrame):
             print("Failed to load image")
             return
 
-        resized_pixmap = pixmap.scaled(self.size().width(), self.size().height(),
-                                       Qt.AspectRatioMode.IgnoreAspectRatio,
-                                       Qt.TransformationMode.SmoothTransformation)
+        self._show_pixmap(pixmap)
 
-        self.scene.clear()
-        pixmap_item = QGraphicsPixmapItem(resized_pixmap)
-        self.scene.addItem(pixmap_item)
-        self.graphics_view.setScene(self.scene)
+    def _show_pixmap(self, pixmap):
+        if pixmap.width() != self.width() or pixmap.height() != self.height():
+            pixmap = pixmap.scaled(self.size().width(), self.size().height(),
+                                   Qt.AspectRatioMode.IgnoreAspectRatio,
+                                   Qt.TransformationMode.SmoothTransformation)
+        if self.pixmap_item is None:
+            self.pixmap_item = QGraphicsPixmapItem(pixmap)
+            self.scene.addItem(self.pixmap_item)
+        else:
+            self.pixmap_item.setPixmap(pixmap)
+
+    def present_frame(self, frame_id, image):
+        """Push mode: show a QImage the presentation service prepared at this widget's size."""
+        if self.is_feed_paused:
+            return
+        self.last_frame_id = frame_id
+        self._show_pixmap(QPixmap.fromImage(image))
 
     def updateCameraLabel(self):
         # start_time = time.time()
@@ -133,7 +164,9 @@ class CameraFeed(QFrame):
             return
         try:
             frame = self.updateCallback()
-            if frame is not None:
+            # The same frame object means the camera has not produced a new frame yet
+            if frame is not None and frame is not self._last_frame:
+                self._last_frame = frame
                 self.set_image(frame)
             else:
                 return
@@ -162,16 +195,17 @@ class CameraFeed(QFrame):
             else:
                 raise TypeError("Unsupported image type")
 
-            resized_pixmap = pixmap.scaled(self.size().width(), self.size().height(),
-                                           Qt.AspectRatioMode.IgnoreAspectRatio,
-                                           Qt.TransformationMode.SmoothTransformation)
-            self.scene.clear()
-            pixmap_item = QGraphicsPixmapItem(resized_pixmap)
-            self.scene.addItem(pixmap_item)
-            self.graphics_view.setScene(self.scene)
+            self._show_pixmap(pixmap)
 
     def resume_feed(self):
         self.is_feed_paused = False
-        self.timer.start(self.updateFrequency)
+        self._last_frame = None
+        if self.presentationService is None:
+            self.timer.start(self.updateFrequency)
         print("Feed resumed.")
         return self.clicked_points
+
+    def closeEvent(self, event):
+        if self.presentationService is not None:
+            self.presentationService.unregister(self)
+        super().closeEvent(event)
@@ -14,6 +14,8 @@ import sys
 import ctypes
 from ctypes import *
 
+import numpy as np
+
 from Cython.Compiler.Options import error_on_unknown_names
 
 is_init =False
@@ -173,6 +175,139 @@ def xmlrpc_timeout(func):
     return wrapper
 
 
+class RobotStateStream:
+    """
+    Framing parser for the realtime state stream (port 20004).
+
+    Frame layout: 0x5A5A header, frame counter (1 byte), data length N (uint16 LE), N data
+    bytes, uint16 LE checksum = sum of the N + 5 preceding bytes. Bytes are received straight
+    into one preallocated buffer (``recv_buffer`` / ``commit``); headers are located with
+    ``bytearray.find`` and the checksum is summed with NumPy.
+
+    Each valid frame is memmoved into a new ``RobotStatePkg`` that is never written again, and
+    published by swapping one ``(sequence, timestamp, pkg)`` reference. Readers never lock and
+    always see a complete sample; ``current`` / ``snapshot`` hand out that published package,
+    which callers must treat as read-only.
+    """
+
+    HEADER = b"\x5a\x5a"
+    HEADER_LEN = 5          # header + frame counter + data length
+    CHECKSUM_LEN = 2
+
+    def __init__(self, capacity=1024 * 16):
+        self.capacity = int(capacity)
+        self.buffer = bytearray(self.capacity)
+        self._view = memoryview(self.buffer)
+        self._address = ctypes.addressof((ctypes.c_char * self.capacity).from_buffer(self.buffer))
+        self._pkg_size = ctypes.sizeof(RobotStatePkg)
+        self._end = 0
+        self._latest = (0, 0.0, None)
+        self.rejected = 0
+
+    @property
+    def sequence(self):
+        """Number of frames decoded so far."""
+        return self._latest[0]
+
+    @property
+    def timestamp(self):
+        """time.monotonic() of the newest decoded frame."""
+        return self._latest[1]
+
+    @property
+    def current(self):
+        """Newest decoded RobotStatePkg (read-only), or None."""
+        return self._latest[2]
+
+    def reset(self):
+        """Drop buffered bytes (e.g. after a reconnect); the last decoded state stays readable."""
+        self._end = 0
+
+    def recv_buffer(self):
+        """Writable view of the free part of the receive buffer, for ``socket.recv_into``."""
+        return self._view[self._end:]
+
+    def feed(self, data):
+        """Copy *data* into the receive buffer and parse it. Returns the number of frames decoded."""
+        decoded = 0
+        data = memoryview(data)
+        while len(data):
+            count = min(len(data), self.capacity - self._end)
+            self._view[self._end:self._end + count] = data[:count]
+            data = data[count:]
+            decoded += self.commit(count)
+        return decoded
+
+    def commit(self, nbytes):
+        """Account for *nbytes* received into ``recv_buffer()`` and decode every complete frame."""
+        self._end += nbytes
+        buffer = self.buffer
+        end = self._end
+        pos = 0
+        decoded = 0
+        while True:
+            start = buffer.find(self.HEADER, pos, end)
+            if start < 0:
+                # Keep a trailing 0x5A: it may be the first half of the next header
+                pos = end - 1 if end and buffer[end - 1] == 0x5A else end
+                break
+            if end - start < self.HEADER_LEN:
+                pos = start
+                break
+            data_len = buffer[start + 3] | (buffer[start + 4] << 8)
+            frame_len = self.HEADER_LEN + data_len + self.CHECKSUM_LEN
+            if frame_len > self.capacity:
+                self.rejected += 1
+                pos = start + 1
+                continue
+            if end - start < frame_len:
+                pos = start
+                break
+
+            checked = self.HEADER_LEN + data_len
+            checksum = int(np.frombuffer(buffer, dtype=np.uint8, count=checked, offset=start).sum())
+            expected = buffer[start + checked] | (buffer[start + checked + 1] << 8)
+            if checksum & 0xFFFF != expected:
+                # False header inside the payload or a corrupted frame - resync one byte on
+                self.rejected += 1
+                pos = start + 1
+                continue
+
+            self._publish(start, min(frame_len, self._pkg_size))
+            decoded += 1
+            pos = start + frame_len
+
+        # Move the unparsed tail (at most one partial frame) to the front of the buffer
+        remaining = end - pos
+        if remaining and pos:
+            ctypes.memmove(self._address, self._address + pos, remaining)
+        self._end = remaining if remaining < self.capacity else 0
+        return decoded
+
+    def _publish(self, start, size):
+        pkg = RobotStatePkg()
+        ctypes.memmove(ctypes.addressof(pkg), self._address + start, size)
+        # One reference swap: readers see either the previous sample or this one, never a mix
+        self._latest = (self._latest[0] + 1, time.monotonic(), pkg)
+
+    def snapshot(self, max_age=None):
+        """
+        (sequence, newest RobotStatePkg), or None if nothing fresh was decoded.
+        The package is the published sample itself - do not modify it.
+        """
+        sequence, timestamp, pkg = self._latest
+        if pkg is None:
+            return None
+        if max_age is not None and time.monotonic() - timestamp > max_age:
+            return None
+        return sequence, pkg
+
+    def tcp_pose(self, max_age=None):
+        """Newest tool pose [x, y, z, rx, ry, rz] from the stream, or None."""
+        result = self.snapshot(max_age)
+        return None if result is None else list(result[1].tl_cur_pos)
+
+
 class RobotError:
     ERR_SUCCESS = 0
     ERR_POINTTABLE_NOTFOUND = -7  # 上传文件不存在
@@ -205,6 +340,7 @@ class RPC():
         self.sock_cli_state = None
         self.robot_realstate_exit = False
         self.robot_state_pkg = RobotStatePkg#机器人状态数据
+        self.state_stream = RobotStateStream(self.BUFFER_SIZE * 2)#实时状态数据帧解析
 
         self.stop_event = threading.Event()  # 停止事件
         thread= threading.Thread(target=self.robot_state_routine_thread)#创建线程循环接收机器人状态数据
@@ -253,85 +389,38 @@ class RPC():
         """处理机器人状态数据包的线程例程"""
 
         while(1):
-            recvbuf = bytearray(self.BUFFER_SIZE)
-            tmp_recvbuf = bytearray(self.BUFFER_SIZE)
-            state_pkg = bytearray(self.BUFFER_SIZE)
-            find_head_flag = False
-            index = 0
-            length = 0
-            tmp_len = 0
+            # The parser's buffer is reused across reconnects
+            self.state_stream.reset()
             if not self.connect_to_robot():
                 return
 
             try:
                 # while not self.robot_realstate_exit:
                 while not self.robot_realstate_exit and not self.stop_event.is_set():
-                    recvbyte = self.sock_cli_state.recv_into(recvbuf)
+                    recvbyte = self.sock_cli_state.recv_into(self.state_stream.recv_buffer())
                     if recvbyte <= 0:
                         self.sock_cli_state.close()
                         print("接收机器人状态字节 -1")
                         return
-                    else:
-                        if tmp_len > 0:
-                            if tmp_len + recvbyte <= self.BUFFER_SIZE:
-                                recvbuf = tmp_recvbuf[:tmp_len] + recvbuf[:recvbyte]
-                                recvbyte += tmp_len
-                                tmp_len = 0
-                            else:
-                                tmp_len = 0
-
-                        for i in range(recvbyte):
-                            if format(recvbuf[i], '02X') == "5A" and not find_head_flag:
-                                if i + 4 < recvbyte:
-                                    if format(recvbuf[i+1], '02X') == "5A":
-                                        find_head_flag = True
-                                        state_pkg[0] = recvbuf[i]
-                                        index += 1
-                                        length = length | recvbuf[i + 4]
-                                        length = length << 8
-                                        length = length | recvbuf[i + 3]
-                                    else:
-                                        continue
-                                else:
-                                    tmp_recvbuf[:recvbyte - i] = recvbuf[i:recvbyte]
-                                    tmp_len = recvbyte - i
-                                    break
-                            elif find_head_flag and index < length + 5:
-                                state_pkg[index] = recvbuf[i]
-                                index += 1
-                            elif find_head_flag and index >= length + 5:
-                                if i + 1 < recvbyte:
-                                    checksum = sum(state_pkg[:index])
-                                    checkdata = 0
-                                    checkdata = checkdata | recvbuf[i + 1]
-                                    checkdata = checkdata << 8
-                                    checkdata = checkdata | recvbuf[i]
-
-                                    if checksum == checkdata:
-                                        self.robot_state_pkg = RobotStatePkg.from_buffer_copy(recvbuf)
-                                        # current_time = datetime.now()
-                                        # print("get robot_state_pkg current_time = datetime.datetime.now()",current_time)
-                                        find_head_flag = False
-                                        index = 0
-                                        length = 0
-                                        i += 1
-                                    else:
-                                        find_head_flag = False
-                                        index = 0
-                                        length = 0
-                                        i += 1
-                                else:
-                                    print("4.2")
-                                    tmp_recvbuf[:recvbyte - i] = recvbuf[i:recvbyte]
-                                    tmp_len = recvbyte - i
-                                    break
-                            else:
-                                continue
+                    if self.state_stream.commit(recvbyte):
+                        self.robot_state_pkg = self.state_stream.current
             except Exception as ex:
                 self.SDK_state=False
                 # self.reconnect()
                 # print("SDK读取机器人实时数据失败", ex)
 
+    def GetRealtimeTCPPose(self, max_age=0.1):
+        """
+        Tool pose from the realtime state stream - no XML-RPC round-trip.
+
+        @param [in] max_age 最大数据时效(s)
+        @return 错误码 成功- 0, 失败-错误码; 返回值 tcp_pose=[x,y,z,rx,ry,rz]
+        """
+        pose = self.state_stream.tcp_pose(max_age=max_age)
+        if pose is None:
+            return RobotError.ERR_SOCKET_COM_FAILED
+        return 0, pose
+
     def setup_logging(self, output_model=1, file_path="", file_num=5):
         """用于处理日志"""
         self.logger = logging.getLogger("RPCLogger")
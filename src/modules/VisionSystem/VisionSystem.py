@@ -14,6 +14,8 @@ from libs.plvision.PLVision.Camera import Camera
 from modules.VisionSystem.brightness_manager import BrightnessManager
 from modules.VisionSystem.camera_initialization import CameraInitializer
 from modules.VisionSystem.data_loading import DataManager
+from modules.VisionSystem.frame_ring import FrameRing
+from modules.VisionSystem.correction_maps import CorrectionMaps
 from modules.VisionSystem.message_publisher import MessagePublisher
 from modules.VisionSystem.settings_manager import SettingsManager
 from modules.VisionSystem.state_manager import StateManager
@@ -28,9 +30,6 @@ from modules.VisionSystem.handlers.camera_calibration_handler import (
 )
 from modules.VisionSystem.handlers.contour_detection_handler import handle_contour_detection
 
-# External or domain-specific image processing
-from libs.plvision.PLVision import ImageProcessing
-
 # Conditional logging import
 from modules.utils.custom_logging import (
     setup_logger, LoggerContext, log_debug_message, log_info_message
@@ -39,19 +38,15 @@ from modules.utils.custom_logging import (
 ENABLE_LOGGING = True  # Enable or disable logging
 vision_system_logger = setup_logger("VisionSystem") if ENABLE_LOGGING else None
 
+# Maximum time VisionSystem.run waits for a new frame before returning empty-handed
+FRAME_WAIT_TIMEOUT = 0.1
+
 # Base storage folder
 DEFAULT_STORAGE_PATH = os.path.join(
     os.path.dirname(__file__),
     'calibration', 'cameraCalibration', 'storage'
 )
 
-from collections import deque
-import threading
-import time
-
-import cv2
-import time
-
 
 
 class FrameGrabber:
@@ -59,12 +54,11 @@ class FrameGrabber:
         """
         Threaded camera grabber.
         camera: Camera object with .capture() method
-        maxlen: number of frames to keep in buffer
+        maxlen: number of preallocated frame slots in the ring
         """
         self.camera = camera
-        self.buffer = deque(maxlen=maxlen)
+        self.ring = FrameRing(capacity=maxlen)
         self.running = False
-        self.lock = threading.Lock()
         self.thread = threading.Thread(target=self._grab_loop, daemon=True)
 
     def start(self):
@@ -75,16 +69,20 @@ class FrameGrabber:
         while self.running:
             frame = self.camera.capture()
             if frame is not None:
-                with self.lock:
-                    self.buffer.append(frame)
+                self.ring.write(frame, timestamp=time.time())
             else:
                 time.sleep(0.001)  # avoid busy loop if capture fails
 
-    def get_latest(self):
-        with self.lock:
-            if self.buffer:
-                return self.buffer[-1]
-        return None
+    def get_latest(self, since_seq=None, timeout=None):
+        """
+        Return the newest FrameSlot (seq, timestamp, read-only image view) or None.
+        When since_seq is given, blocks until a frame newer than since_seq arrives or the timeout expires.
+        """
+        return self.ring.get_latest(since_seq=since_seq, timeout=timeout)
+
+    @property
+    def latest_seq(self):
+        return self.ring.latest_seq
 
     def stop(self):
         self.running = False
@@ -165,6 +163,10 @@ class VisionSystem:
             self.storage_path = storage_path
         log_debug_message(self.logger_context,
                           message=f"VisionSystem initialized with storage path: {self.storage_path}")
+        # Combined undistort + perspective remap tables, rebuilt lazily after calibration changes
+        self.correction_maps = CorrectionMaps()
+        # When True, contour detection only rectifies the spray-area bounding box
+        self.correct_work_area_only = False
         self.data_manager = DataManager(self, ENABLE_LOGGING, vision_system_logger, storage_path=self.storage_path)
         self.settings_manager = SettingsManager()
         self.service_id = "vision_system"
@@ -243,6 +245,8 @@ class VisionSystem:
         # Initialize image variables
         self.image = None
         self.rawImage = None
+        self.frame_seq = 0
+        self.frame_timestamp = None
         self.correctedImage = None
         self.rawMode = False
 
@@ -268,6 +272,7 @@ class VisionSystem:
         try:
             # store the matrix in data_manager
             self.data_manager.cameraToRobotMatrix = value
+            self.invalidate_correction_maps()
             # update calibration state: if we have cameraData and a matrix, mark calibrated
             if value is not None and getattr(self.data_manager, 'cameraData', None) is not None:
                 self.isSystemCalibrated = True
@@ -302,25 +307,29 @@ class VisionSystem:
     def run(self):
         start_time = time.time()
 
-        # Timer 1: Camera capture
+        # Timer 1: Camera capture - wait for a frame newer than the last one processed
         capture_start = time.time()
-        # self.image = self.camera.capture()
-        self.image = self.frame_grabber.get_latest()
+        slot = self.frame_grabber.get_latest(since_seq=self.frame_seq, timeout=FRAME_WAIT_TIMEOUT)
         capture_time = time.time() - capture_start
 
+        if slot is None:
+            return None, None, None
+        self.frame_seq = slot.seq
+        self.frame_timestamp = slot.timestamp
+
         # Handle frame skipping
         if self.current_skip_frames < self.camera_settings.get_skip_frames():
             self.current_skip_frames += 1
             return None, None, None
 
-        if self.image is None:
-            return None, None, None
+        # Read-only view into the grabber ring - no per-frame copy
+        self.image = slot.image
 
         self.state_manager.update_state(ServiceState.IDLE)
 
-        # Timer 2: Image copy
+        # Timer 2: Image copy (kept for timing output; the processing path works on a zero-copy view)
         copy_start = time.time()
-        self.rawImage = self.image.copy()
+        self.rawImage = self.image
         copy_time = time.time() - copy_start
 
         # Timer 3: Brightness adjustment
@@ -331,6 +340,9 @@ class VisionSystem:
             brightness_time = time.time() - brightness_start
 
         if self.rawMode:
+            # The raw frame is stored as latest_frame and published asynchronously, so it must
+            # not stay a view into the ring slot the grabber overwrites a few frames later
+            self.rawImage = self.image.copy()
             total_time = time.time() - start_time
             # print(
             # f"[VisionSystem Timing] Total: {total_time * 1000:.2f}ms | Capture: {capture_time * 1000:.2f}ms | Copy: {copy_time * 1000:.2f}ms | Brightness: {brightness_time * 1000:.2f}ms")
@@ -359,38 +371,41 @@ class VisionSystem:
         #     f"[VisionSystem Timing] Total: {total_time * 1000:.2f}ms | Capture: {capture_time * 1000:.2f}ms | Copy: {copy_time * 1000:.2f}ms | Brightness: {brightness_time * 1000:.2f}ms | Correct Image: {processing_time * 1000:.2f}ms")
         return None, self.correctedImage, None
 
-    def correctImage(self, imageParam):
+    def correctImage(self, imageParam, roi=None):
         """
         Undistorts and applies perspective correction to the given image.
+
+        Both steps are applied in a single cv2.remap through precomputed maps that are rebuilt
+        only when the calibration changes. If roi (x, y, w, h) is given, only that region of the
+        corrected image is computed and the rest of the returned image is black.
+        """
+        width = self.camera_settings.get_camera_width()
+        height = self.camera_settings.get_camera_height()
+
+        if not self.correction_maps.is_valid or self.correction_maps.size != (width, height):
+            if self.optimal_camera_matrix is None:
+                self.optimal_camera_matrix, self.roi = cv2.getOptimalNewCameraMatrix(self.cameraMatrix, self.cameraDist,
+                                                                                     (width, height),
+                                                                                     0.5,
+                                                                                     (width, height))
+            # Perspective matrix is optional (only for single-image calibrations with ArUco markers)
+            self.correction_maps.build(self.cameraMatrix,
+                                       self.cameraDist,
+                                       self.optimal_camera_matrix,
+                                       self.perspectiveMatrix,
+                                       (width, height))
+            log_debug_message(self.logger_context,
+                              message=f"Correction maps rebuilt for {width}x{height}")
+
+        return self.correction_maps.apply(imageParam, roi=roi)
+
+    def invalidate_correction_maps(self):
         """
-        # First, undistort the image using camera calibration parameters
-        if self.optimal_camera_matrix is None:
-            self.optimal_camera_matrix, self.roi = cv2.getOptimalNewCameraMatrix(self.cameraMatrix, self.cameraDist,
-                                                                                 (self.camera_settings.get_camera_width(),
-                                                                                  self.camera_settings.get_camera_height(),),
-                                                                                 0.5,
-                                                                                 (self.camera_settings.get_camera_width(),
-                                                                                  self.camera_settings.get_camera_height(),))
-        imageParam = ImageProcessing.undistortImage(
-            imageParam,
-            self.cameraMatrix,
-            self.cameraDist,
-            self.camera_settings.get_camera_width(),
-            self.camera_settings.get_camera_height(),
-            crop=False,
-            optimal_camera_matrix=self.optimal_camera_matrix,
-            roi=self.roi
-        )
-
-        # Apply perspective transformation if available (only for single-image calibrations with ArUco markers)
-        if self.perspectiveMatrix is not None:
-            imageParam = cv2.warpPerspective(
-                imageParam,
-                self.perspectiveMatrix,
-                (self.camera_settings.get_camera_width(), self.camera_settings.get_camera_height())
-            )
-
-        return imageParam
+        Drop the cached correction maps so they are rebuilt from the current calibration
+        on the next correctImage call.
+        """
+        self.optimal_camera_matrix = None
+        self.correction_maps.invalidate()
 
     def on_threshold_update(self, message):
         # message format {"region": "pickup"})
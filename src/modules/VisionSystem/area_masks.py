@@ -0,0 +1,79 @@
+import cv2
+import numpy as np
+
+# Fixed-point precision used when rasterising float polygon vertices
+_POLYGON_SHIFT = 4
+
+
+class AreaMask:
+    """
+    Rasterised work-area polygon (spray / pickup) for vectorised containment tests.
+
+    The polygon is filled once into a uint8 mask of the frame size. Point containment is then a
+    single fancy-indexing lookup instead of one cv2.pointPolygonTest call per point, and the
+    integral image answers "how many pixels of this rectangle are inside" in O(1).
+    """
+
+    def __init__(self, points, shape):
+        """
+        Args:
+            points: polygon vertices, array-like of shape (N, 2) in image coordinates
+            shape: (height, width) of the frames the mask is applied to
+        """
+        height, width = shape[:2]
+        self.shape = (height, width)
+        polygon = np.round(np.asarray(points, dtype=np.float64).reshape(-1, 2) * (1 << _POLYGON_SHIFT))
+        self.mask = np.zeros((height, width), dtype=np.uint8)
+        cv2.fillPoly(self.mask, [polygon.astype(np.int32).reshape(-1, 1, 2)], 1, lineType=cv2.LINE_8,
+                     shift=_POLYGON_SHIFT)
+        self.integral = cv2.integral(self.mask, sdepth=cv2.CV_32S)
+
+    def contains_points(self, points):
+        """
+        Vectorised containment test.
+
+        Args:
+            points: array of shape (N, 2) or (N, 1, 2) in image coordinates
+
+        Returns:
+            np.ndarray: bool array of length N; points outside the frame are outside the area
+        """
+        points = np.asarray(points).reshape(-1, 2)
+        xs = np.rint(points[:, 0]).astype(np.intp)
+        ys = np.rint(points[:, 1]).astype(np.intp)
+        height, width = self.shape
+        in_frame = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        inside = np.zeros(len(points), dtype=bool)
+        inside[in_frame] = self.mask[ys[in_frame], xs[in_frame]] != 0
+        return inside
+
+    def contours_inside(self, contours):
+        """
+        Check a whole batch of contours with one lookup.
+
+        Returns:
+            np.ndarray: bool array, True where every point of the contour lies inside the area
+        """
+        if len(contours) == 0:
+            return np.zeros(0, dtype=bool)
+        lengths = np.fromiter((len(cnt) for cnt in contours), dtype=np.intp, count=len(contours))
+        inside = self.contains_points(np.concatenate([np.asarray(cnt).reshape(-1, 2) for cnt in contours]))
+        result = np.ones(len(contours), dtype=bool)
+        non_empty = lengths > 0
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        result[non_empty] = np.logical_and.reduceat(inside, starts[non_empty])
+        return result
+
+    def pixels_inside_rect(self, x, y, w, h):
+        """Number of mask pixels inside the rectangle (x, y, w, h), using the integral image."""
+        height, width = self.shape
+        x0, y0 = max(0, int(x)), max(0, int(y))
+        x1, y1 = min(width, int(x + w)), min(height, int(y + h))
+        if x1 <= x0 or y1 <= y0:
+            return 0
+        ii = self.integral
+        return int(ii[y1, x1] - ii[y0, x1] - ii[y1, x0] + ii[y0, x0])
+
+    def bounding_rect(self):
+        """Bounding box (x, y, w, h) of the area."""
+        return cv2.boundingRect(self.mask)
@@ -0,0 +1,75 @@
+import cv2
+import numpy as np
+
+# One row per contour; computed once per frame and shared by the filters and the sorter
+CONTOUR_METRICS_DTYPE = np.dtype([
+    ("area", np.float64),
+    ("perimeter", np.float64),
+    ("x", np.int32),
+    ("y", np.int32),
+    ("w", np.int32),
+    ("h", np.int32),
+    ("m00", np.float64),
+    ("m10", np.float64),
+    ("m01", np.float64),
+    ("cx", np.float64),
+    ("cy", np.float64),
+])
+
+
+def compute_contour_metrics(contours):
+    """
+    Compute area, perimeter, bounding box and first-order moments for every contour.
+
+    Returns:
+        np.ndarray: structured array with CONTOUR_METRICS_DTYPE, one row per contour.
+                    cx/cy are 0 for degenerate contours (m00 == 0), matching
+                    Contouring.calculateCentroid.
+    """
+    metrics = np.zeros(len(contours), dtype=CONTOUR_METRICS_DTYPE)
+    for i, cnt in enumerate(contours):
+        moments = cv2.moments(cnt)
+        metrics[i] = (
+            cv2.contourArea(cnt),
+            cv2.arcLength(cnt, True),
+            *cv2.boundingRect(cnt),
+            moments["m00"],
+            moments["m10"],
+            moments["m01"],
+            0.0,
+            0.0,
+        )
+
+    valid = metrics["m00"] != 0
+    metrics["cx"][valid] = metrics["m10"][valid] / metrics["m00"][valid]
+    metrics["cy"][valid] = metrics["m01"][valid] / metrics["m00"][valid]
+    return metrics
+
+
+def area_filter(metrics, min_area, max_area):
+    """Bool mask of contours with min_area < area < max_area."""
+    return (metrics["area"] > min_area) & (metrics["area"] < max_area)
+
+
+def proximity_order(metrics, start_point):
+    """
+    Greedy nearest-neighbour ordering of contours by centroid, starting from start_point.
+
+    Centroids are truncated to integer pixels like Contouring.calculateCentroid so the order
+    matches the previous per-contour implementation.
+
+    Returns:
+        list[int]: indices into metrics in visiting order
+    """
+    centroids = np.stack((np.trunc(metrics["cx"]), np.trunc(metrics["cy"])), axis=-1)
+    remaining = np.ones(len(centroids), dtype=bool)
+    current = np.asarray(start_point, dtype=np.float64)
+    order = []
+    for _ in range(len(centroids)):
+        distances = np.sum((centroids - current) ** 2, axis=1)
+        distances[~remaining] = np.inf
+        nearest = int(np.argmin(distances))
+        order.append(nearest)
+        remaining[nearest] = False
+        current = centroids[nearest]
+    return order
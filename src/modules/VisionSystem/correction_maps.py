@@ -0,0 +1,107 @@
+import cv2
+import numpy as np
+
+
+class CorrectionMaps:
+    """
+    Combined undistortion + perspective lookup table for VisionSystem.correctImage.
+
+    Undistorting with cv2.undistort and then applying cv2.warpPerspective resamples the full
+    frame twice. Both steps are fixed for a given calibration, so the composed mapping
+    (output pixel -> raw camera pixel) is computed once and applied with a single cv2.remap
+    using fixed-point CV_16SC2 maps.
+
+    The maps must be invalidated whenever the camera matrix, distortion coefficients,
+    perspective matrix or output size change.
+    """
+
+    def __init__(self, interpolation=cv2.INTER_LINEAR):
+        self.interpolation = interpolation
+        self._map1 = None
+        self._map2 = None
+        self._size = None
+
+    @property
+    def is_valid(self):
+        return self._map1 is not None
+
+    @property
+    def size(self):
+        return self._size
+
+    def invalidate(self):
+        self._map1 = None
+        self._map2 = None
+        self._size = None
+
+    def build(self, camera_matrix, dist_coeffs, new_camera_matrix, perspective_matrix, size):
+        """
+        Build the combined maps.
+
+        Args:
+            camera_matrix: 3x3 intrinsic matrix of the raw camera
+            dist_coeffs: distortion coefficients
+            new_camera_matrix: intrinsic matrix of the undistorted image (getOptimalNewCameraMatrix)
+            perspective_matrix: 3x3 homography applied after undistortion, or None
+            size: (width, height) of the corrected output image
+        """
+        width, height = size
+        xs, ys = np.meshgrid(np.arange(width, dtype=np.float64), np.arange(height, dtype=np.float64))
+        points = np.stack((xs.ravel(), ys.ravel()), axis=-1).reshape(-1, 1, 2)
+
+        # Output pixel -> pixel in the undistorted image (inverse of the perspective warp)
+        if perspective_matrix is not None:
+            points = cv2.perspectiveTransform(points, np.linalg.inv(perspective_matrix))
+
+        # Undistorted pixel -> normalised camera ray -> distorted raw pixel
+        new_k_inv = np.linalg.inv(np.asarray(new_camera_matrix, dtype=np.float64))
+        normalised = cv2.perspectiveTransform(points, new_k_inv).reshape(-1, 2)
+        object_points = np.empty((normalised.shape[0], 1, 3), dtype=np.float64)
+        object_points[:, 0, :2] = normalised
+        object_points[:, 0, 2] = 1.0
+        zero = np.zeros(3, dtype=np.float64)
+        raw_points, _ = cv2.projectPoints(object_points, zero, zero,
+                                          np.asarray(camera_matrix, dtype=np.float64),
+                                          np.asarray(dist_coeffs, dtype=np.float64))
+
+        raw_points = raw_points.reshape(height, width, 2).astype(np.float32)
+        self._map1, self._map2 = cv2.convertMaps(raw_points[..., 0], raw_points[..., 1], cv2.CV_16SC2)
+        self._size = (width, height)
+
+    def apply(self, image, roi=None):
+        """
+        Correct an image with the precomputed maps.
+
+        Args:
+            image: raw camera frame
+            roi: optional (x, y, w, h) rectangle in output coordinates. Only that region is
+                 resampled; the rest of the returned full-size image is black.
+
+        Returns:
+            np.ndarray: corrected image of the map size
+        """
+        if not self.is_valid:
+            raise RuntimeError("Correction maps have not been built")
+
+        if roi is None:
+            return cv2.remap(image, self._map1, self._map2, self.interpolation,
+                             borderMode=cv2.BORDER_CONSTANT)
+
+        x, y, w, h = self.clip_roi(roi)
+        width, height = self._size
+        output = np.zeros((height, width) + image.shape[2:], dtype=image.dtype)
+        if w > 0 and h > 0:
+            output[y:y + h, x:x + w] = cv2.remap(image,
+                                                 self._map1[y:y + h, x:x + w],
+                                                 self._map2[y:y + h, x:x + w],
+                                                 self.interpolation,
+                                                 borderMode=cv2.BORDER_CONSTANT)
+        return output
+
+    def clip_roi(self, roi):
+        """Clamp an (x, y, w, h) rectangle to the map size."""
+        width, height = self._size
+        x, y, w, h = (int(v) for v in roi)
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(width, x + w), min(height, y + h)
+        return x0, y0, max(0, x1 - x0), max(0, y1 - y0)
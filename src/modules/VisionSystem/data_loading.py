@@ -3,6 +3,7 @@ import os
 import numpy as np
 
 from modules.utils.custom_logging import log_if_enabled, LoggingLevel
+from modules.VisionSystem.area_masks import AreaMask
 
 
 import os
@@ -28,6 +29,9 @@ class DataManager:
         self.cameraData = None
         self.perspectiveMatrix = None
         self.isSystemCalibrated = False
+        # Rasterised area polygons keyed by (area_type, frame shape); each entry remembers the
+        # points array it was built from, so a mask rebuilt from replaced points is never reused
+        self._area_masks = {}
         self.build_storage_paths()
 
 
@@ -52,7 +56,27 @@ class DataManager:
         self.pickup_area_points_path = os.path.join(self.storage_path, 'pickupAreaPoints.npy')
         self.spray_area_points_path = os.path.join(self.storage_path, 'sprayAreaPoints.npy')
 
+    def get_area_mask(self, area_type, shape):
+        """
+        Return the cached AreaMask for 'pickup' or 'spray' rasterised at the given frame shape,
+        or None if no points are defined for that area.
+        """
+        points = self.pickupAreaPoints if area_type == 'pickup' else self.sprayAreaPoints
+        if points is None:
+            return None
+        key = (area_type, tuple(shape[:2]))
+        cached = self._area_masks.get(key)
+        if cached is not None and cached[0] is points:
+            return cached[1]
+        area_mask = AreaMask(points, shape)
+        self._area_masks[key] = (points, area_mask)
+        return area_mask
+
+    def invalidate_area_masks(self):
+        self._area_masks = {}
+
     def loadWorkAreaPoints(self):
+        self.invalidate_area_masks()
         try:
             self.workAreaPoints = np.load(self.work_area_points_path)
             self.work_area_polygon = np.array(self.workAreaPoints, dtype=np.int32).reshape((-1, 1, 2))
@@ -123,6 +147,7 @@ class DataManager:
 
 
     def loadCameraCalibrationData(self):
+        self.vision_system.invalidate_correction_maps()
         try:
             self.cameraData = np.load(self.camera_data_path)
             self.isSystemCalibrated = True
@@ -137,6 +162,7 @@ class DataManager:
 
 
     def loadPerspectiveMatrix(self):
+        self.vision_system.invalidate_correction_maps()
         try:
             self.perspectiveMatrix = np.load(self.perspective_matrix_path)
             print(f"✅ Perspective matrix loaded from: {self.perspective_matrix_path}")
@@ -158,6 +184,7 @@ class DataManager:
         """
 
         print(f"In  VisionSystem.saveWorkAreaPoints with data: {data}")
+        self.invalidate_area_masks()
 
         if data is None or len(data) == 0:
             return False, "No data provided to save"
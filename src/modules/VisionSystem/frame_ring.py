@@ -0,0 +1,109 @@
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class FrameSlot:
+    """
+    A read-only handle to one frame stored in the FrameRing.
+
+    seq:       monotonically increasing sequence number (1 for the first frame)
+    timestamp: capture time (time.time()) recorded when the frame entered the ring
+    image:     read-only view into the ring buffer (no copy)
+    """
+    seq: int
+    timestamp: float
+    image: np.ndarray
+
+
+class FrameRing:
+    """
+    Preallocated ring of frame buffers with sequence numbers.
+
+    The writer copies each captured frame into the next slot of a fixed set of buffers, so
+    steady-state capture allocates nothing. Readers receive read-only views into the slots.
+    A view stays valid until the writer wraps around to its slot again, i.e. for
+    ``capacity - 1`` further frames; callers that keep a frame longer than that must copy it
+    (or check ``is_current(seq)`` before using it).
+    """
+
+    def __init__(self, capacity=5):
+        if capacity < 2:
+            raise ValueError("FrameRing capacity must be at least 2")
+        self.capacity = capacity
+        self._buffers = None
+        self._views = [None] * capacity
+        self._seqs = np.zeros(capacity, dtype=np.int64)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._latest_seq = 0
+        self._condition = threading.Condition()
+
+    @property
+    def latest_seq(self):
+        return self._latest_seq
+
+    def _allocate(self, frame):
+        self._buffers = [np.empty_like(frame) for _ in range(self.capacity)]
+        views = []
+        for buffer in self._buffers:
+            view = buffer.view()
+            view.flags.writeable = False
+            views.append(view)
+        self._views = views
+        self._seqs[:] = 0
+
+    def write(self, frame, timestamp=None):
+        """
+        Copy a frame into the next slot and publish it to waiting readers.
+
+        Returns:
+            int: the sequence number assigned to the frame
+        """
+        if timestamp is None:
+            timestamp = time.time()
+
+        if self._buffers is None or self._buffers[0].shape != frame.shape or self._buffers[0].dtype != frame.dtype:
+            # First frame or resolution change - (re)allocate all slots once
+            with self._condition:
+                self._allocate(frame)
+
+        seq = self._latest_seq + 1
+        index = seq % self.capacity
+        # Invalidate the slot before overwriting it so concurrent readers never see a stale seq
+        self._seqs[index] = 0
+        np.copyto(self._buffers[index], frame)
+
+        with self._condition:
+            self._timestamps[index] = timestamp
+            self._seqs[index] = seq
+            self._latest_seq = seq
+            self._condition.notify_all()
+        return seq
+
+    def get_latest(self, since_seq=None, timeout=None):
+        """
+        Return the newest frame.
+
+        Args:
+            since_seq: if given, block until a frame with seq > since_seq exists
+            timeout: maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            FrameSlot or None if no (newer) frame is available within the timeout
+        """
+        with self._condition:
+            if since_seq is not None:
+                if not self._condition.wait_for(lambda: self._latest_seq > since_seq, timeout=timeout):
+                    return None
+            seq = self._latest_seq
+            if seq == 0:
+                return None
+            index = seq % self.capacity
+            return FrameSlot(seq=seq, timestamp=float(self._timestamps[index]), image=self._views[index])
+
+    def is_current(self, seq):
+        """Return True while the slot holding ``seq`` has not been overwritten."""
+        return seq > 0 and int(self._seqs[seq % self.capacity]) == seq
@@ -11,7 +11,8 @@ def capture_calibration_image(vision_system,log_enabled,logger):
                        broadcast_to_ui=False)
         return False, "No rawImage image captured for calibration"
 
-    vision_system.calibrationImages.append(vision_system.rawImage)
+    # rawImage is a view into the frame ring which the grabber overwrites - keep our own copy
+    vision_system.calibrationImages.append(vision_system.rawImage.copy())
     vision_system.message_publisher.publish_latest_image(vision_system.rawImage)
     log_if_enabled(enabled=log_enabled,
                    logger=logger,
@@ -39,7 +40,7 @@ def calibrate_camera(vision_system,log_enabled,logger,storage_path) -> tuple[boo
 
     cameraCalibrationService.calibrationImages = vision_system.calibrationImages
 
-    result = cameraCalibrationService.run(vision_system.rawImage)
+    result = cameraCalibrationService.run(vision_system.rawImage.copy())
 
     # result, calibrationData, perspectiveMatrix, message = cameraCalibrationService.run(vision_system.rawImage)
     calibrationData = [result.distortion_coefficients, result.camera_matrix]
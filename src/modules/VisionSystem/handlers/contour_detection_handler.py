@@ -1,7 +1,7 @@
 import cv2
 import numpy as np
 
-from libs.plvision.PLVision import Contouring
+from modules.VisionSystem.contour_metrics import compute_contour_metrics, area_filter, proximity_order
 
 
 def findContours(vision_system, imageParam):
@@ -78,46 +78,38 @@ def approxContours(vision_system, contours):
     return approx
     # return contours
 
-def filter_contours_by_area(vision_system, contours):
+def filter_contours_by_area(vision_system, metrics):
     """
     Filters contours based on minimum and maximum area settings.
+    Returns a bool mask over the rows of the precomputed contour metrics.
     """
-    filteredContours = [cnt for cnt in contours if
-                        cv2.contourArea(cnt) > vision_system.camera_settings.get_min_contour_area()]
-    filteredContours = [cnt for cnt in filteredContours if
-                        cv2.contourArea(cnt) < vision_system.camera_settings.get_max_contour_area()]
-    return filteredContours
-
-# Squared distance function
-def sq_dist(p1, p2):
-    return (p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2
-
-def all_inside_spray_area(vision_system, contour):
-    for pt in contour:
-        if cv2.pointPolygonTest(
-            vision_system.data_manager.sprayAreaPoints.astype(np.float32),
-            (float(pt[0][0]), float(pt[0][1])),
-            False
-        ) < 0:
-            return False
-    return True
-
-def sort_contours_by_proximity(contours, start_point):
-    sorted_contours = []
-    current_point = start_point
-    remaining_contours = contours.copy()
-
-    while remaining_contours:
-        # Find the contour with the closest centroid to the current point
-        next_contour = min(
-            remaining_contours,
-            key=lambda cnt: sq_dist(Contouring.calculateCentroid(cnt), current_point)
-        )
-        sorted_contours.append(next_contour)
-        current_point = Contouring.calculateCentroid(next_contour)
-        remaining_contours.remove(next_contour)
+    return area_filter(metrics,
+                       vision_system.camera_settings.get_min_contour_area(),
+                       vision_system.camera_settings.get_max_contour_area())
+
+def contours_inside_spray_area(vision_system, contours, shape):
+    """
+    Bool mask of contours lying completely inside the spray area, checked with one lookup
+    into the cached rasterised spray-area mask. All True if no spray area is defined.
+    """
+    spray_mask = vision_system.data_manager.get_area_mask("spray", shape)
+    if spray_mask is None:
+        return np.ones(len(contours), dtype=bool)
+    return spray_mask.contours_inside(contours)
+
+def get_work_area_roi(vision_system):
+    """
+    Bounding box (x, y, w, h) of the spray area when only the work area should be rectified,
+    otherwise None (correct the full frame).
+    """
+    if not vision_system.correct_work_area_only or vision_system.data_manager.sprayAreaPoints is None:
+        return None
+    return cv2.boundingRect(vision_system.data_manager.sprayAreaPoints.astype(np.float32).reshape(-1, 1, 2))
 
-    return sorted_contours
+def sort_contours_by_proximity(contours, start_point, metrics=None):
+    if metrics is None:
+        metrics = compute_contour_metrics(contours)
+    return [contours[i] for i in proximity_order(metrics, start_point)]
 
 def handle_contour_detection(vision_system,sort=False):
     """
@@ -125,9 +117,12 @@ def handle_contour_detection(vision_system,sort=False):
     Returns (sorted_contours, corrected_image, None)
     """
     # --- Step 1: Calibration handling ---
+    # vision_system.image is a read-only view into the frame ring; correctImage writes a new array
     if vision_system.isSystemCalibrated:
-        vision_system.correctedImage = vision_system.correctImage(vision_system.image.copy())
+        vision_system.correctedImage = vision_system.correctImage(vision_system.image,
+                                                                  roi=get_work_area_roi(vision_system))
     else:
+        vision_system.image = vision_system.image.copy()
         cv2.putText(
             vision_system.image,
             "System is not calibrated",
@@ -142,30 +137,30 @@ def handle_contour_detection(vision_system,sort=False):
     # --- Step 2: Find and filter contours ---
     contours = findContours(vision_system, vision_system.correctedImage)
     approx_contours = approxContours(vision_system, contours)
-    filtered_contours = filter_contours_by_area(vision_system, approx_contours)
-
-    contours_inside_spray_area = []
-    for cnt in filtered_contours:
+    metrics = compute_contour_metrics(approx_contours)
 
-        if vision_system.data_manager.sprayAreaPoints is None:
-            # print(f"[WARNING] [handle_contour_detection] Spray area points not defined, skipping spray area check.")
-            contours_inside_spray_area.append(cnt)
-            continue
+    keep = filter_contours_by_area(vision_system, metrics)
+    candidate_indices = np.flatnonzero(keep)
+    inside = contours_inside_spray_area(vision_system,
+                                        [approx_contours[i] for i in candidate_indices],
+                                        vision_system.correctedImage.shape)
+    kept_indices = candidate_indices[inside]
 
-        if all_inside_spray_area(vision_system, cnt) :
-            contours_inside_spray_area.append(cnt)
-
-    if not contours_inside_spray_area:
+    if len(kept_indices) == 0:
         return None, vision_system.correctedImage, None
 
+    inside_contours = [approx_contours[i] for i in kept_indices]
+    metrics = metrics[kept_indices]
+
     final_contours = None
     if sort is True:
         # --- Step 3: Sort contours by proximity (using helper) ---
         top_left = (0, 0)
-        contours_sorted = sort_contours_by_proximity(contours_inside_spray_area, start_point=top_left)
+        contours_sorted = sort_contours_by_proximity(inside_contours, start_point=top_left,
+                                                     metrics=metrics)
         final_contours = contours_sorted
     else:
-        final_contours = contours_inside_spray_area
+        final_contours = inside_contours
 
     # --- Step 4: Optional visualization ---
     if vision_system.camera_settings.get_draw_contours():
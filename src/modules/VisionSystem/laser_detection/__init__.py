@@ -20,8 +20,10 @@ from modules.VisionSystem.laser_detection.storage import (
 
 from modules.VisionSystem.laser_detection.laser_detector import LaserDetector
 from modules.VisionSystem.laser_detection.laser_detection_service import LaserDetectionService
+from modules.VisionSystem.laser_detection.strobe_capture import StrobeCapture, StrobeMeasurement
 from modules.VisionSystem.laser_detection.laser_calibration_service import LaserDetectionCalibration
 from modules.VisionSystem.laser_detection.height_measuring import HeightMeasuringService
+from modules.VisionSystem.laser_detection.height_scanning import HeightScan, LaserLineScanner
 
 __all__ = [
     # Configuration
@@ -38,6 +40,10 @@ __all__ = [
     # Services
     'LaserDetector',
     'LaserDetectionService',
+    'StrobeCapture',
+    'StrobeMeasurement',
     'LaserDetectionCalibration',
     'HeightMeasuringService',
+    'HeightScan',
+    'LaserLineScanner',
 ]
\ No newline at end of file
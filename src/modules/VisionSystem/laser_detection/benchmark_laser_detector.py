@@ -0,0 +1,97 @@
+"""
+Benchmark: vectorised laser line extraction vs. the per-line Python loop.
+
+The per-line loop lives here as the reference the vectorised extraction is checked against
+(tests/vision_system/laser_detection/test_laser_detector.py).
+
+Run from the src directory:
+    python -m modules.VisionSystem.laser_detection.benchmark_laser_detector
+"""
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from modules.VisionSystem.laser_detection.config import LaserDetectionConfig
+from modules.VisionSystem.laser_detection.laser_detector import LaserDetector, extract_line_positions
+
+FRAME_SHAPE = (720, 1280)
+ROI_BAND_PX = 40
+
+
+def synthetic_frames(axis='y', shape=FRAME_SHAPE, seed=0):
+    """ON/OFF BGR frames with a curved, noisy Gaussian laser line and a dropout section."""
+    rng = np.random.default_rng(seed)
+    h, w = shape
+    off = rng.integers(0, 40, (h, w, 3)).astype(np.uint8)
+    on = off.astype(np.float32)
+    lines, samples = (h, w) if axis == 'y' else (w, h)
+    centre = samples / 2 + 0.1 * samples * np.sin(np.linspace(0, 4, lines))
+    profile = 150 * np.exp(-0.5 * ((np.arange(samples)[None, :] - centre[:, None]) / 2.0) ** 2)
+    profile[lines // 4: lines // 4 + lines // 20] = 0
+    on[:, :, 2] += profile if axis == 'y' else profile.T
+    on += rng.normal(0, 3, on.shape)
+    return np.clip(on, 0, 255).astype(np.uint8), off
+
+
+def extract_line_positions_per_line(detector, diff, axis):
+    """
+    Reference per-line implementation (the original Python loop). Returns one position per
+    scan line, NaN where invalid.
+    """
+    min_intensity = detector.config.min_intensity
+    profiles = diff if axis == 'y' else diff.T
+    positions = np.zeros(profiles.shape[0], dtype=np.float32)
+    for i in range(profiles.shape[0]):
+        line = profiles[i, :]
+        if np.max(line) > min_intensity:
+            positions[i] = detector.subpixel_quadratic(np.argmax(line), line)
+        else:
+            positions[i] = np.nan
+    return positions
+
+
+def _time(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = fn()
+    return result, (time.perf_counter() - start) / repeats * 1000
+
+
+def run_benchmark(repeats=10):
+    rows = []
+    for axis in ('y', 'x'):
+        on_frame, off_frame = synthetic_frames(axis)
+        detector = LaserDetector(LaserDetectionConfig(default_axis=axis))
+        tracking = LaserDetector(LaserDetectionConfig(default_axis=axis, roi_band_px=ROI_BAND_PX))
+        with contextlib.redirect_stdout(io.StringIO()):
+            tracking.detect_laser_line(on_frame, off_frame)
+
+        diff, _ = detector._difference_image(on_frame, off_frame, axis)
+        profiles = diff if axis == 'y' else diff.T
+        loop, loop_ms = _time(lambda: extract_line_positions_per_line(detector, diff, axis), repeats)
+        vectorised, vectorised_ms = _time(
+            lambda: extract_line_positions(profiles, detector.config.min_intensity), repeats)
+        _, full_ms = _time(lambda: detector.detect_laser_line(on_frame, off_frame), repeats)
+        _, roi_ms = _time(lambda: tracking.detect_laser_line(on_frame, off_frame), repeats)
+
+        same_valid = np.array_equal(np.isnan(loop), np.isnan(vectorised))
+        max_error = float(np.nanmax(np.abs(loop - vectorised)))
+        rows.append((axis, int((~np.isnan(vectorised)).sum()), loop_ms, vectorised_ms, full_ms, roi_ms,
+                     same_valid, max_error))
+    return rows
+
+
+def main():
+    print(f"Frame {FRAME_SHAPE[1]}x{FRAME_SHAPE[0]}, ROI band +/-{ROI_BAND_PX} px")
+    print(f"{'axis':>4}{'points':>8} | {'loop ms':>8}{'vector ms':>10}{'speedup':>9} | "
+          f"{'detect ms':>10}{'roi ms':>8} | {'same mask':>9}{'max |err|':>11}")
+    for axis, points, loop_ms, vectorised_ms, full_ms, roi_ms, same_valid, max_error in run_benchmark():
+        print(f"{axis:>4}{points:>8} | {loop_ms:>8.2f}{vectorised_ms:>10.2f}{loop_ms / vectorised_ms:>8.1f}x | "
+              f"{full_ms:>10.2f}{roi_ms:>8.2f} | {str(same_valid):>9}{max_error:>11.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,9 +26,22 @@ class LaserDetectionConfig:
     image_capture_delay_ms: int = 10  # Delay between consecutive image captures (ms)
     detection_samples: int = 5  # Number of frames to median filter
     max_detection_retries: int = 5  # Maximum retry attempts for detection
+    adaptive_settle_delay: bool = True  # Shrink detection_delay_ms towards the measured camera latency
+    min_settle_delay_ms: int = 20  # Lower bound for the adaptive settle delay (ms)
+    frame_wait_timeout_ms: int = 1000  # Max wait for fresh frames per laser state, after settling (ms)
+    strobe_min_contrast: float = 5.0  # Min ON/OFF laser level difference for a latency measurement
 
     # Subpixel refinement
     use_subpixel_refinement: bool = True  # Enable subpixel peak refinement
+    subpixel_method: str = 'quadratic'  # 'quadratic' (three-point parabola) or 'centroid' (centre of mass)
+    centroid_half_window: int = 3  # Half width (px) of the centre-of-mass window around the peak
+
+    # Line validity
+    min_line_width: int = 0  # Minimum line width (px above half peak) per scan line, 0 = no limit
+    max_line_width: int = 0  # Maximum line width (px above half peak) per scan line, 0 = no limit
+
+    # Tracking
+    roi_band_px: int = 0  # Search only this far (px) around the last detected line, 0 = whole frame
 
     def validate(self):
         """Validate configuration parameters."""
@@ -40,8 +53,20 @@ class LaserDetectionConfig:
             raise ValueError("detection_samples must be at least 1")
         if self.max_detection_retries < 1:
             raise ValueError("max_detection_retries must be at least 1")
+        if self.min_settle_delay_ms < 0:
+            raise ValueError("min_settle_delay_ms must be non-negative")
+        if self.frame_wait_timeout_ms <= 0:
+            raise ValueError("frame_wait_timeout_ms must be positive")
         if self.default_axis not in ('x', 'y'):
             raise ValueError("default_axis must be 'x' or 'y'")
+        if self.subpixel_method not in ('quadratic', 'centroid'):
+            raise ValueError("subpixel_method must be 'quadratic' or 'centroid'")
+        if self.centroid_half_window < 1:
+            raise ValueError("centroid_half_window must be at least 1")
+        if self.min_line_width < 0 or self.max_line_width < 0:
+            raise ValueError("line width limits must be non-negative")
+        if self.roi_band_px < 0:
+            raise ValueError("roi_band_px must be non-negative")
 
 
 @dataclass
@@ -97,6 +122,12 @@ class HeightMeasuringConfig:
     measurement_threshold: float = 0.25  # Position threshold for measurement (mm)
     measurement_timeout: float = 10.0  # Timeout for movement during measurement (seconds)
     delay_between_move_detect_ms: int = 500  # Delay between movement and detection (ms)
+
+    # Continuous scanning
+    scan_velocity: float = 2.0  # MoveL velocity while sweeping a scan line (% of max robot speed, 0-100)
+    scan_pose_interval_ms: int = 5  # Robot pose sampling interval during a scan (ms)
+    scan_timeout: float = 30.0  # Maximum duration of one scan sweep (seconds)
+
     # Calibration file
     calibration_filename: str = "laser_calibration.json"  # Name of calibration file
 
@@ -110,6 +141,10 @@ class HeightMeasuringConfig:
             raise ValueError("measurement_velocity must be positive")
         if self.measurement_acceleration <= 0:
             raise ValueError("measurement_acceleration must be positive")
+        if not 0 < self.scan_velocity <= 100:
+            raise ValueError("scan_velocity must be in (0, 100] percent")
+        if self.scan_pose_interval_ms <= 0:
+            raise ValueError("scan_pose_interval_ms must be positive")
 
 
 @dataclass
@@ -6,6 +6,7 @@ from sklearn.linear_model import LinearRegression
 from core.services.robot_service.impl.base_robot_service import RobotService
 from modules.VisionSystem.laser_detection.laser_detection_service import LaserDetectionService
 from modules.VisionSystem.laser_detection.config import HeightMeasuringConfig
+from modules.VisionSystem.laser_detection.height_scanning import HeightScan, LaserLineScanner
 from modules.VisionSystem.laser_detection.storage import LaserCalibrationStorage
 
 
@@ -39,6 +40,7 @@ class HeightMeasuringService:
         self.poly_model = None
         self.poly_transform = None
         self.poly_degree = None
+        self.polyval_coefficients = None  # np.polyval form of the calibration polynomial
         self.mse = None
         self.zero_reference_z = None  # Z position of the reference plane
         self.reference_xy = None      # XY position used during calibration
@@ -68,6 +70,7 @@ class HeightMeasuringService:
             self.poly_model = LinearRegression()
             self.poly_model.coef_ = np.array(poly_data["coefficients"])
             self.poly_model.intercept_ = poly_data["intercept"]
+            self.polyval_coefficients = polynomial_to_polyval(poly_data["coefficients"], poly_data["intercept"])
 
             # Load zero-reference coordinates (pixel position)
             self.zero_reference_coords = data.get("zero_reference_coords", None)
@@ -89,16 +92,17 @@ class HeightMeasuringService:
             print(f"[HeightMeasuring] Failed to load calibration: {e}")
             self.poly_model = None
             self.poly_transform = None
+            self.polyval_coefficients = None
 
     def pixel_to_mm(self, pixel_delta):
         """
-        Query the height in mm from a pixel delta using the loaded polynomial model.
+        Query the height in mm from a pixel delta (scalar or array) using the loaded polynomial.
         """
-        if self.poly_model is None or self.poly_transform is None:
+        if self.polyval_coefficients is None:
             raise RuntimeError("Polynomial model not loaded. Call load_calibration_curve() first.")
 
-        X = self.poly_transform.fit_transform([[pixel_delta]])
-        return float(self.poly_model.predict(X))
+        heights = np.polyval(self.polyval_coefficients, pixel_delta)
+        return float(heights) if np.ndim(heights) == 0 else heights
 
     def move_to(self, x=None, y=None, wait=True):
         """
@@ -160,3 +164,20 @@ class HeightMeasuringService:
         print(f"[INFO] Calculated height: {height_mm:.4f} mm")
 
         return height_mm,pixel_delta
+
+    def scan_line(self, start_xy, end_xy) -> HeightScan:
+        """
+        Sweep from start_xy to end_xy in a straight line and return the dense height map.
+        Uses config values for the scan velocity, pose sampling and timeout.
+        """
+        return LaserLineScanner(self).scan(start_xy, end_xy)
+
+
+def polynomial_to_polyval(coefficients, intercept):
+    """
+    Convert a saved PolynomialFeatures/LinearRegression fit (coefficients for x^0..x^n plus
+    intercept) into np.polyval coefficients (highest power first).
+    """
+    polyval = np.array(coefficients, dtype=np.float64)[::-1].copy()
+    polyval[-1] += intercept
+    return polyval
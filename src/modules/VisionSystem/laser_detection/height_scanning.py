@@ -0,0 +1,251 @@
+"""
+Continuous (on-the-fly) laser height scanning.
+
+Instead of stopping at every point, the robot sweeps a straight line (MoveL) with the laser
+on. A background thread samples the robot pose; every camera frame is taken with its capture
+timestamp, its laser line is extracted on all scan lines, and the frame is paired with the
+robot pose interpolated at that timestamp, so speed changes (acceleration at the ends of the
+sweep) do not distort the map. The laser profiles are
+converted to millimetres with the precompiled calibration polynomial, giving a dense
+height map: one profile per frame, positioned along the sweep.
+
+Without an OFF frame for every moving frame, the background is estimated from the frame
+itself: the red channel is compared against max(blue, green), which cancels neutral
+(white/grey) surfaces and leaves the red laser.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from modules.VisionSystem.laser_detection.config import HeightMeasuringConfig
+
+
+class PoseSampler:
+    """
+    Records (time.time(), pose) from a pose getter on a background thread.
+
+    Args:
+        get_pose: Callable returning [x, y, z, rx, ry, rz] or None.
+        interval: Sampling interval in seconds.
+    """
+
+    def __init__(self, get_pose, interval: float = 0.005):
+        self.get_pose = get_pose
+        self.interval = interval
+        self._times = []
+        self._poses = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> "PoseSampler":
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name="PoseSampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        self._sample()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _sample(self):
+        pose = self.get_pose()
+        if pose is None:
+            return
+        with self._lock:
+            self._times.append(time.time())
+            self._poses.append(list(pose))
+
+    def latest(self):
+        with self._lock:
+            return self._poses[-1] if self._poses else None
+
+    def samples(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(times (n,), poses (n, 6)) recorded so far."""
+        with self._lock:
+            return np.asarray(self._times, dtype=np.float64), np.asarray(self._poses, dtype=np.float64)
+
+    def interpolate(self, times) -> np.ndarray:
+        """Poses linearly interpolated at the given times; NaN outside the sampled interval."""
+        sample_times, poses = self.samples()
+        times = np.asarray(times, dtype=np.float64)
+        result = np.full((len(times), poses.shape[1] if poses.ndim == 2 else 6), np.nan)
+        if len(sample_times) < 2:
+            return result
+        for axis in range(poses.shape[1]):
+            result[:, axis] = np.interp(times, sample_times, poses[:, axis], left=np.nan, right=np.nan)
+        return result
+
+
+@dataclass
+class HeightScan:
+    """
+    Dense height map from one scan sweep.
+
+    heights[i, j] is the height (mm) seen on scan line j of frame i, NaN where the laser
+    line was not found; poses[i] is the robot pose when frame i was captured.
+    """
+    timestamps: np.ndarray  # (frames,)
+    poses: np.ndarray  # (frames, 6)
+    heights: np.ndarray  # (frames, lines)
+    start_xy: Tuple[float, float]
+    end_xy: Tuple[float, float]
+    reference_line: int  # scan line of the calibration zero reference
+
+    @property
+    def distance(self) -> np.ndarray:
+        """Distance of each frame's pose from start_xy, projected on the sweep direction (mm)."""
+        start = np.asarray(self.start_xy, dtype=np.float64)
+        direction = np.asarray(self.end_xy, dtype=np.float64) - start
+        length = np.linalg.norm(direction)
+        if length == 0:
+            return np.zeros(len(self.poses))
+        return (self.poses[:, :2] - start) @ (direction / length)
+
+    def profile(self, line: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(distance, height) along the sweep on one scan line (default: the reference line)."""
+        line = self.reference_line if line is None else line
+        return self.distance, self.heights[:, line]
+
+    def resample(self, spacing_mm: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Height map on a regular grid along the sweep.
+
+        Returns:
+            (grid distances (m,), heights (m, lines)). Each scan line is interpolated between
+            its valid samples; grid points outside them, or inside a hole (a gap between valid
+            samples wider than 2 * spacing_mm and 3 frame spacings), are NaN.
+        """
+        distance = self.distance
+        order = np.argsort(distance)
+        distance = distance[order]
+        heights = self.heights[order]
+        grid = np.arange(distance[0], distance[-1] + spacing_mm / 2, spacing_mm) if len(distance) else np.empty(0)
+        result = np.full((len(grid), heights.shape[1]), np.nan)
+        max_gap = max(2 * spacing_mm, 3 * float(np.median(np.diff(distance)))) if len(distance) > 1 else 0.0
+        for line in range(heights.shape[1]):
+            valid = ~np.isnan(heights[:, line])
+            if valid.sum() < 2:
+                continue
+            d = distance[valid]
+            values = np.interp(grid, d, heights[valid, line], left=np.nan, right=np.nan)
+            # Do not bridge holes in the line (occlusions, dropouts)
+            right = np.clip(np.searchsorted(d, grid), 1, len(d) - 1)
+            values[d[right] - d[right - 1] > max_gap] = np.nan
+            result[:, line] = values
+        return grid, result
+
+
+def chroma_background(frame) -> np.ndarray:
+    """Zero-copy 'laser off' estimate: a frame view whose every channel is max(blue, green)."""
+    background = np.maximum(frame[:, :, 0], frame[:, :, 1])
+    return np.broadcast_to(background[:, :, None], frame.shape)
+
+
+class LaserLineScanner:
+    """
+    Sweeps the robot along a line and builds a HeightScan.
+
+    Args:
+        height_service: Calibrated HeightMeasuringService; provides the robot and laser
+            detection services, the zero reference and pixel_to_mm().
+        config: HeightMeasuringConfig (defaults to the height service's config).
+    """
+
+    def __init__(self, height_service, config: HeightMeasuringConfig = None):
+        self.height_service = height_service
+        self.config = config if config is not None else height_service.config
+        self.frames_seen = 0
+        self.frames_used = 0
+
+    def scan(self, start_xy, end_xy) -> HeightScan:
+        hs = self.height_service
+        lds = hs.laser_detection_service
+        robot = hs.robot_service
+        vision = lds.vision_service
+        detector = lds.detector
+        axis = detector.config.default_axis
+        if hs.zero_reference_coords is None or hs.polyval_coefficients is None:
+            raise RuntimeError("Height measuring is not calibrated. Cannot scan.")
+
+        end_pose = [end_xy[0], end_xy[1], hs.zero_reference_z, 180, 0, 0]
+        if not robot.is_within_safety_limits(end_pose):
+            raise RuntimeError(f"Scan end pose {end_pose} is outside the robot safety limits.")
+
+        hs.move_to(*start_xy, wait=True)
+        lds.laser.turnOn()
+        time.sleep(lds.strobe.settle_delay)
+
+        sampler = PoseSampler(robot.get_current_position, self.config.scan_pose_interval_ms / 1000.0).start()
+        with vision.frame_lock:
+            last_id = vision.frame_id
+
+        records = []
+        try:
+            result = robot.robot.move_liner(
+                position=end_pose,
+                tool=robot.robot_config.robot_tool,
+                user=robot.robot_config.robot_user,
+                vel=self.config.scan_velocity,
+                acc=self.config.measurement_acceleration,
+                blendR=0
+            )
+            if result != 0:
+                raise RuntimeError(f"Scan move to {end_pose} rejected by the robot (code {result}).")
+
+            deadline = time.time() + self.config.scan_timeout
+            while time.time() < deadline:
+                item = lds.strobe.next_frame(last_id, min(deadline, time.time() + 1.0))
+                if item is not None:
+                    last_id, captured_at, frame = item
+                    lines, positions, _ = detector.detect_line_profile(frame, chroma_background(frame), axis)
+                    records.append((captured_at, lines, positions, frame.shape))
+                pose = sampler.latest()
+                if pose is not None and np.hypot(pose[0] - end_xy[0], pose[1] - end_xy[1]) \
+                        <= self.config.measurement_threshold:
+                    break
+        finally:
+            sampler.stop()
+            lds.laser.turnOff()
+
+        return self._build_scan(records, sampler, start_xy, end_xy, axis)
+
+    def _build_scan(self, records, sampler, start_xy, end_xy, axis) -> HeightScan:
+        hs = self.height_service
+        reference = hs.zero_reference_coords
+        reference_position, reference_line = (reference[0], reference[1]) if axis == 'y' else \
+            (reference[1], reference[0])
+        self.frames_seen = len(records)
+
+        timestamps = np.array([r[0] for r in records], dtype=np.float64)
+        poses = sampler.interpolate(timestamps)
+        keep = ~np.isnan(poses[:, 0])
+        n_lines = 0
+        if records:
+            shape = records[0][3]
+            n_lines = shape[0] if axis == 'y' else shape[1]
+
+        heights = np.full((int(keep.sum()), n_lines), np.nan)
+        for row, (_, lines, positions, _) in enumerate(r for r, k in zip(records, keep) if k):
+            if len(lines):
+                heights[row, lines.astype(np.intp)] = hs.pixel_to_mm(reference_position - positions)
+        self.frames_used = len(heights)
+        print(f"[HeightScanning] {self.frames_used}/{self.frames_seen} frames paired with robot poses")
+
+        return HeightScan(
+            timestamps=timestamps[keep],
+            poses=poses[keep],
+            heights=heights,
+            start_xy=tuple(start_xy),
+            end_xy=tuple(end_xy),
+            reference_line=int(round(reference_line)),
+        )
@@ -4,6 +4,7 @@ import numpy as np
 
 from modules.VisionSystem.laser_detection.laser_detector import LaserDetector
 from modules.VisionSystem.laser_detection.config import LaserDetectionConfig
+from modules.VisionSystem.laser_detection.strobe_capture import StrobeCapture, StrobeMeasurement
 from modules.shared.tools.Laser import Laser
 
 
@@ -25,7 +26,9 @@ class LaserDetectionService:
         self.last_on_frame = None
         self.last_off_frame = None
         self.laser_status = 0
-
+        self.strobe = StrobeCapture(vision_service, laser, self.config)
+        self.last_measurement: StrobeMeasurement = None
+        self._frame_shape = None
 
     # -------------------------------------------------
     # Toggle laser
@@ -53,15 +56,78 @@ class LaserDetectionService:
         """
         Detect laser line using median of multiple ON/OFF frames.
 
-        Args:
-            axis: 'x' or 'y' (uses config default if None)
-            delay_ms: time between frame grabs (uses config default if None)
-            samples: number of frames for median (uses config default if None)
-            max_retries: attempts before giving up (uses config default if None)
+        With a VisionService that numbers its frames, exactly ``detection_samples`` distinct
+        frames are captured per laser state, all exposed after the (adaptive) settle delay,
+        and only the detector's ROI band is copied and reduced. The frame counts and timing
+        of the last capture are kept in ``last_measurement``. Other frame sources fall back
+        to sampling ``latest_frame`` at fixed intervals.
 
         Returns:
             tuple: (mask, bright, closest) or (None, None, None) if detection fails
         """
+        if not self.strobe.supports_sequencing():
+            return self._detect_polling()
+
+        axis = self.config.default_axis
+        samples = self.config.detection_samples
+
+        for attempt in range(self.config.max_detection_retries):
+            started = time.time()
+            region = None
+            if self._frame_shape is not None:
+                region = self.detector.capture_region(axis, self._frame_shape)
+
+            off_phase = self.strobe.capture(False, samples, region)
+            if off_phase.count < samples:
+                print(f"[LaserDetection] Attempt {attempt + 1}: got {off_phase.count}/{samples} OFF frames")
+                continue
+            on_phase = self.strobe.capture(True, samples, region)
+            if on_phase.count < samples:
+                print(f"[LaserDetection] Attempt {attempt + 1}: got {on_phase.count}/{samples} ON frames")
+                continue
+            settle_delay = self.strobe.settle_delay
+            latency = self.strobe.update_settle_delay(off_phase, on_phase)
+
+            off_med = self._median(off_phase.frames, region)
+            on_med = self._median(on_phase.frames, region)
+            self._frame_shape = on_med.shape
+            self.last_off_frame = off_med
+            self.last_on_frame = on_med
+
+            mask, bright, closest = self.detector.detect_laser_line(on_med, off_med, axis)
+            self.last_measurement = StrobeMeasurement(
+                on_frames=on_phase.count,
+                off_frames=off_phase.count,
+                stale_frames=on_phase.stale_frames + off_phase.stale_frames,
+                duration_s=time.time() - started,
+                settle_delay_s=settle_delay,
+                latency_s=latency,
+                region=region,
+            )
+            print(f"[LaserDetection] Measurement used {on_phase.count} ON / {off_phase.count} OFF frames "
+                  f"({self.last_measurement.stale_frames} unsettled skipped) in "
+                  f"{self.last_measurement.duration_s * 1000:.0f} ms, settle {settle_delay * 1000:.0f} ms")
+
+            if closest is not None:
+                print(f"[LaserDetection] Success at {closest}")
+                return mask, bright, closest
+
+            print(f"[LaserDetection] Attempt {attempt + 1}: No detection")
+
+        print("[LaserDetection] FAILED after retries")
+        return None, None, None
+
+    def _median(self, stack, region):
+        """Per-pixel median of a frame stack; a region stack is placed into a zero full frame."""
+        median = np.median(stack, axis=0).astype(np.uint8)
+        if region is None:
+            return median
+        full = np.zeros(self._frame_shape, dtype=np.uint8)
+        full[region] = median
+        return full
+
+    def _detect_polling(self):
+        """Fixed-delay sampling of ``latest_frame``, for frame sources without frame ids."""
         # Use config defaults if not specified
         axis =self.config.default_axis
         delay_between_laser_toggle_and_capture = self.config.detection_delay_ms
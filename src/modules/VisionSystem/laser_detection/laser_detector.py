@@ -16,6 +16,8 @@ class LaserDetector:
         self.config = config
         self.last_closest_point = None
         self.lase_bright_point = None
+        # (axis, line indices, positions) of the last detection, for ROI tracking
+        self.last_line = None
 
     # -------------------------------------------------
    # Subpixel quadratic peak refinement
@@ -39,6 +41,10 @@ class LaserDetector:
         """
         Detect laser line from ON/OFF frames.
 
+        With ``config.roi_band_px`` set, only a band of that half width around the last
+        detected line is processed (falling back to the whole frame when the line is lost);
+        the bright point is then the brightest pixel inside the band.
+
         Args:
             on_frame: Frame with laser ON
             off_frame: Frame with laser OFF
@@ -55,83 +61,200 @@ class LaserDetector:
         if axis is None:
             axis = self.config.default_axis
 
-        on_r = on_frame[:, :, 2].astype(np.float32)
-        off_r = off_frame[:, :, 2].astype(np.float32)
-        diff = on_r - off_r
-        diff[diff < 0] = 0
-
-        # Use config values for blur
-        diff = cv2.GaussianBlur(
-            diff,
-            self.config.gaussian_blur_kernel,
-            self.config.gaussian_blur_sigma
-        )
-        h, w = diff.shape
-
-        # Use config value for minimum intensity
-        min_intensity = self.config.min_intensity
+        h, w = on_frame.shape[:2]
+        lines, positions, bright = self.detect_line_profile(on_frame, off_frame, axis)
 
         if axis == 'y':
-            mask_bool = diff > min_intensity
-            weights = diff * mask_bool
-            centroid_x = np.zeros(h, dtype=np.float32)
-
-            for i in range(h):
-                row = diff[i, :]
-                if np.max(row) > min_intensity:
-                    idx_max = np.argmax(row)
-                    # Subpixel refinement
-                    centroid_x[i] = self.subpixel_quadratic(idx_max, row)
-                else:
-                    centroid_x[i] = np.nan  # invalid row
-
-            y_coords = np.arange(h)
-            points = [(cx, float(y)) for cx, y in zip(centroid_x, y_coords) if not np.isnan(cx)]
-
-
+            xs, ys = positions, lines
         else:
-
-            mask_bool = diff > min_intensity
-
-            centroid_y = np.zeros(w, dtype=np.float32)
-
-            for j in range(w):
-
-                col = diff[:, j]
-
-                if np.max(col) > min_intensity:
-
-                    idx_max = np.argmax(col)
-
-                    centroid_y[j] = self.subpixel_quadratic(idx_max, col)
-
-                else:
-
-                    centroid_y[j] = np.nan
-
-            x_coords = np.arange(w)
-
-            points = [(float(x), cy) for x, cy in zip(x_coords, centroid_y) if not np.isnan(cy)]
+            xs, ys = lines, positions
 
         # Closest point to image center
         closest_point = None
-        if points:
-            cx, cy = w / 2.0, h / 2.0
-            closest_point = min(points, key=lambda p: (p[0] - cx) ** 2 + (p[1] - cy) ** 2)
-
-        bright = cv2.minMaxLoc(diff)[3]
+        if len(lines):
+            d2 = (xs - w / 2.0) ** 2 + (ys - h / 2.0) ** 2
+            i = int(np.argmin(d2))
+            closest_point = (float(xs[i]), float(ys[i]))
 
         # Mask for visualization
         mask = np.zeros((h, w), np.uint8)
-        for (x, y) in points:
-            mask[int(round(y)), int(round(x))] = 255
+        mask[np.rint(ys).astype(np.intp), np.rint(xs).astype(np.intp)] = 255
 
         self.lase_bright_point = bright
         self.last_closest_point = closest_point
         print(
-            f"[LaserDetector.detect_laser_line] Detected {len(points)} points, closest_point={closest_point}, bright={bright}")
+            f"[LaserDetector.detect_laser_line] Detected {len(lines)} points, closest_point={closest_point}, bright={bright}")
         return mask, bright, closest_point
 
+    def detect_line_profile(self, on_frame, off_frame, axis=None):
+        """
+        Laser line position on every scan line, without building the mask.
+
+        Returns:
+            tuple: (line indices, positions, bright_point). For axis 'y' the lines are rows
+            and the positions x coordinates; for 'x' the lines are columns and the positions
+            y coordinates. Lines without a valid peak are left out.
+        """
+        if axis is None:
+            axis = self.config.default_axis
+        h, w = on_frame.shape[:2]
+        band = self._roi_band(axis, w if axis == 'y' else h)
+        lines, positions, bright = self._detect_in_band(on_frame, off_frame, axis, band)
+        if band is not None and len(lines) == 0:
+            lines, positions, bright = self._detect_in_band(on_frame, off_frame, axis, None)
+        self.last_line = (axis, lines, positions) if len(lines) else None
+        return lines, positions, bright
+
+    def _roi_band(self, axis, size):
+        """Sample range [start, stop) to search along the scan axis, or None for all of it."""
+        if self.config.roi_band_px <= 0 or self.last_line is None or self.last_line[0] != axis:
+            return None
+        positions = self.last_line[2]
+        start = max(int(np.floor(positions.min())) - self.config.roi_band_px, 0)
+        stop = min(int(np.ceil(positions.max())) + self.config.roi_band_px + 1, size)
+        if start >= stop or stop - start >= size:
+            return None
+        return start, stop
+
+    def _blur_margin(self, band, size):
+        """Band widened by the blur radius, clipped to [0, size)."""
+        radius = max(self.config.gaussian_blur_kernel) // 2
+        return max(band[0] - radius, 0), min(band[1] + radius, size)
+
+    def capture_region(self, axis, frame_shape):
+        """
+        Part of the frame the next detection on ``axis`` reads, as a (rows, cols) slice pair:
+        the ROI band around the last line plus the blur margin. None means the whole frame.
+        """
+        size = frame_shape[1] if axis == 'y' else frame_shape[0]
+        band = self._roi_band(axis, size)
+        if band is None:
+            return None
+        lo, hi = self._blur_margin(band, size)
+        return (slice(None), slice(lo, hi)) if axis == 'y' else (slice(lo, hi), slice(None))
+
+    def _difference_image(self, on_frame, off_frame, axis, band=None):
+        """
+        Blurred, non-negative red-channel ON-OFF difference, optionally cropped to a band.
+
+        The band is widened by the blur radius before blurring and trimmed afterwards, so
+        the returned pixels equal the corresponding pixels of the full-frame result.
+        """
+        if band is None:
+            on_r, off_r = on_frame[:, :, 2], off_frame[:, :, 2]
+            start = margin = 0
+            stop = on_frame.shape[1] if axis == 'y' else on_frame.shape[0]
+        else:
+            start, stop = band
+            lo, hi = self._blur_margin(band, on_frame.shape[1] if axis == 'y' else on_frame.shape[0])
+            margin = start - lo
+            crop = (slice(None), slice(lo, hi)) if axis == 'y' else (slice(lo, hi), slice(None))
+            on_r, off_r = on_frame[crop + (2,)], off_frame[crop + (2,)]
+
+        diff = on_r.astype(np.float32)
+        diff -= off_r
+        np.maximum(diff, 0, out=diff)
+
+        # Use config values for blur
+        diff = cv2.GaussianBlur(
+            diff,
+            self.config.gaussian_blur_kernel,
+            self.config.gaussian_blur_sigma
+        )
+        if band is not None:
+            keep = slice(margin, margin + stop - start)
+            diff = diff[:, keep] if axis == 'y' else diff[keep, :]
+        return diff, start
+
+    def _detect_in_band(self, on_frame, off_frame, axis, band):
+        """Return (line indices, peak positions, bright point) in full-frame coordinates."""
+        diff, start = self._difference_image(on_frame, off_frame, axis, band)
+        profiles = diff if axis == 'y' else diff.T
+        positions = extract_line_positions(
+            profiles,
+            self.config.min_intensity,
+            subpixel_method=self.config.subpixel_method if self.config.use_subpixel_refinement else None,
+            half_window=self.config.centroid_half_window,
+            min_width=self.config.min_line_width,
+            max_width=self.config.max_line_width,
+        )
+        lines = np.flatnonzero(~np.isnan(positions))
+        positions = positions[lines] + np.float32(start)
+
+        bx, by = cv2.minMaxLoc(diff)[3]
+        bright = (bx + start, by) if axis == 'y' else (bx, by + start)
+        return lines.astype(np.float64), positions, bright
+
+
+# -------------------------------------------------
+# Array-native line extraction
+# -------------------------------------------------
+def subpixel_quadratic_batch(profiles, idx):
+    """
+    Three-point parabolic refinement of the peak at idx[i] in each row of profiles.
+
+    Vectorised form of LaserDetector.subpixel_quadratic: peaks on the border or with a
+    flat neighbourhood keep their integer position.
+    """
+    n = profiles.shape[1]
+    rows = np.arange(len(idx))
+    left = profiles[rows, np.maximum(idx - 1, 0)].astype(np.float64)
+    centre = profiles[rows, idx].astype(np.float64)
+    right = profiles[rows, np.minimum(idx + 1, n - 1)].astype(np.float64)
+    denom = left - 2 * centre + right
+    refine = (idx >= 1) & (idx < n - 1) & (denom != 0)
+    offset = np.zeros(len(idx), dtype=np.float64)
+    np.divide(0.5 * (left - right), denom, out=offset, where=refine)
+    return idx + offset
+
+
+def subpixel_centroid_batch(profiles, idx, half_window, floor=0.0):
+    """Centre of mass of (profile - floor) within +/- half_window samples of each peak."""
+    n = profiles.shape[1]
+    cols = idx[:, None] + np.arange(-half_window, half_window + 1)
+    inside = (cols >= 0) & (cols < n)
+    weights = profiles[np.arange(len(idx))[:, None], np.clip(cols, 0, n - 1)].astype(np.float64) - floor
+    weights[~inside | (weights < 0)] = 0.0
+    total = weights.sum(axis=1)
+    return np.divide((weights * cols).sum(axis=1), total, out=idx.astype(np.float64), where=total > 0)
+
+
+def extract_line_positions(profiles, min_intensity, subpixel_method='quadratic', half_window=3,
+                           min_width=0, max_width=0):
+    """
+    Peak position of the laser line along each row of a 2-D intensity array.
+
+    Args:
+        profiles: (lines, samples) array, one scan line per row.
+        min_intensity: A line is valid only if its peak exceeds this value.
+        subpixel_method: 'quadratic', 'centroid' or None for integer positions.
+        half_window: Centre-of-mass half window (samples) for 'centroid'.
+        min_width, max_width: Valid range for the number of samples at or above half the
+            peak value; 0 disables the respective limit.
+
+    Returns:
+        float32 array with one position per row, NaN where no valid line was found.
+    """
+    idx = np.argmax(profiles, axis=1)
+    peak = np.take_along_axis(profiles, idx[:, None], axis=1)[:, 0]
+    valid = peak > min_intensity
+    if min_width > 0 or max_width > 0:
+        width = np.count_nonzero(profiles >= 0.5 * peak[:, None], axis=1)
+        if min_width > 0:
+            valid &= width >= min_width
+        if max_width > 0:
+            valid &= width <= max_width
+
+    if subpixel_method == 'quadratic':
+        positions = subpixel_quadratic_batch(profiles, idx)
+    elif subpixel_method == 'centroid':
+        positions = subpixel_centroid_batch(profiles, idx, half_window, min_intensity)
+    else:
+        positions = idx
+    positions = positions.astype(np.float32)
+    positions[~valid] = np.nan
+    return positions
+
 
 # # -------------------------------------------------
 # # Pure-Python Zhang–Suen Skeletonization (Thinning)
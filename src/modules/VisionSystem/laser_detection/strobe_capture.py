@@ -0,0 +1,182 @@
+"""
+Sequence-aware ON/OFF frame capture for laser detection.
+
+Frames are taken from VisionService by ``frame_id``, so every captured frame is a distinct
+camera frame, and by capture timestamp, so frames exposed before the laser settled after a
+toggle are skipped. Only the requested region of each frame is copied into a preallocated
+stack. The settle delay starts at ``detection_delay_ms`` and, with
+``adaptive_settle_delay``, follows the measured toggle-to-frame latency of the camera.
+"""
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from modules.VisionSystem.laser_detection.config import LaserDetectionConfig
+
+# Weight of a new latency sample in the running estimate
+LATENCY_SMOOTHING = 0.3
+# Fallback poll interval for vision services without a frame condition
+POLL_INTERVAL_S = 0.002
+
+
+def laser_level(frame) -> float:
+    """
+    Brightness measure that reacts to a thin laser line in any orientation: the mean of the
+    red channel's per-row and per-column maxima.
+    """
+    red = frame[:, :, 2]
+    return float(red.max(axis=1).mean() + red.max(axis=0).mean())
+
+
+@dataclass
+class StrobePhase:
+    """Frames captured for one laser state."""
+    laser_on: bool
+    frames: np.ndarray  # (n, h, w, c) stack of the captured region
+    toggled_at: float
+    frame_times: List[float] = field(default_factory=list)  # capture time - toggled_at, accepted frames
+    levels: List[Tuple[float, float]] = field(default_factory=list)  # (capture time - toggled_at, laser_level), all frames
+    stale_frames: int = 0  # frames captured before the settle delay had passed
+
+    @property
+    def count(self) -> int:
+        return len(self.frames)
+
+
+@dataclass
+class StrobeMeasurement:
+    """Summary of one ON/OFF capture, reported by LaserDetectionService."""
+    on_frames: int
+    off_frames: int
+    stale_frames: int
+    duration_s: float
+    settle_delay_s: float
+    latency_s: Optional[float]
+    region: Optional[tuple]
+
+
+class StrobeCapture:
+    """
+    Captures N distinct, settled frames per laser state from a VisionService.
+
+    Args:
+        vision_service: Provides ``latest_frame``, ``frame_id``, ``frame_lock`` and, when
+            available, ``frame_condition`` and ``latest_frame_timestamp``.
+        laser: Laser with turnOn()/turnOff().
+        config: LaserDetectionConfig (delays, timeouts).
+    """
+
+    def __init__(self, vision_service, laser, config: LaserDetectionConfig):
+        self.vision_service = vision_service
+        self.laser = laser
+        self.config = config
+        self.settle_delay = config.detection_delay_ms / 1000.0
+        self.latency = None  # smoothed toggle-to-frame latency (s)
+        self.frame_interval = None
+
+    def supports_sequencing(self) -> bool:
+        """True if the vision service numbers its frames (VisionService.frame_id)."""
+        return isinstance(getattr(self.vision_service, "frame_id", None), int)
+
+    # -------------------------------------------------
+    # Frame access
+    # -------------------------------------------------
+    def next_frame(self, after_id, deadline, region=None):
+        """(frame_id, capture time, region copy) of the first frame newer than after_id, or None."""
+        vs = self.vision_service
+        condition = getattr(vs, "frame_condition", None)
+        if condition is not None:
+            with condition:
+                if not condition.wait_for(lambda: vs.frame_id > after_id and vs.latest_frame is not None,
+                                          timeout=max(deadline - time.time(), 0.0)):
+                    return None
+                return self._snapshot(region)
+
+        while time.time() < deadline:
+            with vs.frame_lock:
+                if vs.frame_id > after_id and vs.latest_frame is not None:
+                    return self._snapshot(region)
+            time.sleep(POLL_INTERVAL_S)
+        return None
+
+    def _snapshot(self, region):
+        vs = self.vision_service
+        frame = vs.latest_frame if region is None else vs.latest_frame[region]
+        timestamp = getattr(vs, "latest_frame_timestamp", None)
+        return vs.frame_id, (timestamp if timestamp is not None else time.time()), frame.copy()
+
+    # -------------------------------------------------
+    # Capture
+    # -------------------------------------------------
+    def capture(self, laser_on: bool, samples: int, region=None) -> StrobePhase:
+        """
+        Switch the laser and capture ``samples`` distinct frames exposed after the settle delay.
+
+        Returns fewer frames if the camera does not deliver them within
+        ``frame_wait_timeout_ms`` after settling.
+        """
+        vs = self.vision_service
+        with vs.frame_lock:
+            last_id = vs.frame_id
+        if laser_on:
+            self.laser.turnOn()
+        else:
+            self.laser.turnOff()
+        toggled_at = time.time()
+        settled_at = toggled_at + self.settle_delay
+        deadline = settled_at + self.config.frame_wait_timeout_ms / 1000.0
+
+        stack = None
+        phase = StrobePhase(laser_on, np.empty((0,), np.uint8), toggled_at)
+        count = 0
+        while count < samples:
+            item = self.next_frame(last_id, deadline, region)
+            if item is None:
+                break
+            last_id, captured_at, frame = item
+            phase.levels.append((captured_at - toggled_at, laser_level(frame)))
+            if captured_at < settled_at:
+                phase.stale_frames += 1
+                continue
+            if stack is None:
+                stack = np.empty((samples,) + frame.shape, dtype=frame.dtype)
+            stack[count] = frame
+            phase.frame_times.append(captured_at - toggled_at)
+            count += 1
+
+        phase.frames = stack[:count] if stack is not None else phase.frames
+        return phase
+
+    def update_settle_delay(self, off_phase: StrobePhase, on_phase: StrobePhase) -> Optional[float]:
+        """
+        Estimate the latency from the ON phase and adapt the settle delay.
+
+        The latency is the capture time of the first frame after switching on whose
+        laser_level is past the midpoint between the settled OFF and ON levels. Returns the sample,
+        or None if the contrast was too low to tell.
+        """
+        times = np.diff(on_phase.frame_times)
+        if len(times):
+            self.frame_interval = float(np.median(times))
+        if not self.config.adaptive_settle_delay or not off_phase.frame_times or not on_phase.frame_times:
+            return None
+
+        off_level = float(np.median([level for _, level in off_phase.levels[off_phase.stale_frames:]]))
+        on_level = float(np.median([level for _, level in on_phase.levels[on_phase.stale_frames:]]))
+        if on_level - off_level < self.config.strobe_min_contrast:
+            return None
+        threshold = (off_level + on_level) / 2.0
+        sample = next((t for t, level in on_phase.levels if level >= threshold), None)
+        if sample is None:
+            return None
+
+        sample = max(sample, 0.0)
+        self.latency = sample if self.latency is None else \
+            (1 - LATENCY_SMOOTHING) * self.latency + LATENCY_SMOOTHING * sample
+        # One frame of margin, so the first accepted frame is fully exposed with the new state
+        delay = self.latency + (self.frame_interval or 0.0)
+        self.settle_delay = float(np.clip(delay, self.config.min_settle_delay_ms / 1000.0,
+                                          self.config.detection_delay_ms / 1000.0))
+        return sample
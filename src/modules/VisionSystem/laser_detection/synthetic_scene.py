@@ -0,0 +1,184 @@
+"""
+Synthetic laser scene for exercising laser detection and height scanning without hardware.
+
+SyntheticLaserScene plays the robot, the laser and the camera at once:
+
+- robot: ``get_current_position``/``move_to_position``/``robot.move_liner`` with
+  straight-line, constant-speed motion (velocities in % of ``max_speed``, like the real
+  controller), plus the ``robot_config`` fields, ``is_within_safety_limits`` and
+  ``_waitForRobotToReachPosition`` used by HeightMeasuringService;
+- laser: ``turnOn``/``turnOff``;
+- camera: a thread rendering frames at ``fps`` and publishing them through the
+  VisionService fields ``latest_frame``, ``frame_id``, ``frame_lock``, ``frame_condition``
+  and ``latest_frame_timestamp``.
+
+Each frame shows the laser line (axis 'y': one peak per image row) displaced from the zero
+reference column according to the surface height under the laser, via the inverse of a
+linear pixel-to-mm calibration. Image rows map to robot Y offsets of ``mm_per_row``.
+
+Example:
+    scene = SyntheticLaserScene(box_height_fn(x_range=(20, 30), height=5.0)).start()
+    ...
+    scene.stop()
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+
+def box_height_fn(x_range=(20.0, 30.0), y_range=(-np.inf, np.inf), height=5.0):
+    """Height function of a flat box standing on the zero plane."""
+    def height_fn(x, y):
+        inside = (x >= x_range[0]) & (x <= x_range[1]) & (y >= y_range[0]) & (y <= y_range[1])
+        return np.where(inside, height, 0.0)
+    return height_fn
+
+
+class SyntheticLaserScene:
+    """
+    Args:
+        height_fn: Vectorised f(x, y) -> surface height (mm) in robot coordinates.
+        frame_shape: (rows, cols) of the rendered frames.
+        fps: Camera frame rate.
+        mm_per_pixel: Height change per pixel of line displacement (the calibration slope).
+        mm_per_row: Robot Y distance between two image rows on the surface.
+        start_pose: Initial robot pose [x, y, z, rx, ry, rz].
+        max_speed: Robot speed at 100 % velocity (mm/s).
+        noise: Standard deviation of the image noise (grey levels).
+        seed: Noise seed.
+    """
+
+    LASER_PEAK = 160.0
+    LASER_SIGMA_PX = 1.5
+    BACKGROUND = 60.0
+
+    def __init__(self, height_fn, frame_shape=(120, 160), fps=100.0, mm_per_pixel=0.25, mm_per_row=0.2,
+                 start_pose=(0.0, 0.0, 300.0, 180.0, 0.0, 0.0), max_speed=1000.0, noise=2.0, seed=0):
+        self.height_fn = height_fn
+        self.frame_shape = tuple(frame_shape)
+        self.fps = fps
+        self.mm_per_pixel = mm_per_pixel
+        self.mm_per_row = mm_per_row
+        self.noise = noise
+        self.zero_reference_coords = (frame_shape[1] / 2.0, frame_shape[0] / 2.0)
+        self._rng = np.random.default_rng(seed)
+
+        # Robot (the scene is both the robot service and its robot)
+        self.robot = self
+        self.max_speed = max_speed
+        self.robot_config = SimpleNamespace(robot_tool=0, robot_user=0)
+        self._motion_lock = threading.Lock()
+        self._motion = (np.array(start_pose, dtype=np.float64), np.array(start_pose, dtype=np.float64), 0.0, 1.0)
+
+        # Laser
+        self.laser_on = False
+
+        # Camera (VisionService fields)
+        self.frame_lock = threading.Lock()
+        self.frame_condition = threading.Condition(self.frame_lock)
+        self.frame_id = 0
+        self.latest_frame = None
+        self.latest_frame_timestamp = None
+        self._running = False
+        self._thread = None
+
+    # -------------------------------------------------
+    # Calibration
+    # -------------------------------------------------
+    def calibration_data(self):
+        """Calibration file contents (LaserCalibrationStorage format) matching this scene."""
+        return {
+            "zero_reference_coords": list(self.zero_reference_coords),
+            "robot_initial_position": [float(v) for v in self.get_current_position()],
+            "polynomial": {"coefficients": [0.0, self.mm_per_pixel], "intercept": 0.0, "degree": 1, "mse": 0.0},
+        }
+
+    # -------------------------------------------------
+    # Robot
+    # -------------------------------------------------
+    def get_current_position(self):
+        start, target, started_at, duration = self._motion
+        fraction = min(max((time.time() - started_at) / duration, 0.0), 1.0)
+        return list(start + (target - start) * fraction)
+
+    def move_to_position(self, position, tool=None, workpiece=None, velocity=100.0, acceleration=None,
+                         waitToReachPosition=False):
+        duration = self._start_motion(position, velocity)
+        if waitToReachPosition:
+            time.sleep(duration)
+        return 0
+
+    def move_liner(self, position, tool=0, user=0, vel=30, acc=30, blendR=0):
+        self._start_motion(position, vel)
+        return 0
+
+    def is_within_safety_limits(self, position):
+        return True
+
+    def _start_motion(self, position, velocity):
+        with self._motion_lock:
+            start = np.array(self.get_current_position())
+            target = np.array(position, dtype=np.float64)
+            speed = self.max_speed * velocity / 100.0
+            duration = max(np.linalg.norm(target[:3] - start[:3]) / speed, 1e-6)
+            self._motion = (start, target, time.time(), duration)
+        return duration
+
+    def _waitForRobotToReachPosition(self, position, threshold=0.5, delay=0, timeout=10.0):
+        _, _, started_at, duration = self._motion
+        time.sleep(max(started_at + duration - time.time(), 0.0))
+        return True
+
+    # -------------------------------------------------
+    # Laser
+    # -------------------------------------------------
+    def turnOn(self):
+        self.laser_on = True
+
+    def turnOff(self):
+        self.laser_on = False
+
+    # -------------------------------------------------
+    # Camera
+    # -------------------------------------------------
+    def render(self, pose, laser_on=True):
+        """BGR frame of the scene seen from ``pose``."""
+        rows, cols = self.frame_shape
+        frame = self.BACKGROUND + self._rng.normal(0.0, self.noise, (rows, cols, 3))
+        if laser_on:
+            row_y = pose[1] + (np.arange(rows) - self.zero_reference_coords[1]) * self.mm_per_row
+            heights = self.height_fn(np.full(rows, pose[0]), row_y)
+            # calibration: height = mm_per_pixel * (zero_x - x)
+            line_x = self.zero_reference_coords[0] - heights / self.mm_per_pixel
+            profile = np.exp(-0.5 * ((np.arange(cols)[None, :] - line_x[:, None]) / self.LASER_SIGMA_PX) ** 2)
+            frame[:, :, 2] += self.LASER_PEAK * profile
+        return np.clip(frame, 0, 255).astype(np.uint8)
+
+    def start(self) -> "SyntheticLaserScene":
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="SyntheticLaserCamera", daemon=True)
+        self._thread.start()
+        with self.frame_condition:
+            self.frame_condition.wait_for(lambda: self.frame_id > 0, timeout=1.0)
+        return self
+
+    def stop(self):
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+
+    def _run(self):
+        interval = 1.0 / self.fps
+        next_frame = time.time()
+        while self._running:
+            captured_at = time.time()
+            frame = self.render(self.get_current_position(), self.laser_on)
+            with self.frame_condition:
+                self.latest_frame = frame
+                self.latest_frame_timestamp = captured_at
+                self.frame_id += 1
+                self.frame_condition.notify_all()
+            next_frame += interval
+            time.sleep(max(next_frame - time.time(), 0.0))
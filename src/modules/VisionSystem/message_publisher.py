@@ -1,11 +1,12 @@
 from communication_layer.api.v1.topics import VisionTopics
-from modules.shared.MessageBroker import MessageBroker
+from modules.shared.MessageBroker import MessageBroker, DeliveryPolicy
 class MessagePublisher:
     def __init__(self):
         self.broker= MessageBroker()
         self.latest_image_topic = VisionTopics.LATEST_IMAGE
         self.calibration_image_captured_topic = VisionTopics.CALIBRATION_IMAGE_CAPTURED
         self.thresh_image_topic = VisionTopics.THRESHOLD_IMAGE
+        self.broker.set_topic_policy(self.thresh_image_topic, DeliveryPolicy.LATEST)
         self.stateTopic = VisionTopics.SERVICE_STATE
         self.topic = VisionTopics.CALIBRATION_FEEDBACK
 
@@ -1,16 +1,15 @@
 import copy
-from pathlib import Path
 from typing import Any, Tuple
 
 import numpy as np
 
 from modules.contour_matching.matching.match_info import MatchInfo
+from modules.contour_matching.matching.ml_model_service import get_model_service
 from modules.contour_matching.matching.strategies.geometric_matching_strategy import \
     GeometricMatchingStrategy
 from modules.contour_matching.matching.strategies.matching_strategy_interface import MatchingStrategy
 from modules.contour_matching.matching.strategies.ml_matching_strategy import MLMatchingStrategy
 from modules.contour_matching.matching_config import DEBUG_ALIGN_CONTOURS, USE_COMPARISON_MODEL
-from modules.shape_matching_training.utils.io_utils import load_latest_model
 
 from modules.shared.core.ContourStandartized import Contour
 from modules.contour_matching.alignment.contour_aligner import _alignContours
@@ -28,19 +27,10 @@ def get_contour_objects(entries):
 
 def load_model_with_fallback() -> Any:
     """
-    Load the most recent trained ML model with a safe fallback mechanism.
+    The most recent trained ML model, served from the process-wide model service.
+    The model is only read from disk again when a newer model file is saved.
     """
-    model_dir = (
-        Path(__file__).resolve().parent.parent
-        / "shape_matching_training"
-        / "saved_models"
-    )
-
-    if not model_dir.exists():
-        print(f"⚠️ Model directory not found at {model_dir}. Trying fallback path.")
-        model_dir = Path.cwd() / "src" / "modules" / "shape_matching_training" / "saved_models"
-
-    return load_latest_model(save_dir=str(model_dir))
+    return get_model_service().get_model()
 
 def prepare_data_for_alignment(matched: list[MatchInfo]):
     """
@@ -85,8 +75,7 @@ def findMatchingWorkpieces(workpieces, newContours):
 
     # --- FIND MATCHES ---
     if USE_COMPARISON_MODEL:
-        model = load_model_with_fallback()
-        strategy = MLMatchingStrategy(model)
+        strategy = MLMatchingStrategy(get_model_service())
     else:
         # Geometric-based
         strategy = GeometricMatchingStrategy(similarity_threshold=0.8)
@@ -110,15 +99,19 @@ def match_workpieces(
 ) -> Tuple[list[MatchInfo], list[Contour], list[Contour]]:
     """
     Generic matching loop that uses a provided strategy (ML or geometric).
+    Strategies with ``find_best_matches`` score all contours in one batch.
     """
     matched: list[MatchInfo] = []
     noMatches: list[Contour] = []
     matchedContours: list[Contour] = []
 
-    for contour_data in newContours.copy():
-        contour = Contour(contour_data)
-        best = strategy.find_best_match(workpieces, contour)
+    contours = [Contour(contour_data) for contour_data in newContours.copy()]
+    if hasattr(strategy, "find_best_matches"):
+        results = strategy.find_best_matches(workpieces, contours)
+    else:
+        results = [strategy.find_best_match(workpieces, contour) for contour in contours]
 
+    for contour, best in zip(contours, results):
         if best.is_match:
             match_info = MatchInfo(
                 workpiece=best.workpiece,
@@ -0,0 +1,84 @@
+"""
+Benchmark: RotationSearchEngine vs. the legacy three-stage mask refinement.
+
+Run from the src directory:
+    python -m modules.contour_matching.alignment.benchmark_rotation_search
+"""
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from modules.contour_matching.alignment.mask_refinement import _refine_alignment_with_mask
+from modules.contour_matching.alignment.rotation_search import RotationSearchEngine
+from modules.shared.core.ContourStandartized import Contour
+
+
+def _rectangle(cx, cy, w, h):
+    return np.array([[cx - w / 2, cy - h / 2], [cx + w / 2, cy - h / 2],
+                     [cx + w / 2, cy + h / 2], [cx - w / 2, cy + h / 2]], dtype=np.float32)
+
+
+def _l_shape(cx, cy):
+    return np.array([[0, 0], [200, 0], [200, 60], [60, 60], [60, 150], [0, 150]], dtype=np.float32) + [cx - 80, cy - 60]
+
+
+def _ellipse_notch(cx, cy, n=400):
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    r = 1 + 0.25 * (np.cos(3 * t) > 0.9)
+    return np.stack((cx + 180 * r * np.cos(t), cy + 90 * r * np.sin(t)), axis=1).astype(np.float32)
+
+
+SHAPES = {
+    "rectangle": _rectangle(400, 300, 200, 100),
+    "l_shape": _l_shape(400, 300),
+    "ellipse_notch_400pts": _ellipse_notch(400, 300),
+    # Outside the legacy 800x800 canvas - legacy refinement sees no overlap at all
+    "l_shape_frame_corner": _l_shape(1100, 620),
+}
+ANGLES = [3.0, 17.0, -63.5, 120.0, 179.0]
+
+
+def _workpiece(reference, angle):
+    contour = Contour(reference.copy())
+    contour.rotate(-angle, contour.getCentroid())
+    return contour.get()
+
+
+def run_benchmark(repeats=3):
+    rows = []
+    engine = RotationSearchEngine()
+    for name, reference in SHAPES.items():
+        for angle in ANGLES:
+            workpiece = _workpiece(reference, angle)
+
+            start = time.perf_counter()
+            for _ in range(repeats):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    legacy = _refine_alignment_with_mask(workpiece, reference)
+            legacy_ms = (time.perf_counter() - start) / repeats * 1000
+
+            start = time.perf_counter()
+            for _ in range(repeats):
+                engine_result = engine.search(workpiece, reference)
+            engine_ms = (time.perf_counter() - start) / repeats * 1000
+
+            rows.append((name, angle, legacy, legacy_ms, engine_result, engine_ms, engine.evaluations))
+    return rows
+
+
+def main():
+    rows = run_benchmark()
+    print(f"{'shape':<22}{'true':>8} | {'legacy rot':>10}{'IoU':>7}{'ms':>8} | {'engine rot':>10}{'IoU':>7}{'ms':>7}{'evals':>7}")
+    for name, angle, legacy, legacy_ms, engine_result, engine_ms, evaluations in rows:
+        print(f"{name:<22}{angle:>8.1f} | {legacy[0]:>10.2f}{legacy[1]:>7.3f}{legacy_ms:>8.1f} | "
+              f"{engine_result[0]:>10.2f}{engine_result[1]:>7.3f}{engine_ms:>7.1f}{evaluations:>7}")
+    legacy_total = sum(row[3] for row in rows)
+    engine_total = sum(row[5] for row in rows)
+    print(f"\nTotal: legacy {legacy_total:.1f} ms, engine {engine_total:.1f} ms "
+          f"({legacy_total / engine_total:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
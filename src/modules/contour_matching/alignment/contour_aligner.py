@@ -7,7 +7,7 @@ import numpy as np
 # from backend.system.contour_matching.debug.plot_generator import plot_contour_alignment
 from modules.contour_matching.matching.match_info import MatchInfo
 from modules.shared.core.ContourStandartized import Contour
-from modules.contour_matching.alignment.mask_refinement import _refine_alignment_with_mask
+from modules.contour_matching.alignment.rotation_search import find_best_rotation
 from modules.contour_matching.alignment.workpiece_update import update_workpiece_data
 from modules.contour_matching.matching_config import REFINEMENT_THRESHOLD
 
@@ -61,7 +61,7 @@ def align_single_contour(
 
     # --- Mask-based refinement ---
     if refine:
-        best_rotation, _ = _refine_alignment_with_mask(
+        best_rotation, _ = find_best_rotation(
             target.get(),
             reference
         )
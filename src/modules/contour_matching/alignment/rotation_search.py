@@ -0,0 +1,213 @@
+import cv2
+import numpy as np
+
+from modules.shared.core.ContourStandartized import Contour
+
+# Fixed-point precision used when rasterising rotated contours (subpixel vertex positions)
+_RASTER_SHIFT = 4
+# Pixels of empty border kept around the union bounding box
+_CANVAS_MARGIN = 2
+
+
+def _as_points(contour):
+    if isinstance(contour, Contour):
+        return contour.get().astype(np.float64)
+    return Contour(contour).get().astype(np.float64)
+
+
+def polar_signature(points, pivot, bins=360):
+    """
+    Rotation signature of a closed contour: maximum radius from the pivot per angular bin.
+
+    The contour edges are resampled to roughly one point per pixel first so that long
+    straight edges contribute to every bin they sweep. A rotation of the contour by
+    ``k * 360 / bins`` degrees is a circular shift of the signature by k bins.
+
+    Returns:
+        np.ndarray: float64 array of length ``bins``
+    """
+    closed = np.vstack((points, points[:1]))
+    segments = np.diff(closed, axis=0)
+    lengths = np.hypot(segments[:, 0], segments[:, 1])
+    samples_per_segment = np.maximum(1, np.ceil(lengths).astype(np.intp))
+
+    # Densify every edge at once: segment index + fractional position along it
+    segment_index = np.repeat(np.arange(len(segments)), samples_per_segment)
+    offsets = np.arange(segment_index.size) - np.repeat(np.cumsum(samples_per_segment) - samples_per_segment,
+                                                        samples_per_segment)
+    t = (offsets / samples_per_segment[segment_index])[:, None]
+    dense = closed[segment_index] + t * segments[segment_index]
+
+    relative = dense - np.asarray(pivot, dtype=np.float64)
+    radii = np.hypot(relative[:, 0], relative[:, 1])
+    angles = np.arctan2(relative[:, 1], relative[:, 0])
+    bin_index = np.floor((angles + np.pi) / (2 * np.pi) * bins).astype(np.intp) % bins
+
+    signature = np.zeros(bins, dtype=np.float64)
+    np.maximum.at(signature, bin_index, radii)
+    return signature
+
+
+def rotate_points_batch(points, angles_deg, pivot):
+    """
+    Rotate a contour by many angles at once (same convention as Contour.rotate).
+
+    Returns:
+        np.ndarray: array of shape (len(angles_deg), N, 2)
+    """
+    angles = np.radians(np.asarray(angles_deg, dtype=np.float64))
+    cos_a, sin_a = np.cos(angles)[:, None], np.sin(angles)[:, None]
+    pivot = np.asarray(pivot, dtype=np.float64)
+    rel = points - pivot
+    rotated = np.empty((len(angles), len(points), 2), dtype=np.float64)
+    rotated[..., 0] = cos_a * rel[:, 0] - sin_a * rel[:, 1] + pivot[0]
+    rotated[..., 1] = sin_a * rel[:, 0] + cos_a * rel[:, 1] + pivot[1]
+    return rotated
+
+
+class RotationSearchEngine:
+    """
+    Finds the rotation of a workpiece contour (about its centroid) that maximises the mask IoU
+    with a reference contour.
+
+    Compared to the per-angle full-canvas rasterisation in mask_refinement, the engine:
+      - works on a canvas cropped to the union bounding box of the reference and every possible
+        rotation of the workpiece (no clipping, no 800x800 limit),
+      - rasterises the reference mask once,
+      - ranks all angles at once by circular FFT cross-correlation of polar signatures and only
+        evaluates the IoU around the best peaks,
+      - scores candidate angles in batches into a reused raster buffer.
+
+    ``search`` keeps the ``(best_rotation, best_overlap)`` contract of
+    ``_refine_alignment_with_mask``: the rotation is in degrees in [-180, 180) and 0° wins ties.
+    """
+
+    def __init__(self, signature_bins=360, coarse_peaks=4, coarse_window=3.0, coarse_step=1.0,
+                 fine_window=1.0, fine_step=0.25):
+        self.signature_bins = signature_bins
+        self.coarse_peaks = coarse_peaks
+        self.coarse_window = coarse_window
+        self.coarse_step = coarse_step
+        self.fine_window = fine_window
+        self.fine_step = fine_step
+        self.evaluations = 0
+
+        self._points = None
+        self._pivot = None
+        self._origin = None
+        self._reference_mask = None
+        self._reference_area = 0
+        self._canvas = None
+        self._reference_points = None
+
+    def prepare(self, workpiece_contour, reference_contour):
+        """Crop the canvas and rasterise the reference once for this contour pair."""
+        points = _as_points(workpiece_contour)
+        reference = _as_points(reference_contour)
+        pivot = np.asarray(Contour(points).getCentroid(), dtype=np.float64)
+
+        # Every rotation of the workpiece stays inside the circle of radius r_max around the pivot
+        r_max = float(np.max(np.hypot(*(points - pivot).T))) if len(points) else 0.0
+        low = np.minimum(reference.min(axis=0), pivot - r_max)
+        high = np.maximum(reference.max(axis=0), pivot + r_max)
+        origin = np.floor(low) - _CANVAS_MARGIN
+        width, height = (np.ceil(high - origin) + _CANVAS_MARGIN + 1).astype(int)
+
+        self._points = points
+        self._pivot = pivot
+        self._origin = origin
+        self._reference_points = reference
+        self._reference_mask = np.zeros((height, width), dtype=np.uint8)
+        self._fill(self._reference_mask, reference)
+        self._reference_area = cv2.countNonZero(self._reference_mask)
+        self._canvas = np.zeros_like(self._reference_mask)
+        self.evaluations = 0
+
+    def _fill(self, canvas, points):
+        shifted = np.round((points - self._origin) * (1 << _RASTER_SHIFT)).astype(np.int32)
+        cv2.fillPoly(canvas, [shifted.reshape(-1, 1, 2)], 1, lineType=cv2.LINE_8, shift=_RASTER_SHIFT)
+
+    def score(self, angles_deg):
+        """
+        Mask IoU between the reference and the workpiece rotated by each angle.
+
+        Returns:
+            np.ndarray: IoU per angle
+        """
+        angles_deg = np.atleast_1d(np.asarray(angles_deg, dtype=np.float64))
+        rotated = rotate_points_batch(self._points, angles_deg, self._pivot)
+        scores = np.zeros(len(angles_deg), dtype=np.float64)
+        canvas = self._canvas
+        for i, candidate in enumerate(rotated):
+            canvas.fill(0)
+            self._fill(canvas, candidate)
+            area = cv2.countNonZero(canvas)
+            intersection = cv2.countNonZero(cv2.bitwise_and(canvas, self._reference_mask))
+            union = area + self._reference_area - intersection
+            scores[i] = intersection / union if union > 0 else 0.0
+        self.evaluations += len(angles_deg)
+        return scores
+
+    def coarse_candidates(self):
+        """
+        Candidate angles ranked by circular cross-correlation of the polar signatures,
+        computed for all shifts at once with the FFT.
+        """
+        bins = self.signature_bins
+        work = polar_signature(self._points, self._pivot, bins)
+        reference = polar_signature(self._reference_points, self._pivot, bins)
+        work -= work.mean()
+        reference -= reference.mean()
+
+        # correlation[k] = sum_t reference[t] * work[t - k]: rotating the workpiece by k bins
+        correlation = np.fft.irfft(np.fft.rfft(reference) * np.conj(np.fft.rfft(work)), n=bins)
+
+        # Local maxima on the circle, best first
+        is_peak = (correlation >= np.roll(correlation, 1)) & (correlation >= np.roll(correlation, -1))
+        peaks = np.flatnonzero(is_peak)
+        peaks = peaks[np.argsort(correlation[peaks])[::-1]][:self.coarse_peaks]
+        return peaks * (360.0 / bins)
+
+    def search(self, workpiece_contour, reference_contour):
+        """
+        Returns:
+            tuple: (best_rotation_angle, best_overlap_score)
+        """
+        self.prepare(workpiece_contour, reference_contour)
+
+        best_rotation = 0.0
+        best_overlap = float(self.score([0.0])[0])
+
+        # Stage 1: coarse - evaluate a small window around each signature peak in one batch
+        offsets = np.arange(-self.coarse_window, self.coarse_window + 1e-9, self.coarse_step)
+        coarse = (self.coarse_candidates()[:, None] + offsets[None, :]).ravel()
+        best_rotation, best_overlap = self._pick(coarse, best_rotation, best_overlap)
+
+        # Stage 2: fine - sub-degree window around the best angle
+        offsets = np.arange(-self.fine_window, self.fine_window + 1e-9, self.fine_step)
+        best_rotation, best_overlap = self._pick(best_rotation + offsets, best_rotation, best_overlap)
+
+        return _normalize_angle(best_rotation), best_overlap
+
+    def _pick(self, angles, best_rotation, best_overlap):
+        angles = _normalize_angle(np.asarray(angles, dtype=np.float64))
+        scores = self.score(angles)
+        index = int(np.argmax(scores))
+        if scores[index] > best_overlap:
+            return float(angles[index]), float(scores[index])
+        return best_rotation, best_overlap
+
+
+def _normalize_angle(angle):
+    return (angle + 180) % 360 - 180
+
+
+def find_best_rotation(workpiece_contour, reference_contour, engine=None):
+    """
+    Convenience wrapper around RotationSearchEngine.search.
+
+    Returns:
+        tuple: (best_rotation_angle, best_overlap_score)
+    """
+    engine = engine if engine is not None else RotationSearchEngine()
+    return engine.search(workpiece_contour, reference_contour)
@@ -0,0 +1,249 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+
+from modules.shape_matching_training.core.features.base_extractor import FeatureExtractorFactory
+from modules.shape_matching_training.core.features.feature_store import contour_hash, get_feature_store
+from modules.shape_matching_training.utils.io_utils import load_model
+
+# Same extractor set as io_utils.predict_similarity - the saved models were trained on it
+FEATURE_EXTRACTORS = [
+    {'name': 'geometric'},
+    {'name': 'hu', 'config': {'use_log_transform': True}},
+]
+
+# Confidence band of predict_similarity: below LOW the prediction is flipped, inside the band it is UNCERTAIN
+CONFIDENCE_LOW = 0.8
+CONFIDENCE_HIGH = 0.95
+
+RESULT_DIFFERENT = 0
+RESULT_SAME = 1
+RESULT_UNCERTAIN = 2
+RESULT_NAMES = np.array(["DIFFERENT", "SAME", "UNCERTAIN"])
+
+
+def default_model_dir():
+    model_dir = Path(__file__).resolve().parent.parent.parent / "shape_matching_training" / "saved_models"
+    if not model_dir.exists():
+        print(f"⚠️ Model directory not found at {model_dir}. Trying fallback path.")
+        model_dir = Path.cwd() / "src" / "modules" / "shape_matching_training" / "saved_models"
+    return model_dir
+
+
+def find_latest_model_file(save_dir):
+    """
+    Newest model file in save_dir, using the same ordering as io_utils.list_saved_models
+    (timestamped ``model_*`` folders by name, direct .pkl files by mtime) but without loading
+    any metadata or printing.
+
+    Returns:
+        Path or None
+    """
+    save_dir = Path(save_dir)
+    if not save_dir.exists():
+        return None
+    candidates = []
+    for entry in save_dir.iterdir():
+        if entry.is_dir() and entry.name.startswith('model_'):
+            timestamp = entry.name.replace('model_', '')
+            candidates.extend((timestamp, pkl_file) for pkl_file in entry.glob('*.pkl'))
+        elif entry.suffix == '.pkl':
+            candidates.append((str(int(entry.stat().st_mtime)), entry))
+    if not candidates:
+        return None
+    candidates.sort(key=lambda item: item[0], reverse=True)
+    return candidates[0][1]
+
+
+def classify_predictions(predictions, confidences):
+    """
+    Vectorised version of the SAME / DIFFERENT / UNCERTAIN decision in predict_similarity.
+
+    Returns:
+        np.ndarray: RESULT_* codes with the shape of the inputs
+    """
+    predictions = np.asarray(predictions)
+    confidences = np.asarray(confidences)
+    predicted_same = predictions == 1
+    low = confidences < CONFIDENCE_LOW
+    results = np.where(predicted_same != low, RESULT_SAME, RESULT_DIFFERENT)
+    results[(confidences > CONFIDENCE_LOW) & (confidences < CONFIDENCE_HIGH)] = RESULT_UNCERTAIN
+    return results
+
+
+class SimilarityScores:
+    """Result of MLModelService.score: (N contours, M workpieces) matrices."""
+
+    def __init__(self, results, confidences):
+        self.results = results
+        self.confidences = confidences
+
+    @property
+    def shape(self):
+        return self.results.shape
+
+    def result_name(self, row, col):
+        return str(RESULT_NAMES[self.results[row, col]])
+
+
+class MLModelService:
+    """
+    Keeps the similarity model and contour feature vectors in memory between matching calls.
+
+    - The model is loaded once and only reloaded when the newest file in the model directory
+      changes (different path, mtime or size). ``model`` pins a fixed model instead.
+    - Workpiece feature vectors come from the process-wide FeatureStore of the extractor set,
+      shared with predict_similarity and training, so library workpieces are extracted once.
+      Live camera contours go to a bounded LRU instead, since that store never evicts.
+    - ``score`` evaluates all N contours x M workpieces with one ``predict_proba`` call.
+    - ``assign`` picks each contour's most confident SAME workpiece; with a per-workpiece cap
+      it assigns globally with the Hungarian algorithm instead.
+    """
+
+    def __init__(self, model=None, model_dir=None, contour_cache_size=1024):
+        self._lock = threading.RLock()
+        self._fixed_model = model
+        self._model = model
+        self._model_signature = None
+        self._model_dir = Path(model_dir) if model_dir is not None else None
+        self.feature_store = get_feature_store(FeatureExtractorFactory.create_composite_extractor(FEATURE_EXTRACTORS))
+        self._contour_features = OrderedDict()
+        self.contour_cache_size = contour_cache_size
+        self.model_loads = 0
+        self.contour_extractions = 0
+
+    # --- Model ---
+    @property
+    def model_dir(self):
+        if self._model_dir is None:
+            self._model_dir = default_model_dir()
+        return self._model_dir
+
+    def get_model(self):
+        """The current model, reloaded only if the newest model file changed since the last call."""
+        if self._fixed_model is not None:
+            return self._fixed_model
+
+        with self._lock:
+            latest = find_latest_model_file(self.model_dir)
+            if latest is None:
+                if self._model is not None:
+                    return self._model
+                raise FileNotFoundError("No saved models found. Please run training first to create a model.")
+
+            stat = latest.stat()
+            signature = (str(latest), stat.st_mtime_ns, stat.st_size)
+            if signature != self._model_signature:
+                self._model = load_model(latest)
+                self._model_signature = signature
+                self.model_loads += 1
+            return self._model
+
+    # --- Features ---
+    def feature_matrix(self, contours):
+        """(n, n_features) feature matrix of library contours, kept in the shared feature store."""
+        return self.feature_store.features([np.asarray(contour) for contour in contours])
+
+    def contour_feature_matrix(self, contours):
+        """(n, n_features) feature matrix of live contours, cached in a bounded LRU by contour hash."""
+        rows = []
+        for contour in contours:
+            contour = np.asarray(contour)
+            key = contour_hash(contour)
+            with self._lock:
+                vector = self._contour_features.get(key)
+                if vector is not None:
+                    self._contour_features.move_to_end(key)
+            if vector is None:
+                vector = np.asarray(self.feature_store.extractor.extract_features(contour), dtype=np.float64)
+                with self._lock:
+                    self.contour_extractions += 1
+                    self._contour_features[key] = vector
+                    while len(self._contour_features) > self.contour_cache_size:
+                        self._contour_features.popitem(last=False)
+            rows.append(vector)
+        return np.vstack(rows)
+
+    # --- Scoring ---
+    def score(self, contours, workpiece_contours):
+        """
+        Score every (contour, workpiece) pair in one predict_proba call.
+
+        The pair features are ``features(workpiece) + features(contour)``, as in predict_similarity.
+
+        Returns:
+            SimilarityScores with (N, M) result codes and confidences
+        """
+        n, m = len(contours), len(workpiece_contours)
+        if n == 0 or m == 0:
+            return SimilarityScores(np.zeros((n, m), dtype=np.intp), np.zeros((n, m), dtype=np.float64))
+
+        model = self.get_model()
+        contour_features = self.contour_feature_matrix(contours)
+        workpiece_features = self.feature_matrix(workpiece_contours)
+
+        pairs = np.concatenate((
+            np.broadcast_to(workpiece_features[None, :, :], (n, m, workpiece_features.shape[1])),
+            np.broadcast_to(contour_features[:, None, :], (n, m, contour_features.shape[1])),
+        ), axis=2).reshape(n * m, -1)
+
+        probabilities = np.asarray(model.predict_proba(pairs))
+        best_class = np.argmax(probabilities, axis=1)
+        classes = getattr(model, "classes_", None)
+        predictions = np.asarray(classes)[best_class] if classes is not None else model.predict(pairs)
+        confidences = probabilities[np.arange(n * m), best_class]
+
+        results = classify_predictions(predictions, confidences).reshape(n, m)
+        return SimilarityScores(results, confidences.reshape(n, m))
+
+    @staticmethod
+    def assign(scores, max_per_workpiece=None):
+        """
+        Contour -> workpiece assignment over the SAME pairs, maximising total confidence.
+
+        With ``max_per_workpiece`` None a workpiece can take any number of contours (several
+        identical parts on the table), so every contour gets its own most confident SAME
+        workpiece. Otherwise each workpiece takes at most that many contours and the
+        assignment is solved globally. Contours without an admissible workpiece stay unassigned.
+
+        Returns:
+            np.ndarray: workpiece column per contour row, -1 where unassigned
+        """
+        n, m = scores.shape
+        assignment = np.full(n, -1, dtype=np.intp)
+        if n == 0 or m == 0:
+            return assignment
+
+        admissible = scores.results == RESULT_SAME
+        if not admissible.any():
+            return assignment
+
+        if max_per_workpiece is None:
+            rows = np.flatnonzero(admissible.any(axis=1))
+            assignment[rows] = np.argmax(np.where(admissible, scores.confidences, -1.0), axis=1)[rows]
+            return assignment
+
+        # Forbidden pairs cost more than any combination of allowed ones
+        cost = np.where(admissible, -scores.confidences, n + 1.0)
+        cost = np.tile(cost, (1, max_per_workpiece))
+        rows, cols = linear_sum_assignment(cost)
+        cols = cols % m
+        keep = admissible[rows, cols]
+        assignment[rows[keep]] = cols[keep]
+        return assignment
+
+
+_default_service = None
+_default_service_lock = threading.Lock()
+
+
+def get_model_service():
+    """Process-wide model service used by contour matching."""
+    global _default_service
+    with _default_service_lock:
+        if _default_service is None:
+            _default_service = MLModelService()
+        return _default_service
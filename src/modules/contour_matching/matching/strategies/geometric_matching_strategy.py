@@ -5,12 +5,18 @@ import numpy as np
 
 from modules.contour_matching.debug.plot_generator import _create_debug_plot
 from modules.contour_matching.matching.best_match_result import BestMatchResult
+from modules.contour_matching.matching.workpiece_descriptor_index import WorkpieceDescriptorIndex, get_default_index
+from modules.contour_matching import matching_config
 from modules.shared.core.ContourStandartized import Contour
 
 
 class GeometricMatchingStrategy:
-    def __init__(self, similarity_threshold: float = 0.8):
+    def __init__(self, similarity_threshold: float = 0.8, descriptor_index: WorkpieceDescriptorIndex = None,
+                 debug: bool = None):
         self.similarity_threshold = similarity_threshold
+        self.descriptor_index = descriptor_index if descriptor_index is not None else get_default_index()
+        # Read at construction so reload_settings() applies to strategies created afterwards
+        self.debug = matching_config.DEBUG_SIMILARITY if debug is None else debug
 
     def find_best_match(
         self, workpieces: list[Any], contour: Contour
@@ -18,22 +24,51 @@ class GeometricMatchingStrategy:
         from modules.contour_matching.alignment.difference_calculator import _calculateDifferences
 
         best = BestMatchResult(workpiece=None, confidence=0.0, result="DIFFERENT")
-
-        for wp in workpieces:
-            wp_contour = Contour(wp.get_main_contour())
-            similarity = self._getSimilarity(wp_contour.get(), contour.get())
-
-            if similarity > self.similarity_threshold * 100 and similarity > best.confidence:
-                centroid_diff, rotation_diff, contour_angle = _calculateDifferences(wp_contour, contour)
-                best = BestMatchResult(
-                    workpiece=wp,
-                    confidence=similarity,
-                    result="SAME",
-                    centroid_diff=centroid_diff,
-                    rotation_diff=rotation_diff,
-                    contour_angle=contour_angle,
-                    workpiece_id=getattr(wp, "workpieceId", None),
-                )
+        if not workpieces:
+            return best
+
+        index = self.descriptor_index
+        positions = index.sync(workpieces)
+
+        area = cv2.contourArea(np.asarray(contour.get(), dtype=np.float32))
+        if area <= 0:
+            return best
+
+        # Rank of each index position in the given list; positions not in the list keep the sentinel.
+        # Ties go to the workpiece that comes first in the list, as in a sequential scan
+        not_listed = np.iinfo(np.intp).max
+        list_rank = np.full(len(index), not_listed, dtype=np.intp)
+        list_rank[positions[::-1]] = np.arange(len(positions))[::-1]
+
+        # Only listed workpieces whose area ratio can pass the threshold are compared at all
+        candidates = index.area_candidates(area, self.similarity_threshold)
+        candidates = candidates[list_rank[candidates] != not_listed]
+        if len(candidates) == 0:
+            return best
+
+        candidate_areas = index.areas[candidates]
+        similarities = np.minimum(candidate_areas, area) / np.maximum(candidate_areas, area) * 100
+        similarities = np.clip(similarities, 0, 100)
+
+        order = np.lexsort((list_rank[candidates], -similarities))
+        best_position = candidates[order[0]]
+        similarity = float(similarities[order[0]])
+
+        if similarity > self.similarity_threshold * 100:
+            wp = workpieces[list_rank[best_position]]
+            wp_contour = index.contour(best_position)
+            if self.debug:
+                self._getSimilarity(wp_contour.get(), contour.get(), debug=True)
+            centroid_diff, rotation_diff, contour_angle = _calculateDifferences(wp_contour, contour)
+            best = BestMatchResult(
+                workpiece=wp,
+                confidence=similarity,
+                result="SAME",
+                centroid_diff=centroid_diff,
+                rotation_diff=rotation_diff,
+                contour_angle=contour_angle,
+                workpiece_id=getattr(wp, "workpieceId", None),
+            )
 
         return best
 
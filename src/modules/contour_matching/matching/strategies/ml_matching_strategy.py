@@ -1,49 +1,79 @@
-from typing import Any
+from typing import Any, Optional
+
+import numpy as np
 
 from modules.contour_matching.alignment.difference_calculator import _calculateDifferences
 from modules.contour_matching.matching.best_match_result import BestMatchResult
+from modules.contour_matching.matching.ml_model_service import MLModelService, RESULT_SAME
 from modules.contour_matching.matching_config import DEBUG_CALCULATE_DIFFERENCES
-from modules.shape_matching_training.utils.io_utils import predict_similarity
 from modules.shared.core.ContourStandartized import Contour
 
 
 class MLMatchingStrategy:
-    def __init__(self, model: Any):
-        self.model = model
+    """
+    Matches contours to workpieces with the trained similarity model.
+
+    Accepts either an MLModelService or a bare model (wrapped in a service with that model pinned).
+    ``find_best_matches`` scores all contours against all workpieces at once; every contour
+    gets its most confident SAME workpiece, so identical parts all match the same workpiece.
+    ``max_matches_per_workpiece`` caps that and assigns globally instead.
+    ``find_best_match`` is the single-contour form of the same thing.
+    """
+
+    def __init__(self, model: Any, max_matches_per_workpiece: Optional[int] = None):
+        self.service = model if isinstance(model, MLModelService) else MLModelService(model=model)
+        self.max_matches_per_workpiece = max_matches_per_workpiece
+
+    @property
+    def model(self):
+        return self.service.get_model()
 
     def find_best_match(
         self, workpieces: list[Any], contour: Contour
     ) -> BestMatchResult:
+        return self.find_best_matches(workpieces, [contour])[0]
 
+    def find_best_matches(
+        self, workpieces: list[Any], contours: list[Contour]
+    ) -> list[BestMatchResult]:
+        if not contours:
+            return []
+        if not workpieces:
+            return [BestMatchResult(workpiece=None, confidence=0.0, result="DIFFERENT") for _ in contours]
 
-        best = BestMatchResult(workpiece=None, confidence=0.0, result="DIFFERENT")
-
-        for wp in workpieces:
-            wp_contour = Contour(wp.get_main_contour())
-            result, confidence, _ = predict_similarity(self.model, wp_contour.get(), contour.get())
-            wp_id = getattr(wp, "workpieceId", None)
-
-            if result == "SAME":
-                if best.workpiece is None or confidence > best.confidence:
-                    centroid_diff, rotation_diff, contour_angle = _calculateDifferences(
-                        wp_contour, contour, DEBUG_CALCULATE_DIFFERENCES
-                    )
-                    best = BestMatchResult(
-                        workpiece=wp,
-                        confidence=confidence,
-                        result=result,
-                        centroid_diff=centroid_diff,
-                        rotation_diff=rotation_diff,
-                        contour_angle=contour_angle,
-                        workpiece_id=wp_id,
-                    )
-            elif best.workpiece is None and confidence > best.confidence:
-                best = BestMatchResult(
-                    workpiece=None,
-                    confidence=confidence,
-                    result=result,
-                    workpiece_id=wp_id,
-                )
+        wp_contours = [Contour(wp.get_main_contour()) for wp in workpieces]
+        scores = self.service.score([c.get() for c in contours], [c.get() for c in wp_contours])
+        assignment = self.service.assign(scores, self.max_matches_per_workpiece)
 
-        return best
+        results = []
+        for row, contour in enumerate(contours):
+            col = assignment[row]
+            if col >= 0:
+                wp = workpieces[col]
+                centroid_diff, rotation_diff, contour_angle = _calculateDifferences(
+                    wp_contours[col], contour, DEBUG_CALCULATE_DIFFERENCES
+                )
+                results.append(BestMatchResult(
+                    workpiece=wp,
+                    confidence=float(scores.confidences[row, col]),
+                    result=scores.result_name(row, col),
+                    centroid_diff=centroid_diff,
+                    rotation_diff=rotation_diff,
+                    contour_angle=contour_angle,
+                    workpiece_id=getattr(wp, "workpieceId", None),
+                ))
+                continue
 
+            # Unmatched: report the most confident non-SAME verdict, like the sequential scan did
+            confidences = np.where(scores.results[row] != RESULT_SAME, scores.confidences[row], -1.0)
+            col = int(np.argmax(confidences))
+            if confidences[col] > 0.0:
+                results.append(BestMatchResult(
+                    workpiece=None,
+                    confidence=float(confidences[col]),
+                    result=scores.result_name(row, col),
+                    workpiece_id=getattr(workpieces[col], "workpieceId", None),
+                ))
+            else:
+                results.append(BestMatchResult(workpiece=None, confidence=0.0, result="DIFFERENT"))
+        return results
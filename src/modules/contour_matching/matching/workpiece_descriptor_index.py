@@ -0,0 +1,211 @@
+import itertools
+import threading
+
+import cv2
+import numpy as np
+
+from modules.contour_matching.alignment.rotation_search import polar_signature
+from modules.shared.core.ContourStandartized import Contour
+
+SIGNATURE_BINS = 64
+
+
+_anonymous_keys = itertools.count(1)
+
+
+def _workpiece_id(workpiece):
+    workpiece_id = getattr(workpiece, "workpieceId", None)
+    if workpiece_id is not None:
+        return str(workpiece_id)
+    # No id: stamp a process-unique key on the object (id() can be reused after collection)
+    key = getattr(workpiece, "_descriptor_index_key", None)
+    if key is None:
+        key = f"anonymous-{next(_anonymous_keys)}"
+        workpiece._descriptor_index_key = key
+    return key
+
+
+class WorkpieceDescriptorIndex:
+    """
+    Precomputed shape descriptors for a workpiece library.
+
+    Per workpiece the index stores, in contiguous NumPy arrays:
+        areas, perimeters     - (N,)
+        hu_moments            - (N, 7)  log-scaled Hu moments
+        orientations          - (N,)    degrees, same as Contour.getOrientation
+        centroids             - (N, 2)  same as Contour.getCentroid
+        signatures            - (N, SIGNATURE_BINS // 2 + 1) rotation-invariant polar signature
+                                (FFT magnitude of the radius profile, scale-normalised)
+
+    A sorted copy of the areas answers area-ratio range queries with a binary search, so
+    matching only compares the workpieces whose area can pass the similarity threshold.
+
+    The repository keeps the index current: ``upsert`` on save and ``remove`` on delete.
+    ``sync`` additionally indexes any workpiece id it has not seen (e.g. lists that did not
+    come from the repository). Only ids and descriptors are kept, not the workpiece objects.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self):
+        self._ids = []
+        self._contours = []
+        self._positions = {}
+        self._synced_ids = None
+        self._synced_positions = None
+        self.areas = np.empty(0, dtype=np.float64)
+        self.perimeters = np.empty(0, dtype=np.float64)
+        self.hu_moments = np.empty((0, 7), dtype=np.float64)
+        self.orientations = np.empty(0, dtype=np.float64)
+        self.centroids = np.empty((0, 2), dtype=np.float64)
+        self.signatures = np.empty((0, SIGNATURE_BINS // 2 + 1), dtype=np.float64)
+        self._sorted_positions = None
+        self._sorted_areas = None
+
+    def __len__(self):
+        return len(self._ids)
+
+    # --- Maintenance ---
+    def build(self, workpieces):
+        """Rebuild the index from scratch for the given workpieces."""
+        with self._lock:
+            self._reset()
+            for workpiece in workpieces or []:
+                self.upsert(workpiece)
+
+    def upsert(self, workpiece):
+        """Add a workpiece or refresh its descriptors after its contour changed."""
+        contour = Contour(workpiece.get_main_contour())
+        area, perimeter, hu, orientation, centroid, signature = self._describe(contour)
+        workpiece_id = _workpiece_id(workpiece)
+
+        with self._lock:
+            position = self._positions.get(workpiece_id)
+            if position is None:
+                position = len(self._ids)
+                self._positions[workpiece_id] = position
+                self._ids.append(workpiece_id)
+                self._contours.append(contour)
+                self.areas = np.append(self.areas, area)
+                self.perimeters = np.append(self.perimeters, perimeter)
+                self.hu_moments = np.vstack((self.hu_moments, hu))
+                self.orientations = np.append(self.orientations, orientation)
+                self.centroids = np.vstack((self.centroids, centroid))
+                self.signatures = np.vstack((self.signatures, signature))
+            else:
+                self._contours[position] = contour
+                self.areas[position] = area
+                self.perimeters[position] = perimeter
+                self.hu_moments[position] = hu
+                self.orientations[position] = orientation
+                self.centroids[position] = centroid
+                self.signatures[position] = signature
+            self._sorted_positions = None
+
+    def remove(self, workpiece_id):
+        """Drop a workpiece; the last row is moved into the freed slot to keep arrays contiguous."""
+        with self._lock:
+            position = self._positions.pop(str(workpiece_id), None)
+            if position is None:
+                return False
+            last = len(self._ids) - 1
+            if position != last:
+                for values in (self._ids, self._contours):
+                    values[position] = values[last]
+                for name in ("areas", "perimeters", "hu_moments", "orientations", "centroids", "signatures"):
+                    array = getattr(self, name)
+                    array[position] = array[last]
+                self._positions[self._ids[position]] = position
+            for values in (self._ids, self._contours):
+                values.pop()
+            for name in ("areas", "perimeters", "hu_moments", "orientations", "centroids", "signatures"):
+                setattr(self, name, getattr(self, name)[:last])
+            self._sorted_positions = None
+            self._synced_ids = None
+            return True
+
+    def sync(self, workpieces):
+        """
+        Make sure every given workpiece id is indexed and return their index positions in
+        list order (read-only). Only ids missing from the index are described; a list with the
+        same ids as the previous call reuses its positions. Contour edits reach the index
+        through ``upsert``.
+        """
+        ids = [_workpiece_id(workpiece) for workpiece in workpieces]
+        with self._lock:
+            if ids == self._synced_ids:
+                return self._synced_positions
+            missing = set(ids).difference(self._positions)
+            for workpiece_id, workpiece in zip(ids, workpieces):
+                if workpiece_id in missing:
+                    self.upsert(workpiece)
+                    missing.discard(workpiece_id)
+            positions = np.fromiter((self._positions[i] for i in ids), dtype=np.intp, count=len(ids))
+            positions.flags.writeable = False
+            self._synced_ids, self._synced_positions = ids, positions
+        return positions
+
+    # --- Queries ---
+    def workpiece_id(self, position):
+        return self._ids[position]
+
+    def contour(self, position):
+        """Copy of the indexed contour, so callers can transform it without touching the index."""
+        return Contour(self._contours[position].get().copy())
+
+    def area_candidates(self, area, min_ratio, perimeter=None, min_perimeter_ratio=None):
+        """
+        Positions of workpieces with min(area, a) / max(area, a) > min_ratio, found by binary
+        search over the sorted areas. Optionally also prunes by perimeter ratio.
+        """
+        if area <= 0 or min_ratio <= 0:
+            return np.arange(len(self), dtype=np.intp)
+        with self._lock:
+            if self._sorted_positions is None:
+                self._sorted_positions = np.argsort(self.areas, kind="stable")
+                self._sorted_areas = self.areas[self._sorted_positions]
+            low = np.searchsorted(self._sorted_areas, area * min_ratio, side="right")
+            high = np.searchsorted(self._sorted_areas, area / min_ratio, side="left")
+            candidates = self._sorted_positions[low:high]
+
+        if perimeter is not None and min_perimeter_ratio is not None and len(candidates):
+            ratios = np.minimum(self.perimeters[candidates], perimeter) / np.maximum(self.perimeters[candidates],
+                                                                                     perimeter)
+            candidates = candidates[ratios > min_perimeter_ratio]
+        return candidates
+
+    @staticmethod
+    def _describe(contour):
+        points = contour.get()
+        if len(points) < 3:
+            return 0.0, 0.0, np.zeros(7), 0.0, np.zeros(2), np.zeros(SIGNATURE_BINS // 2 + 1)
+
+        cv_points = contour.as_cv()
+        area = cv2.contourArea(cv_points)
+        perimeter = cv2.arcLength(cv_points, True)
+        hu = cv2.HuMoments(cv2.moments(cv_points)).ravel()
+        hu = -np.sign(hu) * np.log10(np.abs(hu) + 1e-30)
+        centroid = np.asarray(contour.getCentroid(), dtype=np.float64)
+
+        radii = polar_signature(points.astype(np.float64), centroid, SIGNATURE_BINS)
+        mean_radius = radii.mean()
+        if mean_radius > 0:
+            spectrum = np.abs(np.fft.rfft(radii / mean_radius)) / SIGNATURE_BINS
+        else:
+            spectrum = np.zeros(SIGNATURE_BINS // 2 + 1)
+        return area, perimeter, hu, contour.getOrientation(), centroid, spectrum
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_default_index():
+    """Process-wide index shared by the workpiece repository and the matching strategies."""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = WorkpieceDescriptorIndex()
+        return _default_index
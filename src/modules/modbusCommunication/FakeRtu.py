@@ -0,0 +1,111 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import minimalmodbus
+
+
+class FakeRtuSlave:
+    """
+    In-process Modbus RTU slave: a register/bit map with configurable latency and faults.
+
+    Args:
+        slave_id: Slave address.
+        registers: Initial holding register values.
+        latency: Seconds each transaction with this slave takes.
+    """
+
+    def __init__(self, slave_id: int, registers: Optional[Dict[int, int]] = None, latency: float = 0.0):
+        self.slave_id = slave_id
+        self.registers: Dict[int, int] = dict(registers or {})
+        self.bits: Dict[int, int] = {}
+        self.latency = latency
+        self.offline = False
+        self._faults = deque()
+
+    def fail_next(self, count: int = 1, exception: Optional[Exception] = None):
+        """Make the next ``count`` transactions raise (a NoResponseError by default)."""
+        for _ in range(count):
+            self._faults.append(exception or minimalmodbus.NoResponseError("No communication with the instrument"))
+
+    def _check(self):
+        if self.latency:
+            time.sleep(self.latency)
+        if self.offline:
+            raise minimalmodbus.NoResponseError("No communication with the instrument (no answer)")
+        if self._faults:
+            raise self._faults.popleft()
+
+
+class FakeRtuBus:
+    """
+    Shared serial line for FakeRtuSlave instances.
+
+    Logs every transaction as (slave, function, register, count/values) and counts
+    ``collisions`` - transactions that overlapped in time, which a real RTU line cannot do.
+    """
+
+    def __init__(self):
+        self.slaves: Dict[int, FakeRtuSlave] = {}
+        self.transactions: List[tuple] = []
+        self.collisions = 0
+        self._busy = threading.Lock()
+
+    def add_slave(self, slave: FakeRtuSlave) -> FakeRtuSlave:
+        self.slaves[slave.slave_id] = slave
+        return slave
+
+    def instrument(self, slave_id: int) -> "FakeRtuInstrument":
+        """Instrument factory, e.g. for ModbusTransactionScheduler."""
+        return FakeRtuInstrument(self, slave_id)
+
+    def transact(self, slave_id: int, function: str, register: int, payload, operation):
+        if not self._busy.acquire(blocking=False):
+            self.collisions += 1
+            self._busy.acquire()
+        try:
+            self.transactions.append((slave_id, function, register, payload))
+            slave = self.slaves.get(slave_id)
+            if slave is None:
+                raise minimalmodbus.NoResponseError("No communication with the instrument (no answer)")
+            slave._check()
+            return operation(slave)
+        finally:
+            self._busy.release()
+
+
+class FakeRtuInstrument:
+    """minimalmodbus.Instrument look-alike bound to one slave on a FakeRtuBus."""
+
+    def __init__(self, bus: FakeRtuBus, slaveaddress: int):
+        self.bus = bus
+        self.address = slaveaddress
+
+    def read_registers(self, registeraddress, number_of_registers, functioncode=3):
+        return self.bus.transact(self.address, "read_registers", registeraddress, number_of_registers,
+                                 lambda s: [s.registers.get(registeraddress + i, 0)
+                                            for i in range(number_of_registers)])
+
+    def read_register(self, registeraddress, number_of_decimals=0, functioncode=3, signed=False):
+        return self.read_registers(registeraddress, 1)[0]
+
+    def write_registers(self, registeraddress, values):
+        def write(slave):
+            for i, value in enumerate(values):
+                slave.registers[registeraddress + i] = value
+        return self.bus.transact(self.address, "write_registers", registeraddress, list(values), write)
+
+    def write_register(self, registeraddress, value, number_of_decimals=0, functioncode=16, signed=False):
+        def write(slave):
+            slave.registers[registeraddress] = value
+        return self.bus.transact(self.address, "write_register", registeraddress, [value], write)
+
+    def read_bit(self, registeraddress, functioncode=2):
+        return self.bus.transact(self.address, "read_bit", registeraddress, 1,
+                                 lambda s: s.bits.get(registeraddress, 0))
+
+    def write_bit(self, registeraddress, value, functioncode=5):
+        def write(slave):
+            slave.bits[registeraddress] = value
+        return self.bus.transact(self.address, "write_bit", registeraddress, [value], write)
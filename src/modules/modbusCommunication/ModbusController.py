@@ -1,4 +1,8 @@
+import threading
+
 from modules.modbusCommunication.ModbusClient import ModbusClient
+from modules.modbusCommunication.ModbusTransactionScheduler import ModbusTransactionScheduler
+from modules.modbusCommunication.ScheduledModbusClient import ScheduledModbusClient
 import minimalmodbus
 from enum import Enum
 from dataclasses import dataclass
@@ -50,6 +54,12 @@ class ModbusClientConfig:
 
 SUDO_PASS = "plp"
 
+# Route getModbusClient() through one transaction scheduler that owns the serial line
+USE_TRANSACTION_SCHEDULER = True
+# Max age (s) of cached register values for periodic state polling (generator, fan). Reads that
+# must observe a fresh device response (e.g. after a health-check trigger) keep the default 0.
+STATE_READ_MAX_AGE = 0.1
+
 
 def load_modbus_config_from_repo():
     """
@@ -110,6 +120,52 @@ def get_config_from_settings() -> ModbusClientConfig:
     )
 
 
+_default_scheduler = None
+_default_scheduler_lock = threading.Lock()
+
+
+def _create_instrument(config: ModbusClientConfig, slave_id: int) -> minimalmodbus.Instrument:
+    instrument = minimalmodbus.Instrument(config.port, slave_id, debug=False)
+    instrument.serial.baudrate = config.baudrate
+    instrument.serial.bytesize = config.byte_size
+    instrument.serial.parity = config.parity.value
+    instrument.serial.stopbits = config.stop_bits
+    instrument.serial.timeout = config.timeout
+    instrument.serial.inter_byte_timeout = config.inter_byte_timeout
+    instrument.clear_buffers_before_each_transaction = True
+    instrument.mode = minimalmodbus.MODE_RTU
+    return instrument
+
+
+def get_default_scheduler() -> ModbusTransactionScheduler:
+    """
+    Return the process-wide ModbusTransactionScheduler for the configured port, starting it on first use.
+    """
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None or not _default_scheduler.running:
+            from communication_layer.api.v1.topics import GlueSprayServiceTopics
+            from modules.shared.MessageBroker import MessageBroker
+
+            config = get_config_from_settings()
+            _default_scheduler = ModbusTransactionScheduler(
+                instrument_factory=lambda slave_id: _create_instrument(config, slave_id),
+                max_retries=config.max_retries,
+                broker=MessageBroker(),
+                statistics_topic=GlueSprayServiceTopics.MODBUS_STATISTICS,
+            ).start()
+        return _default_scheduler
+
+
+def reset_default_scheduler():
+    """Stop the default scheduler so the next client picks up changed port settings."""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is not None:
+            _default_scheduler.stop()
+            _default_scheduler = None
+
+
 class ModbusController:
     """
     Контролер за създаване и конфигуриране на Modbus клиенти.
@@ -119,16 +175,23 @@ class ModbusController:
             Връща конфигуриран ModbusClient за подаден slave ID.
     """
     @classmethod
-    def getModbusClient(cls, slaveId: int) -> ModbusClient:
+    def getModbusClient(cls, slaveId: int, read_max_age: float = 0.0) -> ModbusClient:
         """
         Създава и конфигурира ModbusClient според глобалната конфигурация.
 
+        При USE_TRANSACTION_SCHEDULER връща ScheduledModbusClient (същия интерфейс), който
+        изпраща заявките през общия ModbusTransactionScheduler вместо да отваря порта.
+
         Параметри:
             slaveId (int): ID на Modbus slave устройството.
+            read_max_age (float): Максимална възраст (s) на кеширани стойности при четене на сензори.
 
         Връща:
             ModbusClient: Конфигуриран клиент за комуникация.
         """
+        if USE_TRANSACTION_SCHEDULER:
+            return ScheduledModbusClient(get_default_scheduler(), slaveId, read_max_age=read_max_age)
+
         config = get_config_from_settings()
 
         print(f"ModbusController: Creating client for slave {slaveId} with config: "
@@ -0,0 +1,471 @@
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Callable, Dict, List, Optional, Tuple
+
+from applications.glue_dispensing_application.services.glueSprayService.motorControl.errorCodes import \
+    ModbusExceptionType
+from modules.modbusCommunication.modbus_lock import modbus_lock
+
+# Modbus RTU allows up to 125 registers per read; stay well below to keep frames short
+DEFAULT_MAX_BLOCK_SIZE = 32
+# Quiet time after a multi-register write before the next frame (same as ModbusClient.writeRegisters);
+# the motor controller drops frames that arrive while it is still applying a set-point
+DEFAULT_WRITE_SETTLE_TIME = 0.02
+
+
+class ModbusPriority(IntEnum):
+    """Lower value is served first."""
+    CRITICAL = 0  # stop / safety commands
+    HIGH = 1  # set-points (motor speed, generator)
+    NORMAL = 2
+    LOW = 3  # background sensor polling
+
+
+class ModbusTransactionError(Exception):
+    """Raised from a request future when the transaction finally failed."""
+
+    def __init__(self, error: ModbusExceptionType, slave: int, register: int):
+        super().__init__(f"Modbus {error.name} on slave {slave}, register {register}")
+        self.error = error
+        self.slave = slave
+        self.register = register
+
+
+@dataclass
+class SlaveStatistics:
+    transactions: int = 0
+    errors: int = 0
+    retries: int = 0
+    failed_requests: int = 0
+    merged_reads: int = 0
+    coalesced_writes: int = 0
+    cache_hits: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    last_latency: float = 0.0
+    consecutive_failures: int = 0
+    backoff_until: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        return self.total_latency / self.transactions if self.transactions else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "transactions": self.transactions,
+            "errors": self.errors,
+            "retries": self.retries,
+            "failed_requests": self.failed_requests,
+            "merged_reads": self.merged_reads,
+            "coalesced_writes": self.coalesced_writes,
+            "cache_hits": self.cache_hits,
+            "mean_latency_ms": self.mean_latency * 1000.0,
+            "max_latency_ms": self.max_latency * 1000.0,
+            "last_latency_ms": self.last_latency * 1000.0,
+            "consecutive_failures": self.consecutive_failures,
+        }
+
+
+READ_REGISTERS = "read_registers"
+WRITE_REGISTERS = "write_registers"
+WRITE_REGISTER = "write_register"
+READ_BIT = "read_bit"
+WRITE_BIT = "write_bit"
+
+
+@dataclass
+class _Request:
+    kind: str
+    slave: int
+    register: int
+    count: int = 1
+    values: Optional[list] = None
+    options: dict = field(default_factory=dict)
+    priority: int = ModbusPriority.NORMAL
+    seq: int = 0
+    attempts: int = 0
+    futures: List[Future] = field(default_factory=list)
+
+    @property
+    def sort_key(self):
+        return self.priority, self.seq
+
+    @property
+    def abandoned(self) -> bool:
+        """True when every caller has given up (cancelled / timed out) on this request."""
+        return all(future.done() for future in self.futures)
+
+    def coalesce_key(self):
+        return self.kind, self.slave, self.register, self.count, tuple(sorted(self.options.items()))
+
+
+class ModbusTransactionScheduler:
+    """
+    Single owner of a Modbus RTU line.
+
+    Callers submit requests and get a Future back; one worker thread executes them one at a
+    time, lowest ModbusPriority first. On the way it:
+
+    - merges pending register reads of the same slave that are adjacent into one block read
+      of up to ``max_block_size``; ``max_read_gap`` > 0 also bridges gaps, which reads the
+      registers in between and is only safe on devices where they are all mapped,
+    - coalesces a write with a still-queued write to the same registers, so only the latest
+      set-point goes out and every caller's future completes with it,
+    - retries failed transactions up to ``max_retries`` times with per-slave exponential
+      back-off; requests for other slaves keep flowing while one slave is backed off. A
+      request whose callers all cancelled (see cancel()) is dropped instead of retried,
+    - serves reads that pass ``max_age`` from a register cache filled by reads and writes,
+    - keeps per-slave latency/error statistics and publishes them to ``broker`` on
+      ``statistics_topic`` every ``statistics_interval`` seconds.
+
+    Args:
+        instrument_factory: slave id -> minimalmodbus.Instrument-like object.
+        lock: Held around every transaction so legacy ModbusClient users stay serialised
+            with the scheduler.
+        write_settle_time: Seconds the line is kept quiet after a register block write.
+    """
+
+    def __init__(self, instrument_factory: Callable[[int], object], max_retries: int = 5,
+                 backoff_base: float = 0.02, backoff_max: float = 1.0,
+                 max_block_size: int = DEFAULT_MAX_BLOCK_SIZE, max_read_gap: int = 0,
+                 broker=None, statistics_topic: Optional[str] = None, statistics_interval: float = 1.0,
+                 lock=modbus_lock, write_settle_time: float = DEFAULT_WRITE_SETTLE_TIME):
+        self.instrument_factory = instrument_factory
+        self.max_retries = max(1, int(max_retries))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_block_size = max_block_size
+        self.max_read_gap = max_read_gap
+        self.broker = broker
+        self.statistics_topic = statistics_topic
+        self.statistics_interval = statistics_interval
+        self.lock = lock
+        self.write_settle_time = write_settle_time
+
+        self._condition = threading.Condition()
+        self._pending: List[_Request] = []
+        self._seq = 0
+        self._instruments: Dict[int, object] = {}
+        self._statistics: Dict[int, SlaveStatistics] = {}
+        self._cache: Dict[Tuple[int, int], Tuple[int, float]] = {}
+        self._running = False
+        self._worker: Optional[threading.Thread] = None
+        self._last_published = time.monotonic()
+
+    # ------------------------------------------------------------------ lifecycle
+
+    def start(self):
+        with self._condition:
+            if self._running:
+                return self
+            self._running = True
+        self._worker = threading.Thread(target=self._run, name="ModbusTransactionScheduler", daemon=True)
+        self._worker.start()
+        return self
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the worker; requests still queued fail with MODBUS_EXCEPTION."""
+        with self._condition:
+            self._running = False
+            pending, self._pending = self._pending, []
+            self._condition.notify_all()
+        for request in pending:
+            self._fail(request, ModbusExceptionType.MODBUS_EXCEPTION)
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ------------------------------------------------------------------ submission
+
+    def submit_read(self, slave: int, register: int, count: int = 1, priority: int = ModbusPriority.NORMAL,
+                    max_age: Optional[float] = None) -> Future:
+        """Read holding registers; the future resolves to a list of ``count`` values."""
+        if max_age is not None and max_age > 0:
+            cached = self._cached(slave, register, count, max_age)
+            if cached is not None:
+                future = Future()
+                future.set_result(cached)
+                return future
+        return self._submit(_Request(READ_REGISTERS, slave, register, count=count, priority=priority))
+
+    def submit_write(self, slave: int, register: int, values, priority: int = ModbusPriority.HIGH,
+                     coalesce: bool = True) -> Future:
+        """
+        Write consecutive registers; a queued write to the same registers is replaced when coalescing.
+        The future completes with the values that were written.
+        """
+        values = list(values)
+        request = _Request(WRITE_REGISTERS, slave, register, count=len(values), values=values, priority=priority)
+        return self._submit(request, coalesce=coalesce)
+
+    def submit_write_single(self, slave: int, register: int, value, signed: bool = False,
+                            priority: int = ModbusPriority.HIGH, coalesce: bool = True) -> Future:
+        """Write one register with function code 6."""
+        request = _Request(WRITE_REGISTER, slave, register, values=[value], options={"signed": signed},
+                           priority=priority)
+        return self._submit(request, coalesce=coalesce)
+
+    def submit_read_bit(self, slave: int, address: int, functioncode: int = 1,
+                        priority: int = ModbusPriority.NORMAL) -> Future:
+        return self._submit(_Request(READ_BIT, slave, address, options={"functioncode": functioncode},
+                                     priority=priority))
+
+    def submit_write_bit(self, slave: int, address: int, value: int, priority: int = ModbusPriority.HIGH) -> Future:
+        return self._submit(_Request(WRITE_BIT, slave, address, values=[value], priority=priority))
+
+    def _submit(self, request: _Request, coalesce: bool = False) -> Future:
+        future = Future()
+        with self._condition:
+            if not self._running:
+                future.set_exception(ModbusTransactionError(ModbusExceptionType.CONNECTION_ERROR,
+                                                            request.slave, request.register))
+                return future
+            if coalesce:
+                queued = self._find_coalescable(request)
+                if queued is not None:
+                    queued.values = request.values
+                    queued.priority = min(queued.priority, request.priority)
+                    queued.futures.append(future)
+                    self._stats(request.slave).coalesced_writes += 1
+                    return future
+            self._seq += 1
+            request.seq = self._seq
+            request.futures.append(future)
+            self._pending.append(request)
+            self._condition.notify_all()
+        return future
+
+    def cancel(self, future: Future) -> bool:
+        """
+        Give up on a submitted request, e.g. after the caller timed out.
+
+        The future is cancelled and the request leaves the queue once no other caller is
+        waiting on it, so a stale write never reaches the bus later. A transaction already on
+        the line cannot be recalled, but it is not retried.
+
+        Returns:
+            bool: True if the future was cancelled, False if it had already completed.
+        """
+        with self._condition:
+            if not future.cancel():
+                return False
+            for request in self._pending:
+                if future in request.futures:
+                    request.futures.remove(future)
+                    if request.abandoned:
+                        self._pending.remove(request)
+                    break
+        return True
+
+    def _find_coalescable(self, request: _Request) -> Optional[_Request]:
+        key = request.coalesce_key()
+        for queued in self._pending:
+            # Only requests not yet attempted: a retried write keeps its own values
+            if queued.attempts == 0 and queued.kind == request.kind and queued.coalesce_key() == key:
+                return queued
+        return None
+
+    # ------------------------------------------------------------------ cache / statistics
+
+    def _cached(self, slave, register, count, max_age):
+        now = time.monotonic()
+        values = []
+        with self._condition:
+            for reg in range(register, register + count):
+                entry = self._cache.get((slave, reg))
+                if entry is None or now - entry[1] > max_age:
+                    return None
+                values.append(entry[0])
+            self._stats(slave).cache_hits += 1
+        return values
+
+    def invalidate_cache(self, slave: Optional[int] = None):
+        with self._condition:
+            if slave is None:
+                self._cache.clear()
+            else:
+                for key in [key for key in self._cache if key[0] == slave]:
+                    del self._cache[key]
+
+    def _stats(self, slave: int) -> SlaveStatistics:
+        stats = self._statistics.get(slave)
+        if stats is None:
+            stats = self._statistics[slave] = SlaveStatistics()
+        return stats
+
+    def get_statistics(self) -> Dict[int, dict]:
+        with self._condition:
+            return {slave: stats.to_dict() for slave, stats in self._statistics.items()}
+
+    def publish_statistics(self):
+        if self.broker is None or self.statistics_topic is None:
+            return
+        try:
+            self.broker.publish(self.statistics_topic, self.get_statistics())
+        except Exception as e:
+            print(f"[ModbusTransactionScheduler] Failed to publish statistics: {e}")
+
+    # ------------------------------------------------------------------ worker
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                batch, wait = self._take_next()
+                if batch is None:
+                    self._condition.wait(wait)
+            if batch is not None:
+                self._execute(batch)
+            if time.monotonic() - self._last_published >= self.statistics_interval:
+                self._last_published = time.monotonic()
+                self.publish_statistics()
+
+    def _take_next(self):
+        """Pop the next runnable request (plus reads merged into it); else return the time to wait."""
+        now = time.monotonic()
+        best = None
+        next_ready = None
+        for request in self._pending:
+            backoff_until = self._stats(request.slave).backoff_until
+            if backoff_until > now:
+                next_ready = backoff_until if next_ready is None else min(next_ready, backoff_until)
+                continue
+            if best is None or request.sort_key < best.sort_key:
+                best = request
+        if best is None:
+            wait = self.statistics_interval if next_ready is None else max(0.0, next_ready - now)
+            return None, min(wait, self.statistics_interval)
+
+        self._pending.remove(best)
+        batch = [best]
+        if best.kind == READ_REGISTERS:
+            batch = self._merge_reads(best)
+        return batch, 0.0
+
+    def _merge_reads(self, first: _Request) -> List[_Request]:
+        """Pull queued reads of the same slave that fit in one block around first."""
+        batch = [first]
+        start, end = first.register, first.register + first.count
+        candidates = sorted((r for r in self._pending if r.kind == READ_REGISTERS and r.slave == first.slave),
+                            key=lambda r: r.register)
+        merged = True
+        while merged:
+            merged = False
+            for request in candidates:
+                if request in batch:
+                    continue
+                new_start = min(start, request.register)
+                new_end = max(end, request.register + request.count)
+                gap = max(request.register - end, start - (request.register + request.count))
+                if gap <= self.max_read_gap and new_end - new_start <= self.max_block_size:
+                    batch.append(request)
+                    start, end = new_start, new_end
+                    merged = True
+        for request in batch[1:]:
+            self._pending.remove(request)
+        return batch
+
+    def _instrument(self, slave):
+        instrument = self._instruments.get(slave)
+        if instrument is None:
+            instrument = self._instruments[slave] = self.instrument_factory(slave)
+        return instrument
+
+    def _execute(self, batch: List[_Request]):
+        first = batch[0]
+        start = min(r.register for r in batch)
+        end = max(r.register + r.count for r in batch)
+        began = time.perf_counter()
+        try:
+            with self.lock:
+                instrument = self._instrument(first.slave)
+                result = self._transact(instrument, first, start, end - start)
+                if first.kind == WRITE_REGISTERS and self.write_settle_time > 0:
+                    time.sleep(self.write_settle_time)
+        except Exception as e:
+            self._on_error(batch, ModbusExceptionType.from_exception(e))
+            return
+        latency = time.perf_counter() - began
+
+        now = time.monotonic()
+        with self._condition:
+            stats = self._stats(first.slave)
+            stats.transactions += 1
+            stats.total_latency += latency
+            stats.last_latency = latency
+            stats.max_latency = max(stats.max_latency, latency)
+            stats.consecutive_failures = 0
+            stats.backoff_until = 0.0
+            stats.merged_reads += len(batch) - 1
+            if first.kind == READ_REGISTERS:
+                for offset, value in enumerate(result):
+                    self._cache[(first.slave, start + offset)] = (value, now)
+            elif first.kind in (WRITE_REGISTERS, WRITE_REGISTER):
+                for offset, value in enumerate(first.values):
+                    self._cache[(first.slave, first.register + offset)] = (value, now)
+
+        for request in batch:
+            if request.kind == READ_REGISTERS:
+                offset = request.register - start
+                value = list(result[offset:offset + request.count])
+            elif request.kind in (WRITE_REGISTERS, WRITE_REGISTER):
+                # The values actually sent, which for a coalesced write are the newest set-point
+                value = list(request.values)
+            else:
+                value = result
+            for future in request.futures:
+                if not future.done():
+                    future.set_result(value)
+
+    @staticmethod
+    def _transact(instrument, request: _Request, start: int, count: int):
+        if request.kind == READ_REGISTERS:
+            return instrument.read_registers(start, count)
+        if request.kind == WRITE_REGISTERS:
+            return instrument.write_registers(request.register, list(request.values))
+        if request.kind == WRITE_REGISTER:
+            return instrument.write_register(request.register, request.values[0], **request.options)
+        if request.kind == READ_BIT:
+            return instrument.read_bit(request.register, **request.options)
+        if request.kind == WRITE_BIT:
+            return instrument.write_bit(request.register, request.values[0])
+        raise ValueError(f"Unknown Modbus request kind {request.kind}")
+
+    def _on_error(self, batch: List[_Request], error: ModbusExceptionType):
+        retry = []
+        failed = []
+        with self._condition:
+            stats = self._stats(batch[0].slave)
+            stats.errors += 1
+            stats.consecutive_failures += 1
+            backoff = min(self.backoff_max, self.backoff_base * 2 ** (stats.consecutive_failures - 1))
+            stats.backoff_until = time.monotonic() + backoff
+            for request in batch:
+                request.attempts += 1
+                if request.abandoned:
+                    continue
+                if request.attempts >= self.max_retries or not self._running:
+                    failed.append(request)
+                    stats.failed_requests += 1
+                else:
+                    retry.append(request)
+                    stats.retries += 1
+            # Retried requests keep their sequence number, so they stay ahead of newer ones
+            self._pending.extend(retry)
+            self._condition.notify_all()
+        for request in failed:
+            self._fail(request, error)
+
+    @staticmethod
+    def _fail(request: _Request, error: ModbusExceptionType):
+        exception = ModbusTransactionError(error, request.slave, request.register)
+        for future in request.futures:
+            if not future.done():
+                future.set_exception(exception)
@@ -0,0 +1,81 @@
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import List, Optional, Tuple
+
+from applications.glue_dispensing_application.services.glueSprayService.motorControl.errorCodes import \
+    ModbusExceptionType
+from modules.modbusCommunication.ModbusTransactionScheduler import ModbusPriority, ModbusTransactionError, \
+    ModbusTransactionScheduler
+
+
+class ScheduledModbusClient:
+    """
+    ModbusClient-compatible facade over a ModbusTransactionScheduler for one slave.
+
+    Methods keep ModbusClient's return conventions (None / ModbusExceptionType for writes,
+    (value, error) tuples for reads) and block until the transaction completes. The
+    ``submit*`` methods return the Future instead, for callers that do not need to wait
+    (e.g. streaming motor set-points). close() is a no-op: the scheduler owns the port.
+
+    Args:
+        read_max_age: Reads are served from the register cache when the cached values are
+            at most this old (seconds); 0 always reads the device.
+        timeout: Upper bound on waiting for a transaction, including queueing and retries.
+            On timeout the request is cancelled, so it is never sent (or retried) afterwards.
+    """
+
+    def __init__(self, scheduler: ModbusTransactionScheduler, slave: int, read_max_age: float = 0.0,
+                 priority: int = ModbusPriority.NORMAL, timeout: float = 5.0):
+        self.scheduler = scheduler
+        self.slave = slave
+        self.read_max_age = read_max_age
+        self.priority = priority
+        self.timeout = timeout
+
+    def _wait(self, future: Future):
+        try:
+            return future.result(timeout=self.timeout), None
+        except ModbusTransactionError as e:
+            return None, e.error
+        except FutureTimeoutError:
+            if not self.scheduler.cancel(future):
+                # Completed between the timeout and the cancel
+                return self._wait(future)
+            return None, ModbusExceptionType.TIMEOUT_ERROR
+
+    def writeRegister(self, register: int, value: float, signed: bool = False,
+                      priority: int = ModbusPriority.HIGH) -> Optional[ModbusExceptionType]:
+        return self._wait(self.scheduler.submit_write_single(self.slave, register, value, signed=signed,
+                                                             priority=priority))[1]
+
+    def writeRegisters(self, start_register: int, values: List[float],
+                       priority: int = ModbusPriority.HIGH) -> Optional[ModbusExceptionType]:
+        # Explicit blocking writes are commands (ramps, stop sequences); never merge them away
+        return self._wait(self.scheduler.submit_write(self.slave, start_register, values, priority=priority,
+                                                      coalesce=False))[1]
+
+    def submitWriteRegisters(self, start_register: int, values: List[float],
+                             priority: int = ModbusPriority.HIGH) -> Future:
+        """Queue a set-point write without waiting; a newer write to the same registers supersedes it."""
+        return self.scheduler.submit_write(self.slave, start_register, values, priority=priority, coalesce=True)
+
+    def readRegisters(self, start_register: int, count: int) -> Tuple[
+        Optional[List[int]], Optional[ModbusExceptionType]]:
+        return self._wait(self.scheduler.submit_read(self.slave, start_register, count, priority=self.priority,
+                                                     max_age=self.read_max_age))
+
+    def read(self, register: int) -> Tuple[Optional[int], Optional[ModbusExceptionType]]:
+        values, error = self.readRegisters(register, 1)
+        return (values[0] if values else None), error
+
+    def readBit(self, address: int, functioncode: int = 1) -> int:
+        value, error = self._wait(self.scheduler.submit_read_bit(self.slave, address, functioncode,
+                                                                 priority=self.priority))
+        if error is not None:
+            raise ModbusTransactionError(error, self.slave, address)
+        return value
+
+    def writeBit(self, address: int, value: int) -> None:
+        self._wait(self.scheduler.submit_write_bit(self.slave, address, value))
+
+    def close(self) -> None:
+        pass
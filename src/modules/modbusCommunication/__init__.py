@@ -11,20 +11,31 @@ Quick Start:
 
 Main Components:
     - ModbusClient: Core Modbus RTU client
+    - ModbusTransactionScheduler: Single owner of the RTU line (priorities, merged reads,
+      coalesced writes, per-slave back-off, register cache, statistics)
+    - ScheduledModbusClient: ModbusClient-compatible facade over the scheduler
     - ModbusController: Factory for configured clients
     - ModbusClientSingleton: Singleton pattern wrapper
     - modbus_lock: Thread synchronization
     - MockClient: Testing mock
+    - FakeRtu: In-process fake RTU bus/slaves for scheduler tests
 """
 
 from .ModbusClient import ModbusClient
-from .ModbusController import ModbusController
+from .ModbusTransactionScheduler import ModbusPriority, ModbusTransactionError, ModbusTransactionScheduler
+from .ScheduledModbusClient import ScheduledModbusClient
+from .ModbusController import ModbusController, STATE_READ_MAX_AGE
 from .ModbusClientSingleton import ModbusClientSingleton
 from .modbus_lock import modbus_lock
 
 __all__ = [
     'ModbusClient',
+    'ModbusPriority',
+    'ModbusTransactionError',
+    'ModbusTransactionScheduler',
+    'ScheduledModbusClient',
     'ModbusController',
+    'STATE_READ_MAX_AGE',
     'ModbusClientSingleton',
     'modbus_lock',
 ]
@@ -68,8 +68,10 @@ class CalibrationRobotController:
         move_x_mm = max(-max_move_mm, min(max_move_mm, offset_x_mm))
         move_y_mm = max(-max_move_mm, min(max_move_mm, offset_y_mm))
 
-        log_debug_message(self.logger_context,f"Adaptive movement: max_move={max_move_mm:.1f}mm (error={current_error_mm:.3f}mm)")
-        log_debug_message(self.logger_context,f"Making iterative movement: X+={move_x_mm:.3f}mm, Y+={move_y_mm:.3f}mm")
+        log_debug_message(self.logger_context, "Adaptive movement: max_move=%.1fmm (error=%.3fmm)",
+                          max_move_mm, current_error_mm)
+        log_debug_message(self.logger_context, "Making iterative movement: X+=%.3fmm, Y+=%.3fmm",
+                          move_x_mm, move_y_mm)
 
         # Move robot by small increment
         current_pose = self.robot_service.get_current_position()
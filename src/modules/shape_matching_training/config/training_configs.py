@@ -76,6 +76,9 @@ class FeatureConfig(BaseConfig):
     use_parallel_processing: bool = True
     max_workers: Optional[int] = None
     
+    # Persistent per-contour feature cache (None keeps features in memory only)
+    feature_cache_dir: Optional[Path] = None
+    
     # Feature selection
     feature_types: List[str] = field(default_factory=lambda: [
         'hu_moments', 'fourier', 'geometric', 'curvature'
@@ -89,6 +92,9 @@ class FeatureConfig(BaseConfig):
         if self.max_workers is not None:
             validate_positive_integer(self.max_workers, 'max_workers')
         
+        if self.feature_cache_dir is not None and not isinstance(self.feature_cache_dir, Path):
+            self.feature_cache_dir = Path(self.feature_cache_dir)
+        
         valid_feature_types = ['hu_moments', 'fourier', 'geometric', 'curvature']
         for feature_type in self.feature_types:
             if feature_type not in valid_feature_types:
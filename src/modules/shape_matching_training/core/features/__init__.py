@@ -9,11 +9,14 @@ from .base_extractor import BaseFeatureExtractor, FeatureExtractorFactory
 from .geometric_features import GeometricFeatureExtractor
 from .moment_features import MomentFeatureExtractor  
 from .fourier_features import FourierFeatureExtractor
+from .feature_store import FeatureStore, get_feature_store
 
 __all__ = [
     'BaseFeatureExtractor',
     'FeatureExtractorFactory',
     'GeometricFeatureExtractor',
     'MomentFeatureExtractor', 
-    'FourierFeatureExtractor'
+    'FourierFeatureExtractor',
+    'FeatureStore',
+    'get_feature_store'
 ]
\ No newline at end of file
@@ -290,28 +290,22 @@ def compute_features_parallel(contour_pairs: List[tuple],
     """
     Compute features for multiple contour pairs in parallel
     
+    Each unique contour is extracted once through the shared FeatureStore for this
+    extractor (on its long-lived worker pool); the pair features are then built from
+    the per-contour feature matrix.
+    
     Args:
         contour_pairs: List of (contour1, contour2) tuples
         extractor: Feature extractor to use
-        max_workers: Maximum number of worker processes
+        max_workers: Maximum number of worker processes (used when the store is created)
         
     Returns:
         List of feature vectors for each pair
     """
-    if max_workers is None:
-        max_workers = min(mp.cpu_count(), 8)
-    
-    if len(contour_pairs) == 1:
-        return [compute_features_for_pair(contour_pairs[0], extractor)]
-    
-    # Create worker function that captures the extractor
-    def worker(pair):
-        return compute_features_for_pair(pair, extractor)
-    
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        features = list(executor.map(worker, contour_pairs))
+    from .feature_store import get_feature_store
     
-    return features
+    store = get_feature_store(extractor, max_workers=max_workers)
+    return store.pair_features(contour_pairs).tolist()
 
 
 def get_feature_extraction_metadata(extractor: BaseFeatureExtractor) -> Dict[str, Any]:
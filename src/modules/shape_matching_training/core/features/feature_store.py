@@ -0,0 +1,267 @@
+"""
+Shape Feature Store
+
+Extracts the features of every unique contour once and serves pair features from the
+per-contour feature matrix.
+
+- Contours are keyed by a hash of their points; the store itself is keyed by an
+  extractor signature (type, version and config of the extractor), so changing the
+  extractor never serves stale features.
+- Missing contours are extracted in chunked batches on one long-lived process pool
+  (small batches are extracted inline, where pool overhead would dominate).
+- Pair features are built by indexing the feature matrix with the pair rows, e.g.
+  ``|F[rows1] - F[rows2]|``, instead of re-extracting both contours for every pair.
+- With a cache directory the matrix is persisted as ``.npy`` files and reopened
+  memory-mapped, so repeated training runs skip extraction entirely.
+"""
+
+import atexit
+import hashlib
+import json
+import multiprocessing as mp
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .base_extractor import BaseFeatureExtractor
+
+KEY_BYTES = 16
+
+PAIR_ABS_DIFF = 'abs_diff'
+PAIR_CONCAT = 'concat'
+
+
+def contour_hash(contour: np.ndarray) -> bytes:
+    """Content hash of a contour's points (shape-agnostic: (N,1,2) and (N,2) hash alike)."""
+    points = np.ascontiguousarray(np.asarray(contour, dtype=np.float32).reshape(-1, 2))
+    return hashlib.blake2b(points.tobytes(), digest_size=KEY_BYTES).digest()
+
+
+def extractor_signature(extractor: BaseFeatureExtractor) -> str:
+    """Stable hash of the extractor type, version and configuration."""
+    metadata = extractor.get_metadata()
+    description = json.dumps(
+        {'module': type(extractor).__module__, 'metadata': metadata},
+        sort_keys=True, default=str
+    )
+    return hashlib.blake2b(description.encode('utf-8'), digest_size=8).hexdigest()
+
+
+# Worker-side state: the extractor is sent once per worker process, not once per task
+_worker_extractor = None
+
+
+def _init_worker(extractor: BaseFeatureExtractor) -> None:
+    global _worker_extractor
+    _worker_extractor = extractor
+
+
+def _extract_chunk(contours: List[np.ndarray]) -> np.ndarray:
+    return np.array([_worker_extractor.extract_features(c) for c in contours], dtype=np.float64)
+
+
+class FeatureStore:
+    """
+    Per-contour feature matrix for one extractor, shared by training and prediction.
+
+    Args:
+        extractor: Feature extractor (must be picklable for pooled extraction)
+        cache_dir: Optional directory for the persistent ``.npy`` cache
+        max_workers: Worker processes for extraction (0 disables the pool)
+        chunk_size: Contours per pool task
+        min_parallel: Smallest number of missing contours worth sending to the pool
+    """
+
+    def __init__(self,
+                 extractor: BaseFeatureExtractor,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 max_workers: Optional[int] = None,
+                 chunk_size: int = 64,
+                 min_parallel: int = 256):
+        self.extractor = extractor
+        self.signature = extractor_signature(extractor)
+        self.n_features = extractor.get_feature_count()
+        self.max_workers = min(mp.cpu_count(), 8) if max_workers is None else max_workers
+        self.chunk_size = chunk_size
+        self.min_parallel = min_parallel
+        self.cache_dir = Path(cache_dir) / self.signature if cache_dir is not None else None
+
+        self._lock = threading.RLock()
+        self._rows: Dict[bytes, int] = {}
+        self._matrix = np.empty((0, self.n_features), dtype=np.float64)
+        self._size = 0
+        self._persisted = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.extractions = 0
+
+        if self.cache_dir is not None:
+            self._load_cache()
+
+    # --- Lookup ---
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Feature matrix, one row per stored contour."""
+        return self._matrix[:self._size]
+
+    def rows(self, contours: Sequence[np.ndarray]) -> np.ndarray:
+        """Row index of each contour, extracting the contours not seen before."""
+        keys = [contour_hash(c) for c in contours]
+        with self._lock:
+            missing = {}
+            for key, contour in zip(keys, contours):
+                if key not in self._rows and key not in missing:
+                    missing[key] = contour
+            if missing:
+                self._add(list(missing), self._extract(list(missing.values())))
+            return np.fromiter((self._rows[k] for k in keys), dtype=np.intp, count=len(keys))
+
+    def features(self, contours: Sequence[np.ndarray]) -> np.ndarray:
+        """(n, n_features) feature matrix of the given contours."""
+        rows = self.rows(contours)
+        return self.matrix[rows]
+
+    def pair_features(self, contour_pairs: Sequence[Tuple[np.ndarray, np.ndarray]],
+                      mode: str = PAIR_ABS_DIFF) -> np.ndarray:
+        """
+        Features of contour pairs.
+
+        Args:
+            contour_pairs: (contour1, contour2) tuples
+            mode: 'abs_diff' -> |f1 - f2| (training features),
+                  'concat' -> [f1, f2] (legacy predict_similarity features)
+
+        Returns:
+            (n_pairs, n_features) or (n_pairs, 2 * n_features) array
+        """
+        if len(contour_pairs) == 0:
+            width = self.n_features * (2 if mode == PAIR_CONCAT else 1)
+            return np.empty((0, width), dtype=np.float64)
+        rows = self.rows([c for pair in contour_pairs for c in pair[:2]])
+        matrix = self.matrix
+        first, second = matrix[rows[0::2]], matrix[rows[1::2]]
+        if mode == PAIR_ABS_DIFF:
+            return np.abs(first - second)
+        if mode == PAIR_CONCAT:
+            return np.hstack((first, second))
+        raise ValueError(f"Unknown pair feature mode '{mode}'")
+
+    # --- Extraction ---
+    def _extract(self, contours: List[np.ndarray]) -> np.ndarray:
+        self.extractions += len(contours)
+        if self.max_workers <= 1 or len(contours) < self.min_parallel:
+            return np.array([self.extractor.extract_features(c) for c in contours],
+                            dtype=np.float64).reshape(len(contours), -1)
+        chunks = [contours[i:i + self.chunk_size] for i in range(0, len(contours), self.chunk_size)]
+        return np.vstack(list(self._get_pool().map(_extract_chunk, chunks)))
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             initializer=_init_worker, initargs=(self.extractor,))
+        return self._pool
+
+    def _add(self, keys: List[bytes], features: np.ndarray) -> None:
+        needed = self._size + len(keys)
+        if needed > len(self._matrix) or not self._matrix.flags.writeable:
+            grown = np.empty((max(needed, 2 * len(self._matrix), 64), self.n_features), dtype=np.float64)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+        self._matrix[self._size:needed] = features
+        for offset, key in enumerate(keys):
+            self._rows[key] = self._size + offset
+        self._size = needed
+
+    # --- Persistence ---
+    def _cache_files(self) -> Tuple[Path, Path]:
+        return self.cache_dir / 'features.npy', self.cache_dir / 'keys.npy'
+
+    def _load_cache(self) -> None:
+        features_file, keys_file = self._cache_files()
+        if not features_file.exists() or not keys_file.exists():
+            return
+        try:
+            features = np.load(features_file, mmap_mode='r')
+            keys = np.load(keys_file)
+            if keys.shape[1:] != (KEY_BYTES,) or features.shape != (len(keys), self.n_features):
+                raise ValueError(f"shape {features.shape} does not match {len(keys)} keys")
+        except Exception as e:
+            print(f"⚠️ Ignoring feature cache {self.cache_dir}: {e}")
+            return
+        self._matrix = features
+        self._size = self._persisted = len(keys)
+        self._rows = {key.tobytes(): row for row, key in enumerate(keys)}
+
+    def save(self) -> None:
+        """Write the feature matrix to the cache directory (no-op without one or without changes)."""
+        if self.cache_dir is None:
+            return
+        with self._lock:
+            if self._size == self._persisted:
+                return
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            keys = np.empty((self._size, KEY_BYTES), dtype=np.uint8)
+            for key, row in self._rows.items():
+                keys[row] = np.frombuffer(key, dtype=np.uint8)
+            features_file, keys_file = self._cache_files()
+            # Keys last: a crash in between leaves a mismatched pair that _load_cache rejects
+            _atomic_save(features_file, np.ascontiguousarray(self.matrix))
+            _atomic_save(keys_file, keys)
+            self._persisted = self._size
+
+    def close(self) -> None:
+        """Save the cache and stop the worker pool."""
+        self.save()
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+
+def _atomic_save(path: Path, array: np.ndarray) -> None:
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix='.npy')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, array)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+_stores: Dict[Tuple[str, Optional[str]], FeatureStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_feature_store(extractor: BaseFeatureExtractor,
+                      cache_dir: Optional[Union[str, Path]] = None,
+                      **kwargs: Any) -> FeatureStore:
+    """
+    Process-wide store for an extractor configuration, so training and predict_similarity
+    share extracted features.
+    """
+    key = (extractor_signature(extractor), str(cache_dir) if cache_dir is not None else None)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = FeatureStore(extractor, cache_dir=cache_dir, **kwargs)
+            _stores[key] = store
+        return store
+
+
+@atexit.register
+def _close_stores() -> None:
+    with _stores_lock:
+        for store in _stores.values():
+            try:
+                store.close()
+            except Exception as e:
+                print(f"⚠️ Failed to close feature store: {e}")
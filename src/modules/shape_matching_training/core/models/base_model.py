@@ -148,10 +148,10 @@ class BaseModel(ABC):
         if not self.is_fitted:
             raise ValueError("Model must be fitted before making predictions")
         
-        # Extract features
-        from ..features.base_extractor import compute_features_for_pair
-        features = compute_features_for_pair((contour1, contour2), feature_extractor)
-        features_array = np.array(features).reshape(1, -1)
+        # Extract features (through the same shared store the trainer uses)
+        from ..features.feature_store import get_feature_store
+        features_array = get_feature_store(feature_extractor).pair_features([(contour1, contour2)])
+        features = features_array[0]
         
         # Make prediction
         prediction = self.predict(features_array)[0]
@@ -9,13 +9,11 @@ import time
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional, Union
 from sklearn.model_selection import train_test_split
-from concurrent.futures import ProcessPoolExecutor
-import multiprocessing as mp
-from functools import partial
 
 from ..models.base_model import BaseModel
 from ..models.model_factory import ModelFactory
-from ..features.base_extractor import BaseFeatureExtractor, compute_features_parallel, compute_features_for_pair
+from ..features.base_extractor import BaseFeatureExtractor
+from ..features.feature_store import FeatureStore, get_feature_store
 from ...utils.metrics import calculate_similarity_metrics, evaluate_model_performance
 from ...utils.validation import validate_training_data, validate_dataset_pairs
 from ...config.training_configs import TrainingConfig, DefaultTrainingConfig
@@ -97,13 +95,16 @@ class ModelTrainer:
     
     def __init__(self, 
                  feature_extractor: BaseFeatureExtractor,
-                 config: Optional[Union[Dict[str, Any], TrainingConfig]] = None):
+                 config: Optional[Union[Dict[str, Any], TrainingConfig]] = None,
+                 feature_store: Optional[FeatureStore] = None):
         """
         Initialize model trainer
         
         Args:
             feature_extractor: Feature extractor to use
             config: Training configuration
+            feature_store: Per-contour feature store (defaults to the shared store
+                for the extractor, which predict_similarity also uses)
         """
         self.feature_extractor = feature_extractor
         
@@ -118,6 +119,21 @@ class ModelTrainer:
         
         self.progress = TrainingProgress()
         self.training_results = {}
+        self._feature_store = feature_store
+    
+    @property
+    def feature_store(self) -> FeatureStore:
+        """Shared feature store for this trainer's extractor, created on first use"""
+        if self._feature_store is None:
+            feature_config = getattr(self.config, 'features', None)
+            max_workers = None
+            cache_dir = None
+            if feature_config is not None:
+                max_workers = feature_config.max_workers if feature_config.use_parallel_processing else 0
+                cache_dir = feature_config.feature_cache_dir
+            self._feature_store = get_feature_store(self.feature_extractor, cache_dir=cache_dir,
+                                                    max_workers=max_workers)
+        return self._feature_store
     
     def train_model(self, 
                    model_config: Dict[str, Any],
@@ -272,34 +288,30 @@ class ModelTrainer:
             raise ValueError(f"Data validation failed: {e}")
     
     def _extract_features_parallel(self, contour_pairs: List[Tuple]) -> np.ndarray:
-        """Extract features from contour pairs in parallel"""
+        """Extract features from contour pairs (each unique contour once, via the feature store)"""
         try:
             print(f"🔄 Extracting features from {len(contour_pairs):,} pairs...")
             
-            # Use parallel processing
-            n_cores = min(mp.cpu_count(), 8)
+            store = self.feature_store
+            extracted_before = store.extractions
             batch_size = 1000
             
             features = []
             completed = 0
             total_pairs = len(contour_pairs)
-            
-            # Create a partial function that's picklable
-            worker_func = partial(compute_features_for_pair, extractor=self.feature_extractor)
 
             for i in range(0, total_pairs, batch_size):
                 batch_pairs = contour_pairs[i:i+batch_size]
-                
-                with ProcessPoolExecutor(max_workers=n_cores) as executor:
-                    batch_features = list(executor.map(worker_func, batch_pairs))
-                    features.extend(batch_features)
+                features.append(store.pair_features(batch_pairs))
                 
                 completed += len(batch_pairs)
                 progress_pct = (completed / total_pairs) * 100
                 print(f"   📈 Progress: {completed:,}/{total_pairs:,} pairs ({progress_pct:.1f}%)")
             
-            features_array = np.array(features)
-            print(f"✅ Feature extraction complete: {features_array.shape}")
+            store.save()
+            features_array = np.vstack(features) if features else np.empty((0, store.n_features))
+            print(f"✅ Feature extraction complete: {features_array.shape} "
+                  f"({store.extractions - extracted_before:,} contours extracted, {len(store):,} in store)")
             
             return features_array
             
@@ -476,6 +476,26 @@ def load_dataset(filepath: Union[str, Path]) -> Tuple[List, List]:
     return data['pairs'], data['labels']
 
 
+def _similarity_feature_store():
+    """Shared feature store for the extractor set used by predict_similarity."""
+    global _SIMILARITY_FEATURE_STORE
+    if _SIMILARITY_FEATURE_STORE is None:
+        from ..core.features.base_extractor import FeatureExtractorFactory
+        from ..core.features.feature_store import get_feature_store
+        
+        # Create feature extractor (using same features as original system)
+        extractor_configs = [
+            {'name': 'geometric'},
+            {'name': 'hu', 'config': {'use_log_transform': True}}
+        ]
+        extractor = FeatureExtractorFactory.create_composite_extractor(extractor_configs)
+        _SIMILARITY_FEATURE_STORE = get_feature_store(extractor)
+    return _SIMILARITY_FEATURE_STORE
+
+
+_SIMILARITY_FEATURE_STORE = None
+
+
 def predict_similarity(model, contour1, contour2):
     """
     Compatibility function for the old predict_similarity interface.
@@ -493,21 +513,10 @@ def predict_similarity(model, contour1, contour2):
         - confidence: Confidence score (0-1)
         - features: Extracted features used for prediction
     """
-    from ..core.features.base_extractor import FeatureExtractorFactory
-    
-    # Create feature extractor (using same features as original system)
-    extractor_configs = [
-        {'name': 'geometric'},
-        {'name': 'hu', 'config': {'use_log_transform': True}}
-    ]
-    extractor = FeatureExtractorFactory.create_composite_extractor(extractor_configs)
-    
-    # Extract features from both contours
-    features1 = extractor.extract_features(contour1)
-    features2 = extractor.extract_features(contour2)
+    from ..core.features.feature_store import PAIR_CONCAT
     
-    # Combine features (same as old compute_enhanced_features)
-    features = features1 + features2
+    # Combine features of both contours (same as old compute_enhanced_features)
+    features = _similarity_feature_store().pair_features([(contour1, contour2)], mode=PAIR_CONCAT)[0].tolist()
     
     # Make prediction
     prediction = model.predict([features])[0]
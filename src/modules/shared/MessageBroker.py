@@ -1,11 +1,92 @@
 import logging
+import threading
 import weakref
-from typing import Dict, List, Any, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Dict, List, Any, Callable, Optional
+
+
+class DeliveryPolicy(Enum):
+    """How messages on a topic reach its subscribers."""
+    SYNC = "sync"        # called on the publisher's thread (default)
+    QUEUED = "queued"    # bounded per-subscriber queue drained on the broker worker pool
+    LATEST = "latest"    # only the newest undelivered message is kept; older ones are replaced
+
+
+class SubscriberStats:
+    """Back-pressure counters of one subscriber on an asynchronous topic."""
+
+    def __init__(self):
+        self.delivered = 0
+        self.dropped = 0      # QUEUED: oldest messages discarded because the queue was full
+        self.coalesced = 0    # LATEST: undelivered messages replaced by a newer one
+        self.failed = 0
+        self.max_pending = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "failed": self.failed,
+            "max_pending": self.max_pending,
+        }
+
+
+class _SubscriberChannel:
+    """Pending messages of one subscriber on a QUEUED or LATEST topic."""
+
+    def __init__(self, broker, topic: str, weak_callback, policy: DeliveryPolicy, max_queue: int):
+        self.broker = broker
+        self.topic = topic
+        self.weak_callback = weak_callback
+        self.policy = policy
+        self.pending = deque(maxlen=1 if policy is DeliveryPolicy.LATEST else max_queue)
+        self.stats = SubscriberStats()
+        self.lock = threading.Lock()
+        self.scheduled = False
+
+    def offer(self, message: Any):
+        with self.lock:
+            if len(self.pending) == self.pending.maxlen:
+                if self.policy is DeliveryPolicy.LATEST:
+                    self.stats.coalesced += 1
+                else:
+                    self.stats.dropped += 1
+            self.pending.append(message)
+            self.stats.max_pending = max(self.stats.max_pending, len(self.pending))
+            if self.scheduled:
+                return
+            self.scheduled = True
+        self.broker._executor().submit(self.drain)
+
+    def drain(self):
+        # One drain task per channel at a time keeps per-subscriber ordering
+        while True:
+            with self.lock:
+                if not self.pending:
+                    self.scheduled = False
+                    return
+                message = self.pending.popleft()
+            callback = self.weak_callback()
+            if callback is None:
+                with self.lock:
+                    self.pending.clear()
+                    self.scheduled = False
+                return
+            if self.broker._invoke(self.topic, callback, message):
+                self.stats.delivered += 1
+            else:
+                self.stats.failed += 1
 
 
 class MessageBroker:
     _instance = None
 
+    DEFAULT_MAX_QUEUE = 64
+    DEFAULT_WORKERS = 4
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(MessageBroker, cls).__new__(cls)
@@ -15,22 +96,128 @@ class MessageBroker:
     def _init(self):
         self.subscribers: Dict[str, List[weakref.ref]] = {}
         self.logger = logging.getLogger(self.__class__.__name__)
-
+        self._lock = threading.RLock()
+        # topic -> (policy, max_queue); topics without an entry are SYNC
+        self._policies: Dict[str, tuple] = {}
+        # topic -> {id(weak_ref): channel} for QUEUED / LATEST topics
+        self._channels: Dict[str, Dict[int, _SubscriberChannel]] = {}
+        # topic -> tuple of (weak_ref, channel-or-None); rebuilt only when subscriptions change
+        self._snapshots: Dict[str, tuple] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.max_workers = self.DEFAULT_WORKERS
+
+    # --- Delivery policies ---
+    def set_topic_policy(self, topic: str, policy: DeliveryPolicy, max_queue: int = DEFAULT_MAX_QUEUE):
+        """
+        Choose how a topic is delivered. QUEUED and LATEST move subscriber calls off the
+        publisher's thread so a slow subscriber can no longer stall the publisher.
+        """
+        with self._lock:
+            if policy is DeliveryPolicy.SYNC:
+                self._policies.pop(topic, None)
+            else:
+                self._policies[topic] = (policy, max(1, int(max_queue)))
+            self._channels.pop(topic, None)
+            self._invalidate(topic)
+
+    def get_topic_policy(self, topic: str) -> DeliveryPolicy:
+        return self._policies.get(topic, (DeliveryPolicy.SYNC, 0))[0]
+
+    def get_subscriber_stats(self, topic: str) -> List[Dict[str, Any]]:
+        """Back-pressure counters per live subscriber of an asynchronous topic."""
+        stats = []
+        for channel in list(self._channels.get(topic, {}).values()):
+            callback = channel.weak_callback()
+            if callback is None:
+                continue
+            entry = channel.stats.as_dict()
+            entry["callback"] = self._describe(callback)
+            entry["pending"] = len(channel.pending)
+            stats.append(entry)
+        return stats
+
+    def shutdown(self, wait: bool = True):
+        """Stop the delivery worker pool (it is recreated on the next asynchronous publish)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        pool = self._pool
+        if pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="MessageBroker")
+                pool = self._pool
+        return pool
+
+    def _invalidate(self, topic: str):
+        self._snapshots.pop(topic, None)
+
+    def _snapshot(self, topic: str) -> tuple:
+        snapshot = self._snapshots.get(topic)
+        if snapshot is not None:
+            return snapshot
+        with self._lock:
+            refs = self.subscribers.get(topic)
+            if not refs:
+                return ()
+            policy = self._policies.get(topic)
+            channels = self._channels.setdefault(topic, {}) if policy else None
+            entries = []
+            for ref in refs:
+                channel = None
+                if policy:
+                    channel = channels.get(id(ref))
+                    if channel is None or channel.weak_callback is not ref:
+                        channel = _SubscriberChannel(self, topic, ref, policy[0], policy[1])
+                        channels[id(ref)] = channel
+                entries.append((ref, channel))
+            if channels:
+                live = {id(ref) for ref in refs}
+                for key in [key for key in channels if key not in live]:
+                    del channels[key]
+            snapshot = tuple(entries)
+            self._snapshots[topic] = snapshot
+            return snapshot
+
+    @staticmethod
+    def _describe(callback: Callable) -> str:
+        if hasattr(callback, '__self__'):
+            return f"{callback.__self__.__class__.__name__}.{callback.__name__}"
+        return getattr(callback, '__name__', str(callback))
+
+    def _invoke(self, topic: str, callback: Callable, message: Any) -> bool:
+        try:
+            callback(message)
+            return True
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            # DEBUG: Show which object/method is causing the error
+            self.logger.error(f"Error calling subscriber for topic '{topic}': {e} [Callback: {self._describe(callback)}]")
+            return False
+
+    # --- Subscriptions ---
     def subscribe(self, topic: str, callback: Callable):
         """Subscribe to a topic with automatic cleanup of dead references"""
         print(f"[MessageBroker] Subscribing to topic '{topic}' with callback {callback.__name__ if hasattr(callback, '__name__') else str(callback)}")
-        if topic not in self.subscribers:
-            self.subscribers[topic] = []
-
-        # Create weak reference to avoid keeping objects alive
-        if hasattr(callback, '__self__'):
-            # It's a bound method - use WeakMethod
-            weak_callback = weakref.WeakMethod(callback, self._cleanup_callback(topic, callback))
-        else:
-            # It's a function - use regular weak reference
-            weak_callback = weakref.ref(callback, self._cleanup_callback(topic, callback))
+        with self._lock:
+            if topic not in self.subscribers:
+                self.subscribers[topic] = []
+
+            # Create weak reference to avoid keeping objects alive
+            if hasattr(callback, '__self__'):
+                # It's a bound method - use WeakMethod
+                weak_callback = weakref.WeakMethod(callback, self._cleanup_callback(topic, callback))
+            else:
+                # It's a function - use regular weak reference
+                weak_callback = weakref.ref(callback, self._cleanup_callback(topic, callback))
 
-        self.subscribers[topic].append(weak_callback)
+            self.subscribers[topic].append(weak_callback)
+            self._invalidate(topic)
         print(f"Subscribed to topic '{topic}' with callback {callback.__name__ if hasattr(callback, '__name__') else str(callback)}")
         self.logger.debug(f"Subscribed to topic '{topic}'. Total subscribers: {len(self.subscribers[topic])}")
 
@@ -38,93 +225,74 @@ class MessageBroker:
         """Create a cleanup function that removes dead references"""
 
         def cleanup(weak_ref):
-            if topic in self.subscribers:
-                # Remove the dead reference
-                self.subscribers[topic] = [
-                    ref for ref in self.subscribers[topic]
-                    if ref is not weak_ref
-                ]
-                # Clean up empty topic
-                if topic in self.subscribers and not self.subscribers[topic]:
-                    del self.subscribers[topic]
-                self.logger.debug(f"Auto-cleaned up dead reference for topic '{topic}'")
+            with self._lock:
+                if topic in self.subscribers:
+                    # Remove the dead reference
+                    self.subscribers[topic] = [
+                        ref for ref in self.subscribers[topic]
+                        if ref is not weak_ref
+                    ]
+                    # Clean up empty topic
+                    if topic in self.subscribers and not self.subscribers[topic]:
+                        del self.subscribers[topic]
+                    self._invalidate(topic)
+                    self.logger.debug(f"Auto-cleaned up dead reference for topic '{topic}'")
 
         return cleanup
 
     def unsubscribe(self, topic: str, callback: Callable):
         """Manually unsubscribe from a topic"""
-        if topic not in self.subscribers:
-            return
+        with self._lock:
+            if topic not in self.subscribers:
+                return
 
-        # Find and remove matching callbacks
-        original_count = len(self.subscribers[topic])
-        self.subscribers[topic] = [
-            ref for ref in self.subscribers[topic]
-            if ref() is not None and ref() != callback
-        ]
+            # Find and remove matching callbacks
+            original_count = len(self.subscribers[topic])
+            self.subscribers[topic] = [
+                ref for ref in self.subscribers[topic]
+                if ref() is not None and ref() != callback
+            ]
 
-        # Clean up empty topic
-        if not self.subscribers[topic]:
-            del self.subscribers[topic]
+            # Clean up empty topic
+            if not self.subscribers[topic]:
+                del self.subscribers[topic]
+            self._invalidate(topic)
 
         removed_count = original_count - len(self.subscribers.get(topic, []))
         if removed_count > 0:
             self.logger.debug(f"Unsubscribed {removed_count} callback(s) from topic '{topic}'")
 
     def publish(self, topic: str, message: Any):
-        """Publish message to all live subscribers"""
-        # print(f"[MessageBroker] Publishing to topic '{topic}' message: {message}")
-
-        if topic not in self.subscribers:
-            # print(f"[MessageBroker] WARNING: No subscribers for topic '{topic}'")
-            self.logger.debug(f"No subscribers for topic '{topic}'")
+        """
+        Publish message to all live subscribers.
+
+        SYNC topics call the subscribers here; QUEUED / LATEST topics hand the message to each
+        subscriber's channel and return immediately. The subscriber list is a cached snapshot,
+        so nothing is rebuilt per call.
+        """
+        snapshot = self._snapshots.get(topic)
+        if snapshot is None:
+            snapshot = self._snapshot(topic)
+        if not snapshot:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"No subscribers for topic '{topic}'")
             return
-        # Get all live callbacks and clean up dead ones
-        live_callbacks = []
-        dead_refs = []
 
-        for weak_ref in self.subscribers[topic]:
-            callback = weak_ref()
-            if callback is not None:
-                live_callbacks.append(callback)
-            else:
-                dead_refs.append(weak_ref)
-
-        # Remove dead references
-        if dead_refs:
-            self.subscribers[topic] = [
-                ref for ref in self.subscribers[topic]
-                if ref not in dead_refs
-            ]
-            self.logger.debug(f"Cleaned up {len(dead_refs)} dead references for topic '{topic}'")
-
-        # Call all live callbacks
-        successful_calls = 0
         failed_calls = 0
-
-        for callback in live_callbacks:
-            try:
-                self.logger.debug(f"Publishing to topic: '{topic}' message: {message}")
-                callback(message)
-                successful_calls += 1
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
+        for weak_ref, channel in snapshot:
+            if channel is not None:
+                channel.offer(message)
+                continue
+            callback = weak_ref()
+            if callback is None:
+                # Removed by the weakref cleanup, which also refreshes the snapshot
+                continue
+            if not self._invoke(topic, callback, message):
                 failed_calls += 1
-                # DEBUG: Show which object/method is causing the error
-                callback_info = f"{callback.__self__.__class__.__name__}.{callback.__name__}" if hasattr(callback, '__self__') else str(callback)
-                self.logger.error(f"Error calling subscriber for topic '{topic}': {e} [Callback: {callback_info}]")
-                # Don't break - continue with other subscribers
 
-        if successful_calls > 0:
-            self.logger.debug(f"Successfully published to {successful_calls} subscribers for topic '{topic}'")
         if failed_calls > 0:
             self.logger.warning(f"Failed to publish to {failed_calls} subscribers for topic '{topic}'")
 
-        # Clean up empty topic
-        if not self.subscribers[topic]:
-            del self.subscribers[topic]
-
     def get_subscriber_count(self, topic: str) -> int:
         """Get the number of active subscribers for a topic"""
         if topic not in self.subscribers:
@@ -140,9 +308,11 @@ class MessageBroker:
 
     def clear_topic(self, topic: str):
         """Clear all subscribers for a specific topic"""
-        if topic in self.subscribers:
-            count = len(self.subscribers[topic])
-            del self.subscribers[topic]
+        with self._lock:
+            count = len(self.subscribers.pop(topic, []))
+            self._channels.pop(topic, None)
+            self._invalidate(topic)
+        if count:
             self.logger.debug(f"Cleared {count} subscribers from topic '{topic}'")
 
     def request(self, topic: str, message: Any, timeout: float = 1.0):
@@ -175,8 +345,11 @@ class MessageBroker:
 
     def clear_all(self):
         """Clear all subscribers from all topics"""
-        total_cleared = sum(len(subs) for subs in self.subscribers.values())
-        self.subscribers.clear()
+        with self._lock:
+            total_cleared = sum(len(subs) for subs in self.subscribers.values())
+            self.subscribers.clear()
+            self._channels.clear()
+            self._snapshots.clear()
         self.logger.debug(f"Cleared all {total_cleared} subscribers from all topics")
 
 
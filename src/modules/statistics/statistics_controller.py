@@ -3,15 +3,21 @@ Statistics Controller for Glue Spray Service
 
 Subscribes to MessageBroker topics and maintains statistics asynchronously.
 Delegates business logic to StatisticsService.
+
+Every change is recorded as an event in the repository's append-only log; the full
+statistics are only written as periodic snapshots. On startup the statistics and the
+daily / per-workpiece aggregates are recovered from the last snapshot plus the logged events.
 """
 
 import threading
 import queue
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Callable, Optional
 
 from modules.shared.MessageBroker import MessageBroker
 from communication_layer.api.v1.topics import GlueSprayServiceTopics
+from modules.statistics.statistics_event_log import StatisticsAggregates
 from modules.statistics.statistics_repository import StatisticsRepository
 from modules.statistics.statistics_service import StatisticsService
 
@@ -34,10 +40,10 @@ class StatisticsController:
             )
 
         self.repo = StatisticsRepository(storage_path)
-        self.statistics = self.repo.load()
         self.service = StatisticsService()
         self._lock = threading.Lock()
         self._ui_callbacks = []
+        self._recover()
 
         # Async queue and worker
         self._update_queue = queue.Queue()
@@ -50,18 +56,74 @@ class StatisticsController:
 
         print(f"[StatisticsController] Initialized with storage: {storage_path}")
 
+    # =================== Event log ===================
+
+    def _recover(self):
+        """Load the last snapshot and replay the events logged after it."""
+        statistics, aggregates, _ = self.repo.load_snapshot()
+        self.statistics = statistics
+        self.aggregates = StatisticsAggregates(aggregates)
+        replayed = 0
+        for event in self.repo.replay():
+            self._apply_event(event)
+            replayed += 1
+        if replayed:
+            print(f"[StatisticsController] Replayed {replayed} statistics events")
+
+    def _record(self, event: Dict[str, Any]):
+        """Apply a new event and append it to the log. Caller holds self._lock."""
+        event.setdefault("ts", datetime.now().isoformat())
+        self._apply_event(event)
+        self.repo.append_event(event)
+
+    def _apply_event(self, event: Dict[str, Any]):
+        ts = datetime.fromisoformat(event["ts"])
+        event_type = event["type"]
+        if event_type == "state":
+            component = event["component"]
+            if component.startswith("motors."):
+                # Ensure this motor exists
+                self.statistics.setdefault("motors", {}).setdefault(
+                    component.split(".", 1)[1], self.repo._default_motor_stats())
+            cycles_before = self.statistics["system"]["total_cycles"]
+            runtime_before = self.statistics["generator"]["total_runtime_seconds"]
+            self.statistics = self.service.update_component_state(
+                self.statistics, component, event["state"], event["count_type"], timestamp=ts
+            )
+            self.aggregates.record(
+                event,
+                cycles=self.statistics["system"]["total_cycles"] - cycles_before,
+                generator_runtime=self.statistics["generator"]["total_runtime_seconds"] - runtime_before,
+            )
+        elif event_type == "reset":
+            self.statistics = self.service.reset_statistics(
+                self.statistics, self.repo._default_statistics(), timestamp=ts
+            )
+            self.aggregates.clear()
+        elif event_type == "reset_component":
+            self.statistics = self.service.reset_component(
+                self.statistics, self.repo._default_statistics(), event["component"]
+            )
+
     # =================== Async update processing ===================
 
-    def _enqueue_update(self):
-        """Add an update task to the queue."""
-        self._update_queue.put(1)
+    def _enqueue_update(self, snapshot: bool = False):
+        """Add an update task to the queue; snapshot=True forces a snapshot."""
+        self._update_queue.put(snapshot)
 
     def _process_updates(self):
-        """Worker thread that handles saves and UI notifications asynchronously."""
+        """Worker thread that handles snapshots, log syncs and UI notifications asynchronously."""
         while True:
-            task = self._update_queue.get()
             try:
-                self._save_statistics()
+                snapshot = self._update_queue.get(timeout=self.repo.event_log.sync_interval)
+            except queue.Empty:
+                self.repo.sync_if_due()
+                continue
+            try:
+                if snapshot or self.repo.snapshot_due():
+                    self._save_statistics()
+                else:
+                    self.repo.sync_if_due()
                 self._notify_ui_update()
             except Exception as e:
                 print(f"[StatisticsController] Error processing update: {e}")
@@ -70,9 +132,9 @@ class StatisticsController:
     # =================== Persistence and UI ===================
 
     def _save_statistics(self):
-        """Save current statistics via repository."""
+        """Snapshot current statistics via repository (compacts the event log)."""
         with self._lock:
-            self.repo.save(self.statistics)
+            self.repo.save(self.statistics, self.aggregates.to_dict())
 
     def _notify_ui_update(self):
         """Notify all registered UI callbacks asynchronously."""
@@ -94,22 +156,16 @@ class StatisticsController:
 
     # =================== Component updates ===================
 
-    def _update_component_state(self, component: str, new_state: str, count_type: str, motor_address: str = None):
-        """Delegate component state updates to StatisticsService."""
+    def _update_component_state(self, component: str, new_state: str, count_type: str, motor_address: str = None,
+                                workpiece_id=None):
+        """Record a component state change; StatisticsService applies it."""
         with self._lock:
+            event = {"type": "state", "state": new_state, "count_type": count_type}
+            if workpiece_id is not None:
+                event["workpiece_id"] = workpiece_id
             if component == "motor" and motor_address:
-                # Ensure motors dict exists
-                if "motors" not in self.statistics:
-                    self.statistics["motors"] = {}
-
-                # Ensure this motor exists
-                if motor_address not in self.statistics["motors"]:
-                    self.statistics["motors"][motor_address] = self.repo._default_motor_stats()
-
-                # Update the specific motor
-                self.statistics = self.service.update_component_state(
-                    self.statistics, f"motors.{motor_address}", new_state, count_type
-                )
+                event["component"] = f"motors.{motor_address}"
+                self._record(event)
 
                 print(
                     f"[StatisticsController] Motor {motor_address} {new_state.upper()} "
@@ -117,9 +173,8 @@ class StatisticsController:
                 )
             else:
                 # Handle generator and other components
-                self.statistics = self.service.update_component_state(
-                    self.statistics, component, new_state, count_type
-                )
+                event["component"] = component
+                self._record(event)
 
                 print(
                     f"[StatisticsController] {component.capitalize()} {new_state.upper()} "
@@ -128,19 +183,25 @@ class StatisticsController:
 
         self._enqueue_update()
 
+    @staticmethod
+    def _workpiece_id(data):
+        return data.get("workpiece_id") if isinstance(data, dict) else None
+
     def _on_generator_on(self, data=None):
-        self._update_component_state("generator", "on", "on_count")
+        self._update_component_state("generator", "on", "on_count", workpiece_id=self._workpiece_id(data))
 
     def _on_generator_off(self, data=None):
-        self._update_component_state("generator", "off", "off_count")
+        self._update_component_state("generator", "off", "off_count", workpiece_id=self._workpiece_id(data))
 
     def _on_motor_on(self, data=None):
         motor_address = str(data.get("motor_address", "1")) if isinstance(data, dict) else "1"
-        self._update_component_state("motor", "on", "on_count", motor_address=motor_address)
+        self._update_component_state("motor", "on", "on_count", motor_address=motor_address,
+                                     workpiece_id=self._workpiece_id(data))
 
     def _on_motor_off(self, data=None):
         motor_address = str(data.get("motor_address", "1")) if isinstance(data, dict) else "1"
-        self._update_component_state("motor", "off", "off_count", motor_address=motor_address)
+        self._update_component_state("motor", "off", "off_count", motor_address=motor_address,
+                                     workpiece_id=self._workpiece_id(data))
 
     # =================== Public API ===================
 
@@ -161,22 +222,34 @@ class StatisticsController:
         with self._lock:
             return self.statistics.copy()
 
+    def get_daily_statistics(self, date: Optional[str] = None) -> Dict[str, Any]:
+        """Counts for one day (YYYY-MM-DD, default today) from the incremental aggregates."""
+        with self._lock:
+            return self.aggregates.day(date)
+
+    def get_daily_history(self) -> Dict[str, Dict[str, Any]]:
+        """Counts for every recorded day."""
+        with self._lock:
+            return {date: dict(counts) for date, counts in self.aggregates.daily.items()}
+
+    def get_workpiece_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Counts per workpiece ID, for events that carried one."""
+        with self._lock:
+            return {wid: dict(counts) for wid, counts in self.aggregates.by_workpiece.items()}
+
     def reset_statistics(self):
         """Reset all statistics via service."""
         with self._lock:
-            self.statistics = self.service.reset_statistics(
-                self.statistics, self.repo._default_statistics()
-            )
-        self._enqueue_update()
+            self._record({"type": "reset"})
+        self._enqueue_update(snapshot=True)
         print("[StatisticsController] Statistics reset")
 
     def reset_component_statistics(self, component: str):
         """Reset a single component's statistics via service."""
         try:
             with self._lock:
-                self.statistics = self.service.reset_component(
-                    self.statistics, self.repo._default_statistics(), component
-                )
+                # Applied before it is logged, so an unknown component raises and is not recorded
+                self._record({"type": "reset_component", "component": component})
             self._enqueue_update()
             print(f"[StatisticsController] {component} statistics reset")
         except ValueError as e:
@@ -185,7 +258,7 @@ class StatisticsController:
     def shutdown(self):
         """Cleanup and save statistics before shutdown."""
         print("[StatisticsController] Shutting down...")
-        self._enqueue_update()
+        self._enqueue_update(snapshot=True)
         self._update_queue.join()  # Wait for pending updates
 
         # Unsubscribe from topics
@@ -0,0 +1,147 @@
+"""
+Append-only event log and incremental aggregates for the glue spray statistics.
+
+Every statistics change is appended as one JSON line ({"seq", "ts", "type", ...}) instead of
+rewriting the whole statistics file. Lines are flushed to the OS on every append and fsynced
+in batches (every ``sync_batch`` events or ``sync_interval`` seconds). The repository writes
+periodic snapshots and truncates the log behind them; on startup the statistics are
+recovered from the last snapshot plus the events logged after it. A torn last line (crash
+mid-write) is dropped during recovery.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+
+class StatisticsEventLog:
+    """JSON-lines event log with batched fsync."""
+
+    def __init__(self, path: Path, sync_batch: int = 50, sync_interval: float = 1.0):
+        self.path = Path(path)
+        self.sync_batch = sync_batch
+        self.sync_interval = sync_interval
+        self.seq = 0
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._recover()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _recover(self):
+        """Find the last sequence number and cut off a torn trailing line."""
+        if not self.path.exists():
+            return
+        good_end = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                self.seq = max(self.seq, int(event.get("seq", 0)))
+                good_end += len(line)
+        if good_end < self.path.stat().st_size:
+            print(f"[StatisticsEventLog] Dropping torn tail of {self.path.name} "
+                  f"({self.path.stat().st_size - good_end} bytes)")
+            with open(self.path, "r+b") as f:
+                f.truncate(good_end)
+
+    def append(self, event: Dict[str, Any]) -> int:
+        """Assign the next sequence number, append the event and return its seq."""
+        with self._lock:
+            self.seq += 1
+            event["seq"] = self.seq
+            self._file.write(json.dumps(event, separators=(",", ":")) + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.sync_batch:
+                self._sync_locked()
+            return self.seq
+
+    def sync_if_due(self):
+        with self._lock:
+            if self._unsynced and time.monotonic() - self._last_sync >= self.sync_interval:
+                self._sync_locked()
+
+    def sync(self):
+        with self._lock:
+            self._sync_locked()
+
+    def _sync_locked(self):
+        if self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def events_after(self, seq: int) -> Iterator[Dict[str, Any]]:
+        """Events with a sequence number greater than seq, in log order."""
+        with self._lock:
+            self._file.flush()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                event = json.loads(line)
+                if event["seq"] > seq:
+                    yield event
+
+    def truncate(self):
+        """Drop every logged event (after a snapshot covering them was written)."""
+        with self._lock:
+            self._file.truncate(0)
+            self._file.seek(0)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+
+    def close(self):
+        with self._lock:
+            self._sync_locked()
+            self._file.close()
+
+
+class StatisticsAggregates:
+    """
+    Counts kept up to date event by event, so views never rescan the history.
+
+    daily[YYYY-MM-DD] and by_workpiece[workpiece_id] each hold:
+    cycles, generator_on, motor_on, generator_runtime_seconds.
+    Per-workpiece counts are kept for events that carry a ``workpiece_id``.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        self.daily: Dict[str, Dict[str, float]] = data.get("daily", {})
+        self.by_workpiece: Dict[str, Dict[str, float]] = data.get("by_workpiece", {})
+
+    @staticmethod
+    def _empty() -> Dict[str, float]:
+        return {"cycles": 0, "generator_on": 0, "motor_on": 0, "generator_runtime_seconds": 0.0}
+
+    def record(self, event: Dict[str, Any], cycles: int = 0, generator_runtime: float = 0.0):
+        """Add one state event; cycles/generator_runtime are what the event added to the totals."""
+        buckets = [self.daily.setdefault(event["ts"][:10], self._empty())]
+        if event.get("workpiece_id") is not None:
+            buckets.append(self.by_workpiece.setdefault(str(event["workpiece_id"]), self._empty()))
+        on_key = "generator_on" if event["component"] == "generator" else "motor_on"
+        for bucket in buckets:
+            bucket["cycles"] += cycles
+            bucket["generator_runtime_seconds"] += generator_runtime
+            if event["state"] == "on":
+                bucket[on_key] += 1
+
+    def day(self, date: Optional[str] = None) -> Dict[str, float]:
+        date = date or datetime.now().date().isoformat()
+        return dict(self.daily.get(date, self._empty()))
+
+    def clear(self):
+        self.daily.clear()
+        self.by_workpiece.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"daily": self.daily, "by_workpiece": self.by_workpiece}
@@ -1,36 +1,93 @@
 import json
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
 import threading
 
+from modules.statistics.statistics_event_log import StatisticsEventLog
+
+
 class StatisticsRepository:
-    """Handles loading and saving statistics to JSON."""
+    """
+    Handles persistence of statistics: an append-only event log plus periodic JSON snapshots.
+
+    The snapshot (glue_spray_statistics.json) holds the statistics, the aggregates and the
+    sequence number of the last event it includes; events after it live in the log
+    (glue_spray_statistics.events.jsonl) until the next snapshot compacts them away.
+    """
 
-    def __init__(self, storage_path: Path):
+    def __init__(self, storage_path: Path, snapshot_interval: int = 500, sync_batch: int = 50,
+                 sync_interval: float = 1.0):
         self.storage_path = storage_path
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.stats_file = self.storage_path / "glue_spray_statistics.json"
+        self.snapshot_interval = snapshot_interval
         self._lock = threading.Lock()
+        self.event_log = StatisticsEventLog(self.storage_path / "glue_spray_statistics.events.jsonl",
+                                            sync_batch=sync_batch, sync_interval=sync_interval)
+        self.snapshot_seq = 0
 
     def load(self) -> Dict[str, Any]:
+        return self.load_snapshot()[0]
+
+    def load_snapshot(self) -> Tuple[Dict[str, Any], Dict[str, Any], int]:
+        """(statistics, aggregates, seq of the last event included) from the snapshot file."""
+        self.snapshot_seq = 0
         if self.stats_file.exists():
             try:
                 with open(self.stats_file, "r") as f:
-                    return json.load(f)
+                    data = json.load(f)
+                if "statistics" not in data:  # files written before the event log
+                    return data, {}, 0
+                self.snapshot_seq = int(data.get("seq", 0))
+                # After compaction the log is empty; keep numbering after the snapshot
+                self.event_log.seq = max(self.event_log.seq, self.snapshot_seq)
+                return data["statistics"], data.get("aggregates", {}), self.snapshot_seq
             except Exception as e:
                 print(f"[StatisticsRepository] Error loading statistics: {e}")
-        return self._default_statistics()
+        return self._default_statistics(), {}, 0
 
-    def save(self, stats: Dict[str, Any]):
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """Events logged after the loaded snapshot."""
+        try:
+            yield from self.event_log.events_after(self.snapshot_seq)
+        except Exception as e:
+            print(f"[StatisticsRepository] Error replaying statistics events: {e}")
+
+    def append_event(self, event: Dict[str, Any]) -> int:
+        return self.event_log.append(event)
+
+    def sync_if_due(self):
+        self.event_log.sync_if_due()
+
+    def snapshot_due(self) -> bool:
+        return self.event_log.seq - self.snapshot_seq >= self.snapshot_interval
+
+    def save(self, stats: Dict[str, Any], aggregates: Optional[Dict[str, Any]] = None):
+        """
+        Write a snapshot of everything logged so far and compact the event log.
+        Callers must not append events while a snapshot is being written.
+        """
         try:
             with self._lock:
                 stats["system"]["last_updated"] = datetime.now().isoformat()
-                with open(self.stats_file, "w") as f:
-                    json.dump(stats, f, indent=2)
+                seq = self.event_log.seq
+                temp_file = self.stats_file.with_suffix(".json.tmp")
+                with open(temp_file, "w") as f:
+                    json.dump({"seq": seq, "statistics": stats, "aggregates": aggregates or {}}, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.stats_file)
+                self.snapshot_seq = seq
+                # Events up to seq are in the snapshot; if we crash before this, replay skips them
+                self.event_log.truncate()
         except Exception as e:
             print(f"[StatisticsRepository] Error saving statistics: {e}")
 
+    def close(self):
+        self.event_log.close()
+
     def _default_statistics(self) -> Dict[str, Any]:
         return {
             "generator": {
@@ -1,12 +1,13 @@
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 class StatisticsService:
     """Service to handle business logic for glue spray statistics."""
 
-    def update_component_state(self, statistics: Dict[str, Any], component: str, new_state: str, count_type: str):
-        ts = datetime.now()
+    def update_component_state(self, statistics: Dict[str, Any], component: str, new_state: str, count_type: str,
+                               timestamp: Optional[datetime] = None):
+        ts = timestamp or datetime.now()
 
         # Handle nested paths like "motors.1"
         if "." in component:
@@ -48,10 +49,11 @@ class StatisticsService:
 
         return statistics
 
-    def reset_statistics(self, statistics: Dict[str, Any], default_statistics: Dict[str, Any]):
+    def reset_statistics(self, statistics: Dict[str, Any], default_statistics: Dict[str, Any],
+                         timestamp: Optional[datetime] = None):
         statistics.clear()
         statistics.update(default_statistics)
-        statistics["system"]["session_start"] = datetime.now().isoformat()
+        statistics["system"]["session_start"] = (timestamp or datetime.now()).isoformat()
         return statistics
 
     def reset_component(self, statistics: Dict[str, Any], default_statistics: Dict[str, Any], component: str):
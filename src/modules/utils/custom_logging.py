@@ -1,9 +1,40 @@
+"""
+Logging helpers shared by the robot, vision, calibration and glue process code.
+
+Loggers created by ``setup_logger`` do not write to the console on the calling thread: a
+``QueueHandler`` hands the record to one background ``QueueListener`` that formats and
+writes it. Every helper checks ``enabled`` and the logger level before doing any work, and
+formatting is lazy - pass ``%``-style arguments (or a callable returning the message)
+instead of an f-string so disabled messages cost only the level check. The caller's
+function/line are resolved with ``stacklevel``.
+
+Each call site is rate limited (token bucket); the next message that gets through reports
+how many were suppressed. ERROR and CRITICAL records are never rate limited. Messages logged with ``broadcast_to_ui`` are collected as
+structured records and published to the UI in sampled batches (``UiLogSampler``) instead of
+one broker message per log line.
+"""
+import atexit
+import datetime
+import functools
+import inspect
 import logging
+import queue
+import threading
+import time
+from collections import deque
 from enum import Enum
+from logging.handlers import QueueHandler, QueueListener
+
 from modules.shared.MessageBroker import MessageBroker
-import functools
-import inspect
-import datetime
+
+# Per-call-site rate limit: sustained records/second and burst size
+DEFAULT_RATE_LIMIT = 50.0
+DEFAULT_RATE_BURST = 100
+# Records at or above this level bypass the rate limit
+DEFAULT_RATE_BYPASS_LEVEL = logging.ERROR
+# UI sampling: at most UI_MAX_RECORDS records per topic every UI_FLUSH_INTERVAL seconds
+UI_FLUSH_INTERVAL = 0.25
+UI_MAX_RECORDS = 20
 
 class LoggingLevel(Enum):
     DEBUG = logging.DEBUG
@@ -26,6 +57,8 @@ class ColoredFormatter(logging.Formatter):
     }
 
     def format(self, record):
+        # Colour a copy: the record is shared with the other listener handlers
+        record = logging.makeLogRecord(record.__dict__)
         # Add color to the log level
         log_color = self.COLORS.get(record.levelname, self.COLORS['RESET'])
         reset_color = self.COLORS['RESET']
@@ -38,7 +71,6 @@ class ColoredFormatter(logging.Formatter):
 
     def formatTime(self, record, datefmt=None):
         """Override to add milliseconds support"""
-        import datetime
         ct = datetime.datetime.fromtimestamp(record.created)
         if datefmt:
             # Custom handling for milliseconds
@@ -53,55 +85,134 @@ class ColoredFormatter(logging.Formatter):
             s = ct.strftime('%H:%M:%S.') + ct.strftime('%f')[:-3]
         return s
 
-class LoggerContext:
-    def __init__(self,enabled:bool,logger:logging.Logger,broadcast_to_ui:bool=False,topic="log"):
-        self.enabled=enabled
-        self.logger=logger
-        self.broadcast_to_ui = broadcast_to_ui
-        self.topic = topic
 
-def log_warning_message(logger_context:LoggerContext, message:str):
-    log_if_enabled(enabled=logger_context.enabled,
-                   logger=logger_context.logger,
-                   message=message,
-                   level=LoggingLevel.WARNING,
-                   broadcast_to_ui=logger_context.broadcast_to_ui,
-                   topic=logger_context.topic)
-
-def log_info_message(logger_context:LoggerContext, message:str):
-    log_if_enabled(enabled=logger_context.enabled,
-                   logger=logger_context.logger,
-                   message=message,
-                   level=LoggingLevel.INFO,
-                   broadcast_to_ui=logger_context.broadcast_to_ui,
-                   topic=logger_context.topic)
-
-def log_debug_message(logger_context:LoggerContext, message:str):
-    log_if_enabled(enabled=logger_context.enabled,
-                   logger=logger_context.logger,
-                   message=message,
-                   level=LoggingLevel.DEBUG,
-                   broadcast_to_ui=logger_context.broadcast_to_ui,
-                   topic=logger_context.topic)
-
-def log_error_message(logger_context:LoggerContext, message:str):
-    log_if_enabled(enabled=logger_context.enabled,
-                   logger=logger_context.logger,
-                   message=message,
-                   level=LoggingLevel.ERROR,
-                   broadcast_to_ui=logger_context.broadcast_to_ui,
-                   topic=logger_context.topic)
-
-def setup_logger(name:str):
-    """Setup a specialized logger for RobotWrapper operations"""
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+class CallSiteRateLimiter(logging.Filter):
+    """
+    Token bucket per call site (file, line): sustained ``rate`` records/second with bursts
+    of up to ``burst``. The first record let through after a suppression notes how many
+    records of that call site were dropped. Records at or above ``bypass_level`` always pass
+    and do not use up the call site's budget, so a repeating fault cannot hide an error.
+    """
 
-    # Remove existing handlers to avoid duplicates
-    for handler in logger.handlers[:]:
-        logger.removeHandler(handler)
+    def __init__(self, rate=DEFAULT_RATE_LIMIT, burst=DEFAULT_RATE_BURST, bypass_level=DEFAULT_RATE_BYPASS_LEVEL):
+        super().__init__()
+        self.rate = rate
+        self.burst = burst
+        self.bypass_level = bypass_level
+        self._sites = {}  # (pathname, lineno) -> [tokens, last_refill, suppressed]
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if self.bypass_level is not None and record.levelno >= self.bypass_level:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None:
+                site = self._sites[key] = [float(self.burst), now, 0]
+            site[0] = min(self.burst, site[0] + (now - site[1]) * self.rate)
+            site[1] = now
+            if site[0] < 1.0:
+                site[2] += 1
+                return False
+            site[0] -= 1.0
+            suppressed, site[2] = site[2], 0
+        if suppressed:
+            record.msg = f"{record.getMessage()} ({suppressed} similar messages suppressed)"
+            record.args = None
+        return True
+
+
+class _LogQueueHandler(QueueHandler):
+    """Resolves the message on the calling thread; full formatting happens on the listener."""
+
+    def prepare(self, record):
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class UiLogSampler(logging.Handler):
+    """
+    Publishes records tagged with a ``ui_topic`` to the MessageBroker in batches.
 
-    # Create console handler with custom formatter
+    Every ``interval`` seconds each topic receives
+    ``{"records": [...], "dropped": n}`` with at most ``max_records`` of the newest
+    structured records (timestamp, level, logger, function, line, message); older records of
+    the interval are counted in ``dropped``.
+    """
+
+    def __init__(self, interval=UI_FLUSH_INTERVAL, max_records=UI_MAX_RECORDS):
+        super().__init__()
+        self.interval = interval
+        self.max_records = max_records
+        self._pending = {}  # topic -> deque of structured records
+        self._dropped = {}
+        self._pending_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def to_structured(record):
+        return {
+            "timestamp": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+
+    def emit(self, record):
+        topic = getattr(record, "ui_topic", None)
+        if topic is None:
+            return
+        with self._pending_lock:
+            records = self._pending.get(topic)
+            if records is None:
+                records = self._pending[topic] = deque(maxlen=self.max_records)
+            if len(records) == self.max_records:
+                self._dropped[topic] = self._dropped.get(topic, 0) + 1
+            records.append(self.to_structured(record))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="UiLogSampler", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            dropped, self._dropped = self._dropped, {}
+        if not pending:
+            return
+        broker = MessageBroker()
+        for topic, records in pending.items():
+            try:
+                broker.publish(topic, {"records": list(records), "dropped": dropped.get(topic, 0)})
+            except Exception as e:
+                print(f"[UiLogSampler] Error publishing logs to '{topic}': {e}")
+
+    def close(self):
+        self._stop.set()
+        self.flush()
+        super().close()
+
+
+_log_queue = queue.SimpleQueue()
+_listener = None
+_listener_lock = threading.Lock()
+ui_log_sampler = UiLogSampler()
+
+
+def _create_console_handler():
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG)
 
@@ -111,54 +222,137 @@ def setup_logger(name:str):
         datefmt='%H:%M:%S.%f'
     )
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    return console_handler
 
-    # Prevent propagation to avoid duplicate messages
-    logger.propagate = False
 
-    return logger
+def _ensure_listener():
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = QueueListener(_log_queue, _create_console_handler(), ui_log_sampler,
+                                      respect_handler_level=True)
+            _listener.start()
 
-def log_if_enabled(enabled, logger, level, message, broadcast_to_ui=False, topic="log"):
-    """Helper function to log only if logging is enabled"""
-    if enabled and logger:
 
-        if broadcast_to_ui:
-            broker = MessageBroker()
-            broker.publish(topic, message)
+def flush_logging():
+    """Block until every record queued so far has been written."""
+    stop_logging()
+    _ensure_listener()
 
-        import inspect
-        # Get the calling function's name
-        caller_frame = inspect.currentframe().f_back
-        caller_name = caller_frame.f_code.co_name
 
-        # Convert LoggingLevel enum to string if necessary
-        if isinstance(level, LoggingLevel):
-            level_name = level.name.lower()
-        elif isinstance(level, str):
-            level_name = level.lower()
-        else:
-            # Fallback to info if level is invalid
-            level_name = 'info'
+def stop_logging():
+    """Write out every queued record and stop the background writer."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+    ui_log_sampler.flush()
 
-        # Create a temporary log record with the caller's function name
-        log_method = getattr(logger, level_name)
 
-        # Temporarily modify the logger to show the actual caller
-        original_findCaller = logger.findCaller
+atexit.register(stop_logging)
 
-        def mock_findCaller(stack_info=False, stacklevel=1):
-            # Return the caller's info instead of log_if_enabled
-            return (caller_frame.f_code.co_filename, caller_frame.f_lineno, caller_name, None)
 
-        logger.findCaller = mock_findCaller
-        try:
-            log_method(message)
-        finally:
-            # Restore original findCaller
-            logger.findCaller = original_findCaller
+class LoggerContext:
+    def __init__(self,enabled:bool,logger:logging.Logger,broadcast_to_ui:bool=False,topic="log"):
+        self.enabled=enabled
+        self.logger=logger
+        self.broadcast_to_ui = broadcast_to_ui
+        self.topic = topic
+
+    def is_enabled_for(self, level) -> bool:
+        """Cheap check for call sites that want to skip building expensive messages."""
+        return bool(self.enabled and self.logger and self.logger.isEnabledFor(_level_number(level)))
+
+
+def _level_number(level):
+    if isinstance(level, LoggingLevel):
+        return level.value
+    if isinstance(level, int):
+        return level
+    if isinstance(level, str) and level.upper() in LoggingLevel.__members__:
+        return LoggingLevel[level.upper()].value
+    # Fallback to info if level is invalid
+    return logging.INFO
+
+
+def _log(enabled, logger, level, message, args, broadcast_to_ui, topic):
+    """Shared implementation; stacklevel=3 reports the caller of the public helper."""
+    if not enabled or not logger:
+        return
+    level_number = _level_number(level)
+    if not logger.isEnabledFor(level_number):
+        return
+    if callable(message):
+        message = message()
+    extra = {"ui_topic": topic} if broadcast_to_ui else None
+    logger.log(level_number, message, *args, extra=extra, stacklevel=3)
+
+
+def log_warning_message(logger_context:LoggerContext, message, *args):
+    _log(logger_context.enabled, logger_context.logger, LoggingLevel.WARNING, message, args,
+         logger_context.broadcast_to_ui, logger_context.topic)
+
+def log_info_message(logger_context:LoggerContext, message, *args):
+    _log(logger_context.enabled, logger_context.logger, LoggingLevel.INFO, message, args,
+         logger_context.broadcast_to_ui, logger_context.topic)
+
+def log_debug_message(logger_context:LoggerContext, message, *args):
+    _log(logger_context.enabled, logger_context.logger, LoggingLevel.DEBUG, message, args,
+         logger_context.broadcast_to_ui, logger_context.topic)
+
+def log_error_message(logger_context:LoggerContext, message, *args):
+    _log(logger_context.enabled, logger_context.logger, LoggingLevel.ERROR, message, args,
+         logger_context.broadcast_to_ui, logger_context.topic)
+
+def setup_logger(name:str, rate_limit=DEFAULT_RATE_LIMIT, rate_burst=DEFAULT_RATE_BURST,
+                 rate_bypass_level=DEFAULT_RATE_BYPASS_LEVEL):
+    """
+    Setup a named logger that writes through the background queue listener.
+
+    Args:
+        name: Logger name.
+        rate_limit: Records/second allowed per call site (None disables rate limiting).
+        rate_burst: Burst size per call site.
+        rate_bypass_level: Records at or above this level are never rate limited (None: all are).
+    """
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+
+    # Remove existing handlers to avoid duplicates
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+
+    queue_handler = _LogQueueHandler(_log_queue)
+    if rate_limit is not None:
+        queue_handler.addFilter(CallSiteRateLimiter(rate_limit, rate_burst, rate_bypass_level))
+    logger.addHandler(queue_handler)
+    _ensure_listener()
+
+    # Prevent propagation to avoid duplicate messages
+    logger.propagate = False
+
+    return logger
+
+def log_if_enabled(enabled, logger, level, message, *args, broadcast_to_ui=False, topic="log"):
+    """Helper function to log only if logging is enabled (``message % args`` is built lazily)"""
+    _log(enabled, logger, level, message, args, broadcast_to_ui, topic)
+
+
+class _CallArguments:
+    """Renders the bound call arguments only if the record is actually formatted."""
 
+    __slots__ = ("signature", "args", "kwargs")
 
+    def __init__(self, signature, args, kwargs):
+        self.signature = signature
+        self.args = args
+        self.kwargs = kwargs
 
+    def __str__(self):
+        bound_args = self.signature.bind(*self.args, **self.kwargs)
+        bound_args.apply_defaults()
+        return ", ".join(f"{k}={v!r}" for k, v in bound_args.arguments.items())
 
 
 def log_calls_with_timestamp_decorator(logger=None, enabled=True):
@@ -167,31 +361,27 @@ def log_calls_with_timestamp_decorator(logger=None, enabled=True):
 
     Args:
         logger: Logger instance (must have .info/.debug/.error methods). If None, prints to console.
-        enabled: Toggle logging on/off.
+        enabled: Toggle logging on/off. Disabled decorators return the function unwrapped.
     """
 
     def decorator(func):
+        if not enabled:
+            return func
+        signature = inspect.signature(func)
+        qualname = func.__qualname__
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if enabled:
-                # Timestamp
+            if isinstance(logger, logging.Logger):
+                # The record carries the timestamp; arguments are rendered only if emitted
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("CALL %s(%s)", qualname, _CallArguments(signature, args, kwargs), stacklevel=2)
+            elif logger:
+                log_method = logger.debug if hasattr(logger, "debug") else logger.info
+                log_method(f"CALL {qualname}({_CallArguments(signature, args, kwargs)})")
+            else:
                 timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-
-                # Get function arguments
-                bound_args = inspect.signature(func).bind(*args, **kwargs)
-                bound_args.apply_defaults()
-                args_repr = ", ".join(f"{k}={v!r}" for k, v in bound_args.arguments.items())
-
-                # Log message
-                message = f"[{timestamp}] CALL {func.__qualname__}({args_repr})"
-
-                if logger:
-                    if hasattr(logger, "debug"):
-                        logger.debug(message)
-                    else:
-                        logger.info(message)
-                else:
-                    print(message)
+                print(f"[{timestamp}] CALL {qualname}({_CallArguments(signature, args, kwargs)})")
 
             return func(*args, **kwargs)
 
@@ -1,7 +1,70 @@
+import threading
+
+
 def write_to_debug_file(file_name,message):
     try:
 
         with open(file_name, "a") as _f:
             _f.write(message)
     except Exception as _e:
-        print(f"Error writing content {message} to file {file_name}: {_e}")
\ No newline at end of file
+        print(f"Error writing content {message} to file {file_name}: {_e}")
+
+
+class BufferedDebugWriter:
+    """
+    Appends debug lines to a file from a background thread.
+
+    ``write`` only queues the message, so time-critical loops never block on file I/O. The
+    file is opened once and the queue is flushed every ``flush_interval`` seconds and on
+    ``close``. When more than ``max_pending`` messages are waiting, new ones are dropped and
+    counted in ``dropped``.
+    """
+
+    def __init__(self, file_name, flush_interval=0.5, max_pending=100000):
+        self.file_name = file_name
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending = []
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="BufferedDebugWriter", daemon=True)
+        self._thread.start()
+
+    def write(self, message):
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return
+            self._pending.append(message)
+
+    def _take(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+    def _run(self):
+        try:
+            _f = open(self.file_name, "a")
+        except Exception as _e:
+            print(f"Error opening debug file {self.file_name}: {_e}")
+            return
+        with _f:
+            while not self._stop_event.wait(self.flush_interval):
+                self._flush(_f)
+            self._flush(_f)
+
+    def _flush(self, _f):
+        pending = self._take()
+        if not pending:
+            return
+        try:
+            _f.writelines(pending)
+            _f.flush()
+        except Exception as _e:
+            print(f"Error writing {len(pending)} messages to file {self.file_name}: {_e}")
+
+    def close(self):
+        """Write everything still queued and stop the writer thread."""
+        self._stop_event.set()
+        self._thread.join()
@@ -0,0 +1,241 @@
+"""Array-native path interpolation.
+
+The list-based helpers in ``linear_interpolation`` / ``spline_interpolation`` walk the path
+point by point. The functions here work on ``(N, D)`` arrays instead:
+
+* linear densification builds every intermediate point of every segment in one pass
+  (``np.repeat`` / cumulative-count indexing, no per-point Python loop);
+* spline smoothing fits one parametric B-spline over the non-constant columns only
+  (rx / ry are usually constant and are copied through unchanged);
+* the batch entry points take several paths - e.g. every spray pattern of a workpiece -
+  and densify them all in a single vectorised call.
+"""
+from typing import Sequence, Union
+
+import numpy as np
+import numpy.typing as npt
+
+try:
+    from scipy.interpolate import make_splprep
+except ImportError:  # scipy < 1.15
+    make_splprep = None
+from scipy.interpolate import splev, splprep
+
+SpacingArg = Union[float, Sequence[float]]
+
+
+def _as_points(path) -> npt.NDArray:
+    points = np.asarray(path, dtype=np.float64)
+    if points.ndim != 2:
+        points = points.reshape(len(points), -1) if points.size else np.empty((0, 0))
+    return points
+
+
+def _per_path(value: SpacingArg, count: int, name: str) -> npt.NDArray:
+    """Broadcast a scalar or per-path sequence of parameters to shape (count,)."""
+    values = np.asarray(value, dtype=np.float64)
+    if values.ndim == 0:
+        return np.full(count, float(values))
+    if values.shape != (count,):
+        raise ValueError(f"{name} must be a scalar or have one value per path ({count}), got {values.shape}")
+    return values
+
+
+def segment_point_counts(points: npt.NDArray, target_spacing_mm: SpacingArg) -> npt.NDArray:
+    """Number of intermediate points inserted into each segment of *points*.
+
+    A segment only gets points when it is at least twice the target spacing (measured on
+    x, y, z); it then gets ``floor(length / spacing)`` evenly spaced intermediate points.
+    *target_spacing_mm* may be a scalar or one value per segment.
+    """
+    segments = np.diff(points[:, :3], axis=0)
+    lengths = np.sqrt(np.einsum("ij,ij->i", segments, segments))
+    spacing = np.broadcast_to(np.asarray(target_spacing_mm, dtype=np.float64), lengths.shape)
+    counts = np.floor(lengths / spacing).astype(np.int64)
+    counts[lengths < spacing * 2] = 0
+    return counts
+
+
+def _densify(points: npt.NDArray, counts: npt.NDArray) -> npt.NDArray:
+    """Emit each segment start followed by its *counts* intermediate points, then the last point."""
+    if len(points) < 2:
+        return points.copy()
+
+    emitted = counts + 1
+    total = int(emitted.sum())
+    segment = np.repeat(np.arange(len(counts)), emitted)
+    first = np.cumsum(emitted) - emitted
+    step = np.arange(total) - np.repeat(first, emitted)
+    t = step / (counts[segment] + 1)
+
+    start = points[segment]
+    dense = start + t[:, None] * (points[segment + 1] - start)
+    return np.concatenate((dense, points[-1:]))
+
+
+def densify_linear(path, target_spacing_mm: float) -> npt.NDArray:
+    """Insert linearly interpolated points so that long segments are ~target_spacing_mm apart.
+
+    Args:
+        path: (N, D) array or list of points, first three columns x, y, z.
+        target_spacing_mm: Target distance between consecutive points in mm.
+
+    Returns:
+        (M, D) array; original points are kept, paths with fewer than 2 points are returned as is.
+    """
+    points = _as_points(path)
+    if len(points) < 2:
+        return points.copy()
+    return _densify(points, segment_point_counts(points, target_spacing_mm))
+
+
+def densify_linear_batch(paths: Sequence, target_spacing_mm: SpacingArg) -> list[npt.NDArray]:
+    """Densify several paths in one vectorised pass.
+
+    All paths are concatenated; the pseudo-segments joining one path's last point to the next
+    path's first point get no intermediate points, so each output slice is exactly what
+    ``densify_linear`` returns for that path.
+
+    Args:
+        paths: Sequence of paths with the same point dimensionality.
+        target_spacing_mm: Scalar, or one spacing per path.
+
+    Returns:
+        List of (M_i, D) arrays, one per input path.
+    """
+    arrays = [_as_points(path) for path in paths]
+    if not arrays:
+        return []
+    non_empty = [a for a in arrays if len(a)]
+    if not non_empty:
+        return [a.copy() for a in arrays]
+    dims = {a.shape[1] for a in non_empty}
+    if len(dims) != 1:
+        raise ValueError(f"All paths must have the same point dimensionality, got {sorted(dims)}")
+
+    spacing = _per_path(target_spacing_mm, len(arrays), "target_spacing_mm")
+    lengths = np.array([len(a) for a in arrays])
+    points = np.concatenate(non_empty)
+    if len(points) < 2:
+        return [a.copy() for a in arrays]
+
+    # Segment i joins points[i] -> points[i + 1]; it belongs to the path owning points[i]
+    owner = np.repeat(np.arange(len(arrays)), lengths)[:-1]
+    counts = segment_point_counts(points, spacing[owner])
+    path_ends = np.cumsum(lengths)[lengths > 0] - 1
+    counts[path_ends[:-1]] = 0
+
+    dense = _densify(points, counts)
+
+    # Path k contributes its points plus the intermediate points of its own segments
+    added = np.bincount(owner, weights=counts, minlength=len(arrays)).astype(np.int64)
+    return np.split(dense, np.cumsum(lengths + added)[:-1])
+
+
+def _arc_length_parameter(points: npt.NDArray) -> tuple[npt.NDArray, float]:
+    segments = np.diff(points[:, :3], axis=0)
+    cumulative = np.concatenate(([0.0], np.cumsum(np.sqrt(np.einsum("ij,ij->i", segments, segments)))))
+    total = float(cumulative[-1])
+    return (cumulative / total if total > 0 else cumulative), total
+
+
+def _interp_columns(t: npt.NDArray, values: npt.NDArray, t_new: npt.NDArray) -> npt.NDArray:
+    """Piecewise linear interpolation of every column of *values* at *t_new* (t increasing)."""
+    right = np.clip(np.searchsorted(t, t_new, side="right"), 1, len(t) - 1)
+    left = right - 1
+    span = t[right] - t[left]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weight = np.where(span > 0, (t_new - t[left]) / span, 0.0)
+    return values[left] + weight[:, None] * (values[right] - values[left])
+
+
+def _fit_parametric(t: npt.NDArray, values: npt.NDArray, t_new: npt.NDArray, k: int, s: float) -> npt.NDArray:
+    """One B-spline curve through all columns of *values*; falls back to linear on failure."""
+    try:
+        if make_splprep is not None:
+            spline, _ = make_splprep(values.T, u=t, k=k, s=s)
+            return np.asarray(spline(t_new)).T
+        tck, _ = splprep(values.T, u=t, k=k, s=s)
+        return np.column_stack(splev(t_new, tck))
+    except Exception as e:
+        print(f"parametric spline fit failed, fallback to linear: {e}")
+        return _interp_columns(t, values, t_new)
+
+
+def smooth_spline(
+    path,
+    target_spacing_mm: float = 5.0,
+    k: int = 3,
+    smoothing_lambda: float = 0.0,
+) -> npt.NDArray:
+    """Smooth a path with a single parametric spline and resample it by arc length.
+
+    Columns that are constant along the path are not fitted; they are copied to the output.
+    The remaining columns share one arc-length parameterised B-spline. ``smoothing_lambda``
+    is the per-dimension residual budget of the per-dimension fit this replaces, so the
+    parametric fit gets ``smoothing_lambda * fitted_dims``.
+
+    Args:
+        path: (N, D) array or list of points, first three columns x, y, z.
+        target_spacing_mm: Desired spacing of the output points in mm.
+        k: Spline degree; paths with fewer than ``k + 1`` points are returned unchanged.
+        smoothing_lambda: 0.0 = interpolate every point; larger values smooth more.
+
+    Returns:
+        (M, D) array with ``M = max(2N, ceil(length / target_spacing_mm))``.
+    """
+    points = _as_points(path)
+    if len(points) < k + 1:
+        return points.copy()
+
+    # Repeated points give a zero-length step, which the spline parameter cannot represent
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.any(points[1:, :3] != points[:-1, :3], axis=1)
+    fitted = points[keep]
+
+    t, total_length = _arc_length_parameter(fitted)
+    if total_length <= 0:
+        return points.copy()
+
+    total_points = max(len(points) * 2, int(np.ceil(total_length / target_spacing_mm)))
+    t_new = np.linspace(0.0, 1.0, total_points)
+
+    result = np.empty((total_points, points.shape[1]))
+    active = np.ptp(fitted, axis=0) > 0
+    result[:, ~active] = fitted[0, ~active]
+    if len(fitted) < k + 1:
+        result[:, active] = _interp_columns(t, fitted[:, active], t_new)
+    else:
+        s = smoothing_lambda * int(active.sum())
+        result[:, active] = _fit_parametric(t, fitted[:, active], t_new, k, s)
+    return result
+
+
+def interpolate_paths_two_stage(
+    paths: Sequence,
+    adaptive_spacing_mm: SpacingArg,
+    spline_density_multiplier: SpacingArg = 2.0,
+    smoothing_lambda: SpacingArg = 0.0,
+) -> list[tuple[npt.NDArray, npt.NDArray]]:
+    """Two-stage interpolation of a batch of paths.
+
+    Stage 1 densifies all paths in one vectorised pass; stage 2 fits one parametric spline
+    per path (paths under 4 dense points skip it). Every parameter may be a scalar or one
+    value per path.
+
+    Returns:
+        One ``(dense_linear, smoothed)`` pair of arrays per input path.
+    """
+    spacing = _per_path(adaptive_spacing_mm, len(paths), "adaptive_spacing_mm")
+    multiplier = _per_path(spline_density_multiplier, len(paths), "spline_density_multiplier")
+    lambdas = _per_path(smoothing_lambda, len(paths), "smoothing_lambda")
+
+    results = []
+    for i, dense in enumerate(densify_linear_batch(paths, spacing)):
+        if len(dense) < 4:
+            results.append((dense, dense))
+            continue
+        smoothed = smooth_spline(dense, target_spacing_mm=spacing[i] / multiplier[i], k=3,
+                                 smoothing_lambda=lambdas[i])
+        results.append((dense, smoothed))
+    return results
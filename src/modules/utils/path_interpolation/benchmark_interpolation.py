@@ -0,0 +1,235 @@
+"""
+Benchmark: batched array interpolation vs. the point-by-point list implementation.
+
+The point-by-point implementations live here as the reference the batched path is checked
+against (tests/utils/test_path_interpolation.py); production code only uses the batched path.
+
+Run from the src directory:
+    python -m modules.utils.path_interpolation.benchmark_interpolation
+"""
+import contextlib
+import io
+import time
+
+import numpy as np
+import numpy.typing as npt
+from scipy.interpolate import UnivariateSpline
+
+from modules.utils.path_interpolation import batched_interpolation
+
+POINT_COUNTS = [10, 100, 1000, 10000]
+ADAPTIVE_SPACING_MM = 2.0
+SPLINE_DENSITY_MULTIPLIER = 2.0
+BATCH_SIZE = 8
+
+
+# ----------------- Point-by-point reference implementations ----------------- #
+def _lerp_points(start: npt.NDArray, end: npt.NDArray, num_points: int) -> list[list[float]]:
+    """Generate *num_points* evenly spaced points between start and end (exclusive of both)."""
+    points = []
+    for j in range(1, num_points + 1):
+        t = j / (num_points + 1)
+        point = start + t * (end - start)
+        points.append(point.tolist())
+    return points
+
+def _interpolate_segment_adaptive(start: npt.NDArray, end: npt.NDArray, target_spacing_mm: float) -> tuple[list[list[float]], bool]:
+    """Interpolate a single segment using adaptive spacing.
+
+    Returns (intermediate_points, was_interpolated).
+    If the segment is too short (< 2x target spacing), no points are added.
+    """
+    segment_length = np.linalg.norm(end[:3] - start[:3])
+
+    # Only interpolate if segment is at least 2x the target spacing.
+    # This ensures at least 2 evenly spaced intervals (start -> mid -> end).
+    # Example: spacing=50mm, segment=70mm would create uneven 50mm+20mm — better to skip.
+    if segment_length < (target_spacing_mm * 2):
+        return [], False
+
+    num_intermediate = int(np.floor(segment_length / target_spacing_mm))
+    return _lerp_points(start, end, num_intermediate), True
+
+
+def interpolate_path_linear_pointwise(path: list[list[float]], target_spacing_mm: float) -> list[list[float]]:
+    """Point-by-point reference implementation of :func:`linear_interpolation.interpolate_path_linear`."""
+    if len(path) < 2:
+        return path
+
+    path_array = np.array(path)
+    interpolated_path = []
+    for i in range(len(path) - 1):
+        start = path_array[i]
+        end = path_array[i + 1]
+        interpolated_path.append(start.tolist())
+        points, _ = _interpolate_segment_adaptive(start, end, target_spacing_mm)
+        interpolated_path.extend(points)
+    interpolated_path.append(path_array[-1].tolist())
+    return interpolated_path
+
+
+def _compute_arc_length_parameterization(path_array: npt.NDArray) -> tuple[npt.NDArray, float]:
+    """Compute a normalized arc-length parameter for each point in the path.
+
+    Arc-length parameterization maps each point to a value in [0, 1] based on
+    its cumulative distance along the path (using only x, y, z coordinates).
+    This avoids distortions that occur when parameterizing by point index,
+    especially when segments have very different lengths.
+
+    Args:
+        path_array: Array of shape (N, D) where the first 3 columns are x, y, z.
+
+    Returns:
+        t: Normalized parameter array of shape (N,) with values in [0, 1].
+        total_length: Total arc length of the path in mm.
+    """
+    diffs = np.diff(path_array[:, :3], axis=0)
+    segment_lengths = np.linalg.norm(diffs, axis=1)
+    cumulative_length = np.concatenate([[0], np.cumsum(segment_lengths)])
+
+    total_length = float(cumulative_length[-1])
+    t = cumulative_length / total_length
+
+    return t, total_length
+
+
+def _compute_sample_count(n_original: int, total_length: float, target_spacing_mm: float) -> int:
+    """Decide how many output points the spline should be sampled at.
+
+    Uses whichever is larger:
+      - twice the original point count (guarantees the spline is at least as
+        dense as the input), or
+      - the number of evenly spaced samples needed to achieve
+        *target_spacing_mm* along the path.
+
+    Args:
+        n_original: Number of points in the input path.
+        total_length: Total arc length of the path in mm.
+        target_spacing_mm: Desired spacing between output points in mm.
+
+    Returns:
+        The number of sample points for the output spline.
+    """
+    return max(n_original * 2, int(np.ceil(total_length / target_spacing_mm)))
+
+
+def _fit_spline_dimension(
+    t: npt.NDArray,
+    values: npt.NDArray,
+    t_new: npt.NDArray,
+    k: int,
+    smoothing_lambda: float,
+    dim_index: int,
+) -> npt.NDArray:
+    """Fit a univariate spline to one dimension and evaluate at new parameters.
+
+    If the spline fit fails (e.g., due to numerical issues), falls back to
+    simple linear interpolation so the pipeline never crashes.
+
+    Args:
+        t: Normalized arc-length parameters for the input points, shape (N,).
+        values: Coordinate values for this dimension, shape (N,).
+        t_new: Parameters at which to evaluate the spline, shape (M,).
+        k: Degree of the spline (1=linear, 2=quadratic, 3=cubic).
+        smoothing_lambda: Smoothing factor passed to ``UnivariateSpline(s=...)``.
+            0.0 means exact interpolation (passes through every point);
+            larger values allow the spline to deviate for a smoother result.
+        dim_index: Index of the dimension (used only for the warning message).
+
+    Returns:
+        Interpolated values at *t_new*, shape (M,).
+    """
+    try:
+        spline = UnivariateSpline(t, values, k=k, s=smoothing_lambda)
+        return spline(t_new)
+    except Exception as e:
+        print(f"spline dim {dim_index} failed, fallback to linear: {e}")
+        return np.interp(t_new, t, values)
+
+
+def interpolate_path_spline_per_dimension(
+    path: list[list[float]],
+    target_spacing_mm: float = 5.0,
+    k: int = 3,
+    smoothing_lambda: float = 0.0,
+) -> list[list[float]]:
+    """Per-dimension ``UnivariateSpline`` reference implementation of :func:`spline_interpolation.interpolate_path_spline_with_lambda`."""
+    if len(path) < k + 1:
+        return path
+
+    path_array = np.array(path)
+
+    t, total_length = _compute_arc_length_parameterization(path_array)
+    if total_length <= 0:
+        return path
+
+    total_points = _compute_sample_count(len(path), total_length, target_spacing_mm)
+    t_new = np.linspace(0, 1, total_points)
+
+    interpolated_dims = []
+    for dim in range(path_array.shape[1]):
+        interpolated_dims.append(
+            _fit_spline_dimension(t, path_array[:, dim], t_new, k, smoothing_lambda, dim)
+        )
+
+    return np.column_stack(interpolated_dims).tolist()
+
+
+def _contour_path(n_points, radius=150.0, z=-150.0, seed=0):
+    """Closed, wobbly tool path of n_points [x, y, z, rx, ry, rz] points (constant rx/ry)."""
+    rng = np.random.default_rng(seed)
+    angles = np.linspace(0, 2 * np.pi, n_points)
+    r = radius * (1 + 0.1 * np.sin(5 * angles)) + rng.normal(0, 0.2, n_points)
+    points = np.zeros((n_points, 6))
+    points[:, 0] = r * np.cos(angles)
+    points[:, 1] = r * np.sin(angles)
+    points[:, 2] = z
+    points[:, 3] = 180.0
+    points[:, 5] = np.degrees(angles) % 360
+    return points.tolist()
+
+
+def _legacy_two_stage(path):
+    dense = interpolate_path_linear_pointwise(path, ADAPTIVE_SPACING_MM)
+    if len(dense) < 4:
+        return dense, dense
+    return dense, interpolate_path_spline_per_dimension(
+        dense, target_spacing_mm=ADAPTIVE_SPACING_MM / SPLINE_DENSITY_MULTIPLIER)
+
+
+def _time(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = fn()
+    return result, (time.perf_counter() - start) / repeats * 1000
+
+
+def run_benchmark(repeats=3):
+    rows = []
+    for n_points in POINT_COUNTS:
+        paths = [_contour_path(n_points, seed=seed) for seed in range(BATCH_SIZE)]
+
+        legacy, legacy_ms = _time(lambda: [_legacy_two_stage(path) for path in paths], repeats)
+        batched, batched_ms = _time(
+            lambda: batched_interpolation.interpolate_paths_two_stage(
+                paths, ADAPTIVE_SPACING_MM, SPLINE_DENSITY_MULTIPLIER), repeats)
+
+        dense_points = sum(len(dense) for dense, _ in batched)
+        max_error = max(float(np.max(np.abs(np.asarray(old) - new)))
+                        for (_, old), (_, new) in zip(legacy, batched))
+        rows.append((n_points, dense_points, legacy_ms, batched_ms, max_error))
+    return rows
+
+
+def main():
+    print(f"Batch of {BATCH_SIZE} paths, spacing {ADAPTIVE_SPACING_MM} mm, "
+          f"spline density {SPLINE_DENSITY_MULTIPLIER}x")
+    print(f"{'points/path':>12}{'dense pts':>11} | {'legacy ms':>10} | {'batched ms':>10}{'speedup':>9}{'max |err|':>11}")
+    for n_points, dense_points, legacy_ms, batched_ms, max_error in run_benchmark():
+        print(f"{n_points:>12}{dense_points:>11} | {legacy_ms:>10.1f} | {batched_ms:>10.1f}"
+              f"{legacy_ms / batched_ms:>8.1f}x{max_error:>11.2e}")
+
+
+if __name__ == "__main__":
+    main()
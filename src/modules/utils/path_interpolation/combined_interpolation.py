@@ -1,19 +1,23 @@
-from modules.utils.path_interpolation.linear_interpolation import interpolate_path_linear
-from modules.utils.path_interpolation.spline_interpolation import interpolate_path_spline_with_lambda
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from modules.utils.path_interpolation import batched_interpolation
 
 
 def _stage_linear_densification(
-    path: list[list[float]],
+    path: npt.NDArray,
     adaptive_spacing_mm: float,
     debug: bool,
-) -> list[list[float]]:
+) -> npt.NDArray:
     """Stage 1: Densify the path by inserting linearly interpolated points.
 
     Adds intermediate points between each pair of original vertices so that
     the subsequent spline stage has enough data to produce a smooth curve.
 
     Args:
-        path: Original sparse path (list of [x, y, z, rx, ry, rz] points).
+        path: Original sparse path, (N, D) array of [x, y, z, rx, ry, rz] points.
         adaptive_spacing_mm: Target distance between consecutive points in mm.
         debug: If True, print progress information.
 
@@ -24,7 +28,7 @@ def _stage_linear_densification(
     if debug:
         print(f"Stage 1: Linear densification from {len(path)} points...")
 
-    dense = interpolate_path_linear(path, target_spacing_mm=adaptive_spacing_mm, debug=debug)
+    dense = batched_interpolation.densify_linear(path, adaptive_spacing_mm)
 
     if debug:
         print(f"  -> {len(dense)} dense points")
@@ -33,16 +37,16 @@ def _stage_linear_densification(
 
 
 def _stage_spline_smoothing(
-    dense_path: list[list[float]],
+    dense_path: npt.NDArray,
     adaptive_spacing_mm: float,
     spline_density_multiplier: float,
     smoothing_lambda: float,
     debug: bool,
-) -> list[list[float]]:
+) -> npt.NDArray:
     """Stage 2: Smooth the densified path with a cubic spline.
 
-    Fits independent univariate splines per dimension and re-samples at a
-    finer spacing than the linear stage (controlled by
+    Fits one parametric spline over the non-constant dimensions and re-samples
+    at a finer spacing than the linear stage (controlled by
     *spline_density_multiplier*).
 
     Args:
@@ -52,7 +56,7 @@ def _stage_spline_smoothing(
         spline_density_multiplier: The spline output spacing is
             ``adaptive_spacing_mm / spline_density_multiplier``.  Higher values
             produce denser, smoother output.
-        smoothing_lambda: Smoothing factor for ``UnivariateSpline(s=...)``.
+        smoothing_lambda: Smoothing factor per fitted dimension.
             0.0 = exact interpolation; larger values allow deviation for
             smoother results.
         debug: If True, print progress information.
@@ -64,7 +68,7 @@ def _stage_spline_smoothing(
         print(f"Stage 2: Spline smoothing (density multiplier: {spline_density_multiplier}x, lambda={smoothing_lambda})...")
 
     spline_spacing = adaptive_spacing_mm / spline_density_multiplier
-    smoothed = interpolate_path_spline_with_lambda(
+    smoothed = batched_interpolation.smooth_spline(
         dense_path,
         target_spacing_mm=spline_spacing,
         k=3,
@@ -111,15 +115,44 @@ def interpolate_path_two_stage(
     if len(path) < 2:
         return path, path
 
-    dense_linear = _stage_linear_densification(path, adaptive_spacing_mm, debug)
+    dense_linear = _stage_linear_densification(np.asarray(path, dtype=np.float64), adaptive_spacing_mm, debug)
 
     if len(dense_linear) < 4:
         if debug:
             print(f"  -> Skipping spline stage (need >= 4 points, have {len(dense_linear)})")
-        return dense_linear, dense_linear
+        dense_list = dense_linear.tolist()
+        return dense_list, dense_list
 
     smoothed = _stage_spline_smoothing(
         dense_linear, adaptive_spacing_mm, spline_density_multiplier, smoothing_lambda, debug
     )
 
-    return dense_linear, smoothed
\ No newline at end of file
+    return dense_linear.tolist(), smoothed.tolist()
+
+
+def interpolate_paths_two_stage(
+    paths: Sequence[list[list[float]]],
+    adaptive_spacing_mm: float | Sequence[float],
+    spline_density_multiplier: float | Sequence[float] = 2.0,
+    smoothing_lambda: float | Sequence[float] = 0.0,
+    debug: bool = False,
+) -> list[tuple[list[list[float]], list[list[float]]]]:
+    """Two-stage interpolation of several paths (e.g. every spray pattern of a workpiece).
+
+    The linear stage densifies all paths in a single vectorised pass; see
+    :func:`interpolate_path_two_stage` for the per-path semantics. Each parameter may be a
+    scalar or one value per path.
+
+    Returns:
+        One ``(dense_linear, smoothed)`` pair of point lists per input path.
+    """
+    results = batched_interpolation.interpolate_paths_two_stage(
+        paths, adaptive_spacing_mm, spline_density_multiplier, smoothing_lambda
+    )
+    if debug:
+        for i, (path, (dense, smoothed)) in enumerate(zip(paths, results)):
+            print(f"Path {i + 1}: {len(path)} -> {len(dense)} dense -> {len(smoothed)} smooth points")
+
+    # Paths too short to interpolate are handed back untouched, as in the single-path version
+    return [(path, path) if len(path) < 2 else (dense.tolist(), smoothed.tolist())
+            for path, (dense, smoothed) in zip(paths, results)]
\ No newline at end of file
@@ -11,6 +11,10 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QFrame, Q
 
 from frontend.core.utils.IconLoader import LOGO
 from frontend.core.utils.IconLoader import CAMERA_PREVIEW_PLACEHOLDER
+from plugins.core.dashboard.ui.widgets.trail_renderer import TrailRenderer
+
+# Points kept in the trajectory history (the rendered trail itself is not limited)
+TRAIL_HISTORY = 2000
 
 
 class CompactTimeMetric(QWidget):
@@ -46,7 +50,8 @@ class CompactTimeMetric(QWidget):
 
 class TrajectoryManager:
     def __init__(self):
-        self.trajectory_points = deque()
+        self.trajectory_points = deque(maxlen=TRAIL_HISTORY)
+        self._new_points = deque(maxlen=TRAIL_HISTORY)  # not yet taken by the renderer
         self.current_position = None
         self.last_position = None
         self._lock = threading.Lock()  # Add thread lock for thread safety
@@ -85,9 +90,13 @@ class TrajectoryManager:
                     t = i / (num_interpolated + 1)
                     interp_x = int(start_x + t * (end_x - start_x))
                     interp_y = int(start_y + t * (end_y - start_y))
-                    self.trajectory_points.append((interp_x, interp_y, current_time, False))  # False = not a break
+                    self._append((interp_x, interp_y, current_time, False))  # False = not a break
+
+            self._append((end_x, end_y, current_time, False))  # False = not a break
 
-            self.trajectory_points.append((end_x, end_y, current_time, False))  # False = not a break
+    def _append(self, point):
+        self.trajectory_points.append(point)
+        self._new_points.append(point)
 
     def update_position(self, position):
         # If a trajectory break is pending, reset last position to avoid connecting
@@ -105,7 +114,7 @@ class TrajectoryManager:
         else:
             with self._lock:
                 is_break_start = self.last_position is None  # True if this is the start of a new segment
-                self.trajectory_points.append((*position, time.time(), is_break_start))
+                self._append((*position, time.time(), is_break_start))
     
     def break_trajectory(self):
         """Signal that the next position update should start a new trajectory segment"""
@@ -115,6 +124,7 @@ class TrajectoryManager:
     def clear_trail(self):
         with self._lock:
             self.trajectory_points.clear()
+            self._new_points.clear()
             self.current_position = None
             self.last_position = None
     
@@ -123,6 +133,13 @@ class TrajectoryManager:
         with self._lock:
             return list(self.trajectory_points)
 
+    def take_new_points(self):
+        """Thread-safe method to get the points added since the last call"""
+        with self._lock:
+            points = list(self._new_points)
+            self._new_points.clear()
+            return points
+
 
 
 
@@ -161,7 +178,7 @@ def draw_icon_at_position(icon, image, position):
         # print(f"Warning: Icon position out of bounds: ({x1}, {y1}) to ({x2}, {y2})")
 
 def draw_smooth_trail(image, trajectory_points_with_breaks):
-    """Draw trajectory trail respecting break markers"""
+    """Draw trajectory trail respecting break markers (full redraw; the widget uses TrailRenderer)"""
     if len(trajectory_points_with_breaks) < 2:
         return
 
@@ -288,6 +305,14 @@ class RobotTrajectoryWidget(QWidget):
         self.base_frame = None
         self.current_frame = None
         self.trajectory_manager = TrajectoryManager()
+        self.trail_renderer = TrailRenderer(
+            image_width, image_height,
+            color=self.trajectory_manager.trail_color[::-1],  # renderer works in RGB
+        )
+        # Broker callbacks run off the GUI thread; they only queue work for update_display
+        self._pending_base = None
+        self._trail_reset_pending = False
+        self.drawing_enabled = False
 
         self.init_ui()
 
@@ -296,7 +321,7 @@ class RobotTrajectoryWidget(QWidget):
 
         # Load placeholder image after UI is initialized
         self.load_placeholder_image()
-        self.drawing_enabled = False
+        self.update_display()
         # Timer to refresh display
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_display)
@@ -367,9 +392,7 @@ class RobotTrajectoryWidget(QWidget):
         try:
             placeholder_image = cv2.imread(CAMERA_PREVIEW_PLACEHOLDER)
             placeholder_image = cv2.resize(placeholder_image, (self.image_width, self.image_height))
-            self.base_frame = placeholder_image.copy()
-            self.current_frame = placeholder_image.copy()
-            self._update_label_from_frame()
+            self._set_base_frame(placeholder_image)
         except Exception as e:
             raise ValueError(f"Error loading placeholder image: {e}")
 
@@ -393,25 +416,28 @@ class RobotTrajectoryWidget(QWidget):
         if self.base_frame is None:
             return
 
-        self.current_frame = self.base_frame.copy()
-
-        # Use the thread-safe method to get trajectory points
-        trajectory_points_copy = self.trajectory_manager.get_trajectory_copy()
+        pending_base, self._pending_base = self._pending_base, None
+        if pending_base is not None:
+            self._trail_reset_pending = False
+            self.trail_renderer.set_base(pending_base)
+        elif self._trail_reset_pending:
+            self._trail_reset_pending = False
+            self.trail_renderer.clear()
 
+        # Only the points added since the last tick are rasterised; the overlay keeps the rest
         if self.drawing_enabled == True:
-            if trajectory_points_copy:
-                try:
-                    # Pass the trajectory points with break information directly
-                    draw_smooth_trail(image=self.current_frame, trajectory_points_with_breaks=trajectory_points_copy)
-                except (IndexError, ValueError):
-                    # Handle any remaining issues with point extraction
-                    pass
+            new_points = self.trajectory_manager.take_new_points()
+            if new_points:
+                self.trail_renderer.add_points(new_points)
+
+        self.current_frame, changed = self.trail_renderer.render(show_head=self.drawing_enabled)
 
         # if self.trajectory_manager.current_position is not None and self.trajectory_manager.show_current_point:
         #     draw_icon_at_position(self.logo_icon, self.current_frame,
         #                           self.trajectory_manager.current_position)
 
-        self._update_label_from_frame()
+        if changed:
+            self._update_label_from_frame()
         self.trajectory_manager.update_count += 1
 
         # Update time displays
@@ -422,9 +448,9 @@ class RobotTrajectoryWidget(QWidget):
         if self.current_frame is None:
             return
 
-        rgb_image = cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
-        q_image = QImage(rgb_image.data, w, h, ch * w, QImage.Format.Format_RGB888)
+        # current_frame is the renderer's RGB composite
+        h, w, ch = self.current_frame.shape
+        q_image = QImage(self.current_frame.data, w, h, ch * w, QImage.Format.Format_RGB888)
 
         pixmap = QPixmap.fromImage(q_image)
         self.image_label.setPixmap(pixmap)
@@ -437,6 +463,7 @@ class RobotTrajectoryWidget(QWidget):
         print("Stopping trajectory updates and clearing trail")
         self.drawing_enabled = False
         self.trajectory_manager.clear_trail()
+        self._trail_reset_pending = True
 
     def set_image(self, message=None):
         # print("Updating image from external source")
@@ -451,12 +478,17 @@ class RobotTrajectoryWidget(QWidget):
 
         try:
             frame = cv2.resize(frame, (self.image_width, self.image_height))
-            self.base_frame = frame.copy()
             self.trajectory_manager.clear_trail()
+            self._set_base_frame(frame)
         except Exception as e:
             print(f"Error setting image: {e}")
             self.load_placeholder_image()
 
+    def _set_base_frame(self, frame):
+        """Store the BGR frame and queue it for the renderer (converted to RGB once)"""
+        self.base_frame = frame.copy()
+        self._pending_base = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
     def get_image_dimensions(self):
         """Return the configured image dimensions"""
         return self.image_width, self.image_height
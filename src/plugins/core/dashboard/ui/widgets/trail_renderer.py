@@ -0,0 +1,151 @@
+"""
+Incremental trajectory trail renderer.
+
+The trail is rasterised once into a persistent overlay (colour layer + anti-aliased alpha
+mask); each new point only draws its own segment. The displayed frame is a persistent RGB
+composite of the base image and the overlay, re-blended only inside the rectangles the
+overlay changed. The highlighted head of the trail (last few points) is the only part drawn
+per frame, so the cost of a refresh does not depend on how long the trajectory is.
+
+Points are smoothed with a short moving average and decimated by distance: a point closer
+than ``min_distance`` pixels to the last drawn one does not produce a segment.
+"""
+from collections import deque
+
+import cv2
+import numpy as np
+
+HEAD_OUTER_COLOR = (255, 200, 255)  # RGB
+HEAD_INNER_COLOR = (255, 100, 255)
+
+
+class TrailRenderer:
+    """
+    Not thread-safe: feed and render it from one thread (the GUI thread in the widget).
+
+    Args:
+        width, height: Size of the rendered frame.
+        color: Trail colour (RGB).
+        thickness: Trail line thickness in pixels.
+        smoothing: Moving-average window (points) applied to incoming positions.
+        min_distance: Decimation distance in pixels.
+        head_points: Number of recent points drawn as the highlighted head.
+    """
+
+    HEAD_OUTER_THICKNESS = 6
+    HEAD_INNER_THICKNESS = 2
+
+    def __init__(self, width, height, color=(176, 39, 156), thickness=3, smoothing=3, min_distance=2.0,
+                 head_points=5):
+        self.width = width
+        self.height = height
+        self.color = tuple(int(c) for c in color)
+        self.thickness = thickness
+        self.min_distance = min_distance
+        self.overlay = np.zeros((height, width, 3), dtype=np.uint8)
+        self.alpha = np.zeros((height, width), dtype=np.uint8)
+        self.base = np.zeros((height, width, 3), dtype=np.uint8)
+        self.composite = self.base.copy()
+        self.version = 0  # incremented whenever the composite changes
+        self.segments_drawn = 0
+
+        self._window = deque(maxlen=max(1, smoothing))
+        self._last_drawn = None  # last smoothed point that ended a segment
+        self._head = deque(maxlen=max(2, head_points))
+        self._dirty = []  # (x0, y0, x1, y1) rectangles to re-blend
+        self._head_rect = None  # rectangle covered by the head drawn on the composite
+        self._replaced = True  # composite rebuilt since the last render()
+
+    # --- Input ---
+    def set_base(self, frame_rgb):
+        """Replace the background (RGB, width x height) and clear the trail."""
+        self.base = np.ascontiguousarray(frame_rgb)
+        self.clear()
+
+    def clear(self):
+        self.overlay[:] = 0
+        self.alpha[:] = 0
+        self.composite = self.base.copy()
+        self._window.clear()
+        self._head.clear()
+        self._last_drawn = None
+        self._dirty.clear()
+        self._head_rect = None
+        self._replaced = True
+
+    def add_points(self, points):
+        """Add (x, y[, timestamp, starts_segment]) points; starts_segment=True breaks the trail."""
+        for point in points:
+            if len(point) >= 4 and point[3]:
+                self._window.clear()
+                self._head.clear()
+                self._last_drawn = None
+            self._window.append((float(point[0]), float(point[1])))
+            smoothed = np.mean(self._window, axis=0)
+            smoothed = (int(smoothed[0]), int(smoothed[1]))
+
+            if self._last_drawn is None:
+                self._last_drawn = smoothed
+                self._head.append(smoothed)
+                continue
+            dx, dy = smoothed[0] - self._last_drawn[0], smoothed[1] - self._last_drawn[1]
+            if dx * dx + dy * dy < self.min_distance * self.min_distance:
+                continue
+            self._draw_segment(self._last_drawn, smoothed)
+            self._last_drawn = smoothed
+            self._head.append(smoothed)
+
+    def _draw_segment(self, p1, p2):
+        # Colour without AA (no dark fringes from the black overlay), coverage with AA
+        cv2.line(self.overlay, p1, p2, self.color, self.thickness + 2, lineType=cv2.LINE_8)
+        cv2.line(self.alpha, p1, p2, 255, self.thickness, lineType=cv2.LINE_AA)
+        self._dirty.append(self._rect(p1, p2, self.thickness + 2))
+        self.segments_drawn += 1
+
+    def _rect(self, p1, p2, margin):
+        x0 = max(min(p1[0], p2[0]) - margin, 0)
+        y0 = max(min(p1[1], p2[1]) - margin, 0)
+        x1 = min(max(p1[0], p2[0]) + margin + 1, self.width)
+        y1 = min(max(p1[1], p2[1]) + margin + 1, self.height)
+        return x0, y0, x1, y1
+
+    # --- Output ---
+    def render(self, show_head=True):
+        """
+        Bring the composite up to date and return it (RGB, owned by the renderer).
+
+        Returns:
+            tuple: (frame, changed) - changed is False when the frame is identical to the
+            previous call, so the caller can skip the display update.
+        """
+        rects = self._dirty
+        self._dirty = []
+        if self._head_rect is not None:
+            rects.append(self._head_rect)
+            self._head_rect = None
+        for rect in rects:
+            self._blend(rect)
+
+        if show_head and len(self._head) >= 2:
+            head = list(self._head)
+            for p1, p2 in zip(head[:-1], head[1:]):
+                cv2.line(self.composite, p1, p2, HEAD_OUTER_COLOR, self.HEAD_OUTER_THICKNESS, lineType=cv2.LINE_AA)
+                cv2.line(self.composite, p1, p2, HEAD_INNER_COLOR, self.HEAD_INNER_THICKNESS, lineType=cv2.LINE_AA)
+            xs, ys = [p[0] for p in head], [p[1] for p in head]
+            self._head_rect = self._rect((min(xs), min(ys)), (max(xs), max(ys)), self.HEAD_OUTER_THICKNESS)
+            rects.append(self._head_rect)
+
+        changed = bool(rects) or self._replaced
+        self._replaced = False
+        if changed:
+            self.version += 1
+        return self.composite, changed
+
+    def _blend(self, rect):
+        x0, y0, x1, y1 = rect
+        if x0 >= x1 or y0 >= y1:
+            return
+        alpha = self.alpha[y0:y1, x0:x1, None].astype(np.uint16)
+        base = self.base[y0:y1, x0:x1].astype(np.uint16)
+        overlay = self.overlay[y0:y1, x0:x1].astype(np.uint16)
+        self.composite[y0:y1, x0:x1] = ((base * (255 - alpha) + overlay * alpha + 127) // 255).astype(np.uint8)
@@ -0,0 +1,90 @@
+import pytest
+
+from communication_layer.api_gateway.dispatch.route_table import RouteTable
+
+
+def handler(name):
+    return lambda request, data, params: (name, params)
+
+
+@pytest.fixture
+def routes():
+    table = RouteTable("test")
+    table.add("/api/v1/robot/stop", handler("stop"))
+    table.add("robot/jog/{axis}/{direction}/{step}", handler("jog"))
+    table.add("robot/jog/home/{direction}/{step}", handler("jog_home"))
+    table.add("api/v1/robot/{rest*}", handler("robot"))
+    return table
+
+
+# ----------------- Matching ----------------- #
+def test_exact_route_is_a_direct_lookup(routes):
+    match = routes.match("/api/v1/robot/stop")
+    assert match.route.name == "/api/v1/robot/stop"
+    assert match.params == {}
+
+
+def test_parameters_are_extracted(routes):
+    match = routes.match("robot/jog/X/Minus/10")
+    assert routes.invoke(match, "robot/jog/X/Minus/10") == ("jog", {"axis": "X", "direction": "Minus", "step": "10"})
+
+
+def test_literal_beats_parameter_beats_catch_all(routes):
+    assert routes.match("robot/jog/home/Plus/5").route.name == "robot/jog/home/{direction}/{step}"
+    assert routes.match("robot/jog/Z/Plus/5").route.name == "robot/jog/{axis}/{direction}/{step}"
+    match = routes.match("/api/v1/robot/slots/0/pickup")
+    assert match.route.name == "api/v1/robot/{rest*}"
+    assert match.params == {"rest": "slots/0/pickup"}
+
+
+def test_unknown_paths_do_not_match(routes):
+    assert routes.match("robot/jog/X/Minus") is None
+    assert routes.match("/api/v1/camera/frame") is None
+
+
+# ----------------- Registration checks ----------------- #
+def test_ambiguous_routes_raise(routes):
+    with pytest.raises(ValueError, match="Ambiguous route"):
+        routes.add("/api/v1/robot/stop", handler("other"))
+    with pytest.raises(ValueError, match="Ambiguous route"):
+        routes.add("robot/jog/{a}/{b}/{c}", handler("other"))
+
+
+def test_alias_for_the_same_handler_is_allowed():
+    table = RouteTable()
+    shared = handler("settings")
+    table.add("settings/get", shared)
+    table.add("settings/get", shared)
+    assert len(table.routes) == 1
+
+
+def test_routes_rejected_by_include_fail_validation(routes):
+    gateway = RouteTable("gateway")
+    gateway.add("api/v1/settings/robot/{rest*}", handler("settings"))
+    rejected = gateway.include(routes, accept=lambda route: route.pattern.startswith("robot/"))
+    assert [r.name for r in rejected] == ["/api/v1/robot/stop", "api/v1/robot/{rest*}"]
+    assert gateway.match("robot/jog/X/Plus/1").route is routes.match("robot/jog/X/Plus/1").route
+
+    gateway.validate()
+    with pytest.raises(ValueError, match="Unreachable routes"):
+        gateway.validate(extra_unreachable=rejected)
+
+
+# ----------------- Metrics ----------------- #
+def test_invoke_records_calls_and_errors(routes):
+    def failing(request, data, params):
+        raise RuntimeError("boom")
+
+    routes.add("robot/fail", failing)
+    for _ in range(3):
+        routes.invoke(routes.match("robot/jog/X/Plus/1"), "robot/jog/X/Plus/1")
+    with pytest.raises(RuntimeError):
+        routes.invoke(routes.match("robot/fail"), "robot/fail")
+
+    stats = {row["route"]: row for row in routes.stats()}
+    assert stats["robot/jog/{axis}/{direction}/{step}"]["calls"] == 3
+    assert stats["robot/fail"]["errors"] == 1
+    assert routes.stats()[0]["route"] == "robot/jog/{axis}/{direction}/{step}"
+
+    routes.reset_stats()
+    assert all(row["calls"] == 0 for row in routes.stats())
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from modules.contour_matching.alignment.rotation_search import (
+    RotationSearchEngine,
+    find_best_rotation,
+    polar_signature,
+    rotate_points_batch,
+)
+from modules.shared.core.ContourStandartized import Contour
+from modules.utils.contours import calculate_mask_overlap
+
+
+def l_shape(cx=400, cy=300):
+    points = np.array([[0, 0], [200, 0], [200, 60], [60, 60], [60, 150], [0, 150]], dtype=np.float32)
+    return (points + [cx - 80, cy - 60]).astype(np.float32)
+
+
+def rotated_copy(points, angle):
+    contour = Contour(points.copy())
+    contour.rotate(angle, contour.getCentroid())
+    return contour.get()
+
+
+@pytest.mark.parametrize("true_angle", [0.0, 12.0, -45.0, 100.0, 179.0])
+def test_recovers_rotation(true_angle):
+    reference = l_shape()
+    workpiece = rotated_copy(reference, -true_angle)
+
+    best_rotation, best_overlap = find_best_rotation(workpiece, reference)
+
+    assert -180 <= best_rotation < 180
+    error = (best_rotation - true_angle + 180) % 360 - 180
+    assert abs(error) <= 1.0
+    assert best_overlap > 0.9
+
+
+def test_overlap_matches_mask_iou_inside_legacy_canvas():
+    reference = l_shape()
+    workpiece = rotated_copy(reference, -30.0)
+    engine = RotationSearchEngine()
+    engine.prepare(workpiece, reference)
+
+    for angle in (0.0, 15.0, 30.0):
+        legacy = calculate_mask_overlap(rotated_copy(workpiece, angle), reference)
+        assert engine.score([angle])[0] == pytest.approx(legacy, abs=0.02)
+
+
+def test_contours_outside_800x800_are_not_clipped():
+    reference = l_shape(cx=1100, cy=620)
+    workpiece = rotated_copy(reference, -20.0)
+
+    best_rotation, best_overlap = find_best_rotation(workpiece, reference)
+
+    assert abs(best_rotation - 20.0) <= 1.0
+    assert best_overlap > 0.9
+
+
+def test_zero_rotation_wins_ties():
+    square = np.array([[100, 100], [200, 100], [200, 200], [100, 200]], dtype=np.float32)
+    best_rotation, best_overlap = find_best_rotation(square, square)
+    assert best_rotation == 0.0
+    assert best_overlap == pytest.approx(1.0)
+
+
+def test_polar_signature_rotation_is_circular_shift():
+    reference = l_shape()
+    pivot = np.asarray(Contour(reference).getCentroid(), dtype=np.float64)
+    rotated = rotate_points_batch(reference.astype(np.float64), [90.0], pivot)[0]
+
+    base = polar_signature(reference.astype(np.float64), pivot, bins=360)
+    shifted = polar_signature(rotated, pivot, bins=360)
+    assert np.allclose(np.roll(base, 90), shifted, atol=1.5)
+
+
+def test_rotate_points_batch_matches_contour_rotate():
+    points = l_shape()
+    pivot = Contour(points).getCentroid()
+    batch = rotate_points_batch(points.astype(np.float64), [10.0, -70.0], pivot)
+    for angle, rotated in zip((10.0, -70.0), batch):
+        contour = Contour(points.copy())
+        contour.rotate(angle, pivot)
+        np.testing.assert_allclose(rotated, contour.get(), atol=1e-3)
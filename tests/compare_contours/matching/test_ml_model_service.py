@@ -0,0 +1,169 @@
+import os
+import time
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.neighbors import KNeighborsClassifier
+
+from modules.contour_matching.matching.ml_model_service import MLModelService, RESULT_SAME, SimilarityScores
+from modules.contour_matching.matching.strategies.ml_matching_strategy import MLMatchingStrategy
+from modules.shape_matching_training.utils.io_utils import predict_similarity
+from modules.shared.core.ContourStandartized import Contour
+
+
+class FakeWorkpiece:
+    def __init__(self, workpiece_id, contour):
+        self.workpieceId = workpiece_id
+        self.contour = contour
+
+    def get_main_contour(self):
+        return self.contour
+
+
+def rectangle(w, h, x=100, y=100):
+    return np.array([[[x, y]], [[x + w, y]], [[x + w, y + h]], [[x, y + h]], [[x, y]]], dtype=np.float32)
+
+
+SIZES = [(200, 100), (80, 80), (300, 60), (150, 150)]
+
+
+@pytest.fixture(scope="module")
+def model():
+    """Tiny classifier: same-size rectangle pairs are SAME, everything else DIFFERENT."""
+    service = MLModelService(model=object())
+    shapes = [rectangle(w, h, x=50 + 7 * i, y=40) for i, (w, h) in enumerate(SIZES)]
+    features = service.feature_matrix(shapes)
+    pairs, labels = [], []
+    for i, a in enumerate(features):
+        for j, b in enumerate(features):
+            pairs.append(np.concatenate((a, b)))
+            labels.append(int(i == j))
+    return KNeighborsClassifier(n_neighbors=1).fit(np.array(pairs), np.array(labels))
+
+
+def test_scores_match_pairwise_predict_similarity(model):
+    service = MLModelService(model=model)
+    workpieces = [rectangle(w, h) for w, h in SIZES]
+    contours = [rectangle(w, h, x=400, y=300) for w, h in reversed(SIZES)]
+
+    scores = service.score(contours, workpieces)
+
+    assert scores.shape == (len(contours), len(workpieces))
+    for row, contour in enumerate(contours):
+        for col, workpiece in enumerate(workpieces):
+            result, confidence, _ = predict_similarity(model, workpiece, contour)
+            assert scores.result_name(row, col) == result
+            assert scores.confidences[row, col] == pytest.approx(confidence)
+
+
+def test_features_are_cached_per_contour(model):
+    service = MLModelService(model=model)
+    store = service.feature_store
+    workpieces = [rectangle(w, h, x=1000, y=1000) for w, h in SIZES]
+    start = store.extractions
+
+    service.score([rectangle(200, 100, x=1300)], workpieces)
+    service.score([rectangle(200, 100, x=1300), rectangle(80, 80, x=1300)], workpieces)
+
+    # Workpieces go to the shared store, live contours only to the service's LRU
+    assert store.extractions - start == len(SIZES)
+    assert service.contour_extractions == 2
+
+
+def test_live_contour_cache_is_bounded(model):
+    service = MLModelService(model=model, contour_cache_size=2)
+    workpieces = [rectangle(w, h) for w, h in SIZES]
+    service.score(workpieces, workpieces)
+    store_size = len(service.feature_store)
+
+    for x in range(10):
+        service.score([rectangle(120, 90, x=3000 + x)], workpieces)
+
+    assert len(service._contour_features) == 2
+    assert len(service.feature_store) == store_size
+    service.score([rectangle(120, 90, x=3009)], workpieces)
+    assert service.contour_extractions == len(SIZES) + 10
+
+
+def test_workpiece_features_are_shared_with_predict_similarity(model):
+    service = MLModelService(model=model)
+    workpiece, contour = rectangle(150, 150, x=2000), rectangle(150, 150, x=2300)
+
+    service.score([contour], [workpiece])
+    start = service.feature_store.extractions
+    predict_similarity(model, workpiece, contour)
+
+    # predict_similarity only has to extract the live contour
+    assert service.feature_store.extractions == start + 1
+
+
+def test_assignment_is_global_not_greedy():
+    # Greedy row-by-row would give contour 0 workpiece 0 and leave contour 1 without a match
+    results = np.full((2, 2), RESULT_SAME)
+    results[1, 1] = 0
+    confidences = np.array([[0.99, 0.97], [0.98, 0.90]])
+
+    assignment = MLModelService.assign(SimilarityScores(results, confidences), max_per_workpiece=1)
+
+    assert assignment.tolist() == [1, 0]
+
+
+def test_assignment_leaves_contours_without_same_pairs_unassigned():
+    results = np.array([[RESULT_SAME, 0], [0, 0], [RESULT_SAME, 0]])
+    confidences = np.array([[0.97, 0.99], [0.99, 0.99], [0.99, 0.5]])
+
+    scores = SimilarityScores(results, confidences)
+    assert MLModelService.assign(scores, max_per_workpiece=1).tolist() == [-1, -1, 0]
+    assert MLModelService.assign(scores, max_per_workpiece=2).tolist() == [0, -1, 0]
+    assert MLModelService.assign(scores).tolist() == [0, -1, 0]
+
+
+def test_strategy_matches_each_contour_to_its_workpiece(model):
+    library = [FakeWorkpiece(i, rectangle(w, h)) for i, (w, h) in enumerate(SIZES)]
+    contours = [Contour(rectangle(w, h, x=500, y=350)) for w, h in (SIZES[2], SIZES[0])]
+
+    results = MLMatchingStrategy(model).find_best_matches(library, contours)
+
+    assert [r.workpiece_id for r in results] == [2, 0]
+    assert all(r.is_match and r.result == "SAME" for r in results)
+
+
+def test_identical_contours_all_match_the_same_workpiece(model):
+    library = [FakeWorkpiece(i, rectangle(w, h)) for i, (w, h) in enumerate(SIZES)]
+    contours = [Contour(rectangle(*SIZES[1], x=x, y=350)) for x in (300, 600)]
+
+    results = MLMatchingStrategy(model).find_best_matches(library, contours)
+
+    assert [r.workpiece_id for r in results] == [1, 1]
+    assert all(r.is_match and r.result == "SAME" for r in results)
+
+
+def test_model_reloaded_only_when_newest_file_changes(tmp_path, model):
+    first = tmp_path / "model_20240101_000000"
+    first.mkdir()
+    joblib.dump(model, first / "SGD_acc0.900.pkl")
+    service = MLModelService(model_dir=tmp_path)
+
+    loaded = service.get_model()
+    assert service.get_model() is loaded
+    assert service.model_loads == 1
+
+    newer = tmp_path / "model_20250101_000000"
+    newer.mkdir()
+    joblib.dump(model, newer / "SGD_acc0.950.pkl")
+    assert service.get_model() is not loaded
+    assert service.model_loads == 2
+
+    # Overwriting the newest file in place also triggers a reload
+    path = newer / "SGD_acc0.950.pkl"
+    stamp = time.time() + 10
+    joblib.dump(model, path)
+    os.utime(path, (stamp, stamp))
+    service.get_model()
+    assert service.model_loads == 3
+
+
+def test_missing_model_directory_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        MLModelService(model_dir=tmp_path / "missing").get_model()
@@ -0,0 +1,178 @@
+import numpy as np
+import pytest
+
+from modules.contour_matching.matching.strategies.geometric_matching_strategy import GeometricMatchingStrategy
+from modules.contour_matching.matching.workpiece_descriptor_index import WorkpieceDescriptorIndex
+from modules.shared.core.ContourStandartized import Contour
+
+
+class FakeWorkpiece:
+    def __init__(self, workpiece_id, contour):
+        self.workpieceId = workpiece_id
+        self.contour = contour
+
+    def get_main_contour(self):
+        return self.contour
+
+
+def rectangle(w, h, x=100, y=100):
+    # Closed like the camera contours handed to matching (first point repeated)
+    return np.array([[[x, y]], [[x + w, y]], [[x + w, y + h]], [[x, y + h]], [[x, y]]], dtype=np.float32)
+
+
+def brute_force_best(workpieces, contour, threshold):
+    """Reference: the original sequential area-ratio scan."""
+    import cv2
+    best, best_similarity = None, 0.0
+    area = cv2.contourArea(np.asarray(contour.get(), dtype=np.float32))
+    for wp in workpieces:
+        wp_area = cv2.contourArea(np.asarray(Contour(wp.get_main_contour()).get(), dtype=np.float32))
+        similarity = min(area, wp_area) / max(area, wp_area) * 100 if area > 0 and wp_area > 0 else 0
+        if similarity > threshold * 100 and similarity > best_similarity:
+            best, best_similarity = wp, similarity
+    return best, best_similarity
+
+
+@pytest.fixture
+def library():
+    rng = np.random.default_rng(3)
+    sizes = rng.uniform(20, 400, size=(200, 2))
+    return [FakeWorkpiece(i, rectangle(w, h)) for i, (w, h) in enumerate(sizes)]
+
+
+def test_area_candidates_only_return_passing_ratios(library):
+    index = WorkpieceDescriptorIndex()
+    index.build(library)
+    area = 150 * 120
+    candidates = index.area_candidates(area, 0.8)
+
+    ratios = np.minimum(index.areas, area) / np.maximum(index.areas, area)
+    assert set(candidates.tolist()) == set(np.flatnonzero(ratios > 0.8).tolist())
+    assert len(candidates) < len(library)
+
+
+def test_matches_sequential_scan(library):
+    index = WorkpieceDescriptorIndex()
+    index.build(library)
+    strategy = GeometricMatchingStrategy(similarity_threshold=0.8, descriptor_index=index, debug=False)
+
+    for w, h in [(150, 120), (30, 30), (390, 390), (1000, 1000)]:
+        contour = Contour(rectangle(w, h, x=400, y=300))
+        result = strategy.find_best_match(library, contour)
+        expected, expected_similarity = brute_force_best(library, contour, 0.8)
+        assert result.workpiece is expected
+        if expected is not None:
+            assert result.confidence == pytest.approx(expected_similarity)
+            assert result.result == "SAME"
+
+
+def test_only_given_workpieces_are_considered(library):
+    index = WorkpieceDescriptorIndex()
+    index.build(library)
+    strategy = GeometricMatchingStrategy(similarity_threshold=0.8, descriptor_index=index, debug=False)
+    subset = library[:5]
+    contour = Contour(library[150].get_main_contour())
+
+    result = strategy.find_best_match(subset, contour)
+    expected, _ = brute_force_best(subset, contour, 0.8)
+    assert result.workpiece is expected
+
+
+def test_upsert_and_remove_update_index_incrementally(library):
+    index = WorkpieceDescriptorIndex()
+    index.build(library[:3])
+
+    replacement = FakeWorkpiece(1, rectangle(10, 10))
+    index.upsert(replacement)
+    assert len(index) == 3
+    assert index.areas[1] == pytest.approx(100)
+
+    assert index.remove(0)
+    assert len(index) == 2
+    assert not index.remove(0)
+    # Remaining rows stay consistent after the swap-remove
+    by_id = {str(wp.workpieceId): wp for wp in (library[0], replacement, library[2])}
+    for position in range(len(index)):
+        wp = by_id[index.workpiece_id(position)]
+        assert index.areas[position] == pytest.approx(Contour(wp.get_main_contour()).getArea())
+
+    index.upsert(FakeWorkpiece(99, rectangle(50, 20)))
+    assert index.area_candidates(1000, 0.9).tolist() == [2]
+
+
+def test_workpieces_without_id_are_indexed_separately(library):
+    index = WorkpieceDescriptorIndex()
+    index.build(library[:2])
+    strategy = GeometricMatchingStrategy(similarity_threshold=0.8, descriptor_index=index, debug=False)
+    unnamed = [FakeWorkpiece(None, rectangle(w, h)) for w, h in [(40, 40), (300, 200), (120, 60)]]
+
+    for workpiece in unnamed:
+        result = strategy.find_best_match(unnamed, Contour(workpiece.get_main_contour()))
+        assert result.workpiece is workpiece
+    assert len(index) == 2 + len(unnamed)
+    assert index.sync(unnamed).tolist() == [2, 3, 4]
+
+
+def test_workpieces_missing_from_the_list_are_never_returned(library):
+    index = WorkpieceDescriptorIndex()
+    index.build(library)
+    strategy = GeometricMatchingStrategy(similarity_threshold=0.8, descriptor_index=index, debug=False)
+    # Same length as the index but with a duplicate id, so one indexed workpiece is not listed
+    listed = library[:-1] + [library[0]]
+    contour = Contour(library[-1].get_main_contour())
+
+    result = strategy.find_best_match(listed, contour)
+    expected, _ = brute_force_best(listed, contour, 0.8)
+    assert result.workpiece is expected
+
+
+def test_sync_only_describes_unknown_ids(library, monkeypatch):
+    index = WorkpieceDescriptorIndex()
+    index.sync(library[:10])
+    described = []
+    describe = WorkpieceDescriptorIndex._describe
+    monkeypatch.setattr(WorkpieceDescriptorIndex, "_describe",
+                        staticmethod(lambda contour: described.append(contour) or describe(contour)))
+
+    # Fresh objects for known ids are not described again
+    copies = [FakeWorkpiece(wp.workpieceId, wp.contour) for wp in library[:10]]
+    positions = index.sync(copies)
+    assert described == []
+    assert index.sync(copies) is positions
+
+    index.sync(library[:12])
+    assert len(described) == 2
+    assert index.sync(library[5:12]).tolist() == list(range(5, 12))
+
+
+def test_returned_contours_do_not_alias_the_index(library):
+    index = WorkpieceDescriptorIndex()
+    index.build(library[:3])
+    strategy = GeometricMatchingStrategy(similarity_threshold=0.8, descriptor_index=index, debug=False)
+    original = index.contour(1).get().copy()
+
+    result = strategy.find_best_match(library[:3], Contour(library[1].get_main_contour()))
+    assert result.workpiece is library[1]
+
+    index.contour(1).get()[:] += 50
+    np.testing.assert_array_equal(index.contour(1).get(), original)
+
+
+def test_debug_flag_is_read_at_construction(monkeypatch):
+    from modules.contour_matching import matching_config
+
+    monkeypatch.setattr(matching_config, "DEBUG_SIMILARITY", True)
+    assert GeometricMatchingStrategy(descriptor_index=WorkpieceDescriptorIndex()).debug is True
+    monkeypatch.setattr(matching_config, "DEBUG_SIMILARITY", False)
+    assert GeometricMatchingStrategy(descriptor_index=WorkpieceDescriptorIndex()).debug is False
+
+
+def test_signature_is_rotation_invariant():
+    base = Contour(np.array([[0, 0], [200, 0], [200, 60], [60, 60], [60, 150], [0, 150]], dtype=np.float32))
+    rotated = Contour(base.get().copy())
+    rotated.rotate(37, base.getCentroid())
+
+    index = WorkpieceDescriptorIndex()
+    index.build([FakeWorkpiece("a", base.get()), FakeWorkpiece("b", rotated.get())])
+    np.testing.assert_allclose(index.signatures[0], index.signatures[1], atol=0.02)
+    np.testing.assert_allclose(index.hu_moments[0], index.hu_moments[1], atol=0.05)
@@ -0,0 +1,86 @@
+import time
+
+import numpy as np
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from frontend.core.services.FramePresentationService import FramePresentationService
+from frontend.widgets.CameraFeed import CameraFeed, CameraFeedConfig
+from modules.shared.MessageBroker import MessageBroker
+
+TOPIC = "test/frame-presentation"
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def service(app):
+    service = FramePresentationService(topic=TOPIC)
+    yield service
+    service.shutdown()
+
+
+def feed(service, size):
+    config = CameraFeedConfig(screen_size=size, resolution_small=size, resolution_large=size, current_resolution=size)
+    return CameraFeed(cameraFeedConfig=config, presentationService=service)
+
+
+def publish(frame_id, value=0, timestamp=None):
+    frame = np.full((72, 128, 3), value, np.uint8)
+    MessageBroker().publish(TOPIC, {"frame_id": frame_id, "timestamp": timestamp or time.time(), "frame": frame})
+
+
+def wait_for(app, condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        app.processEvents()
+        if condition():
+            return True
+        time.sleep(0.002)
+    return False
+
+
+def test_frames_are_prepared_per_view_size(app, service):
+    small, large = feed(service, (32, 18)), feed(service, (64, 36))
+    assert not small.timer.isActive()
+    assert MessageBroker().get_subscriber_count(TOPIC) == 1
+
+    publish(1, value=200)
+    assert wait_for(app, lambda: small.last_frame_id == 1 and large.last_frame_id == 1)
+    assert small.pixmap_item.pixmap().size().width() == 32
+    assert large.pixmap_item.pixmap().size().width() == 64
+    item = small.pixmap_item
+
+    publish(2)
+    assert wait_for(app, lambda: small.last_frame_id == 2)
+    assert small.pixmap_item is item
+    assert len(small.scene.items()) == 1
+    assert service.stats.frames_presented >= 2
+    assert service.stats.latency_ms_last > 0
+
+    small.close()
+    large.close()
+    assert MessageBroker().get_subscriber_count(TOPIC) == 0
+
+
+def test_unchanged_and_missing_frames_are_counted(app, service):
+    view = feed(service, (32, 18))
+    publish(1)
+    assert wait_for(app, lambda: view.last_frame_id == 1)
+
+    publish(1)
+    assert wait_for(app, lambda: service.stats.frames_unchanged == 1)
+    publish(5)
+    assert wait_for(app, lambda: view.last_frame_id == 5)
+    assert service.stats.frames_dropped_source == 3
+    assert service.stats.frames_prepared == 2
+
+    view.pause_feed()
+    publish(6)
+    assert wait_for(app, lambda: service.stats.frames_prepared == 3)
+    app.processEvents()
+    assert view.last_frame_id == 5
+    view.close()
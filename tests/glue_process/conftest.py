@@ -23,6 +23,7 @@ from applications.glue_dispensing_application.glue_process.state_machine.Executa
     ExecutableStateMachine, StateRegistry, State, ExecutableStateMachineBuilder
 )
 from applications.glue_dispensing_application.settings.GlueSettings import GlueSettings
+from core.services.robot_service.impl.trajectory_streamer import TrajectoryStreamer
 from modules.utils.custom_logging import LoggerContext
 
 
@@ -39,6 +40,8 @@ def mock_robot_service():
     robot.robot = MagicMock()
     robot.robot.move_cartesian = MagicMock(return_value=0)  # Success
     robot.robot.move_liner = MagicMock(return_value=0)  # Success
+    robot.robot.get_trajectory_upload_modes = MagicMock(return_value=())  # MoveL-only robot
+    robot.robot.get_motion_queue_length = MagicMock(return_value=None)
     robot.get_current_position = MagicMock(return_value=[0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
     robot.get_current_velocity = MagicMock(return_value=100.0)
     robot.get_current_acceleration = MagicMock(return_value=0.0)
@@ -54,6 +57,13 @@ def mock_robot_service():
     robot.robot_config.global_motion_settings.global_acceleration = 100.0
     robot.robot_state_manager_cycle_time = 0.01  # Fast for testing
 
+    # Path upload goes through a real TrajectoryStreamer on the mocked robot
+    streamer = TrajectoryStreamer(robot.robot)
+    robot.stream_trajectory = MagicMock(
+        side_effect=lambda points, velocity, acceleration, blend_radius=1, should_abort=None: streamer.stream(
+            points, tool=robot.robot_config.robot_tool, user=robot.robot_config.robot_user,
+            vel=velocity, acc=acceleration, blend_radius=blend_radius, should_abort=should_abort))
+
     # Logger context
     robot.logger_context = LoggerContext(enabled=False, logger=None)
 
@@ -96,6 +96,29 @@ class TestHandleSendingPathToRobotState:
         next_state = handle_send_path_to_robot(context, logger_context)
         assert next_state == GlueProcessState.STOPPED
 
+    def test_spline_capable_robot_gets_batched_upload(self, context_with_paths, logger_context):
+        from core.model.robot.recording_robot import RecordingRobot
+        from core.services.robot_service.impl.trajectory_streamer import TrajectoryStreamer
+
+        context = context_with_paths
+        context.current_path = [[float(i), 0.0, 100.0, 180.0, 0.0, 0.0] for i in range(120)]
+        context.current_settings = {RobotSettingKey.VELOCITY.value: 10, RobotSettingKey.ACCELERATION.value: 30}
+        mock_sm = Mock()
+        mock_sm.state = GlueProcessState.EXECUTING_PATH
+        context.state_machine = mock_sm
+
+        robot = RecordingRobot()
+        streamer = TrajectoryStreamer(robot, batch_size=50, spline_enabled=True)
+        context.robot_service.stream_trajectory = Mock(
+            side_effect=lambda points, velocity, acceleration, blend_radius=1, should_abort=None:
+            streamer.stream(points, vel=velocity, acc=acceleration, should_abort=should_abort))
+
+        next_state = handle_send_path_to_robot(context, logger_context)
+
+        assert next_state == GlueProcessState.WAIT_FOR_PATH_COMPLETION
+        assert robot.command_names() == ["start_spline"] + ["add_spline_points"] * 3 + ["end_spline"]
+        assert robot.uploaded_points() == context.current_path
+
     def test_update_context_function(self, context_with_paths):
         context = context_with_paths
         result = Mock()
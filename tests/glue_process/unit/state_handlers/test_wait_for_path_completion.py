@@ -0,0 +1,53 @@
+import threading
+import time
+
+from applications.glue_dispensing_application.glue_process.dynamicPumpSpeedAdjustment import PumpThreadWithResult
+from applications.glue_dispensing_application.glue_process.state_handlers.wait_for_path_completion_state_handler import \
+    handle_wait_for_path_completion
+from applications.glue_dispensing_application.glue_process.state_machine.GlueProcessState import GlueProcessState
+from modules.utils.custom_logging import LoggerContext
+
+LOGGER_CONTEXT = LoggerContext(enabled=False, logger=None)
+
+
+def start_pump_thread(machine, result, release):
+    def run():
+        release.wait(5.0)
+        return result
+
+    thread = PumpThreadWithResult(target=run, on_done=machine.notify, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestHandleWaitForPathCompletion:
+
+    def test_returns_as_soon_as_pump_thread_finishes(self, context_with_paths, mock_state_machine):
+        context = context_with_paths
+        context.state_machine = mock_state_machine
+        release = threading.Event()
+        context.pump_thread = start_pump_thread(mock_state_machine, (True, 2), release)
+        threading.Timer(0.05, release.set).start()
+
+        start = time.monotonic()
+        next_state = handle_wait_for_path_completion(context, LOGGER_CONTEXT)
+
+        assert next_state == GlueProcessState.TRANSITION_BETWEEN_PATHS
+        assert context.current_point_index == 2
+        assert context.pump_thread is None
+        assert time.monotonic() - start < 0.5
+
+    def test_stop_from_another_thread_wakes_the_wait(self, context_with_paths, mock_state_machine):
+        context = context_with_paths
+        context.state_machine = mock_state_machine
+        mock_state_machine.current_state = GlueProcessState.WAIT_FOR_PATH_COMPLETION
+        release = threading.Event()
+        context.pump_thread = start_pump_thread(mock_state_machine, (False, 1), release)
+        threading.Timer(0.05, mock_state_machine.transition, args=(GlueProcessState.STOPPED,)).start()
+
+        try:
+            next_state = handle_wait_for_path_completion(context, LOGGER_CONTEXT)
+        finally:
+            release.set()
+
+        assert next_state == GlueProcessState.STOPPED
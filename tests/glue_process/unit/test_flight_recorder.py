@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from applications.glue_dispensing_application.glue_process import flight_recorder
+from applications.glue_dispensing_application.glue_process.flight_recorder import (
+    ContextDigest, EVENT_ENTER, EVENT_EXIT, FlightRecorder, read_records, split_cycles, state_latency_histograms,
+)
+from applications.glue_dispensing_application.glue_process.state_machine.GlueProcessState import GlueProcessState
+
+STATE_NAMES = {state.value: state.name for state in GlueProcessState}
+
+
+def record_cycle(recorder, states, path_index=0):
+    for point, state in enumerate(states):
+        recorder.record(state.value, EVENT_ENTER, ContextDigest(path_index, point, 10, 2, flight_recorder.FLAG_SPRAY_ON))
+        recorder.record(state.value, EVENT_EXIT, ContextDigest(path_index, point, 10, 2))
+
+
+@pytest.fixture
+def recorder_path(tmp_path):
+    return str(tmp_path / "glue.flightrec")
+
+
+def test_records_round_trip_with_durations(recorder_path):
+    recorder = FlightRecorder(recorder_path, STATE_NAMES, capacity=64)
+    record_cycle(recorder, [GlueProcessState.STARTING, GlueProcessState.MOVING_TO_FIRST_POINT])
+    recorder.close()
+
+    records = read_records(recorder_path)
+
+    assert [r.seq for r in records] == [0, 1, 2, 3]
+    assert [(r.state, r.event) for r in records] == [
+        ("STARTING", "ENTER"), ("STARTING", "EXIT"),
+        ("MOVING_TO_FIRST_POINT", "ENTER"), ("MOVING_TO_FIRST_POINT", "EXIT")]
+    assert records[0].flags == flight_recorder.FLAG_SPRAY_ON
+    assert records[2].point_index == 1 and records[2].total_paths == 2
+    assert records[0].duration == 0.0
+    assert records[1].duration == pytest.approx(records[1].timestamp - records[0].timestamp)
+
+
+def test_ring_keeps_newest_records_and_survives_reopen(recorder_path):
+    recorder = FlightRecorder(recorder_path, STATE_NAMES, capacity=8)
+    record_cycle(recorder, [GlueProcessState.IDLE] * 5)  # 10 records into 8 slots
+    recorder.close()
+
+    recorder = FlightRecorder(recorder_path, STATE_NAMES, capacity=8)
+    record_cycle(recorder, [GlueProcessState.COMPLETED])
+    assert recorder.flush()
+    records = read_records(recorder_path)
+    recorder.close()
+
+    assert [r.seq for r in records] == list(range(4, 12))
+    assert records[-1].state == "COMPLETED"
+
+
+def test_torn_record_is_skipped(recorder_path):
+    recorder = FlightRecorder(recorder_path, STATE_NAMES, capacity=8)
+    record_cycle(recorder, [GlueProcessState.STARTING])
+    recorder.close()
+
+    with open(recorder_path, "r+b") as f:
+        f.seek(flight_recorder.HEADER_SIZE + flight_recorder.RECORD_SIZE + 20)
+        f.write(b"\xff\xff")
+
+    assert [r.seq for r in read_records(recorder_path)] == [0]
+
+
+def test_cycles_and_latency_histograms(recorder_path):
+    recorder = FlightRecorder(recorder_path, STATE_NAMES, capacity=64)
+    for _ in range(3):
+        record_cycle(recorder, [GlueProcessState.STARTING, GlueProcessState.SENDING_PATH_POINTS,
+                                GlueProcessState.COMPLETED, GlueProcessState.IDLE])
+    recorder.close()
+    records = read_records(recorder_path)
+
+    cycles = split_cycles(records)
+    histograms = state_latency_histograms(records)
+
+    assert [len(cycle) for cycle in cycles] == [8, 8, 8]
+    counts, edges = histograms["SENDING_PATH_POINTS"]
+    assert counts.sum() == 3
+    assert edges[-1] == np.inf
+
+
+def test_cli_prints_timeline_and_histograms(recorder_path, capsys):
+    recorder = FlightRecorder(recorder_path, STATE_NAMES, capacity=64)
+    record_cycle(recorder, [GlueProcessState.STARTING, GlueProcessState.WAIT_FOR_PATH_COMPLETION])
+    recorder.close()
+
+    flight_recorder.main([recorder_path, "--cycles", "1"])
+
+    out = capsys.readouterr().out
+    assert "4 records" in out
+    assert "WAIT_FOR_PATH_COMPLETION" in out
+    assert "State latency" in out
@@ -0,0 +1,151 @@
+"""
+Unit tests for PathProgressTracker and the pump adjustment loop that uses it.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from applications.glue_dispensing_application.glue_process import dynamicPumpSpeedAdjustment
+from applications.glue_dispensing_application.glue_process.path_progress_tracker import PathProgressTracker
+from modules.utils.custom_logging import LoggerContext
+
+
+def dense_square(side=100.0, step=0.5, z=50.0):
+    """Closed square path densified to `step` mm, like the spline paths sent to the robot."""
+    corners = np.array([[0, 0], [side, 0], [side, side], [0, side], [0, 0]], dtype=float)
+    points = []
+    for a, b in zip(corners[:-1], corners[1:]):
+        n = int(np.linalg.norm(b - a) / step)
+        for t in np.arange(n) / n:
+            x, y = a + t * (b - a)
+            points.append([x, y, z, 180.0, 0.0, 0.0])
+    points.append([0.0, 0.0, z, 180.0, 0.0, 0.0])
+    return points
+
+
+def brute_force_passed(path, position, previous):
+    """The original checkpoint scan: every point within 1 mm from `previous` onward is passed."""
+    passed = previous
+    for i in range(previous, len(path)):
+        if np.linalg.norm(np.subtract(path[i][:3], position[:3])) < 1:
+            passed = i + 1
+    return passed
+
+
+class TestPathProgressTracker:
+
+    def test_arc_length_follows_the_robot(self):
+        path = dense_square()
+        tracker = PathProgressTracker(path)
+
+        tracker.update([50.0, 0.2, 50.0])
+        assert tracker.progress == pytest.approx(50.0)
+        tracker.update([100.0, 30.0, 50.0])
+        assert tracker.progress == pytest.approx(130.0)
+        assert tracker.total_length == pytest.approx(400.0)
+        assert tracker.remaining_length == pytest.approx(270.0)
+
+    def test_progress_never_moves_backwards(self):
+        tracker = PathProgressTracker(dense_square())
+        tracker.update([60.0, 0.0, 50.0])
+        tracker.update([40.0, 0.0, 50.0])
+        assert tracker.progress == pytest.approx(60.0)
+
+    def test_closed_path_does_not_jump_to_the_end_at_the_start(self):
+        path = dense_square()
+        tracker = PathProgressTracker(path)
+
+        tracker.update(path[0])
+        assert tracker.progress == pytest.approx(0.0)
+        assert tracker.passed_count < 10
+
+    def test_positions_off_path_are_rejected(self):
+        tracker = PathProgressTracker(dense_square(), max_deviation=1.0)
+        assert tracker.update([50.0, 20.0, 50.0]) is False
+        assert tracker.progress == 0.0
+        assert tracker.deviation == pytest.approx(20.0)
+
+    def test_recovers_when_robot_is_beyond_the_window(self):
+        tracker = PathProgressTracker(dense_square(step=0.5), window=8)
+        tracker.update([1.0, 0.0, 50.0])
+        assert tracker.update([100.0, 50.0, 50.0])
+        assert tracker.progress == pytest.approx(150.0)
+        assert tracker.full_searches == 1
+
+    def test_passed_count_matches_original_checkpoint_scan(self):
+        path = dense_square(step=2.0)
+        tracker = PathProgressTracker(path)
+        rng = np.random.default_rng(1)
+        passed = 0
+        for s in np.arange(1.0, 399.0, 3.7):
+            side, offset = divmod(s, 100.0)
+            corner = [[0, 0], [100, 0], [100, 100], [0, 100]][int(side)]
+            direction = [[1, 0], [0, 1], [-1, 0], [0, -1]][int(side)]
+            position = [corner[0] + direction[0] * offset, corner[1] + direction[1] * offset, 50.0]
+            position = np.add(position, rng.normal(0, 0.05, 3))
+
+            tracker.update(position)
+            passed = brute_force_passed(path, position, passed)
+            # Same checkpoint, give or take the one point within tolerance ahead
+            assert abs(tracker.passed_count - passed) <= 1
+
+    def test_window_keeps_work_bounded(self):
+        tracker = PathProgressTracker(dense_square(step=0.1), window=16)
+        for s in np.arange(0.0, 100.0, 0.5):
+            tracker.update([s, 0.0, 50.0])
+        assert tracker.full_searches == 0
+        assert tracker.segment_index == pytest.approx(995, abs=2)
+
+
+class FakeTelemetry:
+    def __init__(self, service):
+        self.service = service
+
+    def latest(self):
+        return self.service.next_sample()
+
+
+class FakeRobotService:
+    """Walks the path one point per telemetry read."""
+
+    def __init__(self, path):
+        self.path = path
+        self.index = 0
+        self.logger_context = LoggerContext(enabled=False, logger=None)
+
+    def next_sample(self):
+        from core.services.robot_service.impl.robot_monitor.telemetry_buffer import TelemetrySample
+        position = self.path[min(self.index, len(self.path) - 1)]
+        self.index += 1
+        return TelemetrySample(0.0, np.array(position, dtype=float), 100.0, 0.0)
+
+    def get_telemetry(self):
+        return FakeTelemetry(self)
+
+
+class FakeGlueService:
+    def __init__(self):
+        self.speeds = []
+
+    def adjustMotorSpeed(self, motorAddress, speed):
+        self.speeds.append(speed)
+
+
+def test_pump_loop_completes_path_at_fixed_rate(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(dynamicPumpSpeedAdjustment, "PUMP_LOOP_PERIOD", 0.001)
+    path = dense_square(step=5.0)[:-1]
+    glue = FakeGlueService()
+
+    success, final_index = dynamicPumpSpeedAdjustment.adjustPumpSpeedDynamically(
+        glue, FakeRobotService(path), 1.0, 0.0, 0, path, 2.0,
+        ready_event=threading.Event())
+
+    assert success is True
+    assert final_index == len(path) - 1
+    assert all(speed == 100 for speed in glue.speeds)
+    debug_log = (tmp_path / dynamicPumpSpeedAdjustment.DEBUG_FILE).read_text()
+    assert "Checkpoint 0 reached" in debug_log
+    assert "Pump speed: 100.000" in debug_log
@@ -3,6 +3,9 @@ Unit tests for ExecutableStateMachine core components.
 Tests State, StateRegistry, ExecutableStateMachine, and Builder.
 """
 
+import threading
+import time
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from enum import Enum
@@ -468,6 +471,74 @@ class TestExecutableStateMachineBuilder:
         assert machine.state == GlueProcessState.IDLE
 
 
+# ============================================================================
+# EVENT-DRIVEN SCHEDULING TESTS
+# ============================================================================
+
+class TestEventDrivenScheduling:
+    """Transitions, stop requests and notify() wake waiters without polling."""
+
+    def test_wait_until_woken_by_transition_from_other_thread(self, mock_state_machine):
+        timer = threading.Timer(0.05, mock_state_machine.transition, args=(GlueProcessState.STARTING,))
+        start = time.monotonic()
+        timer.start()
+
+        assert mock_state_machine.wait_for_states([GlueProcessState.STARTING], timeout=5.0)
+        assert time.monotonic() - start < 1.0
+        timer.join()
+
+    def test_wait_until_woken_by_notify(self, mock_state_machine):
+        done = threading.Event()
+        timer = threading.Timer(0.05, lambda: (done.set(), mock_state_machine.notify()))
+        timer.start()
+
+        assert mock_state_machine.wait_until(done.is_set, timeout=5.0)
+        timer.join()
+
+    def test_wait_until_times_out(self, mock_state_machine):
+        start = time.monotonic()
+        assert mock_state_machine.wait_until(lambda: False, timeout=0.05) is False
+        assert time.monotonic() - start >= 0.05
+
+    def test_transition_listener_receives_new_state(self, mock_state_machine):
+        seen = []
+        mock_state_machine.add_transition_listener(seen.append)
+        mock_state_machine.transition(GlueProcessState.STARTING)
+        mock_state_machine.remove_transition_listener(seen.append)
+        mock_state_machine.transition(GlueProcessState.MOVING_TO_FIRST_POINT)
+
+        assert seen == [GlueProcessState.STARTING]
+
+    def test_execution_chains_transitions_without_delay(self, transition_rules):
+        chain = [GlueProcessState.STARTING, GlueProcessState.MOVING_TO_FIRST_POINT,
+                 GlueProcessState.EXECUTING_PATH, GlueProcessState.PUMP_INITIAL_BOOST,
+                 GlueProcessState.STARTING_PUMP_ADJUSTMENT_THREAD]
+        registry = StateRegistry()
+        for current, nxt in zip(chain, chain[1:]):
+            registry.register_state(State(current, lambda ctx, s=nxt: s))
+        machine = ExecutableStateMachine(GlueProcessState.STARTING, transition_rules, registry,
+                                         context=ExecutionContext())
+        machine.add_transition_listener(
+            lambda state: machine.stop_execution() if state == chain[-1] else None)
+
+        start = time.monotonic()
+        machine.start_execution(delay=1.0)
+
+        assert machine.state == chain[-1]
+        # The old loop slept `delay` after every handler: 4 x 1.0 s
+        assert time.monotonic() - start < 0.5
+
+    def test_stop_wakes_idle_execution_loop(self, mock_state_machine):
+        runner = threading.Thread(target=mock_state_machine.start_execution, kwargs={"delay": 10.0})
+        runner.start()
+        time.sleep(0.05)
+
+        mock_state_machine.stop_execution()
+        runner.join(timeout=1.0)
+
+        assert not runner.is_alive()
+
+
 # ============================================================================
 # PARAMETRIZED TESTS
 # ============================================================================
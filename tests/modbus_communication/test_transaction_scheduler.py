@@ -0,0 +1,238 @@
+import importlib
+import threading
+import time
+
+import pytest
+
+from applications.glue_dispensing_application.services.glueSprayService.motorControl.errorCodes import \
+    ModbusExceptionType
+from modules.modbusCommunication.FakeRtu import FakeRtuBus, FakeRtuSlave
+from modules.modbusCommunication.ModbusTransactionScheduler import ModbusPriority, ModbusTransactionError, \
+    ModbusTransactionScheduler
+from modules.modbusCommunication.ScheduledModbusClient import ScheduledModbusClient
+
+
+@pytest.fixture
+def bus():
+    bus = FakeRtuBus()
+    bus.add_slave(FakeRtuSlave(1, {i: 100 + i for i in range(40)}))
+    bus.add_slave(FakeRtuSlave(2, {0: 7}))
+    return bus
+
+
+@pytest.fixture
+def line_lock():
+    return threading.Lock()
+
+
+@pytest.fixture
+def scheduler(bus, line_lock):
+    scheduler = ModbusTransactionScheduler(bus.instrument, max_retries=3, backoff_base=0.01, backoff_max=0.05,
+                                           lock=line_lock).start()
+    yield scheduler
+    scheduler.stop()
+
+
+def hold_line(scheduler, line_lock):
+    """Block the worker inside a transaction so the following submissions queue up."""
+    line_lock.acquire()
+    blocker = scheduler.submit_write(2, 30, [0], coalesce=False)
+    deadline = time.monotonic() + 1.0
+    while scheduler._pending and time.monotonic() < deadline:
+        time.sleep(0.001)
+    return blocker
+
+
+def test_adjacent_reads_are_merged_into_one_block_read(bus, scheduler, line_lock):
+    blocker = hold_line(scheduler, line_lock)
+    futures = [scheduler.submit_read(1, register, 2) for register in (0, 2, 4, 8)]
+    line_lock.release()
+
+    results = [f.result(timeout=1) for f in futures]
+    blocker.result(timeout=1)
+
+    assert results == [[100, 101], [102, 103], [104, 105], [108, 109]]
+    reads = [t for t in bus.transactions if t[1] == "read_registers"]
+    # 0..5 are contiguous; 8 is not merged because registers 6..7 may be unmapped
+    assert reads == [(1, "read_registers", 0, 6), (1, "read_registers", 8, 2)]
+    assert scheduler.get_statistics()[1]["merged_reads"] == 2
+
+
+def test_read_gap_is_bridged_only_when_enabled(bus, line_lock):
+    scheduler = ModbusTransactionScheduler(bus.instrument, max_read_gap=2, lock=line_lock).start()
+    try:
+        blocker = hold_line(scheduler, line_lock)
+        futures = [scheduler.submit_read(1, register, 2) for register in (0, 4)]
+        line_lock.release()
+        assert [f.result(timeout=1) for f in futures] == [[100, 101], [104, 105]]
+        blocker.result(timeout=1)
+    finally:
+        scheduler.stop()
+
+    reads = [t for t in bus.transactions if t[1] == "read_registers"]
+    assert reads == [(1, "read_registers", 0, 6)]
+
+
+def test_queued_set_points_are_coalesced(bus, scheduler, line_lock):
+    blocker = hold_line(scheduler, line_lock)
+    futures = [scheduler.submit_write(1, 0, [speed, 0]) for speed in (1000, 2000, 3000)]
+    line_lock.release()
+
+    # Every caller's future completes with the set-point that actually went out
+    assert [f.result(timeout=1) for f in futures] == [[3000, 0]] * 3
+    blocker.result(timeout=1)
+
+    writes = [t for t in bus.transactions if t[1] == "write_registers" and t[0] == 1]
+    assert writes == [(1, "write_registers", 0, [3000, 0])]
+    assert bus.slaves[1].registers[0] == 3000
+    assert scheduler.get_statistics()[1]["coalesced_writes"] == 2
+
+
+def test_priority_orders_queued_requests(bus, scheduler, line_lock):
+    blocker = hold_line(scheduler, line_lock)
+    low = scheduler.submit_read(1, 0, priority=ModbusPriority.LOW)
+    critical = scheduler.submit_write(2, 1, [0], priority=ModbusPriority.CRITICAL)
+    line_lock.release()
+    low.result(timeout=1), critical.result(timeout=1), blocker.result(timeout=1)
+
+    order = [(t[0], t[1]) for t in bus.transactions[1:]]
+    assert order == [(2, "write_registers"), (1, "read_registers")]
+
+
+def test_retries_with_backoff_and_reports_final_error(bus, scheduler):
+    bus.slaves[1].fail_next(2)
+    assert scheduler.submit_read(1, 5).result(timeout=1) == [105]
+
+    bus.slaves[1].offline = True
+    with pytest.raises(ModbusTransactionError) as exc_info:
+        scheduler.submit_read(1, 5).result(timeout=1)
+    assert exc_info.value.error is ModbusExceptionType.NO_RESPONSE_ERROR
+
+    stats = scheduler.get_statistics()[1]
+    assert stats["retries"] == 4 and stats["errors"] == 5 and stats["failed_requests"] == 1
+
+
+def test_flaky_slave_does_not_block_other_slaves(bus, line_lock):
+    scheduler = ModbusTransactionScheduler(bus.instrument, max_retries=10, backoff_base=0.2, backoff_max=0.2,
+                                           lock=line_lock).start()
+    try:
+        bus.slaves[1].offline = True
+        stuck = scheduler.submit_read(1, 0)
+        time.sleep(0.02)  # slave 1 is now backed off
+
+        started = time.monotonic()
+        assert scheduler.submit_read(2, 0).result(timeout=1) == [7]
+        assert time.monotonic() - started < 0.1
+        assert not stuck.done()
+    finally:
+        scheduler.stop()
+    with pytest.raises(ModbusTransactionError):
+        stuck.result(timeout=1)
+
+
+def test_cached_reads_skip_the_line(bus, scheduler):
+    assert scheduler.submit_read(1, 3, 2).result(timeout=1) == [103, 104]
+    scheduler.submit_write(1, 4, [55]).result(timeout=1)
+    transactions = len(bus.transactions)
+
+    assert scheduler.submit_read(1, 3, 2, max_age=1.0).result(timeout=1) == [103, 55]
+    assert len(bus.transactions) == transactions
+    assert scheduler.get_statistics()[1]["cache_hits"] == 1
+
+    time.sleep(0.02)
+    scheduler.submit_read(1, 3, 2, max_age=0.01).result(timeout=1)
+    assert len(bus.transactions) == transactions + 1
+
+
+def test_scheduled_client_keeps_modbus_client_conventions(bus, scheduler):
+    client = ScheduledModbusClient(scheduler, slave=1)
+
+    assert client.writeRegisters(10, [1, 2]) is None
+    assert client.readRegisters(10, 2) == ([1, 2], None)
+    assert client.read(11) == (2, None)
+    assert client.writeRegister(12, 9) is None
+    client.writeBit(3, 1)
+    assert client.readBit(3) == 1
+
+    bus.slaves[1].offline = True
+    assert client.read(11) == (None, ModbusExceptionType.NO_RESPONSE_ERROR)
+    assert bus.collisions == 0
+
+
+def test_statistics_are_published(bus):
+    published = []
+
+    class Broker:
+        def publish(self, topic, data):
+            published.append((topic, data))
+
+    scheduler = ModbusTransactionScheduler(bus.instrument, broker=Broker(), statistics_topic="modbus/stats",
+                                           statistics_interval=0.01).start()
+    try:
+        scheduler.submit_read(2, 0).result(timeout=1)
+        time.sleep(0.05)
+    finally:
+        scheduler.stop()
+
+    assert published and published[-1][0] == "modbus/stats"
+    assert published[-1][1][2]["transactions"] == 1
+
+
+def test_timed_out_write_is_cancelled_and_never_sent(bus, scheduler, line_lock):
+    client = ScheduledModbusClient(scheduler, slave=1, timeout=0.05)
+    blocker = hold_line(scheduler, line_lock)
+
+    assert client.writeRegisters(0, [42, 0]) is ModbusExceptionType.TIMEOUT_ERROR
+    assert not scheduler._pending
+
+    line_lock.release()
+    blocker.result(timeout=1)
+    scheduler.submit_read(2, 0).result(timeout=1)
+    assert not [t for t in bus.transactions if t[0] == 1]
+
+
+def test_cancelled_request_is_not_retried(bus, line_lock):
+    scheduler = ModbusTransactionScheduler(bus.instrument, max_retries=30, backoff_base=0.05, backoff_max=0.05,
+                                           lock=line_lock).start()
+    try:
+        bus.slaves[1].offline = True
+        future = scheduler.submit_write(1, 0, [42, 0])
+        time.sleep(0.02)  # first attempt failed, request is waiting out the back-off
+        assert scheduler.cancel(future)
+        bus.slaves[1].offline = False
+
+        scheduler.submit_read(2, 0).result(timeout=1)
+        time.sleep(0.1)
+        assert not scheduler._pending
+        assert bus.slaves[1].registers.get(0) == 100
+    finally:
+        scheduler.stop()
+
+
+def test_write_keeps_the_line_quiet_for_the_settle_time(bus, line_lock):
+    scheduler = ModbusTransactionScheduler(bus.instrument, write_settle_time=0.05, lock=line_lock).start()
+    try:
+        write = scheduler.submit_write(1, 0, [1])
+        time.sleep(0.01)
+        started = time.monotonic()
+        with line_lock:
+            waited = time.monotonic() - started
+        write.result(timeout=1)
+    finally:
+        scheduler.stop()
+    assert waited >= 0.03
+
+
+def test_state_polling_is_served_from_the_register_cache(bus, scheduler, monkeypatch):
+    from applications.glue_dispensing_application.services.glueSprayService.generatorControl.GeneratorControl import \
+        GeneratorControl
+    # The package re-exports the ModbusController class under the module's name
+    controller_module = importlib.import_module("modules.modbusCommunication.ModbusController")
+    monkeypatch.setattr(controller_module, "get_default_scheduler", lambda: scheduler)
+    generator = GeneratorControl(timer=None, generator_id=1)
+
+    states = [generator.getGeneratorState() for _ in range(3)]
+
+    assert all(not state.has_errors() for state in states)
+    reads = [t for t in bus.transactions if t[1] == "read_registers" and t[0] == 1]
+    assert len(reads) == 1
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from plugins.core.dashboard.ui.widgets.trail_renderer import TrailRenderer
+
+
+def _path(n, start=(10, 10), step=(3, 1)):
+    return [(start[0] + i * step[0], start[1] + i * step[1], 0.0, False) for i in range(n)]
+
+
+@pytest.fixture
+def base():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 255, (120, 200, 3), dtype=np.uint8)
+
+
+def _full_render(base, points):
+    renderer = TrailRenderer(base.shape[1], base.shape[0])
+    renderer.set_base(base)
+    renderer.add_points(points)
+    return renderer.render()[0].copy()
+
+
+# ----------------- Incremental rendering ----------------- #
+def test_incremental_matches_full_redraw(base):
+    points = _path(40)
+    renderer = TrailRenderer(base.shape[1], base.shape[0])
+    renderer.set_base(base)
+    for i in range(0, len(points), 3):
+        renderer.add_points(points[i:i + 3])
+        renderer.render()
+
+    assert np.array_equal(renderer.render()[0], _full_render(base, points))
+
+
+def test_only_new_segments_are_drawn(base):
+    renderer = TrailRenderer(base.shape[1], base.shape[0])
+    renderer.set_base(base)
+    renderer.add_points(_path(30))
+    renderer.render()
+    drawn = renderer.segments_drawn
+
+    renderer.add_points(_path(2, start=(100, 40)))
+    renderer.render()
+    assert renderer.segments_drawn - drawn <= 2
+
+
+def test_unchanged_frame_is_reported(base):
+    renderer = TrailRenderer(base.shape[1], base.shape[0])
+    renderer.set_base(base)
+    assert renderer.render(show_head=False)[1] is True
+    assert renderer.render(show_head=False)[1] is False
+
+
+# ----------------- Decimation / breaks ----------------- #
+def test_close_points_are_decimated(base):
+    renderer = TrailRenderer(base.shape[1], base.shape[0], min_distance=5.0)
+    renderer.set_base(base)
+    renderer.add_points([(50, 50, 0.0, False)] * 100)
+    assert renderer.segments_drawn == 0
+
+
+def test_break_starts_new_segment(base):
+    renderer = TrailRenderer(base.shape[1], base.shape[0], smoothing=1)
+    renderer.set_base(base)
+    renderer.add_points([(10, 10, 0.0, False), (20, 10, 0.0, False),
+                         (150, 100, 0.0, True), (160, 100, 0.0, False)])
+    frame = renderer.render(show_head=False)[0]
+
+    assert renderer.segments_drawn == 2
+    # Nothing drawn on the jump between the segments
+    assert np.array_equal(frame[55, 85], base[55, 85])
+
+
+def test_clear_restores_base(base):
+    renderer = TrailRenderer(base.shape[1], base.shape[0])
+    renderer.set_base(base)
+    renderer.add_points(_path(40))
+    assert not np.array_equal(renderer.render()[0], base)
+
+    renderer.clear()
+    assert np.array_equal(renderer.render()[0], base)
+
+
+# ----------------- Trajectory history ----------------- #
+def test_trajectory_history_is_bounded():
+    from plugins.core.dashboard.ui.widgets.RobotTrajectoryWidget import TrajectoryManager, TRAIL_HISTORY
+
+    manager = TrajectoryManager()
+    manager.interpolate_motion = False
+    for i in range(TRAIL_HISTORY + 500):
+        manager.update_position((i % 300, i % 200))
+
+    assert len(manager.get_trajectory_copy()) == TRAIL_HISTORY
+    assert len(manager.take_new_points()) == TRAIL_HISTORY
+    assert manager.take_new_points() == []
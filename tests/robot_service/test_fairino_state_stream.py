@@ -0,0 +1,105 @@
+import ctypes
+import time
+
+import numpy as np
+
+from libs.fairino.linux.fairino.Robot import RobotStatePkg, RobotStateStream
+
+
+def make_frame(pose, frame_cnt=0, corrupt=False):
+    pkg = RobotStatePkg()
+    pkg.frame_head = 0x5A5A
+    pkg.frame_cnt = frame_cnt
+    pkg.data_len = ctypes.sizeof(RobotStatePkg) - 7
+    pkg.tl_cur_pos[:] = pose
+    pkg.robot_state = 2
+    raw = bytearray(pkg)
+    pkg.check_sum = sum(raw[:-2]) & 0xFFFF
+    raw = bytearray(pkg)
+    if corrupt:
+        raw[40] ^= 0xFF
+    return bytes(raw)
+
+
+def pose(i):
+    return [100.0 + i, 200.0 - i, 300.0, 180.0, 0.0, float(i)]
+
+
+def test_decodes_frames_split_at_arbitrary_boundaries():
+    stream = RobotStateStream(capacity=4096)
+    data = b"".join(make_frame(pose(i), frame_cnt=i) for i in range(20))
+    rng = np.random.default_rng(0)
+    cuts = np.sort(rng.choice(np.arange(1, len(data)), size=60, replace=False))
+
+    decoded = 0
+    for chunk in np.split(np.frombuffer(data, dtype=np.uint8), cuts):
+        decoded += stream.feed(chunk.tobytes())
+
+    assert decoded == 20
+    assert stream.sequence == 20
+    assert stream.tcp_pose() == pose(19)
+    assert stream.rejected == 0
+
+
+def test_resyncs_after_garbage_and_bad_checksum():
+    stream = RobotStateStream(capacity=4096)
+    # Garbage containing a fake header, a corrupted frame, then a valid one
+    data = b"\x01\x5a\x5a\x10\x00\x02" + make_frame(pose(1), corrupt=True) + b"\x5a" + make_frame(pose(2))
+
+    assert stream.feed(data) == 1
+    assert stream.tcp_pose() == pose(2)
+    assert stream.rejected >= 1
+
+
+def test_recv_into_path_uses_preallocated_buffer():
+    stream = RobotStateStream(capacity=4096)
+    frame = make_frame(pose(7))
+    buffer = stream.buffer
+
+    view = stream.recv_buffer()
+    view[:len(frame) - 10] = frame[:-10]
+    assert stream.commit(len(frame) - 10) == 0
+    view = stream.recv_buffer()
+    view[:10] = frame[-10:]
+    assert stream.commit(10) == 1
+
+    assert stream.buffer is buffer
+    sequence, pkg = stream.snapshot()
+    assert sequence == 1
+    assert list(pkg.tl_cur_pos) == pose(7)
+    assert pkg.robot_state == 2
+
+
+def test_snapshot_is_independent_of_later_frames():
+    stream = RobotStateStream(capacity=4096)
+    stream.feed(make_frame(pose(1)))
+    _, first = stream.snapshot()
+    for i in range(2, 10):
+        stream.feed(make_frame(pose(i)))
+
+    assert list(first.tl_cur_pos) == pose(1)
+    assert stream.tcp_pose() == pose(9)
+
+
+def test_stale_or_missing_state_returns_none(monkeypatch):
+    stream = RobotStateStream(capacity=4096)
+    assert stream.tcp_pose() is None
+    stream.feed(make_frame(pose(3)))
+    monkeypatch.setattr(time, "monotonic", lambda: stream.timestamp + 1.0)
+    assert stream.tcp_pose(max_age=0.1) is None
+    assert stream.tcp_pose() == pose(3)
+
+
+
+def test_published_state_is_never_rewritten():
+    stream = RobotStateStream(capacity=4096)
+    stream.feed(make_frame(pose(1)))
+    held = stream.current
+    sequence, snapshot = stream.snapshot()
+    for i in range(2, 10):
+        stream.feed(make_frame(pose(i)))
+
+    # A reader holding the published package keeps a complete, unchanged sample
+    assert list(held.tl_cur_pos) == pose(1)
+    assert snapshot is held and sequence == 1
+    assert list(stream.current.tl_cur_pos) == pose(9)
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from core.services.robot_service.impl.robot_monitor.base_robot_monitor import BaseRobotMonitor
+from core.services.robot_service.impl.robot_monitor.telemetry_buffer import TelemetryBuffer
+
+DT = 0.03
+
+
+def feed(buffer, positions, t0=100.0, dt=DT):
+    results = []
+    for i, position in enumerate(positions):
+        results.append(buffer.append(t0 + i * dt, [*position, 180.0, 0.0, 0.0]))
+    return results
+
+
+def test_constant_velocity_converges_to_true_speed():
+    buffer = TelemetryBuffer()
+    t = np.arange(200) * DT
+    positions = np.stack((100 + 30.0 * t, 50 + 40.0 * t, np.full_like(t, 300.0)), axis=1)
+
+    speed, acceleration = feed(buffer, positions)[-1]
+
+    assert speed == pytest.approx(50.0, rel=1e-3)
+    assert acceleration == pytest.approx(0.0, abs=1e-2)
+
+
+def test_acceleration_sign_and_magnitude_along_path():
+    buffer = TelemetryBuffer()
+    t = np.arange(300) * DT
+    # Along x: v = 10 + 20 t  (accelerating at 20 mm/s²)
+    positions = np.stack((10 * t + 10 * t ** 2, np.zeros_like(t), np.zeros_like(t)), axis=1)
+    _, acceleration = feed(buffer, positions)[-1]
+    assert acceleration == pytest.approx(20.0, rel=0.05)
+
+    buffer = TelemetryBuffer()
+    positions = np.stack((200 * t - 10 * t ** 2, np.zeros_like(t), np.zeros_like(t)), axis=1)
+    _, acceleration = feed(buffer, positions)[-1]
+    assert acceleration == pytest.approx(-20.0, rel=0.05)
+
+
+def test_filter_uses_real_sample_interval():
+    buffer = TelemetryBuffer()
+    rng = np.random.default_rng(0)
+    times = 100.0 + np.cumsum(rng.uniform(0.02, 0.05, size=300))
+    for t in times:
+        buffer.append(t, [25.0 * t, 0, 0, 0, 0, 0])
+    assert buffer.latest().speed == pytest.approx(25.0, rel=1e-2)
+
+
+def test_ring_keeps_newest_samples_in_order():
+    buffer = TelemetryBuffer(capacity=8)
+    feed(buffer, [(i, 0, 0) for i in range(20)])
+
+    window = buffer.window(0, 1e9)
+    assert len(buffer) == 8
+    assert window.poses[:, 0].tolist() == list(range(12, 20))
+    assert np.all(np.diff(window.timestamps) > 0)
+    assert buffer.latest().pose[0] == 19
+
+
+def test_pose_at_interpolates_between_samples():
+    buffer = TelemetryBuffer()
+    feed(buffer, [(0, 0, 0), (3, 6, 0), (6, 12, 0)], t0=10.0, dt=1.0)
+
+    assert buffer.pose_at(10.5)[:3].tolist() == [1.5, 3.0, 0.0]
+    assert buffer.pose_at(12.0)[:2].tolist() == [6.0, 12.0]
+    assert buffer.pose_at(50.0)[0] == 6.0
+    assert buffer.pose_at(9.0) is None
+
+
+def test_window_selects_time_range():
+    buffer = TelemetryBuffer()
+    feed(buffer, [(i, 0, 0) for i in range(10)], t0=0.0, dt=1.0)
+
+    window = buffer.window(2.5, 5.0)
+    assert window.timestamps.tolist() == [3.0, 4.0, 5.0]
+    assert window.poses[:, 0].tolist() == [3, 4, 5]
+    assert len(buffer.window(20, 30)) == 0
+
+
+def test_older_samples_are_ignored():
+    buffer = TelemetryBuffer()
+    buffer.append(10.0, [1, 0, 0, 0, 0, 0])
+    buffer.append(9.0, [5, 0, 0, 0, 0, 0])
+    assert len(buffer) == 1
+    assert buffer.latest().pose[0] == 1
+
+
+class ScriptedMonitor(BaseRobotMonitor):
+    def __init__(self, positions):
+        super().__init__(cycle_time=0)
+        self.positions = iter(positions)
+
+    def get_current_position(self):
+        try:
+            return next(self.positions)
+        except StopIteration:
+            self._stop_event.set()
+            return None
+
+
+def test_monitor_reports_filtered_motion_from_buffer():
+    positions = [[i * 1.5, 0.0, 0.0, 180.0, 0.0, 0.0] for i in range(100)]
+    monitor = ScriptedMonitor(positions)
+    received = []
+    monitor.set_data_callback(lambda pos, vel, acc, ts, error=False: received.append((pos, vel, acc, error)))
+
+    monitor.run()
+
+    assert len(monitor.telemetry) == len(positions)
+    last_pos, last_velocity, last_acceleration, _ = received[-2]
+    assert last_pos == positions[-1]
+    assert last_velocity == pytest.approx(monitor.telemetry.latest().speed)
+    assert received[-1][3] is True
@@ -0,0 +1,110 @@
+import pytest
+
+from core.model.robot.enums.trajectory import TrajectoryUploadMode
+from core.model.robot.recording_robot import RecordingRobot
+from core.services.robot_service.impl.trajectory_streamer import TrajectoryStreamer, spline_average_time_ms
+
+
+def make_path(n):
+    return [[float(i), 2.0 * i, 100.0, 180.0, 0.0, 0.0] for i in range(n)]
+
+
+def test_spline_robot_receives_points_in_batches():
+    robot = RecordingRobot()
+    path = make_path(230)
+
+    result = TrajectoryStreamer(robot, batch_size=100, spline_enabled=True).stream(path, tool=1, user=0, vel=20, acc=40)
+
+    assert result.success and result.points_sent == 230
+    assert robot.command_names() == ["start_spline"] + ["add_spline_points"] * 3 + ["end_spline"]
+    batches = [c.args for c in robot.commands if c.name == "add_spline_points"]
+    assert [len(b["points"]) for b in batches] == [100, 100, 30]
+    assert [b["last"] for b in batches] == [False, False, True]
+    assert robot.uploaded_points() == path
+    assert result.stats.mode is TrajectoryUploadMode.SPLINE
+    assert result.stats.batches == 3
+    assert result.stats.points_per_second > 0
+
+
+def test_robot_without_spline_support_falls_back_to_movel():
+    robot = RecordingRobot(upload_modes=())
+    path = make_path(12)
+
+    result = TrajectoryStreamer(robot).stream(path, vel=20, acc=40, blend_radius=1)
+
+    assert result.success
+    assert robot.command_names() == ["move_liner"] * 12
+    assert all(c.args["blendR"] == 1 for c in robot.commands)
+    assert robot.uploaded_points() == path
+    assert result.stats.mode is TrajectoryUploadMode.MOVEL
+
+
+def test_movel_is_the_default_even_on_spline_robots():
+    robot = RecordingRobot()
+
+    result = TrajectoryStreamer(robot).stream(make_path(12), vel=20, acc=40)
+
+    assert result.success
+    assert robot.command_names() == ["move_liner"] * 12
+    assert result.stats.mode is TrajectoryUploadMode.MOVEL
+
+
+def test_short_paths_use_movel_even_on_spline_robots():
+    robot = RecordingRobot()
+    streamer = TrajectoryStreamer(robot, min_spline_points=4, spline_enabled=True)
+    assert streamer.choose_mode(make_path(3)) is TrajectoryUploadMode.MOVEL
+    assert streamer.choose_mode(make_path(4)) is TrajectoryUploadMode.SPLINE
+
+
+def test_upload_stays_within_queue_depth():
+    robot = RecordingRobot(queue_drain_per_poll=10)
+    streamer = TrajectoryStreamer(robot, batch_size=25, max_queue_depth=60, queue_poll_interval=0,
+                                  spline_enabled=True)
+
+    result = streamer.stream(make_path(500))
+
+    assert result.success
+    assert robot.max_queued <= 60
+    assert result.stats.max_queue_depth <= 60
+    assert robot.uploaded_points() == make_path(500)
+
+
+def test_abort_between_batches_reports_progress_and_closes_spline():
+    robot = RecordingRobot()
+    polls = iter([False, False, True])
+
+    result = TrajectoryStreamer(robot, batch_size=10, spline_enabled=True).stream(make_path(50), should_abort=lambda: next(polls))
+
+    assert result.aborted and not result.success
+    assert result.points_sent == 20
+    assert robot.command_names() == ["start_spline", "add_spline_points", "add_spline_points", "end_spline"]
+
+
+@pytest.mark.parametrize("fail_at, expected_sent", [(("add_spline_points", 2), 10), (("start_spline", 1), 0)])
+def test_robot_errors_are_reported(fail_at, expected_sent):
+    robot = RecordingRobot(fail_at=fail_at, error_code=-4)
+
+    result = TrajectoryStreamer(robot, batch_size=10, spline_enabled=True).stream(make_path(30))
+
+    assert not result.success and not result.aborted
+    assert result.error_code == -4
+    assert result.points_sent == expected_sent
+
+
+def test_spline_timing_follows_segment_length_and_velocity():
+    # 3-4-5 triangle steps: every segment is 5 mm long
+    path = [[3.0 * i, 4.0 * i, 100.0, 180.0, 0.0, 0.0] for i in range(11)]
+    assert spline_average_time_ms(path, 20) == 250
+    assert spline_average_time_ms(path, 50) == 100
+
+    robot = RecordingRobot()
+    TrajectoryStreamer(robot, spline_enabled=True).stream(path, vel=20, acc=40)
+
+    start = robot.commands[0]
+    assert start.name == "start_spline"
+    assert start.args["average_time_ms"] == 250
+
+
+def test_spline_timing_rejects_non_positive_velocity():
+    with pytest.raises(ValueError):
+        spline_average_time_ms(make_path(5), 0)
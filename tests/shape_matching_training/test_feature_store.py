@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from modules.shape_matching_training.core.dataset.shape_factory import ShapeFactory, ShapeType
+from modules.shape_matching_training.core.features.base_extractor import FeatureExtractorFactory, \
+    compute_features_for_pair, compute_features_parallel
+from modules.shape_matching_training.core.features.feature_store import FeatureStore, PAIR_CONCAT, \
+    extractor_signature
+
+
+def make_extractor(log_transform=True):
+    return FeatureExtractorFactory.create_composite_extractor([
+        {'name': 'geometric'},
+        {'name': 'hu', 'config': {'use_log_transform': log_transform}},
+    ])
+
+
+@pytest.fixture(scope="module")
+def contours():
+    shapes = [ShapeType.CIRCLE, ShapeType.SQUARE, ShapeType.TRIANGLE]
+    return [ShapeFactory.generate_shape(shape, scale, (256, 256)) for shape in shapes for scale in (0.8, 1.2)]
+
+
+@pytest.fixture(scope="module")
+def pairs(contours):
+    rng = np.random.default_rng(0)
+    return [(contours[i], contours[j]) for i, j in rng.integers(0, len(contours), (40, 2))]
+
+
+def test_pair_features_match_per_pair_extraction(contours, pairs):
+    extractor = make_extractor()
+    store = FeatureStore(extractor, max_workers=0)
+
+    features = store.pair_features(pairs)
+
+    expected = np.array([compute_features_for_pair(pair, extractor) for pair in pairs])
+    np.testing.assert_allclose(features, expected)
+    assert store.extractions == len(store) <= len(contours)
+
+    concat = store.pair_features(pairs[:3], mode=PAIR_CONCAT)
+    assert concat.shape == (3, 2 * store.n_features)
+    assert store.extractions == len(store)
+
+
+def test_pooled_extraction_matches_inline(contours):
+    extractor = make_extractor()
+    inline = FeatureStore(extractor, max_workers=0).features(contours)
+    pooled_store = FeatureStore(extractor, max_workers=2, chunk_size=2, min_parallel=1)
+    try:
+        np.testing.assert_allclose(pooled_store.features(contours), inline)
+    finally:
+        pooled_store.close()
+
+
+def test_cache_persists_and_reopens_memory_mapped(tmp_path, contours, pairs):
+    extractor = make_extractor()
+    store = FeatureStore(extractor, cache_dir=tmp_path, max_workers=0)
+    expected = store.pair_features(pairs)
+    store.save()
+
+    reopened = FeatureStore(extractor, cache_dir=tmp_path, max_workers=0)
+    assert len(reopened) == len(store)
+    assert isinstance(reopened.matrix.base, np.memmap) or isinstance(reopened.matrix, np.memmap)
+    np.testing.assert_allclose(reopened.pair_features(pairs), expected)
+    assert reopened.extractions == 0
+
+    # New contours are appended to the (copied) matrix and saved again
+    extra = ShapeFactory.generate_shape(ShapeType.CIRCLE, 2.0, (256, 256))
+    reopened.features([extra])
+    reopened.save()
+    assert len(FeatureStore(extractor, cache_dir=tmp_path, max_workers=0)) == len(store) + 1
+
+
+def test_extractor_configuration_changes_signature():
+    assert extractor_signature(make_extractor(True)) == extractor_signature(make_extractor(True))
+    assert extractor_signature(make_extractor(True)) != extractor_signature(make_extractor(False))
+
+
+def test_compute_features_parallel_uses_shared_store(pairs):
+    extractor = make_extractor()
+    features = compute_features_parallel(pairs, extractor)
+    np.testing.assert_allclose(features, [compute_features_for_pair(pair, extractor) for pair in pairs])
@@ -0,0 +1,144 @@
+import threading
+import time
+
+import pytest
+
+from modules.shared.MessageBroker import DeliveryPolicy, MessageBroker
+
+
+@pytest.fixture
+def broker(request):
+    broker = MessageBroker()
+    topic = f"test/{request.node.name}"
+    yield broker, topic
+    broker.clear_topic(topic)
+    broker.set_topic_policy(topic, DeliveryPolicy.SYNC)
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class Collector:
+    def __init__(self):
+        self.received = []
+
+    def on_message(self, message):
+        self.received.append(message)
+
+
+class SlowSubscriber(Collector):
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.gate = threading.Event()
+
+    def on_message(self, message):
+        self.started.set()
+        self.gate.wait(2.0)
+        super().on_message(message)
+
+
+def test_sync_is_the_default_and_runs_on_publisher_thread(broker):
+    broker, topic = broker
+    threads = []
+
+    def subscriber(message):
+        threads.append(threading.current_thread())
+
+    broker.subscribe(topic, subscriber)
+    broker.publish(topic, 1)
+
+    assert broker.get_topic_policy(topic) is DeliveryPolicy.SYNC
+    assert threads == [threading.current_thread()]
+
+
+def test_latest_policy_drops_stale_frames_without_blocking_publisher(broker):
+    broker, topic = broker
+    broker.set_topic_policy(topic, DeliveryPolicy.LATEST)
+    slow = SlowSubscriber()
+    broker.subscribe(topic, slow.on_message)
+
+    broker.publish(topic, 0)
+    assert slow.started.wait(1.0)
+    start = time.monotonic()
+    for frame in range(1, 20):
+        broker.publish(topic, frame)
+    assert time.monotonic() - start < 0.5
+
+    slow.gate.set()
+    assert wait_for(lambda: slow.received and slow.received[-1] == 19)
+    # Frame 0 was taken by the worker right away, then only the newest pending frame survives
+    assert slow.received == [0, 19]
+    stats = broker.get_subscriber_stats(topic)[0]
+    assert stats["coalesced"] == 18
+    assert stats["delivered"] == 2
+
+
+def test_queued_policy_keeps_order_and_counts_overflow(broker):
+    broker, topic = broker
+    broker.set_topic_policy(topic, DeliveryPolicy.QUEUED, max_queue=5)
+    slow = SlowSubscriber()
+    broker.subscribe(topic, slow.on_message)
+
+    broker.publish(topic, 0)
+    assert slow.started.wait(1.0)
+    for message in range(1, 10):
+        broker.publish(topic, message)
+    slow.gate.set()
+
+    assert wait_for(lambda: len(slow.received) == 6)
+    assert slow.received == [0, 5, 6, 7, 8, 9]
+    stats = broker.get_subscriber_stats(topic)[0]
+    assert stats["dropped"] == 4
+    assert stats["max_pending"] == 5
+
+
+def test_slow_subscriber_does_not_delay_other_subscribers(broker):
+    broker, topic = broker
+    broker.set_topic_policy(topic, DeliveryPolicy.LATEST)
+    slow = SlowSubscriber()
+    fast = Collector()
+    broker.subscribe(topic, slow.on_message)
+    broker.subscribe(topic, fast.on_message)
+
+    broker.publish(topic, "frame")
+    assert wait_for(lambda: fast.received == ["frame"], timeout=0.5)
+    slow.gate.set()
+
+
+def test_snapshot_refreshes_on_subscribe_and_unsubscribe(broker):
+    broker, topic = broker
+    first, second = Collector(), Collector()
+    broker.subscribe(topic, first.on_message)
+    broker.publish(topic, "a")
+    broker.subscribe(topic, second.on_message)
+    broker.publish(topic, "b")
+    broker.unsubscribe(topic, first.on_message)
+    broker.publish(topic, "c")
+
+    assert first.received == ["a", "b"]
+    assert second.received == ["b", "c"]
+
+
+def test_dead_subscriber_is_dropped_from_snapshot(broker):
+    broker, topic = broker
+    received = []
+
+    class Subscriber(Collector):
+        def __init__(self):
+            self.received = received
+
+    subscriber = Subscriber()
+    broker.subscribe(topic, subscriber.on_message)
+    broker.publish(topic, 1)
+    del subscriber
+    broker.publish(topic, 2)
+
+    assert received == [1]
+    assert broker.get_subscriber_count(topic) == 0
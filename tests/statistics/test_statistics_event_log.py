@@ -0,0 +1,119 @@
+import json
+
+import pytest
+
+from modules.statistics.statistics_controller import StatisticsController
+from modules.statistics.statistics_event_log import StatisticsEventLog
+from modules.statistics.statistics_repository import StatisticsRepository
+
+
+def run_cycle(controller, workpiece_id=None, motor="1"):
+    data = {"workpiece_id": workpiece_id} if workpiece_id else {}
+    controller._on_generator_on(dict(data))
+    controller._on_motor_on({"motor_address": motor, **data})
+    controller._on_motor_off({"motor_address": motor, **data})
+    controller._on_generator_off(dict(data))
+
+
+@pytest.fixture
+def controllers(tmp_path):
+    created = []
+
+    def make():
+        controller = StatisticsController(tmp_path)
+        created.append(controller)
+        return controller
+
+    yield make
+    for controller in created:
+        if controller.repo.event_log._file.closed:
+            continue
+        controller.shutdown()
+        controller.repo.close()
+
+
+def test_events_are_appended_not_rewritten(tmp_path, controllers):
+    controller = controllers()
+    run_cycle(controller)
+    controller._update_queue.join()
+
+    assert not controller.repo.stats_file.exists()
+    lines = controller.repo.event_log.path.read_text().splitlines()
+    assert [json.loads(line)["seq"] for line in lines] == [1, 2, 3, 4]
+
+
+def test_recovery_replays_log_after_snapshot(tmp_path, controllers):
+    controller = controllers()
+    run_cycle(controller, "wp-1")
+    controller._save_statistics()
+    run_cycle(controller, "wp-2", motor="2")
+    run_cycle(controller)
+    controller._update_queue.join()
+    expected = controller.get_statistics()
+    expected_daily = controller.get_daily_history()
+    # The second instance recovers from disk as if the first had crashed
+
+    recovered = controllers()
+    assert recovered.get_statistics() == expected
+    assert recovered.statistics["system"]["total_cycles"] == 3
+    assert recovered.get_daily_history() == expected_daily
+    assert recovered.get_daily_statistics()["cycles"] == 3
+    assert recovered.get_daily_statistics()["generator_on"] == 3
+    workpieces = recovered.get_workpiece_statistics()
+    assert set(workpieces) == {"wp-1", "wp-2"} and workpieces["wp-2"]["motor_on"] == 1
+
+
+def test_snapshot_compacts_log_and_sequence_continues(tmp_path, controllers):
+    controller = controllers()
+    run_cycle(controller)
+    controller.shutdown()
+
+    assert controller.repo.event_log.path.read_text() == ""
+    with open(controller.repo.stats_file) as f:
+        assert json.load(f)["seq"] == 4
+    controller.repo.close()
+
+    recovered = controllers()
+    run_cycle(recovered)
+    recovered._update_queue.join()
+    assert recovered.repo.event_log.seq == 8
+    assert controllers().statistics["system"]["total_cycles"] == 2
+
+
+def test_reset_is_logged(tmp_path, controllers):
+    controller = controllers()
+    run_cycle(controller)
+    controller.reset_statistics()
+    controller.reset_component_statistics("unknown")
+    controller._update_queue.join()
+
+    assert controller.statistics["system"]["total_cycles"] == 0
+    assert controller.get_daily_history() == {}
+    assert controllers().statistics["generator"]["on_count"] == 0
+
+
+def test_torn_tail_is_dropped(tmp_path):
+    path = tmp_path / "events.jsonl"
+    log = StatisticsEventLog(path, sync_batch=2)
+    log.append({"type": "a"})
+    log.append({"type": "b"})
+    log.close()
+    with open(path, "a") as f:
+        f.write('{"type": "c", "se')
+
+    log = StatisticsEventLog(path)
+    assert log.seq == 2
+    assert log.append({"type": "d"}) == 3
+    assert [e["type"] for e in log.events_after(1)] == ["b", "d"]
+    log.close()
+
+
+def test_legacy_statistics_file_is_loaded(tmp_path):
+    legacy = StatisticsRepository(tmp_path)._default_statistics()
+    legacy["system"]["total_cycles"] = 7
+    (tmp_path / "glue_spray_statistics.json").write_text(json.dumps(legacy))
+
+    repo = StatisticsRepository(tmp_path)
+    statistics, aggregates, seq = repo.load_snapshot()
+    assert statistics["system"]["total_cycles"] == 7 and aggregates == {} and seq == 0
+    repo.close()
@@ -0,0 +1,162 @@
+import logging
+
+import pytest
+
+from modules.shared.MessageBroker import MessageBroker
+from modules.utils.custom_logging import (
+    CallSiteRateLimiter, LoggerContext, LoggingLevel, UiLogSampler, log_calls_with_timestamp_decorator,
+    flush_logging, log_debug_message, log_if_enabled, log_info_message, setup_logger, stop_logging,
+)
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class CountingStr:
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "value"
+
+
+@pytest.fixture
+def captured(request):
+    logger = logging.getLogger(f"test.{request.node.name}")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    handler = ListHandler()
+    logger.addHandler(handler)
+    yield logger, handler
+    logger.removeHandler(handler)
+
+
+def calling_function(context):
+    log_info_message(context, "from %s", "caller")
+
+
+# ----------------- Caller resolution / lazy formatting ----------------- #
+def test_records_report_the_calling_function(captured):
+    logger, handler = captured
+    calling_function(LoggerContext(True, logger))
+    log_if_enabled(True, logger, LoggingLevel.INFO, "direct")
+
+    assert [r.getMessage() for r in handler.records] == ["from caller", "direct"]
+    assert handler.records[0].funcName == "calling_function"
+    assert handler.records[1].funcName == "test_records_report_the_calling_function"
+    assert "findCaller" not in vars(logger)
+
+
+def test_disabled_messages_are_not_formatted(captured):
+    logger, handler = captured
+    argument = CountingStr()
+    log_debug_message(LoggerContext(True, logger), "debug %s", argument)  # below the logger level
+    log_info_message(LoggerContext(False, logger), lambda: pytest.fail("message built while disabled"))
+
+    assert handler.records == []
+    assert argument.calls == 0
+    assert not LoggerContext(True, logger).is_enabled_for(LoggingLevel.DEBUG)
+
+
+def test_decorator_renders_arguments_lazily(captured):
+    logger, handler = captured
+    argument = CountingStr()
+
+    @log_calls_with_timestamp_decorator(logger=logger)
+    def traced(value):
+        return value
+
+    assert traced(argument) is argument
+    assert argument.calls == 0  # DEBUG is disabled on the logger
+
+    def plain(value):
+        return value
+
+    assert log_calls_with_timestamp_decorator(logger=logger, enabled=False)(plain) is plain
+
+
+# ----------------- Rate limiting ----------------- #
+def test_rate_limiter_suppresses_per_call_site():
+    limiter = CallSiteRateLimiter(rate=0.0, burst=3)
+
+    def record(lineno):
+        return logging.LogRecord("test", logging.INFO, "file.py", lineno, "message %d", (lineno,), None)
+
+    assert [limiter.filter(record(10)) for _ in range(5)] == [True, True, True, False, False]
+    assert limiter.filter(record(20))  # other call sites keep their own budget
+
+    limiter.rate = 1e9
+    passed = record(10)
+    assert limiter.filter(passed)
+    assert passed.getMessage() == "message 10 (2 similar messages suppressed)"
+
+
+def test_errors_bypass_the_rate_limit():
+    limiter = CallSiteRateLimiter(rate=0.0, burst=1)
+
+    def record(level):
+        return logging.LogRecord("test", level, "file.py", 10, "message", None, None)
+
+    assert limiter.filter(record(logging.WARNING))
+    assert not limiter.filter(record(logging.WARNING))
+    assert limiter.filter(record(logging.ERROR))
+    assert limiter.filter(record(logging.CRITICAL))
+
+    limiter.bypass_level = None
+    assert not limiter.filter(record(logging.ERROR))
+
+
+# ----------------- UI sampling ----------------- #
+def test_ui_records_are_published_in_sampled_batches():
+    topic = "test/ui-log-sampling"
+    batches = []
+    broker = MessageBroker()
+
+    def callback(message):
+        batches.append(message)
+
+    broker.subscribe(topic, callback)
+    sampler = UiLogSampler(interval=60.0, max_records=3)
+    try:
+        for i in range(10):
+            record = logging.LogRecord("test", logging.INFO, "file.py", i, "step %d", (i,), None)
+            record.ui_topic = topic
+            sampler.handle(record)
+        sampler.handle(logging.LogRecord("test", logging.INFO, "file.py", 0, "not for the UI", None, None))
+        assert batches == []
+
+        sampler.flush()
+        assert len(batches) == 1
+        assert [r["message"] for r in batches[0]["records"]] == ["step 7", "step 8", "step 9"]
+        assert batches[0]["dropped"] == 7
+        assert batches[0]["records"][0]["level"] == "INFO"
+    finally:
+        sampler.close()
+        broker.clear_topic(topic)
+
+
+# ----------------- Background writer ----------------- #
+@pytest.fixture
+def restarted_listener():
+    """
+    Request before capfd: the listener is restarted inside the test so its console handler
+    binds the captured stderr, and again after capfd is torn down.
+    """
+    stop_logging()
+    yield
+    flush_logging()
+
+
+def test_setup_logger_writes_through_the_queue(restarted_listener, capfd):
+    logger = setup_logger("test.custom_logging.queue")
+    log_info_message(LoggerContext(True, logger), "queued %s", "record")
+    flush_logging()
+
+    assert "queued record" in capfd.readouterr().err
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from modules.utils.path_interpolation import batched_interpolation, combined_interpolation
+from modules.utils.path_interpolation.benchmark_interpolation import (
+    interpolate_path_linear_pointwise,
+    interpolate_path_spline_per_dimension,
+)
+from modules.utils.path_interpolation.linear_interpolation import interpolate_path_linear
+from modules.utils.path_interpolation.spline_interpolation import interpolate_path_spline_with_lambda
+
+
+def polygon(n_points, radius=100.0, z=-150.0, seed=0):
+    rng = np.random.default_rng(seed)
+    angles = np.sort(rng.uniform(0, 2 * np.pi, n_points))
+    points = np.zeros((n_points, 6))
+    points[:, 0] = radius * np.cos(angles)
+    points[:, 1] = radius * np.sin(angles)
+    points[:, 2] = z + rng.normal(0, 1.0, n_points)
+    points[:, 3] = 180.0
+    points[:, 5] = np.degrees(angles)
+    return points.tolist()
+
+
+@pytest.mark.parametrize("spacing", [0.5, 5.0, 30.0, 500.0])
+def test_densify_matches_pointwise_reference(spacing):
+    path = polygon(25)
+    expected = interpolate_path_linear_pointwise(path, spacing)
+
+    assert interpolate_path_linear(path, spacing) == expected
+    np.testing.assert_array_equal(batched_interpolation.densify_linear(path, spacing), expected)
+
+
+def test_short_segments_are_not_split():
+    # 15 mm segment < 2 x 10 mm spacing: kept as is; 40 mm segment gets 4 points 8 mm apart
+    path = [[0, 0, 0], [15, 0, 0], [55, 0, 0]]
+    dense = batched_interpolation.densify_linear(path, 10.0)
+    assert dense[:, 0].tolist() == [0, 15, 23, 31, 39, 47, 55]
+
+
+def test_batch_equals_per_path_with_per_path_spacing():
+    paths = [polygon(12, seed=1), [], polygon(1, seed=2), polygon(30, radius=40, seed=3), polygon(2, seed=4)]
+    spacings = [3.0, 1.0, 1.0, 0.7, 10.0]
+
+    batch = batched_interpolation.densify_linear_batch(paths, spacings)
+
+    assert len(batch) == len(paths)
+    for path, spacing, dense in zip(paths, spacings, batch):
+        if len(path):
+            np.testing.assert_array_equal(dense, interpolate_path_linear_pointwise(path, spacing))
+        else:
+            assert len(dense) == 0
+
+
+def test_batch_rejects_mismatched_spacing_count():
+    with pytest.raises(ValueError):
+        batched_interpolation.densify_linear_batch([polygon(5), polygon(5)], [1.0, 2.0, 3.0])
+
+
+def test_spline_matches_per_dimension_fit_when_interpolating():
+    dense = interpolate_path_linear_pointwise(polygon(20), 5.0)
+    expected = np.asarray(interpolate_path_spline_per_dimension(dense, target_spacing_mm=2.5))
+
+    smoothed = np.asarray(interpolate_path_spline_with_lambda(dense, target_spacing_mm=2.5))
+
+    assert smoothed.shape == expected.shape
+    np.testing.assert_allclose(smoothed, expected, atol=1e-6)
+
+
+def test_spline_copies_constant_columns_and_passes_through_end_points():
+    path = polygon(40)
+    smoothed = batched_interpolation.smooth_spline(path, target_spacing_mm=1.0, smoothing_lambda=5.0)
+
+    assert np.all(smoothed[:, 3] == 180.0)
+    assert np.all(smoothed[:, 4] == 0.0)
+    np.testing.assert_allclose(smoothed[0, :3], path[0][:3], atol=0.5)
+    assert len(smoothed) >= 2 * len(path)
+
+
+def test_spline_tolerates_repeated_points():
+    path = polygon(10)
+    path.insert(5, list(path[4]))
+    smoothed = batched_interpolation.smooth_spline(path, target_spacing_mm=2.0)
+    assert np.all(np.isfinite(smoothed))
+    np.testing.assert_allclose(smoothed[-1], path[-1], atol=1e-6)
+
+
+def test_two_stage_keeps_list_interface():
+    path = polygon(8)
+    linear, smoothed = combined_interpolation.interpolate_path_two_stage(path, adaptive_spacing_mm=10.0)
+
+    assert isinstance(linear, list) and isinstance(linear[0], list)
+    assert isinstance(smoothed, list) and isinstance(smoothed[0], list)
+    assert linear == interpolate_path_linear_pointwise(path, 10.0)
+    assert combined_interpolation.interpolate_path_two_stage(path[:1], 10.0) == (path[:1], path[:1])
+
+
+def test_batched_two_stage_matches_single_path_calls():
+    paths = [polygon(8, seed=1), polygon(3, radius=5, seed=2), polygon(1)]
+    batch = combined_interpolation.interpolate_paths_two_stage(
+        paths, adaptive_spacing_mm=[10.0, 1.0, 5.0], spline_density_multiplier=2.0, smoothing_lambda=[0.0, 0.0, 1.0])
+
+    for path, spacing, result in zip(paths, [10.0, 1.0, 5.0], batch):
+        single = combined_interpolation.interpolate_path_two_stage(path, adaptive_spacing_mm=spacing)
+        assert result[0] == single[0]
+        np.testing.assert_allclose(result[1], single[1])
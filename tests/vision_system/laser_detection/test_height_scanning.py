@@ -0,0 +1,101 @@
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from modules.VisionSystem.laser_detection.config import HeightMeasuringConfig, LaserDetectionConfig
+from modules.VisionSystem.laser_detection.height_measuring import HeightMeasuringService, polynomial_to_polyval
+from modules.VisionSystem.laser_detection.height_scanning import PoseSampler
+from modules.VisionSystem.laser_detection.laser_detection_service import LaserDetectionService
+from modules.VisionSystem.laser_detection.laser_detector import LaserDetector
+from modules.VisionSystem.laser_detection.storage import LaserCalibrationStorage
+from modules.VisionSystem.laser_detection.synthetic_scene import SyntheticLaserScene, box_height_fn
+
+BOX = (20.0, 30.0)
+BOX_HEIGHT = 5.0
+
+
+@pytest.fixture
+def scene():
+    scene = SyntheticLaserScene(box_height_fn(x_range=BOX, height=BOX_HEIGHT)).start()
+    yield scene
+    scene.stop()
+
+
+@pytest.fixture
+def height_service(scene):
+    storage = Mock(spec=LaserCalibrationStorage)
+    storage.load_calibration = Mock(return_value=scene.calibration_data())
+    detection_config = LaserDetectionConfig(gaussian_blur_kernel=(3, 3), default_axis='y', detection_delay_ms=20,
+                                            min_intensity=20)
+    laser_service = LaserDetectionService(LaserDetector(detection_config), scene, scene, detection_config)
+    config = HeightMeasuringConfig(scan_velocity=10.0, measurement_velocity=100.0)  # 100 / 1000 mm/s
+    return HeightMeasuringService(laser_service, scene, config=config, storage=storage)
+
+
+def test_polyval_coefficients_match_the_saved_polynomial():
+    # height = 1 + 0.5 x + 0.25 x^2, saved as PolynomialFeatures coefficients + intercept
+    coefficients = polynomial_to_polyval([0.0, 0.5, 0.25], 1.0)
+    np.testing.assert_allclose(np.polyval(coefficients, [0.0, 2.0]), [1.0, 3.0])
+
+
+def test_pose_sampler_interpolates_between_samples():
+    sampler = PoseSampler(lambda: None)
+    sampler._times = [100.0, 100.1]
+    sampler._poses = [[0, 0, 0, 0, 0, 0], [10, 20, 0, 0, 0, 0]]
+
+    interpolated = sampler.interpolate([100.05, 99.0])
+    np.testing.assert_allclose(interpolated[0, :2], [5, 10])
+    assert np.isnan(interpolated[1]).all()
+
+
+def test_scan_line_produces_dense_height_map(height_service):
+    scan = height_service.scan_line((0.0, 0.0), (50.0, 0.0))
+
+    assert len(scan.timestamps) >= 30
+    assert scan.heights.shape == (len(scan.timestamps), 120)
+    distance, heights = scan.profile()
+    assert distance[-1] == pytest.approx(50.0, abs=1.0)
+
+    on_box = (distance > BOX[0] + 1) & (distance < BOX[1] - 1)
+    off_box = (distance < BOX[0] - 1) | (distance > BOX[1] + 1)
+    assert on_box.sum() >= 5 and off_box.sum() >= 20
+    np.testing.assert_allclose(heights[on_box], BOX_HEIGHT, atol=0.2)
+    np.testing.assert_allclose(heights[off_box], 0.0, atol=0.2)
+    # Every scan line of a frame sees the same (y-independent) surface
+    np.testing.assert_allclose(np.nanstd(scan.heights, axis=1), 0.0, atol=0.2)
+
+    grid, resampled = scan.resample(0.5)
+    assert np.diff(grid) == pytest.approx(0.5)
+    assert resampled.shape == (len(grid), 120)
+    middle = np.argmin(np.abs(grid - sum(BOX) / 2))
+    assert np.nanmean(resampled[middle]) == pytest.approx(BOX_HEIGHT, abs=0.2)
+
+
+def test_scan_requires_calibration(height_service):
+    height_service.polyval_coefficients = None
+    with pytest.raises(RuntimeError):
+        height_service.scan_line((0.0, 0.0), (10.0, 0.0))
+
+
+def test_rejected_scan_move_fails_fast(height_service, scene):
+    scene.move_liner = Mock(return_value=-1)
+    started = time.monotonic()
+
+    with pytest.raises(RuntimeError):
+        height_service.scan_line((0.0, 0.0), (50.0, 0.0))
+
+    assert time.monotonic() - started < 1.0
+    assert not scene.laser_on
+
+
+def test_scan_outside_safety_limits_is_not_started(height_service, scene):
+    scene.is_within_safety_limits = Mock(return_value=False)
+    scene.move_liner = Mock(return_value=0)
+
+    with pytest.raises(RuntimeError):
+        height_service.scan_line((0.0, 0.0), (50.0, 0.0))
+
+    scene.move_liner.assert_not_called()
+    assert not scene.laser_on
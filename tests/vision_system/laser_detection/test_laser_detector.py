@@ -1,8 +1,9 @@
 import pytest
 import numpy as np
 import cv2
-from modules.VisionSystem.laser_detection.laser_detector import LaserDetector
+from modules.VisionSystem.laser_detection.laser_detector import LaserDetector, extract_line_positions
 from modules.VisionSystem.laser_detection.config import LaserDetectionConfig
+from modules.VisionSystem.laser_detection.benchmark_laser_detector import extract_line_positions_per_line
 
 @pytest.fixture
 def config():
@@ -114,3 +115,71 @@ def test_detect_laser_line_subpixel_refinement(detector):
     # Check that subpixel refinement moves centroid slightly
     x_coords = [int(round(p[0])) for p in np.argwhere(mask > 0)]
     assert 1 in x_coords or 2 in x_coords or 3 in x_coords
+
+# -------------------------------------------------
+# Vectorised extraction
+# -------------------------------------------------
+def synthetic_laser_pair(shape=(120, 160), axis='y', seed=0):
+    """ON/OFF frames with a noisy, curved Gaussian laser line across the scan axis."""
+    rng = np.random.default_rng(seed)
+    h, w = shape
+    off = rng.integers(0, 30, (h, w, 3)).astype(np.uint8)
+    on = off.astype(np.float32)
+    lines, samples = (h, w) if axis == 'y' else (w, h)
+    centre = samples / 2 + 10 * np.sin(np.linspace(0, 3, lines))
+    profile = 120 * np.exp(-0.5 * ((np.arange(samples)[None, :] - centre[:, None]) / 1.5) ** 2)
+    profile[lines // 3: lines // 3 + 5] = 0  # occluded section
+    on[:, :, 2] += profile if axis == 'y' else profile.T
+    on += rng.normal(0, 2, on.shape)
+    return np.clip(on, 0, 255).astype(np.uint8), off
+
+
+@pytest.mark.parametrize("axis", ['x', 'y'])
+def test_vectorised_extraction_matches_per_line_reference(detector, axis):
+    on_frame, off_frame = synthetic_laser_pair(axis=axis)
+    diff, _ = detector._difference_image(on_frame, off_frame, axis)
+
+    expected = extract_line_positions_per_line(detector, diff, axis)
+    positions = extract_line_positions(diff if axis == 'y' else diff.T, detector.config.min_intensity)
+
+    np.testing.assert_array_equal(np.isnan(positions), np.isnan(expected))
+    assert np.isnan(positions).sum() >= 3
+    np.testing.assert_array_equal(positions[~np.isnan(positions)], expected[~np.isnan(expected)])
+
+
+def test_roi_band_tracks_the_line(config):
+    config.roi_band_px = 15
+    detector = LaserDetector(config)
+    full = LaserDetector(LaserDetectionConfig(gaussian_blur_kernel=(3, 3), gaussian_blur_sigma=0.5,
+                                              min_intensity=10))
+    on_frame, off_frame = synthetic_laser_pair(axis='y')
+
+    detector.detect_laser_line(on_frame, off_frame, axis='y')
+    assert detector._roi_band('y', on_frame.shape[1]) is not None
+    mask, _, closest = detector.detect_laser_line(on_frame, off_frame, axis='y')
+    full_mask, _, full_closest = full.detect_laser_line(on_frame, off_frame, axis='y')
+
+    np.testing.assert_array_equal(mask, full_mask)
+    assert closest == pytest.approx(full_closest, abs=1e-4)
+
+    # Line moved out of the band: falls back to the whole frame
+    moved_on = np.roll(on_frame, 60, axis=1)
+    moved_off = np.roll(off_frame, 60, axis=1)
+    _, _, closest = detector.detect_laser_line(moved_on, moved_off, axis='y')
+    assert closest[0] == pytest.approx(full_closest[0] + 60, abs=1.0)
+
+
+def test_width_limits_reject_wide_blobs(detector):
+    profiles = np.zeros((2, 40), dtype=np.float32)
+    profiles[0, 18:21] = [50, 100, 50]
+    profiles[1, 5:35] = 100
+    positions = extract_line_positions(profiles, 10, max_width=5)
+    assert positions[0] == pytest.approx(19.0)
+    assert np.isnan(positions[1])
+
+
+def test_centroid_refinement():
+    profiles = np.array([[0, 0, 20, 60, 40, 0, 0]], dtype=np.float32)
+    positions = extract_line_positions(profiles, 10, subpixel_method='centroid', half_window=2)
+    # weights above the floor: 10, 50, 30 at samples 2, 3, 4
+    assert positions[0] == pytest.approx((2 * 10 + 3 * 50 + 4 * 30) / 90)
@@ -0,0 +1,113 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from modules.VisionSystem.laser_detection.config import LaserDetectionConfig
+from modules.VisionSystem.laser_detection.laser_detection_service import LaserDetectionService
+from modules.VisionSystem.laser_detection.laser_detector import LaserDetector
+from modules.VisionSystem.laser_detection.strobe_capture import StrobeCapture
+
+FRAME_INTERVAL = 0.004
+LATENCY = 0.015
+LINE_X = 30
+
+
+class FakeCamera:
+    """VisionService look-alike: numbered frames whose laser line lags the laser by LATENCY."""
+
+    def __init__(self, shape=(40, 64, 3)):
+        self.frame_lock = threading.Lock()
+        self.frame_condition = threading.Condition(self.frame_lock)
+        self.frame_id = 0
+        self.latest_frame = None
+        self.latest_frame_timestamp = None
+        self.shape = shape
+        self.laser_on = False
+        self.toggled_at = 0.0
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def turnOn(self):
+        self.laser_on, self.toggled_at = True, time.time()
+
+    def turnOff(self):
+        self.laser_on, self.toggled_at = False, time.time()
+
+    def _run(self):
+        while self._running:
+            now = time.time()
+            lit = self.laser_on if now - self.toggled_at >= LATENCY else not self.laser_on
+            frame = np.full(self.shape, 10, np.uint8)
+            if lit:
+                frame[:, LINE_X - 1:LINE_X + 2, 2] = [120, 200, 120]
+            with self.frame_condition:
+                self.latest_frame = frame
+                self.latest_frame_timestamp = now
+                self.frame_id += 1
+                self.frame_condition.notify_all()
+            time.sleep(FRAME_INTERVAL)
+
+    def stop(self):
+        self._running = False
+        self._thread.join()
+
+
+@pytest.fixture
+def camera():
+    camera = FakeCamera()
+    time.sleep(0.02)
+    yield camera
+    camera.stop()
+
+
+@pytest.fixture
+def config():
+    return LaserDetectionConfig(detection_delay_ms=80, min_settle_delay_ms=5, detection_samples=3,
+                                gaussian_blur_kernel=(3, 3), default_axis='y')
+
+
+def test_capture_takes_distinct_settled_frames(camera, config):
+    strobe = StrobeCapture(camera, camera, config)
+
+    phase = strobe.capture(True, 3)
+
+    assert phase.count == 3
+    assert all(t >= strobe.settle_delay for t in phase.frame_times)
+    assert len(set(phase.frame_times)) == 3
+    assert phase.stale_frames > 0
+    assert (phase.frames[:, :, LINE_X, 2] == 200).all()
+
+
+def test_settle_delay_adapts_to_camera_latency(camera, config):
+    strobe = StrobeCapture(camera, camera, config)
+
+    for _ in range(4):
+        off_phase = strobe.capture(False, 3)
+        on_phase = strobe.capture(True, 3)
+        latency = strobe.update_settle_delay(off_phase, on_phase)
+
+    assert latency == pytest.approx(LATENCY, abs=0.01)
+    assert LATENCY <= strobe.settle_delay < config.detection_delay_ms / 1000.0
+    # Every accepted frame still shows the laser
+    assert (on_phase.frames[:, :, LINE_X, 2] == 200).all()
+
+
+def test_service_reports_measurement(camera, config):
+    config.roi_band_px = 6
+    service = LaserDetectionService(LaserDetector(config), camera, camera, config)
+
+    _, _, closest = service.detect()
+    assert closest[0] == pytest.approx(LINE_X, abs=0.01)
+    first = service.last_measurement
+    assert (first.on_frames, first.off_frames) == (3, 3)
+    assert first.region is None
+
+    _, _, closest = service.detect()
+    second = service.last_measurement
+    assert closest[0] == pytest.approx(LINE_X, abs=0.01)
+    assert second.region is not None
+    assert second.settle_delay_s < first.settle_delay_s
+    assert second.duration_s < first.duration_s
@@ -0,0 +1,94 @@
+import cv2
+import numpy as np
+import pytest
+
+from modules.VisionSystem.area_masks import AreaMask
+from modules.VisionSystem.data_loading import DataManager
+from modules.VisionSystem.contour_metrics import (
+    compute_contour_metrics,
+    area_filter,
+    proximity_order,
+)
+from libs.plvision.PLVision import Contouring
+
+SHAPE = (200, 300)
+POLYGON = np.array([[20.5, 30.2], [260.0, 25.0], [280.0, 180.0], [40.0, 170.5]], dtype=np.float32)
+
+
+def square(x, y, size):
+    return np.array([[[x, y]], [[x + size, y]], [[x + size, y + size]], [[x, y + size]]], dtype=np.int32)
+
+
+@pytest.fixture
+def area_mask():
+    return AreaMask(POLYGON, SHAPE)
+
+
+def test_contains_points_matches_point_polygon_test(area_mask):
+    rng = np.random.default_rng(1)
+    points = rng.uniform(-10, 310, size=(2000, 2))
+    distances = np.array([cv2.pointPolygonTest(POLYGON, (float(x), float(y)), True) for x, y in points])
+    # Rasterisation is only exact away from the polygon edge
+    clear = np.abs(distances) > 1.5
+    expected = distances > 0
+    np.testing.assert_array_equal(area_mask.contains_points(points)[clear], expected[clear])
+
+
+def test_points_outside_frame_are_outside(area_mask):
+    points = np.array([[-5, 50], [50, -1], [300, 50], [50, 200]])
+    assert not area_mask.contains_points(points).any()
+
+
+def test_contours_inside_batch(area_mask):
+    contours = [
+        square(60, 60, 40),      # fully inside
+        square(250, 150, 40),    # crosses the right edge
+        square(0, 0, 10),        # outside
+        square(100, 80, 20),     # inside
+    ]
+    np.testing.assert_array_equal(area_mask.contours_inside(contours), [True, False, False, True])
+    assert area_mask.contours_inside([]).shape == (0,)
+
+
+def test_pixels_inside_rect_uses_integral(area_mask):
+    x, y, w, h = 50, 40, 100, 60
+    assert area_mask.pixels_inside_rect(x, y, w, h) == int(area_mask.mask[y:y + h, x:x + w].sum())
+    assert area_mask.pixels_inside_rect(-50, -50, 10, 10) == 0
+
+
+def test_metrics_match_opencv():
+    contours = [square(10, 10, 20), square(100, 50, 5), np.array([[[3, 3]]], dtype=np.int32)]
+    metrics = compute_contour_metrics(contours)
+
+    for row, cnt in zip(metrics, contours):
+        assert row["area"] == pytest.approx(cv2.contourArea(cnt))
+        assert row["perimeter"] == pytest.approx(cv2.arcLength(cnt, True))
+        assert (row["x"], row["y"], row["w"], row["h"]) == cv2.boundingRect(cnt)
+        assert (int(row["cx"]), int(row["cy"])) == Contouring.calculateCentroid(cnt)
+
+
+def test_area_filter_is_exclusive():
+    metrics = compute_contour_metrics([square(0, 0, 10), square(0, 0, 20), square(0, 0, 30)])
+    np.testing.assert_array_equal(area_filter(metrics, 100, 900), [False, True, False])
+
+
+def test_proximity_order_is_greedy_nearest_neighbour():
+    contours = [square(200, 200, 10), square(0, 0, 10), square(100, 100, 10), square(20, 0, 10)]
+    order = proximity_order(compute_contour_metrics(contours), (0, 0))
+    assert order == [1, 3, 2, 0]
+
+
+def test_mask_built_from_replaced_points_is_not_reused(tmp_path):
+    manager = DataManager(vision_system=None, logging_enabled=False, logger=None, storage_path=str(tmp_path))
+    manager.sprayAreaPoints = POLYGON
+    old_mask = manager.get_area_mask("spray", SHAPE)
+
+    # Vision thread rebuilding the mask between invalidation and the new points being assigned
+    manager.invalidate_area_masks()
+    assert manager.get_area_mask("spray", SHAPE) is not None
+    manager.sprayAreaPoints = POLYGON + 10
+
+    new_mask = manager.get_area_mask("spray", SHAPE)
+    assert new_mask is not old_mask
+    assert new_mask.contains_points(np.array([[285.0, 185.0]])).all()
+    assert manager.get_area_mask("spray", SHAPE) is new_mask
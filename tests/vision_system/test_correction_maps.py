@@ -0,0 +1,90 @@
+import cv2
+import numpy as np
+import pytest
+
+from modules.VisionSystem.correction_maps import CorrectionMaps
+
+WIDTH, HEIGHT = 320, 240
+
+
+@pytest.fixture
+def calibration():
+    camera_matrix = np.array([[300.0, 0.0, 160.0], [0.0, 300.0, 120.0], [0.0, 0.0, 1.0]])
+    dist = np.array([-0.2, 0.05, 0.001, -0.001, 0.0])
+    new_camera_matrix, _ = cv2.getOptimalNewCameraMatrix(camera_matrix, dist, (WIDTH, HEIGHT), 0.5,
+                                                         (WIDTH, HEIGHT))
+    src = np.float32([[20, 15], [300, 10], [310, 230], [10, 220]])
+    dst = np.float32([[0, 0], [WIDTH, 0], [WIDTH, HEIGHT], [0, HEIGHT]])
+    perspective = cv2.getPerspectiveTransform(src, dst)
+    return camera_matrix, dist, new_camera_matrix, perspective
+
+
+@pytest.fixture
+def smooth_image():
+    rng = np.random.default_rng(0)
+    small = rng.integers(0, 255, (12, 16, 3), dtype=np.uint8)
+    return cv2.resize(small, (WIDTH, HEIGHT), interpolation=cv2.INTER_CUBIC)
+
+
+def two_pass(image, camera_matrix, dist, new_camera_matrix, perspective):
+    undistorted = cv2.undistort(image, camera_matrix, dist, None, new_camera_matrix)
+    if perspective is None:
+        return undistorted
+    return cv2.warpPerspective(undistorted, perspective, (WIDTH, HEIGHT))
+
+
+@pytest.mark.parametrize("use_perspective", [True, False])
+def test_single_remap_matches_two_pass_correction(calibration, smooth_image, use_perspective):
+    camera_matrix, dist, new_camera_matrix, perspective = calibration
+    perspective = perspective if use_perspective else None
+
+    maps = CorrectionMaps()
+    maps.build(camera_matrix, dist, new_camera_matrix, perspective, (WIDTH, HEIGHT))
+    corrected = maps.apply(smooth_image)
+    expected = two_pass(smooth_image, camera_matrix, dist, new_camera_matrix, perspective)
+
+    assert corrected.shape == expected.shape
+    # Ignore the black border where either path samples outside the source image
+    valid = (corrected.sum(axis=2) > 0) & (expected.sum(axis=2) > 0)
+    diff = np.abs(corrected.astype(int) - expected.astype(int))[valid]
+    assert diff.mean() < 1.0
+    assert diff.max() <= 4
+
+
+def test_maps_are_fixed_point(calibration):
+    maps = CorrectionMaps()
+    maps.build(*calibration, (WIDTH, HEIGHT))
+    assert maps._map1.dtype == np.int16
+    assert maps._map1.shape == (HEIGHT, WIDTH, 2)
+
+
+def test_roi_correction_matches_full_frame_inside_roi(calibration, smooth_image):
+    maps = CorrectionMaps()
+    maps.build(*calibration, (WIDTH, HEIGHT))
+    full = maps.apply(smooth_image)
+
+    roi = (40, 30, 100, 80)
+    partial = maps.apply(smooth_image, roi=roi)
+
+    x, y, w, h = roi
+    np.testing.assert_array_equal(partial[y:y + h, x:x + w], full[y:y + h, x:x + w])
+    outside = partial.copy()
+    outside[y:y + h, x:x + w] = 0
+    assert not outside.any()
+
+
+def test_roi_is_clipped_to_image(calibration):
+    maps = CorrectionMaps()
+    maps.build(*calibration, (WIDTH, HEIGHT))
+    assert maps.clip_roi((-10, -5, 50, 40)) == (0, 0, 40, 35)
+    assert maps.clip_roi((WIDTH - 10, HEIGHT - 10, 50, 50)) == (WIDTH - 10, HEIGHT - 10, 10, 10)
+
+
+def test_invalidate_requires_rebuild(calibration, smooth_image):
+    maps = CorrectionMaps()
+    maps.build(*calibration, (WIDTH, HEIGHT))
+    assert maps.is_valid
+    maps.invalidate()
+    assert not maps.is_valid
+    with pytest.raises(RuntimeError):
+        maps.apply(smooth_image)
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from modules.VisionSystem.frame_ring import FrameRing
+
+
+def make_frame(value, shape=(4, 6, 3)):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+def test_empty_ring_returns_none():
+    ring = FrameRing(capacity=3)
+    assert ring.get_latest() is None
+    assert ring.get_latest(since_seq=0, timeout=0.01) is None
+
+
+def test_write_assigns_monotonic_sequence_numbers():
+    ring = FrameRing(capacity=3)
+    seqs = [ring.write(make_frame(i), timestamp=float(i)) for i in range(5)]
+    assert seqs == [1, 2, 3, 4, 5]
+
+    slot = ring.get_latest()
+    assert slot.seq == 5
+    assert slot.timestamp == 4.0
+    assert np.all(slot.image == 4)
+
+
+def test_views_are_read_only_and_not_copies():
+    ring = FrameRing(capacity=3)
+    ring.write(make_frame(7))
+    first = ring.get_latest().image
+    assert not first.flags.writeable
+    with pytest.raises(ValueError):
+        first[0, 0, 0] = 1
+
+    # Same slot -> same underlying buffer, no per-read allocation
+    assert np.shares_memory(first, ring.get_latest().image)
+
+
+def test_slots_are_reused_without_reallocation():
+    ring = FrameRing(capacity=2)
+    ring.write(make_frame(1))
+    buffers = list(ring._buffers)
+    for i in range(10):
+        ring.write(make_frame(i))
+    assert all(a is b for a, b in zip(buffers, ring._buffers))
+
+
+def test_is_current_reports_overwritten_slots():
+    ring = FrameRing(capacity=2)
+    seq = ring.write(make_frame(1))
+    assert ring.is_current(seq)
+    ring.write(make_frame(2))
+    assert ring.is_current(seq)
+    ring.write(make_frame(3))
+    assert not ring.is_current(seq)
+
+
+def test_get_latest_since_seq_does_not_return_same_frame_twice():
+    ring = FrameRing(capacity=3)
+    seq = ring.write(make_frame(1))
+    assert ring.get_latest(since_seq=seq, timeout=0.01) is None
+
+
+def test_get_latest_blocks_until_newer_frame():
+    ring = FrameRing(capacity=3)
+    seq = ring.write(make_frame(1))
+
+    def writer():
+        time.sleep(0.05)
+        ring.write(make_frame(2))
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    slot = ring.get_latest(since_seq=seq, timeout=2.0)
+    thread.join()
+
+    assert slot is not None
+    assert slot.seq == seq + 1
+    assert np.all(slot.image == 2)
+
+
+def test_resolution_change_reallocates():
+    ring = FrameRing(capacity=2)
+    ring.write(make_frame(1, shape=(4, 4, 3)))
+    ring.write(make_frame(2, shape=(8, 8, 3)))
+    slot = ring.get_latest()
+    assert slot.image.shape == (8, 8, 3)
+    assert slot.seq == 2
+
+
+def test_capacity_must_be_at_least_two():
+    with pytest.raises(ValueError):
+        FrameRing(capacity=1)
@@ -0,0 +1,156 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+from applications.glue_dispensing_application.model.workpiece.GlueWorkpiece import GlueWorkpiece
+from applications.glue_dispensing_application.repositories.workpiece.glue_workpiece_json_repository import \
+    GlueWorkpieceJsonRepository
+from applications.glue_dispensing_application.repositories.workpiece.workpiece_index import merge_arrays, \
+    split_large_arrays
+from core.services.workpiece.BaseWorkpieceService import BaseWorkpieceService
+
+SAMPLE = os.path.join(os.path.dirname(__file__), "../../src/applications/glue_dispensing_application/storage/data/"
+                      "workpieces/2026-02-18/2026-02-18_16-11-51-372499/2026-02-18_16-11-51-372499_workpiece.json")
+
+
+def sample_data(workpiece_id="wp-1", points=4):
+    with open(SAMPLE) as f:
+        data = json.load(f)
+    data["workpieceId"] = workpiece_id
+    data["name"] = f"name-{workpiece_id}"
+    t = np.linspace(0, 2 * np.pi, points, endpoint=False)
+    data["contour"] = [[[float(100 + 50 * np.cos(a)), float(200 + 30 * np.sin(a))]] for a in t]
+    return data
+
+
+def write_file(directory, folder, data):
+    path = os.path.join(directory, "2026-01-01", folder, f"{folder}_workpiece.json")
+    os.makedirs(os.path.dirname(path))
+    with open(path, "w") as f:
+        json.dump(data, f)
+    return path
+
+
+@pytest.fixture
+def repo_dir(tmp_path):
+    write_file(str(tmp_path), "a", sample_data("wp-1"))
+    write_file(str(tmp_path), "b", sample_data("wp-2"))
+    return str(tmp_path)
+
+
+def make_repo(directory, **kwargs):
+    return GlueWorkpieceJsonRepository(directory, [], GlueWorkpiece, **kwargs)
+
+
+def test_index_is_built_and_bodies_load_lazily(repo_dir):
+    repo = make_repo(repo_dir)
+
+    assert os.path.exists(os.path.join(repo_dir, repo.INDEX_FILE_NAME))
+    summaries = {e.workpiece_id: e for e in repo.list_summaries()}
+    assert set(summaries) == {"wp-1", "wp-2"}
+    assert summaries["wp-1"].name == "name-wp-1"
+    assert summaries["wp-1"].bbox == pytest.approx([50, 170, 150, 230])
+    assert not repo._cache
+
+    wp = repo.get_workpiece_by_id("wp-1")
+    assert wp.name == "name-wp-1"
+    assert repo.get_workpiece_by_id("wp-1") is wp
+    assert repo.get_workpiece_by_id("missing") is None
+    assert {w.workpieceId for w in repo.data} == {"wp-1", "wp-2"}
+    assert wp in repo.data
+
+
+def test_cache_is_bounded(repo_dir):
+    repo = make_repo(repo_dir, cache_size=1)
+    repo.get_workpiece_by_id("wp-1")
+    repo.get_workpiece_by_id("wp-2")
+    assert list(repo._cache) == ["wp-2"]
+
+
+def test_listing_all_workpieces_keeps_only_the_cache_resident(repo_dir):
+    write_file(repo_dir, "c", sample_data("wp-3"))
+    repo = make_repo(repo_dir, cache_size=1)
+    service = BaseWorkpieceService(repo)
+
+    assert [s.workpiece_id for s in service.list_summaries()] == ["wp-1", "wp-2", "wp-3"]
+    assert not repo._cache
+
+    assert {wp.workpieceId for wp in service.load_all()} == {"wp-1", "wp-2", "wp-3"}
+    assert len(repo._cache) == 1
+    assert len(repo.data) == 3 and len(repo._cache) == 1
+
+
+def test_save_update_and_delete_keep_index_in_sync(repo_dir):
+    repo = make_repo(repo_dir)
+    assert len(repo.data) == 2
+
+    new = GlueWorkpiece.deserialize(sample_data("wp-3"))
+    assert repo.save_workpiece(new) == (True, "Workpiece saved successfully")
+    path = repo.index.get("wp-3").path
+    new.name = "renamed"
+    assert repo.save_workpiece(new) == (True, "Workpiece updated successfully")
+    assert repo.index.get("wp-3").path == path
+    assert len(repo.data) == 3
+    assert not [n for n in os.listdir(os.path.dirname(os.path.join(repo_dir, path))) if n.startswith(".tmp_")]
+
+    reopened = make_repo(repo_dir)
+    assert reopened.index.get("wp-3").name == "renamed"
+    assert reopened.get_workpiece_by_id("wp-3").name == "renamed"
+
+    assert reopened.delete_workpiece_by_id("wp-3")[0]
+    assert not os.path.exists(os.path.join(repo_dir, path))
+    assert reopened.index.get("wp-3") is None
+    assert reopened.deleteWorkpiece("wp-3")[0] is False
+    assert make_repo(repo_dir).index.ids() == ["wp-1", "wp-2"]
+
+
+def test_index_rebuilds_on_drift(repo_dir):
+    make_repo(repo_dir)
+    # Changed, removed and added behind the repository's back
+    path = os.path.join(repo_dir, "2026-01-01", "a", "a_workpiece.json")
+    data = sample_data("wp-1")
+    data["name"] = "edited by hand"
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    shutil.rmtree(os.path.join(repo_dir, "2026-01-01", "b"))
+    write_file(repo_dir, "c", sample_data("wp-4"))
+
+    repo = make_repo(repo_dir)
+    assert sorted(repo.index.ids()) == ["wp-1", "wp-4"]
+    assert repo.index.get("wp-1").name == "edited by hand"
+    assert repo.rebuild_index_if_drifted() == 0
+
+    with open(os.path.join(repo_dir, repo.INDEX_FILE_NAME), "w") as f:
+        f.write("{corrupt")
+    assert sorted(make_repo(repo_dir).index.ids()) == ["wp-1", "wp-4"]
+
+
+def test_large_contours_go_to_sidecar(repo_dir):
+    repo = make_repo(repo_dir, binary_sidecar=True)
+    original = sample_data("wp-big", points=repo.SIDECAR_MIN_POINTS + 10)
+    assert repo.save_workpiece(GlueWorkpiece.deserialize(json.loads(json.dumps(original))))[0]
+
+    entry = repo.index.get("wp-big")
+    assert entry.sidecar and os.path.exists(os.path.join(repo_dir, entry.sidecar))
+    with open(os.path.join(repo_dir, entry.path)) as f:
+        assert f.read().count("$npz") >= 1
+
+    loaded = make_repo(repo_dir).get_workpiece_by_id("wp-big")
+    np.testing.assert_allclose(np.asarray(loaded.contour, dtype=float).reshape(-1, 2),
+                               np.asarray(original["contour"], dtype=float).reshape(-1, 2))
+
+
+def test_split_and_merge_round_trip():
+    data = {"contour": [[[1.0, 2.0]], [[3.0, 4.0]]],
+            "sprayPattern": {"Contour": [{"contour": [[[5.0, 6.0]], [[7.0, 8.0]]], "settings": {}}]}}
+    stripped, arrays = split_large_arrays(data, min_points=2)
+    assert stripped["contour"] == {"$npz": "a0"} and len(arrays) == 2
+    assert data["contour"] == [[[1.0, 2.0]], [[3.0, 4.0]]]
+
+    merged = merge_arrays(json.loads(json.dumps(stripped)), arrays)
+    assert merged["contour"] == data["contour"]
+    np.testing.assert_array_equal(merged["sprayPattern"]["Contour"][0]["contour"],
+                                  data["sprayPattern"]["Contour"][0]["contour"])